@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+"""
+Construction animation benchmark
+
+For growing span counts, compares the cost of one incremental animation
+frame (bridge_animation.py: background restored and only the changed strip
+redrawn) against a full render of the drawing, which is what every frame
+would cost if each stage were drawn as a fresh figure through
+generate_drawing.
+
+Usage:
+    python benchmarks/bench_animation.py [--spans 3 10 30] [--type beam] [--dpi 60]
+"""
+
+import argparse
+import os
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+import matplotlib
+matplotlib.use('Agg')
+import matplotlib.pyplot as plt
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+
+from bridge_animation import DEFAULT_DPI, AnimationStats, construction_frames
+from bridge_drawings import BridgeDrawingGenerator, BridgeParameters, resolve_bridge_type
+from bridge_types import bridge_type_names
+
+
+def full_render(bridge_type, params, dpi: float) -> float:
+    """Seconds to generate and rasterise the drawing from scratch"""
+    start = time.perf_counter()
+    generator = BridgeDrawingGenerator(bridge_type, params)
+    figure = generator.generate_drawing()
+    canvas = FigureCanvasAgg(figure)
+    figure.dpi = dpi
+    canvas.draw()
+    seconds = time.perf_counter() - start
+    plt.close(figure)
+    return seconds
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark incremental animation frames against full renders')
+    parser.add_argument('--spans', type=int, nargs='+', default=[3, 10, 30],
+                        help='Span counts to animate (default: 3 10 30)')
+    parser.add_argument('--type', choices=bridge_type_names(), default='beam', help='Bridge type (default: beam)')
+    parser.add_argument('--span-length', type=float, default=30.0, help='Length of each span in metres (default: 30)')
+    parser.add_argument('--dpi', type=float, default=DEFAULT_DPI, help=f'Frame resolution (default: {DEFAULT_DPI})')
+    args = parser.parse_args()
+
+    bridge_type = resolve_bridge_type(args.type)
+    print(f"{'spans':>5} {'frames':>6} {'members':>7} {'full ms':>8} {'setup ms':>9} {'frame ms':>9} "
+          f"{'ratio':>6} {'all frames s':>12} {'fresh s':>8}")
+    for count in args.spans:
+        params = BridgeParameters(span_length=args.span_length * count, deck_width=12, height=20,
+                                  supports=count - 1, load_capacity=50, material='concrete')
+        full_render(bridge_type, params, args.dpi)  # imports and font cache warm-up
+        full = full_render(bridge_type, params, args.dpi)
+
+        generator = BridgeDrawingGenerator(bridge_type, params)
+        stats = AnimationStats()
+        for _ in construction_frames(generator, args.dpi, stats=stats):
+            pass
+        plt.close(generator.figure)
+
+        total = stats.setup_seconds + stats.frame_seconds + stats.final_seconds
+        print(f"{count:>5} {stats.frames:>6} {stats.members:>7} {full * 1e3:>8.1f} {stats.setup_seconds * 1e3:>9.1f} "
+              f"{stats.seconds_per_frame * 1e3:>9.2f} {stats.seconds_per_frame / full:>6.1%} "
+              f"{total:>12.2f} {full * stats.frames:>8.2f}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,70 @@
+#!/usr/bin/env python3
+"""
+Sub-pixel culling benchmark
+
+Renders long bridges of every type to PNG with and without culling at a
+few resolutions and reports render time, culled artist counts and the
+fraction of pixels that differ.
+
+Usage:
+    python benchmarks/bench_cull.py [--span 2000] [--supports 60] [--dpi 100 300]
+"""
+
+import argparse
+import io
+import os
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+import matplotlib
+matplotlib.use('Agg')
+import matplotlib.pyplot as plt
+import numpy as np
+from PIL import Image
+
+from bridge_cull import cull_subpixel
+from bridge_drawings import BridgeDrawingGenerator, BridgeParameters, BridgeType, OutputFormat
+
+
+def render(generator: BridgeDrawingGenerator, dpi: int, threshold: float, repeat: int):
+    generator.cull_threshold_px = threshold
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        data = generator.export_bytes(OutputFormat.PNG, dpi)
+        best = min(best, time.perf_counter() - start)
+    return np.asarray(Image.open(io.BytesIO(data)).convert('RGB')), best
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark sub-pixel culling of raster output')
+    parser.add_argument('--span', type=float, default=2000.0, help='Span length in metres (default: 2000)')
+    parser.add_argument('--supports', type=int, default=60, help='Intermediate supports (default: 60)')
+    parser.add_argument('--dpi', type=int, nargs='+', default=[100, 300], help='Resolutions (default: 100 300)')
+    parser.add_argument('--threshold', type=float, default=1.0, help='Culling threshold in pixels (default: 1.0)')
+    parser.add_argument('--repeat', type=int, default=2, help='Renders per measurement, best is kept (default: 2)')
+    args = parser.parse_args()
+
+    print(f"{'bridge':<14} {'dpi':>4} {'full s':>8} {'culled s':>9} {'dropped':>8} {'merged':>7} {'px diff':>8}")
+    for bridge_type in BridgeType:
+        params = BridgeParameters(span_length=args.span, deck_width=12, height=25, supports=args.supports,
+                                  load_capacity=50, material='concrete')
+        generator = BridgeDrawingGenerator(bridge_type, params)
+        generator.generate_drawing()
+        for dpi in args.dpi:
+            full, full_s = render(generator, dpi, 0, args.repeat)
+            culled, culled_s = render(generator, dpi, args.threshold, args.repeat)
+            with cull_subpixel(generator.figure, dpi, args.threshold) as stats:
+                pass
+            diff = np.mean(np.any(full != culled, axis=2)) if full.shape == culled.shape else float('nan')
+            print(f"{bridge_type.value:<14} {dpi:>4} {full_s:>8.2f} {culled_s:>9.2f} "
+                  f"{stats.dropped:>8} {stats.merged:>7} {diff:>8.2%}")
+        plt.close(generator.figure)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+"""
+DXF sheet benchmark
+
+Writes multi-sheet DXFs two ways and reports size and write time: as
+paper-space layouts with viewports onto one modelspace (bridge_layouts.py),
+and by copying the modelspace geometry once per sheet, side by side, which
+was the only way to get separate sheets before.
+
+Usage:
+    python benchmarks/bench_dxf_sheets.py [--sheets 3 10 30] [--span 300]
+"""
+
+import argparse
+import io
+import os
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+import matplotlib
+matplotlib.use('Agg')
+
+from bridge_drawings import BridgeDrawingGenerator, BridgeParameters, BridgeType
+from bridge_layouts import SheetSpec, ViewportSpec, add_sheets, layer_extents
+
+
+def detail_sheets(msp, count: int):
+    """count sheets, each showing the next stretch of the structure"""
+    xmin, ymin, xmax, ymax = layer_extents(msp)
+    step = (xmax - xmin) / count
+    return [SheetSpec(f"S{i + 1:02d}", f"Detail {i + 1}",
+                      [ViewportSpec(f"CH {xmin + i * step:.0f}", (xmin + i * step, ymin, xmin + (i + 1) * step, ymax),
+                                    frozen_layers=('TEXT',))])
+            for i in range(count)]
+
+
+def copied_sheets(msp, count: int):
+    """Duplicate every modelspace entity count - 1 times, one copy per extra sheet"""
+    from ezdxf.math import Matrix44
+
+    xmin, _, xmax, _ = layer_extents(msp)
+    originals = list(msp)
+    for i in range(1, count):
+        shift = Matrix44.translate(i * (xmax - xmin) * 1.2, 0, 0)
+        for entity in originals:
+            msp.add_entity(entity.copy().transform(shift))
+
+
+def write(doc) -> int:
+    stream = io.StringIO()
+    doc.write(stream)
+    return len(stream.getvalue().encode(doc.output_encoding))
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark DXF sheets as layouts against copied geometry')
+    parser.add_argument('--sheets', type=int, nargs='+', default=[3, 10, 30],
+                        help='Sheet counts to write (default: 3 10 30)')
+    parser.add_argument('--type', choices=[bt.value for bt in BridgeType], default='truss',
+                        help='Bridge type (default: truss)')
+    parser.add_argument('--span', type=float, default=300.0, help='Span length in metres (default: 300)')
+    args = parser.parse_args()
+
+    params = BridgeParameters(span_length=args.span, deck_width=12, height=30, supports=3,
+                              load_capacity=50, material='steel')
+    generator = BridgeDrawingGenerator(BridgeType(args.type), params)
+    generator.dxf_sheets = False
+    generator.build_dxf_document()  # imports and geometry warm-up
+
+    print(f"{'sheets':>6} {'layouts KB':>11} {'layouts ms':>11} {'copies KB':>10} {'copies ms':>10}")
+    for count in args.sheets:
+        row = []
+        for build in (lambda doc: add_sheets(doc, detail_sheets(doc.modelspace(), count), "Benchmark", []),
+                      lambda doc: copied_sheets(doc.modelspace(), count)):
+            start = time.perf_counter()
+            doc = generator.build_dxf_document()
+            build(doc)
+            size = write(doc)
+            row.append((size, time.perf_counter() - start))
+        print(f"{count:>6} {row[0][0] / 1024:>11.1f} {row[0][1] * 1e3:>11.1f} "
+              f"{row[1][0] / 1024:>10.1f} {row[1][1] * 1e3:>10.1f}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,118 @@
+#!/usr/bin/env python3
+"""
+Worker result hand-off benchmark
+
+A worker process renders a drawing once and keeps three payloads: the raw
+RGBA buffer (6000x4800 at the default 300 dpi), the encoded PNG and the
+DXF. The parent then fetches each payload repeatedly through a process
+pool, once pickled back through the pool's result pipe and once handed off
+in shared memory (bridge_handoff.py), and reports per payload:
+
+- the latency from submit until the parent holds a usable buffer
+- the parent's peak Python heap allocation while receiving it (tracemalloc)
+- the private memory it still holds for the received result (RssAnon, Linux)
+
+Rendering is left out; only the transport is timed.
+
+Usage:
+    python benchmarks/bench_handoff.py [--dpi 300] [--repeat 5]
+"""
+
+import argparse
+import os
+import sys
+import time
+import tracemalloc
+from concurrent.futures import ProcessPoolExecutor
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+import matplotlib
+matplotlib.use('Agg')
+import matplotlib.pyplot as plt
+import numpy as np
+
+from bridge_drawings import BridgeDrawingGenerator, BridgeParameters, BridgeType, OutputFormat
+from bridge_handoff import hand_off, handoff_dir, receive
+from bridge_raster import render_rgba
+
+PAYLOADS = ("rgba", "png", "dxf")
+
+_payloads = {}
+
+
+def _prepare(dpi: int) -> dict:
+    """Render the payloads in the worker; returns their sizes"""
+    params = BridgeParameters(span_length=400, deck_width=12, height=25, supports=29,
+                              load_capacity=50, material='steel')
+    generator = BridgeDrawingGenerator(BridgeType.SLAB, params)
+    generator.generate_drawing()
+    image, _ = render_rgba(generator.figure, dpi)
+    _payloads["rgba"] = np.asarray(image).copy()
+    _payloads["png"] = generator.export_bytes(OutputFormat.PNG, dpi)
+    _payloads["dxf"] = generator.export_bytes(OutputFormat.DXF)
+    plt.close(generator.figure)
+    return {kind: np.asarray(payload).nbytes if kind == "rgba" else len(payload)
+            for kind, payload in _payloads.items()}
+
+
+def _fetch(kind: str, shared: bool):
+    payload = _payloads[kind]
+    return hand_off(payload) if shared else payload
+
+
+def private_kb() -> int:
+    """Private resident memory of this process, 0 where /proc is unavailable"""
+    try:
+        with open("/proc/self/status") as f:
+            for line in f:
+                if line.startswith("RssAnon:"):
+                    return int(line.split()[1])
+    except OSError:
+        pass
+    return 0
+
+
+def fetch(executor, kind: str, shared: bool):
+    start = time.perf_counter()
+    data = receive(executor.submit(_fetch, kind, shared).result())
+    return data, time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark pickled versus shared-memory worker results')
+    parser.add_argument('--dpi', type=int, default=300, help='Raster resolution (default: 300)')
+    parser.add_argument('--repeat', type=int, default=5, help='Fetches per payload and transport (default: 5)')
+    args = parser.parse_args()
+
+    # One worker holds the payloads, so every fetch reaches it
+    with ProcessPoolExecutor(max_workers=1) as executor:
+        sizes = executor.submit(_prepare, args.dpi).result()
+        print(f"hand-off directory: {handoff_dir()}")
+        print(f"{'payload':<8} {'MB':>8} {'transport':<10} {'latency ms':>11} {'heap peak MB':>13} {'held MB':>8}")
+        for kind in PAYLOADS:
+            reference = None
+            for shared in (False, True):
+                fetch(executor, kind, shared)  # warm-up
+                latencies = [fetch(executor, kind, shared)[1] for _ in range(args.repeat)]
+
+                before = private_kb()
+                tracemalloc.start()
+                data, _ = fetch(executor, kind, shared)
+                _, peak = tracemalloc.get_traced_memory()
+                tracemalloc.stop()
+                held = private_kb() - before
+
+                if reference is None:
+                    reference = data
+                elif not np.array_equal(np.frombuffer(reference, np.uint8), np.frombuffer(data, np.uint8)):
+                    raise AssertionError(f"{kind} differs between transports")
+                print(f"{kind:<8} {sizes[kind] / 1e6:>8.2f} {'shared' if shared else 'pickle':<10} "
+                      f"{np.median(latencies) * 1e3:>11.1f} {peak / 1e6:>13.1f} {held / 1024:>8.1f}")
+                del data
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+"""
+Metrics overhead benchmark
+
+Times the registry operations used on the render path and compares what one
+render records with the time of the render itself.
+
+Usage:
+    python benchmarks/bench_metrics.py [--ops 200000] [--bridge beam]
+"""
+
+import argparse
+import os
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+import matplotlib
+matplotlib.use('Agg')
+import matplotlib.pyplot as plt
+
+from bridge_drawings import BridgeDrawingGenerator, BridgeParameters, BridgeType, OutputFormat
+from bridge_metrics import MetricsRegistry
+
+
+def per_op(ops: int, func) -> float:
+    start = time.perf_counter()
+    for _ in range(ops):
+        func()
+    return (time.perf_counter() - start) / ops
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark the cost of recording metrics')
+    parser.add_argument('--ops', type=int, default=200000, help='Operations per measurement (default: 200000)')
+    parser.add_argument('--bridge', default='beam', choices=[bt.value for bt in BridgeType],
+                        help='Bridge type rendered for comparison (default: beam)')
+    args = parser.parse_args()
+
+    registry = MetricsRegistry()
+    counter = registry.counter("bench_total", "", ("bridge_type", "format"))
+    histogram = registry.histogram("bench_seconds", "", ("stage",))
+    inc_s = per_op(args.ops, lambda: counter.inc("beam", "png"))
+    observe_s = per_op(args.ops, lambda: histogram.observe(0.123, "export_png"))
+    print(f"counter.inc        {inc_s * 1e9:8.0f} ns")
+    print(f"histogram.observe  {observe_s * 1e9:8.0f} ns")
+
+    params = BridgeParameters(span_length=100, deck_width=12, height=20, supports=2,
+                              load_capacity=50, material='steel')
+    generator = BridgeDrawingGenerator(BridgeType(args.bridge), params)
+    start = time.perf_counter()
+    generator.generate_drawing()
+    generator.export_bytes(OutputFormat.PNG, dpi=100)
+    render_s = time.perf_counter() - start
+    plt.close(generator.figure)
+
+    # generate observes latency and artist count, export observes latency and counts renders and bytes
+    recorded_s = 3 * observe_s + 2 * inc_s
+    print(f"render             {render_s * 1e3:8.1f} ms")
+    print(f"metrics per render {recorded_s * 1e6:8.1f} us ({recorded_s / render_s:.4%} of the render)")
+    print(f"exposition         {per_op(100, registry.exposition) * 1e6:8.1f} us")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
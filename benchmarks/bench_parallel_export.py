@@ -0,0 +1,62 @@
+#!/usr/bin/env python3
+"""
+Parallel export benchmark
+
+Times OutputFormat.ALL exported serially by save_drawing against the
+snapshot-and-fan-out path in bridge_export, for a few bridge sizes.
+
+Usage:
+    python benchmarks/bench_parallel_export.py [--dpi 300]
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+import matplotlib
+matplotlib.use('Agg')
+import matplotlib.pyplot as plt
+
+from bridge_drawings import BridgeDrawingGenerator, BridgeParameters, BridgeType, OutputFormat
+from bridge_export import export_parallel
+
+
+CASES = [
+    (BridgeType.BEAM, 60, 1),
+    (BridgeType.TRUSS, 200, 9),
+    (BridgeType.SLAB, 400, 29),
+]
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark serial versus parallel multi-format export')
+    parser.add_argument('--dpi', type=int, default=300, help='Raster resolution (default: 300)')
+    args = parser.parse_args()
+
+    print(f"{'bridge':<10} {'span':>6} {'serial s':>9} {'parallel s':>11} {'speed-up':>9}")
+    with tempfile.TemporaryDirectory() as tmp:
+        for bridge_type, span, supports in CASES:
+            params = BridgeParameters(span_length=span, deck_width=12, height=25, supports=supports,
+                                      load_capacity=50, material='steel')
+            generator = BridgeDrawingGenerator(bridge_type, params)
+            generator.generate_drawing()
+
+            start = time.perf_counter()
+            generator.save_drawing(os.path.join(tmp, "serial"), OutputFormat.ALL, dpi=args.dpi)
+            serial = time.perf_counter() - start
+            start = time.perf_counter()
+            export_parallel(generator, [OutputFormat.ALL], args.dpi, os.path.join(tmp, "parallel"))
+            parallel = time.perf_counter() - start
+            plt.close(generator.figure)
+
+            print(f"{bridge_type.value:<10} {span:>6} {serial:>9.2f} {parallel:>11.2f} {serial / parallel:>8.1f}x")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
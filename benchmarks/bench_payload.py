@@ -0,0 +1,60 @@
+#!/usr/bin/env python3
+"""
+Client-side preview benchmark
+
+For each example bridge, compares the server time and bytes of the geometry
+payload the browser draws itself (bridge_payload.py) against rasterising the
+preview as a PNG at the preview and download resolutions.
+
+Usage:
+    python benchmarks/bench_payload.py [--dpi 100 300]
+"""
+
+import argparse
+import gzip
+import os
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+import matplotlib
+matplotlib.use('Agg')
+import matplotlib.pyplot as plt
+
+from bridge_drawings import BridgeDrawingGenerator, OutputFormat, create_example_bridges
+from bridge_payload import encode_payload, generator_payload
+from bridge_raster import RasterOptions
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark the geometry payload against PNG previews')
+    parser.add_argument('--dpi', type=int, nargs='+', default=[100, 300],
+                        help='PNG resolutions to compare against (default: 100 300)')
+    args = parser.parse_args()
+
+    print(f"{'bridge':<14} {'payload ms':>10} {'bytes':>8} {'gzip':>7} "
+          + " ".join(f"{f'png{dpi} ms':>10} {'bytes':>8}" for dpi in args.dpi))
+    for bridge_type, params, _ in create_example_bridges():
+        generator = BridgeDrawingGenerator(bridge_type, params)
+        generator.generate_drawing()
+
+        start = time.perf_counter()
+        payload = encode_payload(generator_payload(generator))
+        payload_s = time.perf_counter() - start
+
+        pngs = []
+        for dpi in args.dpi:
+            start = time.perf_counter()
+            png = generator.export_bytes(OutputFormat.PNG, dpi, RasterOptions(compress_level=1))
+            pngs.append((time.perf_counter() - start, len(png)))
+        plt.close(generator.figure)
+
+        print(f"{bridge_type.value:<14} {payload_s * 1e3:>10.1f} {len(payload):>8} {len(gzip.compress(payload)):>7} "
+              + " ".join(f"{seconds * 1e3:>10.1f} {size:>8}" for seconds, size in pngs))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
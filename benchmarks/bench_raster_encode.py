@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+"""
+Raster encoding benchmark
+
+Part 1 re-encodes every PNG in test_png/ from its decoded RGBA pixels with
+each encoder setting and compares encode time and byte size against the
+committed file.
+
+Part 2 renders the example bridges and compares savefig(format='png') with
+the draw-once Agg buffer path in bridge_raster.encode_figure.
+
+Usage:
+    python benchmarks/bench_raster_encode.py [--dpi 300] [--repeat 1]
+"""
+
+import argparse
+import glob
+import os
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+import matplotlib
+matplotlib.use('Agg')
+import matplotlib.pyplot as plt
+from PIL import Image
+
+from bridge_drawings import BridgeDrawingGenerator, OutputFormat, create_example_bridges
+from bridge_raster import RasterOptions, encode_figure, encode_image
+
+
+SETTINGS = [
+    ("png rgb z6", RasterOptions()),
+    ("png rgb z1", RasterOptions(compress_level=1)),
+    ("png pal256 z6", RasterOptions(colors=256)),
+    ("png pal64 z9", RasterOptions(colors=64, compress_level=9)),
+    ("webp lossless", RasterOptions(format="webp", compress_level=4)),
+    ("webp q90", RasterOptions(format="webp", lossless=False, compress_level=4)),
+]
+
+
+def _timed(func, repeat: int):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func()
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+def bench_test_png(repeat: int):
+    """Re-encode the committed reference images"""
+    print("Re-encoding test_png/ (best of %d)" % repeat)
+    print(f"{'file':<34} {'setting':<15} {'seconds':>8} {'bytes':>10} {'vs file':>8}")
+    totals = {name: [0.0, 0] for name, _ in SETTINGS}
+    original_total = 0
+    for path in sorted(glob.glob(os.path.join(ROOT, "test_png", "*.png"))):
+        original = os.path.getsize(path)
+        original_total += original
+        with Image.open(path) as image:
+            image.load()
+            for name, options in SETTINGS:
+                seconds, data = _timed(lambda: encode_image(image, options), repeat)
+                totals[name][0] += seconds
+                totals[name][1] += len(data)
+                print(f"{os.path.basename(path):<34} {name:<15} {seconds:>8.3f} {len(data):>10} "
+                      f"{len(data) / original:>7.0%}")
+    print()
+    print(f"{'TOTAL':<34} {'original':<15} {'':>8} {original_total:>10}")
+    for name, (seconds, size) in totals.items():
+        print(f"{'TOTAL':<34} {name:<15} {seconds:>8.3f} {size:>10} {size / original_total:>7.0%}")
+    print()
+
+
+def bench_render_paths(dpi: int, repeat: int):
+    """savefig versus draw-once encoding on freshly generated drawings"""
+    print(f"Render + encode at {dpi} dpi (best of {repeat})")
+    print(f"{'bridge':<14} {'path':<20} {'seconds':>8} {'bytes':>10}")
+    for bridge_type, params, _ in create_example_bridges():
+        generator = BridgeDrawingGenerator(bridge_type, params)
+        generator.generate_drawing()
+        seconds, data = _timed(lambda: generator.export_bytes(OutputFormat.PNG, dpi), repeat)
+        print(f"{bridge_type.value:<14} {'savefig png':<20} {seconds:>8.3f} {len(data):>10}")
+        for name, options in SETTINGS:
+            seconds, data = _timed(lambda: encode_figure(generator.figure, dpi, options), repeat)
+            print(f"{bridge_type.value:<14} {name:<20} {seconds:>8.3f} {len(data):>10}")
+        plt.close(generator.figure)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark raster encoders')
+    parser.add_argument('--dpi', type=int, default=300, help='Render resolution (default: 300)')
+    parser.add_argument('--repeat', type=int, default=1, help='Repetitions, best time is reported')
+    parser.add_argument('--skip-test-png', action='store_true', help='Only benchmark render paths')
+    args = parser.parse_args()
+
+    if not args.skip_test_png:
+        bench_test_png(args.repeat)
+    bench_render_paths(args.dpi, args.repeat)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
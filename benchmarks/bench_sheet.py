@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+"""
+Static sheet cache benchmark
+
+Renders a batch of drawings that share one sheet (same type, span and
+sheet size; the number of supports and the material vary, as in a design
+sweep) through the Pillow raster path, once drawing every sheet in full
+and once compositing the cached sheet (bridge_sheet.py). Reports the draw
+time per drawing at each dpi, leaving out encoding, and the largest pixel
+difference between the two.
+
+Usage:
+    python benchmarks/bench_sheet.py [--dpi 100 300] [--count 8]
+"""
+
+import argparse
+import os
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+import matplotlib
+matplotlib.use('Agg')
+import matplotlib.pyplot as plt
+import numpy as np
+
+from bridge_drawings import BridgeDrawingGenerator, BridgeParameters, BridgeType
+from bridge_raster import render_rgba
+from bridge_sheet import SheetCache
+
+
+def batch(count: int):
+    materials = ('steel', 'concrete', 'composite')
+    return [BridgeParameters(span_length=120, deck_width=12, height=25, supports=i % 6,
+                             load_capacity=50, material=materials[i % len(materials)])
+            for i in range(count)]
+
+
+def draw(figure, dpi: float, cache) -> np.ndarray:
+    original_dpi = figure.dpi
+    try:
+        image, _ = render_rgba(figure, dpi, cache)
+        return np.asarray(image).copy()
+    finally:
+        figure.dpi = original_dpi
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark cached sheet compositing against full draws')
+    parser.add_argument('--dpi', type=int, nargs='+', default=[100, 300],
+                        help='Resolutions to render at (default: 100 300)')
+    parser.add_argument('--count', type=int, default=8, help='Drawings per batch (default: 8)')
+    parser.add_argument('--type', choices=[bt.value for bt in BridgeType], default='beam',
+                        help='Bridge type (default: beam)')
+    args = parser.parse_args()
+
+    generators = []
+    for params in batch(args.count):
+        generator = BridgeDrawingGenerator(BridgeType(args.type), params)
+        generator.generate_drawing()
+        generators.append(generator)
+
+    print(f"{'dpi':>5} {'full ms':>8} {'cached ms':>10} {'first ms':>9} {'speed-up':>9} {'sheet KB':>9} {'max diff':>9}")
+    for dpi in args.dpi:
+        draw(generators[0].figure, dpi, None)  # font cache warm-up
+        cache = SheetCache()
+        full, cached, worst = [], [], 0
+        for generator in generators:
+            start = time.perf_counter()
+            reference = draw(generator.figure, dpi, None)
+            full.append(time.perf_counter() - start)
+            start = time.perf_counter()
+            composited = draw(generator.figure, dpi, cache)
+            cached.append(time.perf_counter() - start)
+            worst = max(worst, int(np.abs(reference.astype(int) - composited.astype(int)).max()))
+        hits = cached[1:] or cached
+        print(f"{dpi:>5} {np.mean(full) * 1e3:>8.1f} {np.mean(hits) * 1e3:>10.1f} {cached[0] * 1e3:>9.1f} "
+              f"{np.mean(full) / np.mean(hits):>8.2f}x {cache.nbytes / 1024:>9.0f} {worst:>9}")
+
+    for generator in generators:
+        plt.close(generator.figure)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,61 @@
+#!/usr/bin/env python3
+"""
+Geometry simplification benchmark
+
+Renders each bridge type with and without the simplification pass and
+reports line/entity counts, SVG and DXF sizes, and render time.
+
+Usage:
+    python benchmarks/bench_simplify.py [--span 200] [--supports 9]
+"""
+
+import argparse
+import os
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+import matplotlib
+matplotlib.use('Agg')
+import matplotlib.pyplot as plt
+
+from bridge_drawings import BridgeDrawingGenerator, BridgeParameters, BridgeType, OutputFormat
+
+
+def measure(bridge_type: BridgeType, params: BridgeParameters, simplify: bool):
+    generator = BridgeDrawingGenerator(bridge_type, params)
+    generator.simplify_geometry = simplify
+    start = time.perf_counter()
+    generator.generate_drawing()
+    svg = generator.export_bytes(OutputFormat.SVG)
+    seconds = time.perf_counter() - start
+    lines = len(generator.ax_elevation.lines) + len(generator.ax_plan.lines)
+    plt.close(generator.figure)
+    doc = generator.build_dxf_document()
+    entities = len(doc.modelspace())
+    dxf = generator.dxf_bytes()
+    return lines, len(svg), entities, len(dxf), seconds
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark geometry simplification')
+    parser.add_argument('--span', type=float, default=200.0, help='Span length in metres (default: 200)')
+    parser.add_argument('--supports', type=int, default=9, help='Intermediate supports (default: 9)')
+    args = parser.parse_args()
+
+    print(f"{'bridge':<14} {'lines':>11} {'svg bytes':>17} {'dxf entities':>13} {'dxf bytes':>15} {'seconds':>13}")
+    for bridge_type in BridgeType:
+        params = BridgeParameters(span_length=args.span, deck_width=12, height=25, supports=args.supports,
+                                  load_capacity=50, material='steel')
+        before = measure(bridge_type, params, False)
+        after = measure(bridge_type, params, True)
+        print(f"{bridge_type.value:<14} {before[0]:>5}->{after[0]:<5} {before[1]:>8}->{after[1]:<8} "
+              f"{before[2]:>6}->{after[2]:<6} {before[3]:>7}->{after[3]:<7} "
+              f"{before[4]:>6.2f}->{after[4]:<6.2f}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+"""
+Per-span layout benchmark
+
+Lays out bridges with a growing number of random unequal spans and reports
+the time spent in the span table (chainages, pier levels, panel points) and
+in generate_drawing, to show that both grow linearly with the span count.
+
+Usage:
+    python benchmarks/bench_spans.py [--spans 10 100 300 1000] [--types beam truss arch]
+"""
+
+import argparse
+import os
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+import matplotlib
+matplotlib.use('Agg')
+import matplotlib.pyplot as plt
+import numpy as np
+
+from bridge_drawings import BridgeDrawingGenerator, BridgeParameters, BridgeType
+from bridge_spans import SpanTable
+
+
+def best_of(repeat: int, func) -> float:
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def layout(table: SpanTable):
+    table.chainages
+    table.midpoints
+    table.pier_tops(20.0)
+    table.subdivide(table.panel_counts(10.0, 4))
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark layout of many unequal spans')
+    parser.add_argument('--spans', type=int, nargs='+', default=[10, 100, 300, 1000],
+                        help='Span counts to lay out (default: 10 100 300 1000)')
+    parser.add_argument('--types', nargs='+', default=['beam', 'truss', 'arch'],
+                        choices=[bt.value for bt in BridgeType], help='Bridge types to draw (default: beam truss arch)')
+    parser.add_argument('--repeat', type=int, default=3, help='Runs per measurement, best is kept (default: 3)')
+    parser.add_argument('--seed', type=int, default=0, help='Random seed for the span lengths (default: 0)')
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(args.seed)
+    print(f"{'spans':>6} {'table ms':>9} " + " ".join(f"{t + ' s':>14}" for t in args.types)
+          + " " + " ".join(f"{t + ' us/span':>16}" for t in args.types))
+    for count in args.spans:
+        lengths = rng.uniform(20.0, 60.0, count).round(1)
+        pier_heights = rng.uniform(14.0, 20.0, count - 1).round(1)
+        table = SpanTable.from_lengths(lengths, pier_heights)
+        table_s = best_of(args.repeat, lambda: layout(table))
+
+        draw_s = []
+        for bridge_type in args.types:
+            params = BridgeParameters(span_length=0.0, deck_width=12, height=25, supports=0, load_capacity=50,
+                                      material='concrete', span_lengths=lengths.tolist(),
+                                      pier_heights=pier_heights.tolist())
+            generator = BridgeDrawingGenerator(BridgeType(bridge_type), params)
+
+            def draw():
+                generator.generate_drawing()
+                plt.close(generator.figure)
+            draw_s.append(best_of(args.repeat, draw))
+
+        print(f"{count:>6} {table_s * 1e3:>9.3f} " + " ".join(f"{s:>14.3f}" for s in draw_s)
+              + " " + " ".join(f"{s / count * 1e6:>16.0f}" for s in draw_s))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
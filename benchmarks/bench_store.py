@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+"""
+Member store benchmark
+
+For each example bridge, compares generating from scratch and exporting
+against loading a saved .npz member store (memory-mapped and fully read)
+and exporting from it.
+
+Usage:
+    python benchmarks/bench_store.py [--format svg] [--dpi 150]
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+import matplotlib
+matplotlib.use('Agg')
+import matplotlib.pyplot as plt
+
+from bridge_drawings import BridgeDrawingGenerator, OutputFormat, create_example_bridges
+from bridge_store import MemberStore
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark re-export from the member store')
+    parser.add_argument('--format', choices=['png', 'svg', 'pdf', 'dxf', 'webp'], default='svg',
+                       help='Export format (default: svg)')
+    parser.add_argument('--dpi', type=int, default=150, help='Raster resolution (default: 150)')
+    args = parser.parse_args()
+    output_format = OutputFormat(args.format)
+
+    print(f"{'bridge':<14} {'store bytes':>11} {'generate':>9} {'load mmap':>10} {'load read':>10} "
+          f"{'rebuild':>8} {'export new':>11} {'export store':>13}")
+    with tempfile.TemporaryDirectory() as tmp:
+        for bridge_type, params, _ in create_example_bridges():
+            start = time.perf_counter()
+            generator = BridgeDrawingGenerator(bridge_type, params)
+            generator.generate_drawing()
+            generate = time.perf_counter() - start
+            start = time.perf_counter()
+            generator.export_bytes(output_format, args.dpi)
+            export_new = time.perf_counter() - start
+
+            path = os.path.join(tmp, f"{bridge_type.value}.npz")
+            MemberStore.from_generator(generator).save(path)
+            plt.close(generator.figure)
+
+            start = time.perf_counter()
+            MemberStore.load(path, mmap=False)
+            load_read = time.perf_counter() - start
+            start = time.perf_counter()
+            store = MemberStore.load(path)
+            load_mmap = time.perf_counter() - start
+            start = time.perf_counter()
+            stored = store.to_generator()
+            rebuild = time.perf_counter() - start
+            start = time.perf_counter()
+            stored.export_bytes(output_format, args.dpi)
+            export_store = time.perf_counter() - start
+            plt.close(stored.figure)
+
+            print(f"{bridge_type.value:<14} {os.path.getsize(path):>11} {generate:>9.3f} {load_mmap:>10.3f} "
+                  f"{load_read:>10.3f} {rebuild:>8.3f} {export_new:>11.3f} {export_store:>13.3f}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
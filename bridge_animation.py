@@ -0,0 +1,423 @@
+"""
+Construction-Sequence Animation
+
+Exports the erection sequence of a bridge as GIF, MP4 or a directory of PNG
+frames from a single drawing: the figure is built once by generate_drawing,
+its members are sorted into construction stages, and every frame only
+reveals what was built since the previous one:
+
+- foundations, then piers, towers and abutments, each in one frame
+- deck and superstructure, and cables, erected span by span by moving a
+  clip front along the chainage
+- dimensions and annotations last, as the finished drawing
+
+The sheet without any members (frame, axes, ticks, titles) is rendered
+once and kept as a background buffer. For each frame the changed strip is
+restored from it and only the members overlapping that strip are drawn
+again, clipped to it, so a frame costs a fraction of a full render however
+many spans the bridge has. Gridlines stay part of the background, under
+the members. The last frame is a full draw and matches the exported
+drawing.
+
+Stages come from the generator's colour scheme. A bridge type plugin may
+reorder them with CONSTRUCTION_STAGES and reassign members with a
+construction_stage(generator, artist) function returning a stage name, or
+None for the default.
+
+Usage:
+    python bridge_animation.py --type suspension --output erection.gif
+    python bridge_animation.py --spans 30 --output frames/
+"""
+
+from dataclasses import dataclass
+from typing import Dict, Iterator, List, Optional, Sequence, Tuple
+import argparse
+import os
+import shutil
+import subprocess
+import time
+
+import numpy as np
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.collections import LineCollection
+from matplotlib.colors import to_rgb
+from matplotlib.lines import Line2D
+from matplotlib.text import Text
+from matplotlib.transforms import Bbox
+from PIL import Image
+
+from bridge_cull import cull_subpixel
+
+STAGES = ('foundations', 'substructure', 'superstructure', 'cables', 'finishing')
+ERECTED_STAGES = ('superstructure', 'cables')  # revealed span by span along the chainage
+STAGE_TITLES = {
+    'foundations': 'Foundations',
+    'substructure': 'Piers and abutments',
+    'superstructure': 'Deck erection',
+    'cables': 'Cable installation',
+    'finishing': 'Completed structure',
+}
+
+DEFAULT_DPI = 60
+DEFAULT_FPS = 4
+MIN_ERECTION_STEPS = 8       # single and few-span decks are still erected in this many steps
+FINAL_HOLD_FRAMES = 4        # the finished drawing stays on screen longer
+FORMATS = ('gif', 'mp4', 'frames')
+
+
+@dataclass
+class AnimationStats:
+    """Frame counts and timings of one animation export"""
+    frames: int = 0
+    members: int = 0
+    setup_seconds: float = 0.0   # drawing if needed, culling, staging and the background render
+    frame_seconds: float = 0.0   # all incremental frames
+    final_seconds: float = 0.0   # the full draw of the finished drawing
+
+    @property
+    def seconds_per_frame(self) -> float:
+        return self.frame_seconds / max(1, self.frames - 1)
+
+    def __str__(self):
+        return (f"{self.frames} frames of {self.members} members: setup {self.setup_seconds * 1e3:.0f} ms, "
+                f"{self.seconds_per_frame * 1e3:.1f} ms per frame, final {self.final_seconds * 1e3:.0f} ms")
+
+
+def stage_order(plugin) -> Tuple[str, ...]:
+    """Construction stages of a bridge type plugin, in erection order"""
+    order = tuple(getattr(plugin, 'CONSTRUCTION_STAGES', STAGES))
+    unknown = [stage for stage in order if stage not in STAGES]
+    if unknown:
+        raise ValueError(f"Unknown construction stages: {', '.join(unknown)}")
+    return order
+
+
+def _is_line(artist) -> bool:
+    return isinstance(artist, (Line2D, LineCollection))
+
+
+def _artist_color(artist) -> Optional[Tuple[float, float, float]]:
+    """Line colour of lines, fill colour of filled members (edge colour when unfilled)"""
+    if isinstance(artist, Line2D):
+        return to_rgb(artist.get_color())
+    colors = np.atleast_2d(artist.get_edgecolor() if _is_line(artist) else artist.get_facecolor())
+    if not _is_line(artist) and (not len(colors) or colors[0][3] == 0):
+        colors = np.atleast_2d(artist.get_edgecolor())
+    return tuple(colors[0][:3]) if len(colors) else None
+
+
+def classify_artist(generator, artist, plugin=None) -> str:
+    """Construction stage of one drawn member"""
+    if isinstance(artist, Text):
+        return 'finishing'
+    hook = getattr(plugin, 'construction_stage', None)
+    if hook is not None:
+        stage = hook(generator, artist)
+        if stage is not None:
+            return stage
+
+    scheme = {to_rgb(value): key for key, value in generator.colors.items()}
+    key = scheme.get(_artist_color(artist))
+    if key == 'foundations':
+        return 'foundations'
+    if key == 'supports':
+        return 'substructure'
+    if key == 'annotations':
+        return 'finishing'
+    # Stay cables are drawn as red lines and hangers as grey ones
+    if key in ('dimensions', 'deck') and _is_line(artist):
+        return 'cables'
+    return 'superstructure'
+
+
+def erection_fronts(spans, min_steps: int = MIN_ERECTION_STEPS) -> np.ndarray:
+    """Chainages the erection front stops at: every span end, subdivided so there are at least min_steps"""
+    per_span = max(1, -(-min_steps // spans.count))
+    fronts = (spans.starts[:, None] + spans.lengths[:, None] * np.arange(1, per_span + 1) / per_span).reshape(-1)
+    # The last step runs to the end of the axes, past abutments and overhangs
+    fronts[-1] = np.inf
+    return fronts
+
+
+def _union(boxes: Sequence[Bbox]) -> Optional[Bbox]:
+    boxes = [box for box in boxes if box is not None]
+    return Bbox.union(boxes) if boxes else None
+
+
+def _snap(box: Bbox) -> Bbox:
+    """Grow a pixel region to whole pixels, so restores and clips cover the same pixels"""
+    return Bbox.from_extents(np.floor(box.x0), np.floor(box.y0), np.ceil(box.x1), np.ceil(box.y1))
+
+
+def _intersect(a: Optional[Bbox], b: Optional[Bbox]) -> Optional[Bbox]:
+    if a is None or b is None:
+        return None
+    box = Bbox.intersection(a, b)
+    return box if box is not None and box.width > 0 and box.height > 0 else None
+
+
+class _AxesStages:
+    """The staged members of one axes, in draw order, with their pixel extents"""
+
+    def __init__(self, generator, ax, plugin):
+        self.ax = ax
+        drawn = set(ax.patches) | set(ax.lines) | set(ax.collections) | set(ax.texts)
+        children = [artist for artist in ax.get_children() if artist in drawn and artist.get_visible()]
+        self.stage = {artist: classify_artist(generator, artist, plugin) for artist in children}
+        # Same order as Axes.draw: stable sort on zorder
+        self.members = sorted((artist for artist, stage in self.stage.items() if stage != 'finishing'),
+                              key=lambda artist: artist.get_zorder())
+
+    def measure(self, renderer, pad: float):
+        """Pixel extents, once a draw has applied the axes aspect and layout"""
+        self.pad = pad
+        self.extent = {artist: artist.get_window_extent(renderer).padded(pad) for artist in self.members}
+        # Members keep clear of the spines, which stay in the background
+        self.interior = _snap(self.ax.bbox.padded(-2))
+        self.stage_extent = {stage: _intersect(_union([self.extent[artist] for artist in self.members
+                                                      if self.stage[artist] == stage]), self.interior)
+                             for stage in STAGES}
+
+    def front_px(self, chainage: float) -> float:
+        if np.isinf(chainage):
+            return self.interior.x1
+        return float(np.round(self.ax.transData.transform((chainage, 0))[0]))
+
+    def strip(self, stage: str, start: float, stop: float) -> Optional[Bbox]:
+        """Pixel region of a stage between two erection fronts"""
+        x0 = self.front_px(start) if np.isfinite(start) else self.interior.x0
+        x1 = self.front_px(stop)
+        box = Bbox.from_extents(x0 - self.pad, self.interior.y0, x1 + self.pad, self.interior.y1)
+        return _intersect(box, self.stage_extent[stage])
+
+
+def _linewidth_px(figure, dpi: float) -> float:
+    """Widest member outline in pixels"""
+    widths = [np.max(artist.get_linewidth(), initial=0)
+              for ax in figure.axes for artist in ax.lines + ax.patches + ax.collections]
+    return max(widths, default=1.0) * dpi / 72
+
+
+def _save_state(artists) -> List[tuple]:
+    return [(artist, artist.get_visible(), artist.get_clip_box(), artist.get_clip_on()) for artist in artists]
+
+
+def _restore_state(state: List[tuple]):
+    for artist, visible, clip_box, clip_on in state:
+        artist.set_visible(visible)
+        artist.set_clip_box(clip_box)
+        artist.set_clip_on(clip_on)
+
+
+def construction_frames(generator, dpi: float = DEFAULT_DPI, min_steps: int = MIN_ERECTION_STEPS,
+                        caption: bool = True,
+                        stats: Optional[AnimationStats] = None) -> Iterator[Tuple[str, np.ndarray]]:
+    """Yield (label, RGBA pixels) for every frame of the erection sequence
+
+    The pixels are a view of the live Agg buffer and are overwritten by the
+    next frame; copy them to keep them. The figure is restored when the
+    iteration finishes or is closed.
+    """
+    stats = stats if stats is not None else AnimationStats()
+    started = time.perf_counter()
+    if not generator.figure:
+        generator.generate_drawing()
+    figure = generator.figure
+    plugin = generator.plugin
+    order = stage_order(plugin)
+    fronts = erection_fronts(generator.params.span_table(), min_steps)
+
+    original_dpi = figure.dpi
+    canvas = FigureCanvasAgg(figure)
+    figure.dpi = dpi
+    label = figure.text(0.01, 0.005, '', fontsize=9, fontweight='bold', ha='left', va='bottom', visible=caption)
+    try:
+        with cull_subpixel(figure, dpi, generator.cull_threshold_px):
+            layers = [_AxesStages(generator, ax, plugin) for ax in figure.axes]
+            staged = [artist for layer in layers for artist in layer.stage]
+            stats.members = sum(len(layer.members) for layer in layers)
+            state = _save_state(staged)
+            try:
+                for artist in staged:
+                    artist.set_visible(False)
+                    artist.set_clip_on(True)
+
+                # The empty sheet, kept for restoring changed regions
+                canvas.draw()
+                background = canvas.copy_from_bbox(figure.bbox)
+                height = figure.bbox.height
+                renderer = canvas.get_renderer()
+                pad = 2 + _linewidth_px(figure, dpi)
+                for layer in layers:
+                    layer.measure(renderer, pad)
+                built: Dict[str, float] = {}  # stage -> erection front reached, inf once complete
+                stats.setup_seconds = time.perf_counter() - started
+
+                def restore(box: Bbox):
+                    # Buffer regions are addressed from the top left with inclusive ends;
+                    # xy places the whole saved sheet
+                    canvas.restore_region(background, bbox=(int(box.x0), int(height - box.y1),
+                                                            int(box.x1) - 1, int(height - box.y0) - 1), xy=(0, 0))
+
+                def redraw(layer: _AxesStages, region: Bbox):
+                    region = _snap(region)
+                    restore(region)
+                    for artist in layer.members:
+                        front = built.get(layer.stage[artist])
+                        if front is None or not layer.extent[artist].overlaps(region):
+                            continue
+                        clip = region
+                        if np.isfinite(front):
+                            clip = _intersect(region, Bbox.from_extents(
+                                layer.interior.x0, layer.interior.y0, layer.front_px(front), layer.interior.y1))
+                        if clip is not None:
+                            artist.set_clip_box(clip)
+                            artist.set_visible(True)
+                            artist.draw(renderer)
+
+                def steps() -> Iterator[str]:
+                    """Draw the frames one by one, yielding their captions"""
+                    yield "Site"
+                    for number, stage in enumerate(order, 1):
+                        title = f"Stage {number}/{len(order)}: {STAGE_TITLES[stage]}"
+                        if stage == 'finishing' or not any(layer.stage_extent[stage] for layer in layers):
+                            continue
+                        if stage not in ERECTED_STAGES:
+                            built[stage] = np.inf
+                            for layer in layers:
+                                if layer.stage_extent[stage] is not None:
+                                    redraw(layer, layer.stage_extent[stage])
+                            yield title
+                            continue
+                        previous = -np.inf
+                        for step, front in enumerate(fronts, 1):
+                            built[stage] = front
+                            for layer in layers:
+                                region = layer.strip(stage, previous, front)
+                                if region is not None:
+                                    redraw(layer, region)
+                            previous = front
+                            yield f"{title} ({step}/{len(fronts)})"
+
+                tick = time.perf_counter()
+                for text in steps():
+                    if caption:
+                        old = label.get_window_extent(renderer) if label.get_text() else None
+                        label.set_text(text)
+                        restore(_snap(_union([old, label.get_window_extent(renderer)]).padded(2)))
+                        label.draw(renderer)
+                    stats.frames += 1
+                    stats.frame_seconds += time.perf_counter() - tick
+                    yield text, np.asarray(canvas.buffer_rgba())
+                    tick = time.perf_counter()
+            finally:
+                _restore_state(state)
+
+            # The finished drawing is drawn in full, exactly as it is exported
+            final_started = time.perf_counter()
+            text = f"Stage {len(order)}/{len(order)}: {STAGE_TITLES['finishing']}"
+            label.set_text(text)
+            canvas.draw()
+            stats.final_seconds = time.perf_counter() - final_started
+            stats.frames += 1
+            yield text, np.asarray(canvas.buffer_rgba())
+    finally:
+        label.remove()
+        figure.dpi = original_dpi
+
+
+def _frame_image(pixels: np.ndarray) -> Image.Image:
+    return Image.fromarray(pixels[..., :3])  # copies, so the buffer may move on
+
+
+def _write_gif(frames, path: str, fps: float):
+    images = [_frame_image(pixels).convert('P', palette=Image.Palette.ADAPTIVE) for _, pixels in frames]
+    durations = [int(1000 / fps)] * len(images)
+    durations[-1] *= FINAL_HOLD_FRAMES
+    images[0].save(path, save_all=True, append_images=images[1:], duration=durations, loop=0)
+
+
+def _write_mp4(frames, path: str, fps: float):
+    ffmpeg = shutil.which('ffmpeg')
+    if ffmpeg is None:
+        raise RuntimeError("MP4 export needs ffmpeg on the PATH; write a GIF or a frame directory instead")
+    process = None
+    try:
+        for _, pixels in frames:
+            if process is None:
+                height, width = pixels.shape[:2]
+                process = subprocess.Popen(
+                    [ffmpeg, '-y', '-loglevel', 'error', '-f', 'rawvideo', '-pix_fmt', 'rgba',
+                     '-s', f'{width}x{height}', '-r', str(fps), '-i', '-',
+                     '-vf', 'pad=ceil(iw/2)*2:ceil(ih/2)*2:color=white', '-pix_fmt', 'yuv420p', path],
+                    stdin=subprocess.PIPE)
+            process.stdin.write(pixels.tobytes())
+        for _ in range(FINAL_HOLD_FRAMES - 1):
+            process.stdin.write(pixels.tobytes())
+    finally:
+        if process is not None:
+            process.stdin.close()
+            if process.wait() != 0:
+                raise RuntimeError(f"ffmpeg failed writing {path}")
+
+
+def _write_frames(frames, directory: str):
+    os.makedirs(directory, exist_ok=True)
+    for index, (_, pixels) in enumerate(frames):
+        _frame_image(pixels).save(os.path.join(directory, f"frame_{index:04d}.png"), compress_level=1)
+
+
+def animation_format(path: str) -> str:
+    """gif or mp4 from the file extension, frames for anything else (a directory)"""
+    extension = os.path.splitext(path)[1].lower().lstrip('.')
+    return extension if extension in ('gif', 'mp4') else 'frames'
+
+
+def export_animation(generator, path: str, format: Optional[str] = None, dpi: float = DEFAULT_DPI,
+                     fps: float = DEFAULT_FPS, min_steps: int = MIN_ERECTION_STEPS,
+                     caption: bool = True) -> AnimationStats:
+    """Write the erection sequence to path as a GIF, an MP4 or a directory of PNG frames"""
+    format = format or animation_format(path)
+    if format not in FORMATS:
+        raise ValueError(f"Unsupported animation format: {format}")
+    stats = AnimationStats()
+    frames = construction_frames(generator, dpi, min_steps, caption, stats)
+    if format == 'gif':
+        _write_gif(frames, path, fps)
+    elif format == 'mp4':
+        _write_mp4(frames, path, fps)
+    else:
+        _write_frames(frames, path)
+    return stats
+
+
+def main():
+    from bridge_drawings import BridgeDrawingGenerator, BridgeParameters, resolve_bridge_type
+    from bridge_types import bridge_type_names
+
+    parser = argparse.ArgumentParser(description='Export a construction-sequence animation of a bridge')
+    parser.add_argument('--type', choices=bridge_type_names(), default='beam', help='Bridge type (default: beam)')
+    parser.add_argument('--span', type=float, default=100.0, help='Total length in metres (default: 100)')
+    parser.add_argument('--spans', type=int, default=3, help='Number of equal spans (default: 3)')
+    parser.add_argument('--width', type=float, default=12.0, help='Deck width in metres (default: 12)')
+    parser.add_argument('--height', type=float, default=20.0, help='Height in metres (default: 20)')
+    parser.add_argument('--output', default='erection.gif',
+                        help='.gif or .mp4 file, or a directory for PNG frames (default: erection.gif)')
+    parser.add_argument('--dpi', type=float, default=DEFAULT_DPI, help=f'Frame resolution (default: {DEFAULT_DPI})')
+    parser.add_argument('--fps', type=float, default=DEFAULT_FPS, help=f'Frames per second (default: {DEFAULT_FPS})')
+    parser.add_argument('--min-steps', type=int, default=MIN_ERECTION_STEPS,
+                        help=f'Fewest erection steps per stage (default: {MIN_ERECTION_STEPS})')
+    parser.add_argument('--no-caption', action='store_true', help='Leave out the stage caption')
+    args = parser.parse_args()
+
+    params = BridgeParameters(span_length=args.span, deck_width=args.width, height=args.height,
+                              supports=args.spans - 1, load_capacity=50, material='steel')
+    generator = BridgeDrawingGenerator(resolve_bridge_type(args.type), params)
+    stats = export_animation(generator, args.output, dpi=args.dpi, fps=args.fps, min_steps=args.min_steps,
+                             caption=not args.no_caption)
+    print(f"Wrote {args.output}: {stats}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
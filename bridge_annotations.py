@@ -0,0 +1,134 @@
+"""
+Collision-Free Annotation Placement
+
+A uniform-grid spatial hash over axis-aligned boxes (structure extents and
+already placed text) and a placer that tries candidate positions for each
+label in order of preference, keeping the first one that overlaps nothing.
+
+Each query only inspects the grid cells a candidate touches, so annotating
+every span and pier of a long bridge stays near-linear instead of comparing
+every label against every other label and member. The placer works in any
+2-D coordinate system and is shared by the matplotlib and DXF outputs.
+"""
+
+from collections import defaultdict
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+import math
+
+
+Box = Tuple[float, float, float, float]  # (x0, y0, x1, y1)
+
+
+def text_box(x: float, y: float, width: float, height: float,
+             ha: str = 'center', va: str = 'bottom') -> Box:
+    """Box of a text block anchored at (x, y) with matplotlib-style alignment"""
+    if ha == 'center':
+        x0 = x - width / 2
+    elif ha == 'right':
+        x0 = x - width
+    else:
+        x0 = x
+    if va == 'center':
+        y0 = y - height / 2
+    elif va == 'top':
+        y0 = y - height
+    else:
+        y0 = y
+    return x0, y0, x0 + width, y0 + height
+
+
+def text_extent(text: str, char_width: float, line_height: float) -> Tuple[float, float]:
+    """Approximate (width, height) of a possibly multi-line string"""
+    lines = text.split('\n')
+    return max(len(line) for line in lines) * char_width, len(lines) * line_height
+
+
+def boxes_overlap(a: Box, b: Box) -> bool:
+    return a[0] < b[2] and b[0] < a[2] and a[1] < b[3] and b[1] < a[3]
+
+
+class SpatialHash:
+    """Uniform grid of cells, each listing the boxes that touch it"""
+
+    def __init__(self, cell_size: float, max_cells_per_box: int = 4096):
+        if cell_size <= 0:
+            raise ValueError("cell_size must be positive")
+        self.cell_size = cell_size
+        self.max_cells_per_box = max_cells_per_box
+        self.boxes: List[Box] = []
+        self.cells: Dict[Tuple[int, int], List[int]] = defaultdict(list)
+        self.large: List[int] = []  # boxes too big to spread over the grid
+
+    def _cell_range(self, box: Box) -> Tuple[int, int, int, int]:
+        size = self.cell_size
+        return (int(math.floor(box[0] / size)), int(math.floor(box[1] / size)),
+                int(math.floor(box[2] / size)), int(math.floor(box[3] / size)))
+
+    def insert(self, box: Box) -> int:
+        index = len(self.boxes)
+        self.boxes.append(box)
+        i0, j0, i1, j1 = self._cell_range(box)
+        if (i1 - i0 + 1) * (j1 - j0 + 1) > self.max_cells_per_box:
+            self.large.append(index)
+            return index
+        for i in range(i0, i1 + 1):
+            for j in range(j0, j1 + 1):
+                self.cells[(i, j)].append(index)
+        return index
+
+    def intersects(self, box: Box) -> bool:
+        """True if box overlaps any stored box"""
+        boxes = self.boxes
+        for index in self.large:
+            if boxes_overlap(box, boxes[index]):
+                return True
+        i0, j0, i1, j1 = self._cell_range(box)
+        seen = set()
+        for i in range(i0, i1 + 1):
+            for j in range(j0, j1 + 1):
+                for index in self.cells.get((i, j), ()):
+                    if index not in seen:
+                        seen.add(index)
+                        if boxes_overlap(box, boxes[index]):
+                            return True
+        return False
+
+
+class AnnotationPlacer:
+    """Choose non-overlapping positions for labels among candidate boxes"""
+
+    def __init__(self, cell_size: float, padding: float = 0.0):
+        self.index = SpatialHash(cell_size)
+        self.padding = padding
+        self.placed: List[Box] = []
+
+    def _padded(self, box: Box) -> Box:
+        p = self.padding
+        return box[0] - p, box[1] - p, box[2] + p, box[3] + p
+
+    def add_obstacle(self, box: Box):
+        self.index.insert(box)
+
+    def add_obstacles(self, boxes: Iterable[Box]):
+        for box in boxes:
+            self.index.insert(box)
+
+    def is_free(self, box: Box) -> bool:
+        return not self.index.intersects(self._padded(box))
+
+    def place(self, candidates: Sequence[Box], force: bool = True) -> Optional[Box]:
+        """Reserve and return the first free candidate
+
+        When every candidate collides the first one is used if force is set,
+        otherwise nothing is reserved and None is returned.
+        """
+        for box in candidates:
+            if self.is_free(box):
+                break
+        else:
+            if not force or not candidates:
+                return None
+            box = candidates[0]
+        self.index.insert(box)
+        self.placed.append(box)
+        return box
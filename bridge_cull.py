@@ -0,0 +1,146 @@
+"""
+Sub-Pixel Detail Culling for Raster Output
+
+How large a member ends up on screen depends on the output resolution and
+on the drawing scale, so culling is decided per export from the figure's
+display transforms at the target dpi:
+
+- members smaller than the pixel threshold in both directions are hidden
+- rectangles thinner than the threshold in one direction (cross-beams,
+  joints) collapse to their centre lines
+- those centre lines and all other straight solid lines (rebar ticks, truss
+  members, cables) are merged into one line collection per style, so the
+  renderer pays per style instead of per member
+
+Everything is restored when the export finishes, so the same figure can be
+rendered at another resolution or as vector output afterwards. DXF output
+is built separately and is never culled.
+"""
+
+from collections import defaultdict
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Dict, List, Tuple
+
+import numpy as np
+
+
+DEFAULT_THRESHOLD_PX = 1.0
+POINTS_PER_INCH = 72.0
+
+
+@dataclass
+class CullStats:
+    """Artists hidden and merged for one export"""
+    examined: int = 0
+    dropped: int = 0
+    merged: int = 0
+    collections: int = 0
+
+    def __str__(self):
+        return (f"{self.examined} artists: {self.dropped} dropped, "
+                f"{self.merged} merged into {self.collections} collections")
+
+
+def _pixel_extent(points: np.ndarray, scale: float) -> Tuple[float, float]:
+    span = points.max(axis=0) - points.min(axis=0)
+    return span[0] * scale, span[1] * scale
+
+
+def _line_key(line) -> Tuple:
+    from matplotlib.colors import to_rgba
+    return (to_rgba(line.get_color(), line.get_alpha()), round(line.get_linewidth(), 3), line.get_zorder(),
+            line.get_solid_capstyle(), id(line.get_transform()))
+
+
+def _mergeable_line(line) -> bool:
+    return (len(line.get_xydata()) == 2 and line.get_linestyle() == '-'
+            and line.get_marker() in (None, 'None', '', ' ') and line.get_clip_on()
+            and line.get_path_effects() == [])
+
+
+def _visible_edge(patch) -> bool:
+    return patch.get_linewidth() > 0 and patch.get_edgecolor()[3] > 0
+
+
+def _merge_line(patch, thin_axis: int, thin_px: float, dpi: float):
+    """Centre line (in the patch's data coordinates) and style replacing a thin rectangle"""
+    unit = np.array([[0.5, 0.0], [0.5, 1.0]]) if thin_axis == 0 else np.array([[0.0, 0.5], [1.0, 0.5]])
+    segment = patch.get_patch_transform().transform(unit)
+    if _visible_edge(patch):
+        color, width = tuple(patch.get_edgecolor()), patch.get_linewidth()
+    else:
+        color, width = tuple(patch.get_facecolor()), thin_px * POINTS_PER_INCH / dpi
+    return segment, (color, round(width, 3), patch.get_zorder(), 'butt', id(patch.get_data_transform()))
+
+
+@contextmanager
+def cull_subpixel(figure, dpi: float, threshold_px: float = DEFAULT_THRESHOLD_PX):
+    """Hide or merge members that would render below threshold_px at dpi, for the duration of one export"""
+    from matplotlib.collections import LineCollection
+    from matplotlib.patches import Rectangle
+
+    stats = CullStats()
+    if threshold_px <= 0:
+        yield stats
+        return
+
+    scale = dpi / figure.dpi  # display coordinates are computed at the figure's own dpi
+    hidden = []
+    added = []
+    try:
+        for ax in figure.axes:
+            groups: Dict[Tuple, List[np.ndarray]] = defaultdict(list)
+            transforms = {}
+            for line in ax.lines:
+                if not line.get_visible() or len(line.get_xydata()) == 0:
+                    continue
+                stats.examined += 1
+                width, height = _pixel_extent(line.get_transform().transform(line.get_xydata()), scale)
+                if max(width, height) < threshold_px:
+                    hidden.append(line)
+                    stats.dropped += 1
+                elif _mergeable_line(line):
+                    key = _line_key(line)
+                    groups[key].append(line.get_xydata())
+                    transforms[key] = line.get_transform()
+                    hidden.append(line)
+                    stats.merged += 1
+            for patch in ax.patches:
+                if not patch.get_visible():
+                    continue
+                stats.examined += 1
+                transform = patch.get_transform()
+                if isinstance(patch, Rectangle):
+                    origin, x_end, y_end = transform.transform([[0, 0], [1, 0], [0, 1]])
+                    width = np.hypot(*(x_end - origin)) * scale
+                    height = np.hypot(*(y_end - origin)) * scale
+                else:
+                    width, height = _pixel_extent(patch.get_path().get_extents(transform).get_points(), scale)
+                if width < threshold_px and height < threshold_px:
+                    hidden.append(patch)
+                    stats.dropped += 1
+                elif isinstance(patch, Rectangle) and min(width, height) < threshold_px:
+                    thin_axis = 0 if width < height else 1
+                    segment, key = _merge_line(patch, thin_axis, min(width, height), dpi)
+                    groups[key].append(segment)
+                    transforms[key] = patch.get_data_transform()
+                    hidden.append(patch)
+                    stats.merged += 1
+
+            for key, segments in groups.items():
+                color, width, zorder, capstyle, _ = key
+                collection = LineCollection(segments, colors=[color], linewidths=[width], zorder=zorder,
+                                            transform=transforms[key], capstyle=capstyle)
+                ax.add_collection(collection, autolim=False)
+                added.append(collection)
+                stats.collections += 1
+
+        for artist in hidden:
+            artist.set_visible(False)
+        yield stats
+    finally:
+        for collection in added:
+            collection.remove()
+        for artist in hidden:
+            artist.set_visible(True)
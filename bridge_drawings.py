@@ -15,9 +15,14 @@ Features:
 - Automatic dimensioning and labeling
 """
 
+import matplotlib
 import matplotlib.pyplot as plt
 import matplotlib.patches as patches
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
 from matplotlib.patches import Arc, Circle, Polygon, Rectangle, FancyBboxPatch
+from matplotlib.collections import Collection
+from matplotlib.lines import Line2D
 import numpy as np
 import svgwrite
 from reportlab.pdfgen import canvas
@@ -26,12 +31,28 @@ from reportlab.lib.units import mm
 from reportlab.lib.colors import black, blue, red
 import math
 from dataclasses import dataclass
-from typing import List, Tuple, Optional, Dict, Any
+from typing import BinaryIO, List, Tuple, Optional, Dict, Any
 from enum import Enum
+from contextlib import nullcontext
 import argparse
+import io
 import os
+import threading
+import time
 import ezdxf
 
+from bridge_annotations import AnnotationPlacer, text_box, text_extent
+from bridge_cull import DEFAULT_THRESHOLD_PX, cull_subpixel
+from bridge_layouts import add_sheets, standard_sheets
+from bridge_metrics import ARTISTS, DXF_ENTITIES, OUTPUT_BYTES, RENDERS, STAGE_SECONDS
+from bridge_outputs import OutputManifest, fixed_dxf_metadata, write_if_changed, write_stable_dxf
+from bridge_raster import RasterOptions, encode_figure
+from bridge_sheet import SHEET_CACHE
+from bridge_simplify import simplify_axes_lines, simplify_dxf_lines
+from bridge_spans import SpanTable
+from bridge_transforms import plan_skew_transform
+from bridge_types import PluginBridgeType, bridge_type_names, get_plugin
+
 
 class BridgeType(Enum):
     """Enumeration of supported bridge types"""
@@ -50,9 +71,46 @@ class OutputFormat(Enum):
     PNG = "png"
     PDF = "pdf"
     DXF = "dxf"
+    WEBP = "webp"
     ALL = "all"
 
 
+# Fixed values used when a generator is in deterministic mode, so identical
+# inputs give byte-identical files
+DETERMINISTIC_SVG_SALT = "bridge-drawings"
+DETERMINISTIC_METADATA = {
+    'png': {},
+    'svg': {'Date': None},
+    'pdf': {'CreationDate': None},
+}
+
+# Serialises SVG exports, see BridgeDrawingGenerator._savefig
+_SVG_LOCK = threading.Lock()
+
+
+# DXF annotation text height and approximate character width as a fraction of it
+DXF_TEXT_HEIGHT = 1.5
+DXF_CHAR_WIDTH = 0.9
+
+
+def _stream_position(target) -> Optional[int]:
+    """Current offset of a writable stream, None for paths and unseekable streams"""
+    if isinstance(target, (str, os.PathLike)):
+        return None
+    try:
+        return target.tell()
+    except (AttributeError, OSError, ValueError):
+        return None
+
+
+def _written_size(target, start: Optional[int]) -> Optional[int]:
+    """Bytes written to a path or to a stream since start"""
+    if isinstance(target, (str, os.PathLike)):
+        return os.path.getsize(target)
+    end = _stream_position(target)
+    return None if start is None or end is None else end - start
+
+
 @dataclass
 class BridgeParameters:
     """Parameters defining bridge geometry and specifications"""
@@ -68,15 +126,73 @@ class BridgeParameters:
     foundation_depth: float = 5.0
     girder_depth: float = 2.0
     rail_height: float = 1.2
+    skew_angle: float = 0.0  # Plan skew of supports in degrees
+    span_lengths: Optional[List[float]] = None  # Unequal spans; overrides span_length and supports
+    pier_heights: Optional[List[float]] = None  # Pier top levels, one per intermediate support
     
     def __post_init__(self):
         """Validate parameters after initialization"""
+        if self.span_lengths is not None:
+            table = self.span_table()
+            self.span_lengths = table.lengths.tolist()
+            self.span_length = table.total
+            self.supports = table.count - 1
         if self.span_length <= 0:
             raise ValueError("Span length must be positive")
         if self.deck_width <= 0:
             raise ValueError("Deck width must be positive")
         if self.height <= 0:
             raise ValueError("Height must be positive")
+        if not -90 < self.skew_angle < 90:
+            raise ValueError("Skew angle must be between -90 and 90 degrees")
+        if self.pier_heights is not None:
+            self.pier_heights = self.span_table().pier_heights.tolist()  # validates their number
+    
+    def span_table(self) -> SpanTable:
+        """Per-span lengths and pier heights; equal spans when span_lengths is not given"""
+        if self.span_lengths is not None:
+            return SpanTable.from_lengths(self.span_lengths, self.pier_heights)
+        table = SpanTable.equal(self.span_length, self.supports + 1)
+        if self.pier_heights is not None:
+            table = SpanTable(table.lengths, self.pier_heights)
+        return table
+
+
+def resolve_bridge_type(name: str):
+    """BridgeType member of a built-in type name, else a PluginBridgeType for a registered plugin type"""
+    try:
+        return BridgeType(name)
+    except ValueError:
+        if name not in bridge_type_names():
+            raise
+        return PluginBridgeType(name)
+
+
+def artist_data_bounds(artist) -> Optional[Tuple[float, float, float, float]]:
+    """Data-space bounding box (x0, y0, x1, y1) of a patch, line or collection
+
+    Transforms applied on top of the data coordinates (the plan skew) are
+    included, so the box is where the artist is drawn.
+    """
+    ax = artist.axes
+    if isinstance(artist, patches.Patch):
+        transform = artist.get_patch_transform()
+        if ax is not None and artist.get_data_transform() is not ax.transData:
+            transform = transform + (artist.get_data_transform() - ax.transData)
+        bbox = artist.get_path().get_extents(transform)
+    elif isinstance(artist, Line2D):
+        xy = artist.get_xydata()
+        if len(xy) == 0:
+            return None
+        if ax is not None and artist.get_transform() is not ax.transData:
+            xy = (artist.get_transform() - ax.transData).transform(xy)
+        (x0, y0), (x1, y1) = xy.min(axis=0), xy.max(axis=0)
+        return float(x0), float(y0), float(x1), float(y1)
+    elif isinstance(artist, Collection) and ax is not None:
+        bbox = artist.get_datalim(ax.transData)
+    else:
+        return None
+    return bbox.x0, bbox.y0, bbox.x1, bbox.y1
 
 
 class BridgeDrawingGenerator:
@@ -90,6 +206,14 @@ class BridgeDrawingGenerator:
         self.ax_plan = None
         self.scale = 1.0
         self.include_plan_view = True
+        self.include_dimensions = True
+        self.simplify_geometry = True
+        self.member_store = None  # set by from_store(); exports then replay the stored geometry
+        self.deterministic = False  # byte-stable SVG/PDF/DXF output
+        self.cull_threshold_px = DEFAULT_THRESHOLD_PX  # raster members smaller than this are dropped or merged; 0 keeps all
+        self.dxf_sheets = True  # paper-space sheet layouts with viewports onto the DXF modelspace
+        self.sheet_cache = SHEET_CACHE  # cached grid/labels/titles under Pillow raster exports; None draws them each time
+        self.pyplot_figure = False  # register the figure with pyplot, for plt.show(); off keeps render threads independent
         
         # Drawing settings
         self.line_width = 2.0
@@ -109,22 +233,48 @@ class BridgeDrawingGenerator:
             'plan_structure': 'darkgray'
         }
     
+    @classmethod
+    def from_store(cls, store) -> "BridgeDrawingGenerator":
+        """Generator for a bridge_store.MemberStore, ready to export without redrawing"""
+        generator = cls(resolve_bridge_type(store.metadata['bridge_type']), BridgeParameters(**store.metadata['params']))
+        generator.member_store = store
+        generator.figure, generator.ax_elevation, generator.ax_plan = store.to_figure()
+        return generator
+    
+    def view_limits(self) -> Dict[str, Tuple[Tuple[float, float], Tuple[float, float]]]:
+        """Data limits ((xmin, xmax), (ymin, ymax)) of the elevation and plan views"""
+        margin = max(self.params.span_length * 0.1, 20)
+        plan_margin = max(self.params.deck_width * 0.2, 5)
+        skew_shift = abs(math.tan(math.radians(self.params.skew_angle))) * self.params.deck_width / 2
+        return {
+            'elevation': ((-margin, self.params.span_length + margin),
+                          (-self.params.foundation_depth - 10, self.params.height + margin)),
+            'plan': ((-margin - skew_shift, self.params.span_length + margin + skew_shift),
+                     (-plan_margin, self.params.deck_width + plan_margin)),
+        }
+    
     def setup_drawing(self, width: float = 20, height: float = 16):
         """Initialize the drawing canvas with elevation and plan views"""
-        # Create subplots for elevation and plan views
-        self.figure, (self.ax_elevation, self.ax_plan) = plt.subplots(2, 1, figsize=(width, height))
+        # Create subplots for elevation and plan views. Without pyplot the figure
+        # is not a global "current figure" that other render threads could touch
+        if self.pyplot_figure:
+            self.figure = plt.figure(figsize=(width, height))
+        else:
+            self.figure = Figure(figsize=(width, height))
+            FigureCanvasAgg(self.figure)
+        self.ax_elevation, self.ax_plan = self.figure.subplots(2, 1)
         
         if self.ax_elevation is None or self.ax_plan is None:
             raise RuntimeError("Failed to create matplotlib axes")
         
+        limits = self.view_limits()
+        
         # Setup elevation view (side view)
         self.ax_elevation.set_aspect('equal')
         self.ax_elevation.grid(True, alpha=0.3)
         
-        margin = max(self.params.span_length * 0.1, 20)
-        self.ax_elevation.set_xlim(-margin, self.params.span_length + margin)
-        self.ax_elevation.set_ylim(-self.params.foundation_depth - 10, 
-                                 self.params.height + margin)
+        self.ax_elevation.set_xlim(*limits['elevation'][0])
+        self.ax_elevation.set_ylim(*limits['elevation'][1])
         
         self.ax_elevation.set_xlabel('Distance (m)', fontsize=self.annotation_fontsize)
         self.ax_elevation.set_ylabel('Elevation (m)', fontsize=self.annotation_fontsize)
@@ -134,9 +284,8 @@ class BridgeDrawingGenerator:
         self.ax_plan.set_aspect('equal')
         self.ax_plan.grid(True, alpha=0.3)
         
-        plan_margin = max(self.params.deck_width * 0.2, 5)
-        self.ax_plan.set_xlim(-margin, self.params.span_length + margin)
-        self.ax_plan.set_ylim(-plan_margin, self.params.deck_width + plan_margin)
+        self.ax_plan.set_xlim(*limits['plan'][0])
+        self.ax_plan.set_ylim(*limits['plan'][1])
         
         self.ax_plan.set_xlabel('Distance (m)', fontsize=self.annotation_fontsize)
         self.ax_plan.set_ylabel('Width (m)', fontsize=self.annotation_fontsize)
@@ -148,991 +297,424 @@ class BridgeDrawingGenerator:
         overall_title += f"Span: {self.params.span_length}m, Width: {self.params.deck_width}m"
         self.figure.suptitle(overall_title, fontsize=self.title_fontsize + 2, fontweight='bold')
     
-    def draw_beam_bridge(self):
-        """Generate elevation and plan views for beam bridge"""
-        self.draw_beam_bridge_elevation()
-        self.draw_beam_bridge_plan()
-    
-    def draw_beam_bridge_elevation(self):
-        """Generate elevation view for beam bridge"""
-        # Main deck
-        deck_y = self.params.height - self.params.girder_depth
-        deck = Rectangle((0, deck_y), self.params.span_length, 
-                        self.params.girder_depth, 
-                        facecolor=self.colors['deck'], alpha=0.7,
-                        edgecolor=self.colors['structure'], linewidth=self.line_width)
-        self.ax_elevation.add_patch(deck)
-        
-        # Girders (simplified as rectangles under deck)
-        girder_height = self.params.girder_depth * 0.8
-        girder_y = deck_y - girder_height
-        
-        # Main girders
-        for i in range(2):  # Two main girders
-            girder = Rectangle((0, girder_y), self.params.span_length, 
-                             girder_height * 0.3,
-                             facecolor=self.colors['structure'], alpha=0.8)
-            self.ax_elevation.add_patch(girder)
-        
-        # Supports/piers
-        if self.params.supports > 0:
-            support_spacing = self.params.span_length / (self.params.supports + 1)
-            support_width = 2.0
-            
-            for i in range(self.params.supports):
-                x_pos = support_spacing * (i + 1) - support_width / 2
-                
-                # Pier
-                pier = Rectangle((x_pos, -self.params.foundation_depth), 
-                               support_width, self.params.height - self.params.girder_depth + self.params.foundation_depth,
-                               facecolor=self.colors['supports'], alpha=0.8,
-                               edgecolor=self.colors['structure'], linewidth=self.line_width)
-                self.ax_elevation.add_patch(pier)
-                
-                # Foundation
-                foundation_width = support_width * 2
-                foundation = Rectangle((x_pos - support_width/2, -self.params.foundation_depth), 
-                                     foundation_width, self.params.foundation_depth * 0.6,
-                                     facecolor=self.colors['foundations'], alpha=0.8)
-                self.ax_elevation.add_patch(foundation)
-        
-        # Abutments at ends
-        abutment_width = 3.0
-        for x_pos in [0, self.params.span_length]:
-            abutment = Rectangle((x_pos - abutment_width/2, -self.params.foundation_depth), 
-                               abutment_width, self.params.height - self.params.girder_depth + self.params.foundation_depth,
-                               facecolor=self.colors['supports'], alpha=0.6,
-                               edgecolor=self.colors['structure'], linewidth=self.line_width)
-            self.ax_elevation.add_patch(abutment)
-        
-        # Railings
-        rail_y = self.params.height
-        self.ax_elevation.plot([0, self.params.span_length], [rail_y, rail_y], 
-                             color=self.colors['structure'], linewidth=1.5)
-    
-    def draw_beam_bridge_plan(self):
-        """Generate plan view for beam bridge"""
-        # Deck outline
-        deck_plan = Rectangle((0, 0), self.params.span_length, self.params.deck_width,
-                            facecolor=self.colors['plan_deck'], alpha=0.7,
-                            edgecolor=self.colors['structure'], linewidth=self.line_width)
-        self.ax_plan.add_patch(deck_plan)
-        
-        # Main girders (longitudinal)
-        girder_width = 0.6
-        girder_positions = [self.params.deck_width * 0.2, self.params.deck_width * 0.8]
-        
-        for y_pos in girder_positions:
-            girder_plan = Rectangle((0, y_pos - girder_width/2), self.params.span_length, girder_width,
-                                  facecolor=self.colors['plan_structure'], alpha=0.9,
-                                  edgecolor=self.colors['structure'], linewidth=1)
-            self.ax_plan.add_patch(girder_plan)
-        
-        # Cross-beams/diaphragms
-        num_cross_beams = max(5, int(self.params.span_length / 15))
-        cross_beam_spacing = self.params.span_length / (num_cross_beams - 1)
-        cross_beam_width = 0.3
-        
-        for i in range(num_cross_beams):
-            x_pos = i * cross_beam_spacing
-            cross_beam = Rectangle((x_pos - cross_beam_width/2, 0), cross_beam_width, self.params.deck_width,
-                                 facecolor=self.colors['plan_structure'], alpha=0.6,
-                                 edgecolor=self.colors['structure'], linewidth=0.5)
-            self.ax_plan.add_patch(cross_beam)
-        
-        # Supports/piers in plan
-        if self.params.supports > 0:
-            support_spacing = self.params.span_length / (self.params.supports + 1)
-            support_width = 2.0
-            support_depth = 1.5
-            
-            for i in range(self.params.supports):
-                x_pos = support_spacing * (i + 1) - support_width / 2
-                y_pos = (self.params.deck_width - support_depth) / 2
-                
-                pier_plan = Rectangle((x_pos, y_pos), support_width, support_depth,
-                                    facecolor=self.colors['supports'], alpha=0.8,
-                                    edgecolor=self.colors['structure'], linewidth=self.line_width)
-                self.ax_plan.add_patch(pier_plan)
-        
-        # Centerline
-        self.ax_plan.plot([0, self.params.span_length], [self.params.deck_width/2, self.params.deck_width/2], 
-                         '--', color=self.colors['annotations'], linewidth=1, alpha=0.7)
-        
-        # Edge lines  
-        self.ax_plan.plot([0, self.params.span_length], [0, 0], 
-                         color=self.colors['structure'], linewidth=2)
-        self.ax_plan.plot([0, self.params.span_length], [self.params.deck_width, self.params.deck_width], 
-                         color=self.colors['structure'], linewidth=2)
-    
-    def draw_truss_bridge(self):
-        """Generate elevation and plan views for truss bridge"""
-        self.draw_truss_bridge_elevation()
-        self.draw_truss_bridge_plan()
-    
-    def draw_truss_bridge_elevation(self):
-        """Generate elevation view for truss bridge"""
-        # Support multi-span capability (up to 30 spans)
-        num_spans = min(max(1, self.params.supports + 1), 30)
-        span_length = self.params.span_length / num_spans
-        
-        for span_idx in range(num_spans):
-            span_start = span_idx * span_length
-            span_end = (span_idx + 1) * span_length
-            
-            # Deck level for this span
-            deck_y = self.params.height * 0.3
-            deck = Rectangle((span_start, deck_y), span_length, 0.5,
-                            facecolor=self.colors['deck'], alpha=0.7,
-                            edgecolor=self.colors['structure'], linewidth=self.line_width)
-            self.ax_elevation.add_patch(deck)
-        
-            # Truss structure for this span
-            truss_height = self.params.height - deck_y - 1
-            num_panels = max(4, int(span_length / 10))  # Panel every ~10m
-            panel_width = span_length / num_panels
-            
-            # Top chord
-            top_y = deck_y + truss_height
-            self.ax_elevation.plot([span_start, span_end], [top_y, top_y], 
-                                 color=self.colors['structure'], linewidth=self.line_width * 1.5)
-            
-            # Bottom chord (deck level)
-            self.ax_elevation.plot([span_start, span_end], [deck_y, deck_y], 
-                                 color=self.colors['structure'], linewidth=self.line_width * 1.5)
-            
-            # Vertical members and diagonals for this span
-            for i in range(num_panels + 1):
-                x = span_start + i * panel_width
-                
-                # Vertical members
-                self.ax_elevation.plot([x, x], [deck_y, top_y], 
-                                     color=self.colors['structure'], linewidth=self.line_width)
-                
-                # Diagonal members (alternating pattern)
-                if i < num_panels:
-                    x_next = span_start + (i + 1) * panel_width
-                    if i % 2 == 0:
-                        # Diagonal up-right
-                        self.ax_elevation.plot([x, x_next], [deck_y, top_y], 
-                                             color=self.colors['structure'], linewidth=self.line_width * 0.8)
-                    else:
-                        # Diagonal down-right  
-                        self.ax_elevation.plot([x, x_next], [top_y, deck_y], 
-                                             color=self.colors['structure'], linewidth=self.line_width * 0.8)
-        
-        # Supports at intermediate points and ends
-        support_width = 2.5
-        for i in range(num_spans + 1):
-            x_pos = i * span_length
-            support = Rectangle((x_pos - support_width/2, -self.params.foundation_depth), 
-                              support_width, deck_y + self.params.foundation_depth,
-                              facecolor=self.colors['supports'], alpha=0.8,
-                              edgecolor=self.colors['structure'], linewidth=self.line_width)
-            self.ax_elevation.add_patch(support)
-    
-    def draw_truss_bridge_plan(self):
-        """Generate plan view for truss bridge"""
-        # Deck outline
-        deck_plan = Rectangle((0, 0), self.params.span_length, self.params.deck_width,
-                            facecolor=self.colors['plan_deck'], alpha=0.7,
-                            edgecolor=self.colors['structure'], linewidth=self.line_width)
-        self.ax_plan.add_patch(deck_plan)
-        
-        # Main trusses (two parallel trusses)
-        truss_width = 1.0
-        truss_positions = [self.params.deck_width * 0.15, self.params.deck_width * 0.85]
-        
-        for y_pos in truss_positions:
-            truss_plan = Rectangle((0, y_pos - truss_width/2), self.params.span_length, truss_width,
-                                 facecolor=self.colors['plan_structure'], alpha=0.9,
-                                 edgecolor=self.colors['structure'], linewidth=1.5)
-            self.ax_plan.add_patch(truss_plan)
-        
-        # Cross-bracing/floor beams
-        num_cross_frames = max(8, int(self.params.span_length / 10))
-        cross_frame_spacing = self.params.span_length / (num_cross_frames - 1)
-        
-        for i in range(num_cross_frames):
-            x_pos = i * cross_frame_spacing
-            self.ax_plan.plot([x_pos, x_pos], [truss_positions[0], truss_positions[1]], 
-                             color=self.colors['structure'], linewidth=1.5, alpha=0.8)
-        
-        # Support positions in plan
-        num_spans = min(max(1, self.params.supports + 1), 30)
-        span_length = self.params.span_length / num_spans
-        support_width = 2.5
-        
-        for i in range(num_spans + 1):
-            x_pos = i * span_length
-            support_plan = Rectangle((x_pos - support_width/2, (self.params.deck_width - support_width)/2), 
-                                   support_width, support_width,
-                                   facecolor=self.colors['supports'], alpha=0.8,
-                                   edgecolor=self.colors['structure'], linewidth=self.line_width)
-            self.ax_plan.add_patch(support_plan)
-    
-    def draw_arch_bridge(self):
-        """Generate elevation and plan views for arch bridge"""
-        self.draw_arch_bridge_elevation()
-        self.draw_arch_bridge_plan()
-    
-    def draw_arch_bridge_elevation(self):
-        """Generate elevation view for arch bridge"""
-        # Support multi-span arches
-        num_spans = min(max(1, self.params.supports + 1), 30)
-        span_length = self.params.span_length / num_spans
-        
-        for span_idx in range(num_spans):
-            span_start = span_idx * span_length
-            span_end = (span_idx + 1) * span_length
-            
-            # Arch parameters for this span
-            arch_center_y = 0
-            arch_rise = self.params.height * 0.7
-            
-            # Create arch using parametric equations
-            theta = np.linspace(0, np.pi, 100)
-            arch_x = span_length/2 * np.cos(theta) + span_start + span_length/2
-            arch_y = arch_rise * np.sin(theta) + arch_center_y
-            
-            # Arch structure (hollow)
-            arch_thickness = 2.0
-            inner_x = (span_length/2 - arch_thickness) * np.cos(theta) + span_start + span_length/2
-            inner_y = (arch_rise - arch_thickness) * np.sin(theta) + arch_center_y
-            
-            # Draw arch
-            self.ax_elevation.fill_between(arch_x, arch_y, inner_y, 
-                                         where=inner_y <= arch_y, alpha=0.8,
-                                         facecolor=self.colors['structure'], 
-                                         edgecolor=self.colors['structure'],
-                                         linewidth=self.line_width)
-            
-            # Spandrel walls/supports between arch and deck for this span
-            num_spandrels = max(3, int(span_length / 20))
-            spandrel_spacing = span_length / (num_spandrels + 1)
-            
-            for i in range(1, num_spandrels + 1):
-                x_pos = span_start + i * spandrel_spacing
-                # Find corresponding arch height at this x position
-                arch_height_at_x = arch_rise * np.sin(np.pi * (x_pos - span_start) / span_length)
-                
-                spandrel = Rectangle((x_pos - 0.3, arch_height_at_x), 0.6, 
-                                   (arch_rise + 2) - arch_height_at_x,
-                                   facecolor=self.colors['supports'], alpha=0.6,
-                                   edgecolor=self.colors['structure'], linewidth=1)
-                self.ax_elevation.add_patch(spandrel)
-        
-        # Continuous deck/roadway above arches
-        deck_y = arch_rise + 2
-        deck = Rectangle((0, deck_y), self.params.span_length, 0.8,
-                        facecolor=self.colors['deck'], alpha=0.7,
-                        edgecolor=self.colors['structure'], linewidth=self.line_width)
-        self.ax_elevation.add_patch(deck)
-        
-        # Abutments and piers
-        abutment_width = 4.0
-        abutment_height = arch_rise + 5
-        
-        # End abutments
-        for x_pos in [0, self.params.span_length]:
-            abutment = Rectangle((x_pos - abutment_width/2, -self.params.foundation_depth), 
-                               abutment_width, abutment_height + self.params.foundation_depth,
-                               facecolor=self.colors['supports'], alpha=0.8,
-                               edgecolor=self.colors['structure'], linewidth=self.line_width)
-            self.ax_elevation.add_patch(abutment)
-        
-        # Intermediate piers for multi-span
-        for i in range(1, num_spans):
-            x_pos = i * span_length
-            pier = Rectangle((x_pos - abutment_width/3, -self.params.foundation_depth), 
-                           abutment_width * 2/3, abutment_height + self.params.foundation_depth,
-                           facecolor=self.colors['supports'], alpha=0.8,
-                           edgecolor=self.colors['structure'], linewidth=self.line_width)
-            self.ax_elevation.add_patch(pier)
-    
-    def draw_arch_bridge_plan(self):
-        """Generate plan view for arch bridge"""
-        # Deck outline
-        deck_plan = Rectangle((0, 0), self.params.span_length, self.params.deck_width,
-                            facecolor=self.colors['plan_deck'], alpha=0.7,
-                            edgecolor=self.colors['structure'], linewidth=self.line_width)
-        self.ax_plan.add_patch(deck_plan)
-        
-        # Arch ribs (multiple parallel arches)
-        num_ribs = 3  # Three parallel arch ribs
-        rib_width = 1.0
-        rib_spacing = self.params.deck_width / (num_ribs + 1)
-        
-        for i in range(num_ribs):
-            y_pos = (i + 1) * rib_spacing - rib_width/2
-            rib_plan = Rectangle((0, y_pos), self.params.span_length, rib_width,
-                               facecolor=self.colors['plan_structure'], alpha=0.9,
-                               edgecolor=self.colors['structure'], linewidth=1.5)
-            self.ax_plan.add_patch(rib_plan)
-        
-        # Spandrel structure (cross-walls)
-        num_spans = min(max(1, self.params.supports + 1), 30)
-        span_length = self.params.span_length / num_spans
-        
-        for span_idx in range(num_spans):
-            span_start = span_idx * span_length
-            num_spandrels = max(3, int(span_length / 20))
-            spandrel_spacing = span_length / (num_spandrels + 1)
-            
-            for i in range(1, num_spandrels + 1):
-                x_pos = span_start + i * spandrel_spacing
-                spandrel_plan = Rectangle((x_pos - 0.3, 0), 0.6, self.params.deck_width,
-                                        facecolor=self.colors['plan_structure'], alpha=0.4,
-                                        edgecolor=self.colors['structure'], linewidth=0.5)
-                self.ax_plan.add_patch(spandrel_plan)
-        
-        # Supports in plan view
-        support_width = 4.0
-        
-        # End abutments
-        for x_pos in [0, self.params.span_length]:
-            abutment_plan = Rectangle((x_pos - support_width/2, (self.params.deck_width - support_width)/2), 
-                                    support_width, support_width,
-                                    facecolor=self.colors['supports'], alpha=0.8,
-                                    edgecolor=self.colors['structure'], linewidth=self.line_width)
-            self.ax_plan.add_patch(abutment_plan)
-        
-        # Intermediate piers
-        for i in range(1, num_spans):
-            x_pos = i * span_length
-            pier_plan = Rectangle((x_pos - support_width/3, (self.params.deck_width - support_width*2/3)/2), 
-                                support_width * 2/3, support_width * 2/3,
-                                facecolor=self.colors['supports'], alpha=0.8,
-                                edgecolor=self.colors['structure'], linewidth=self.line_width)
-            self.ax_plan.add_patch(pier_plan)
+    @property
+    def plugin(self):
+        """The bridge_types module drawing this bridge type, imported on first use"""
+        return get_plugin(self.bridge_type.value)
     
-    def draw_suspension_bridge(self):
-        """Generate elevation and plan views for suspension bridge"""
-        self.draw_suspension_bridge_elevation()
-        self.draw_suspension_bridge_plan()
+    def draw_view(self, view: str):
+        """Draw only the elevation or plan view of this bridge type into its axes"""
+        if view not in ('elevation', 'plan'):
+            raise ValueError(f"Unknown view: {view}")
+        getattr(self.plugin, f"draw_{view}")(self)
     
-    def draw_suspension_bridge_elevation(self):
-        """Generate elevation view for suspension bridge"""
-        # Towers
-        tower_height = self.params.height
-        tower_width = 3.0
-        tower_positions = [self.params.span_length * 0.2, self.params.span_length * 0.8]
-        
-        for x_pos in tower_positions:
-            # Tower shaft
-            tower = Rectangle((x_pos - tower_width/2, -self.params.foundation_depth), 
-                            tower_width, tower_height + self.params.foundation_depth,
-                            facecolor=self.colors['supports'], alpha=0.8,
-                            edgecolor=self.colors['structure'], linewidth=self.line_width)
-            self.ax_elevation.add_patch(tower)
-            
-            # Tower top cross-beam
-            crossbeam = Rectangle((x_pos - tower_width, tower_height - 2), 
-                                tower_width * 2, 1,
-                                facecolor=self.colors['structure'], alpha=0.9)
-            self.ax_elevation.add_patch(crossbeam)
-        
-        # Main cables (catenary curve approximation)
-        cable_sag = self.params.height * 0.3
-        deck_y = self.params.height * 0.4
-        
-        # Main span cable
-        x_cable = np.linspace(tower_positions[0], tower_positions[1], 100)
-        y_cable = deck_y + cable_sag * (1 - 4 * (x_cable - self.params.span_length/2)**2 / 
-                                       (tower_positions[1] - tower_positions[0])**2)
-        self.ax_elevation.plot(x_cable, y_cable, color='black', linewidth=3, label='Main Cable')
-        
-        # Side span cables
-        x_left = np.linspace(0, tower_positions[0], 50)
-        y_left = tower_height - (tower_height - deck_y) * (x_left / tower_positions[0])**2
-        self.ax_elevation.plot(x_left, y_left, color='black', linewidth=3)
-        
-        x_right = np.linspace(tower_positions[1], self.params.span_length, 50)
-        y_right = tower_height - (tower_height - deck_y) * ((x_right - self.params.span_length) / 
-                                                            (tower_positions[1] - self.params.span_length))**2
-        self.ax_elevation.plot(x_right, y_right, color='black', linewidth=3)
-        
-        # Deck
-        deck = Rectangle((0, deck_y), self.params.span_length, 0.8,
-                        facecolor=self.colors['deck'], alpha=0.7,
-                        edgecolor=self.colors['structure'], linewidth=self.line_width)
-        self.ax_elevation.add_patch(deck)
-        
-        # Hangers (vertical cables)
-        num_hangers = 20
-        hanger_spacing = self.params.span_length / num_hangers
-        
-        for i in range(1, num_hangers):
-            x_hanger = i * hanger_spacing
-            if tower_positions[0] <= x_hanger <= tower_positions[1]:
-                # Main span hanger
-                y_cable_at_x = deck_y + cable_sag * (1 - 4 * (x_hanger - self.params.span_length/2)**2 / 
-                                                    (tower_positions[1] - tower_positions[0])**2)
-                self.ax_elevation.plot([x_hanger, x_hanger], [deck_y + 0.8, y_cable_at_x], 
-                                     color='gray', linewidth=1, alpha=0.8)
-        
-        # Anchorages
-        anchorage_width = 6.0
-        for x_pos in [0, self.params.span_length]:
-            anchorage = Rectangle((x_pos - anchorage_width/2, -self.params.foundation_depth), 
-                                anchorage_width, deck_y + self.params.foundation_depth,
-                                facecolor=self.colors['foundations'], alpha=0.8,
-                                edgecolor=self.colors['structure'], linewidth=self.line_width)
-            self.ax_elevation.add_patch(anchorage)
+    def _support_chainages(self) -> np.ndarray:
+        """Chainages of abutments and intermediate supports along the span"""
+        return self.params.span_table().chainages
     
-    def draw_suspension_bridge_plan(self):
-        """Generate plan view for suspension bridge"""
-        # Deck outline
-        deck_plan = Rectangle((0, 0), self.params.span_length, self.params.deck_width,
-                            facecolor=self.colors['plan_deck'], alpha=0.7,
-                            edgecolor=self.colors['structure'], linewidth=self.line_width)
-        self.ax_plan.add_patch(deck_plan)
-        
-        # Main cables (two parallel cables)
-        cable_positions = [self.params.deck_width * 0.1, self.params.deck_width * 0.9]
-        cable_width = 0.5
-        
-        for y_pos in cable_positions:
-            cable_plan = Rectangle((0, y_pos - cable_width/2), self.params.span_length, cable_width,
-                                 facecolor='black', alpha=0.9,
-                                 edgecolor='black', linewidth=1)
-            self.ax_plan.add_patch(cable_plan)
-        
-        # Towers in plan
-        tower_positions = [self.params.span_length * 0.2, self.params.span_length * 0.8]
-        tower_width = 3.0
-        tower_depth = 2.0
-        
-        for x_pos in tower_positions:
-            tower_plan = Rectangle((x_pos - tower_width/2, (self.params.deck_width - tower_depth)/2), 
-                                 tower_width, tower_depth,
-                                 facecolor=self.colors['supports'], alpha=0.8,
-                                 edgecolor=self.colors['structure'], linewidth=self.line_width)
-            self.ax_plan.add_patch(tower_plan)
-        
-        # Deck stiffening trusses/girders
-        truss_positions = [self.params.deck_width * 0.25, self.params.deck_width * 0.75]
-        truss_width = 0.8
-        
-        for y_pos in truss_positions:
-            truss_plan = Rectangle((0, y_pos - truss_width/2), self.params.span_length, truss_width,
-                                 facecolor=self.colors['plan_structure'], alpha=0.6,
-                                 edgecolor=self.colors['structure'], linewidth=1)
-            self.ax_plan.add_patch(truss_plan)
-        
-        # Anchorages in plan
-        anchorage_width = 6.0
-        for x_pos in [0, self.params.span_length]:
-            anchorage_plan = Rectangle((x_pos - anchorage_width/2, (self.params.deck_width - anchorage_width)/2), 
-                                     anchorage_width, anchorage_width,
-                                     facecolor=self.colors['foundations'], alpha=0.8,
-                                     edgecolor=self.colors['structure'], linewidth=self.line_width)
-            self.ax_plan.add_patch(anchorage_plan)
+    def _data_per_point(self, ax) -> Tuple[float, float]:
+        """Data units per typographic point along x and y of an axes"""
+        ax.apply_aspect()
+        position = ax.get_position()
+        fig_width, fig_height = self.figure.get_size_inches()
+        (x0, x1), (y0, y1) = ax.get_xlim(), ax.get_ylim()
+        return ((x1 - x0) / (position.width * fig_width * 72),
+                (y1 - y0) / (position.height * fig_height * 72))
     
-    def draw_cable_stayed_bridge(self):
-        """Generate elevation and plan views for cable-stayed bridge"""
-        self.draw_cable_stayed_bridge_elevation()
-        self.draw_cable_stayed_bridge_plan()
+    def _annotation_placer(self, ax) -> Tuple[AnnotationPlacer, float, float]:
+        """Placer seeded with the extents of everything drawn in ax, plus the text cell size"""
+        x_per_pt, y_per_pt = self._data_per_point(ax)
+        char_width = self.dimension_fontsize * 0.65 * x_per_pt
+        line_height = self.dimension_fontsize * 1.3 * y_per_pt
+        placer = AnnotationPlacer(cell_size=max(char_width * 8, line_height), padding=line_height * 0.2)
+        for artist in list(ax.patches) + list(ax.lines) + list(ax.collections):
+            bounds = artist_data_bounds(artist)
+            if bounds is not None:
+                placer.add_obstacle(bounds)
+        # Everything outside the view limits is off limits too
+        (x0, x1), (y0, y1) = ax.get_xlim(), ax.get_ylim()
+        big = max(x1 - x0, y1 - y0)
+        placer.add_obstacles([(x0 - big, y1, x1 + big, y1 + big), (x0 - big, y0 - big, x1 + big, y0),
+                              (x0 - big, y0, x0, y1), (x1, y0, x1 + big, y1)])
+        return placer, char_width, line_height
     
-    def draw_cable_stayed_bridge_elevation(self):
-        """Generate elevation view for cable-stayed bridge"""
-        # Support multi-tower design for longer spans
-        num_spans = min(max(1, self.params.supports + 1), 30)
-        span_length = self.params.span_length / num_spans
-        
-        # Tower positions (at each support point)
-        tower_positions = []
-        for i in range(self.params.supports):
-            tower_positions.append((i + 1) * span_length)
-        
-        tower_height = self.params.height
-        tower_width = 4.0
-        
-        # Draw towers
-        for tower_x in tower_positions:
-            tower = Rectangle((tower_x - tower_width/2, -self.params.foundation_depth), 
-                            tower_width, tower_height + self.params.foundation_depth,
-                            facecolor=self.colors['supports'], alpha=0.8,
-                            edgecolor=self.colors['structure'], linewidth=self.line_width)
-            self.ax_elevation.add_patch(tower)
-        
-        # Deck
-        deck_y = self.params.height * 0.3
-        deck = Rectangle((0, deck_y), self.params.span_length, 0.8,
-                        facecolor=self.colors['deck'], alpha=0.7,
-                        edgecolor=self.colors['structure'], linewidth=self.line_width)
-        self.ax_elevation.add_patch(deck)
-        
-        # Stay cables for each tower
-        num_cables = max(4, int(span_length / 15))  # Scale cables with span length
-        cable_attachment_height = tower_height * 0.8
-        
-        for tower_x in tower_positions:
-            for i in range(1, num_cables + 1):
-                # Left side cables from this tower
-                if tower_x > 0:
-                    deck_x_left = tower_x - (i * min(tower_x, span_length) / (num_cables + 1))
-                    if deck_x_left >= 0:
-                        self.ax_elevation.plot([tower_x, deck_x_left], [cable_attachment_height, deck_y + 0.8], 
-                                             color='red', linewidth=2, alpha=0.8)
-                
-                # Right side cables from this tower
-                if tower_x < self.params.span_length:
-                    deck_x_right = tower_x + (i * min(self.params.span_length - tower_x, span_length) / (num_cables + 1))
-                    if deck_x_right <= self.params.span_length:
-                        self.ax_elevation.plot([tower_x, deck_x_right], [cable_attachment_height, deck_y + 0.8], 
-                                             color='red', linewidth=2, alpha=0.8)
-        
-        # Abutments at ends
-        abutment_width = 5.0
-        for x_pos in [0, self.params.span_length]:
-            abutment = Rectangle((x_pos - abutment_width/2, -self.params.foundation_depth), 
-                               abutment_width, deck_y + self.params.foundation_depth,
-                               facecolor=self.colors['supports'], alpha=0.8,
-                               edgecolor=self.colors['structure'], linewidth=self.line_width)
-            self.ax_elevation.add_patch(abutment)
-    
-    def draw_cable_stayed_bridge_plan(self):
-        """Generate plan view for cable-stayed bridge"""
-        # Deck outline
-        deck_plan = Rectangle((0, 0), self.params.span_length, self.params.deck_width,
-                            facecolor=self.colors['plan_deck'], alpha=0.7,
-                            edgecolor=self.colors['structure'], linewidth=self.line_width)
-        self.ax_plan.add_patch(deck_plan)
-        
-        # Tower positions in plan
-        num_spans = min(max(1, self.params.supports + 1), 30)
-        span_length = self.params.span_length / num_spans
-        tower_width = 4.0
-        tower_depth = 3.0
-        
-        tower_positions = []
-        for i in range(self.params.supports):
-            tower_positions.append((i + 1) * span_length)
-        
-        for tower_x in tower_positions:
-            tower_plan = Rectangle((tower_x - tower_width/2, (self.params.deck_width - tower_depth)/2), 
-                                 tower_width, tower_depth,
-                                 facecolor=self.colors['supports'], alpha=0.8,
-                                 edgecolor=self.colors['structure'], linewidth=self.line_width)
-            self.ax_plan.add_patch(tower_plan)
-        
-        # Cable arrangement (stays in plan view)
-        cable_positions = [self.params.deck_width * 0.15, self.params.deck_width * 0.85]
-        
-        for tower_x in tower_positions:
-            for y_cable in cable_positions:
-                # Draw cable lines radiating from tower center
-                num_cables = max(4, int(span_length / 15))
-                for i in range(1, num_cables + 1):
-                    # Left side cables
-                    if tower_x > 0:
-                        deck_x_left = tower_x - (i * min(tower_x, span_length) / (num_cables + 1))
-                        if deck_x_left >= 0:
-                            self.ax_plan.plot([tower_x, deck_x_left], [self.params.deck_width/2, y_cable], 
-                                            color='red', linewidth=1, alpha=0.6)
-                    
-                    # Right side cables
-                    if tower_x < self.params.span_length:
-                        deck_x_right = tower_x + (i * min(self.params.span_length - tower_x, span_length) / (num_cables + 1))
-                        if deck_x_right <= self.params.span_length:
-                            self.ax_plan.plot([tower_x, deck_x_right], [self.params.deck_width/2, y_cable], 
-                                            color='red', linewidth=1, alpha=0.6)
-        
-        # Main girders
-        girder_positions = [self.params.deck_width * 0.2, self.params.deck_width * 0.8]
-        girder_width = 0.8
-        
-        for y_pos in girder_positions:
-            girder_plan = Rectangle((0, y_pos - girder_width/2), self.params.span_length, girder_width,
-                                  facecolor=self.colors['plan_structure'], alpha=0.6,
-                                  edgecolor=self.colors['structure'], linewidth=1)
-            self.ax_plan.add_patch(girder_plan)
-        
-        # Abutments in plan
-        abutment_width = 5.0
-        for x_pos in [0, self.params.span_length]:
-            abutment_plan = Rectangle((x_pos - abutment_width/2, (self.params.deck_width - abutment_width)/2), 
-                                    abutment_width, abutment_width,
-                                    facecolor=self.colors['supports'], alpha=0.8,
-                                    edgecolor=self.colors['structure'], linewidth=self.line_width)
-            self.ax_plan.add_patch(abutment_plan)
-    
-    def draw_t_beam_bridge(self):
-        """Generate elevation and plan views for T-beam bridge"""
-        self.draw_t_beam_bridge_elevation()
-        self.draw_t_beam_bridge_plan()
-    
-    def draw_t_beam_bridge_elevation(self):
-        """Generate elevation view for T-beam bridge"""
-        # Support multi-span capability
-        num_spans = min(max(1, self.params.supports + 1), 30)
-        span_length = self.params.span_length / num_spans
-        
-        # Main deck slab
-        deck_y = self.params.height - self.params.girder_depth
-        deck_thickness = 0.6  # Deck slab thickness
-        deck = Rectangle((0, deck_y), self.params.span_length, deck_thickness,
-                        facecolor=self.colors['deck'], alpha=0.7,
-                        edgecolor=self.colors['structure'], linewidth=self.line_width)
-        self.ax_elevation.add_patch(deck)
-        
-        # T-beam girders (showing the T-shape in elevation)
-        girder_height = self.params.girder_depth - deck_thickness
-        girder_y = deck_y - girder_height
-        
-        # Number of T-beams based on deck width
-        num_beams = max(3, int(self.params.deck_width / 3))  # T-beam every ~3m
-        beam_spacing = self.params.span_length / 20  # Show beams every 20m for visibility
-        
-        for i in range(0, int(self.params.span_length / beam_spacing) + 1):
-            x_pos = i * beam_spacing
-            if x_pos <= self.params.span_length:
-                # Web of T-beam (vertical part)
-                web_width = 0.4
-                web = Rectangle((x_pos - web_width/2, girder_y), web_width, girder_height,
-                              facecolor=self.colors['structure'], alpha=0.8,
-                              edgecolor=self.colors['structure'], linewidth=1)
-                self.ax_elevation.add_patch(web)
-                
-                # Flange of T-beam (bottom horizontal part)
-                flange_width = 1.2
-                flange_height = 0.3
-                flange = Rectangle((x_pos - flange_width/2, girder_y - flange_height), 
-                                 flange_width, flange_height,
-                                 facecolor=self.colors['structure'], alpha=0.8,
-                                 edgecolor=self.colors['structure'], linewidth=1)
-                self.ax_elevation.add_patch(flange)
-        
-        # Supports/piers for multi-span
-        if num_spans > 1:
-            support_width = 2.0
-            for i in range(1, num_spans):
-                x_pos = i * span_length - support_width / 2
-                pier = Rectangle((x_pos, -self.params.foundation_depth), 
-                               support_width, self.params.height - self.params.girder_depth + self.params.foundation_depth,
-                               facecolor=self.colors['supports'], alpha=0.8,
-                               edgecolor=self.colors['structure'], linewidth=self.line_width)
-                self.ax_elevation.add_patch(pier)
-        
-        # Abutments at ends
-        abutment_width = 3.0
-        for x_pos in [0, self.params.span_length]:
-            abutment = Rectangle((x_pos - abutment_width/2, -self.params.foundation_depth), 
-                               abutment_width, self.params.height - self.params.girder_depth + self.params.foundation_depth,
-                               facecolor=self.colors['supports'], alpha=0.6,
-                               edgecolor=self.colors['structure'], linewidth=self.line_width)
-            self.ax_elevation.add_patch(abutment)
-    
-    def draw_t_beam_bridge_plan(self):
-        """Generate plan view for T-beam bridge"""
-        # Deck slab outline
-        deck_plan = Rectangle((0, 0), self.params.span_length, self.params.deck_width,
-                            facecolor=self.colors['plan_deck'], alpha=0.7,
-                            edgecolor=self.colors['structure'], linewidth=self.line_width)
-        self.ax_plan.add_patch(deck_plan)
-        
-        # T-beam girders (longitudinal beams)
-        num_beams = max(3, int(self.params.deck_width / 3))  # T-beam every ~3m
-        beam_spacing = self.params.deck_width / (num_beams + 1)
-        beam_width = 0.4  # Web width of T-beam
-        
-        for i in range(num_beams):
-            y_pos = (i + 1) * beam_spacing - beam_width/2
-            beam_plan = Rectangle((0, y_pos), self.params.span_length, beam_width,
-                                facecolor=self.colors['plan_structure'], alpha=0.9,
-                                edgecolor=self.colors['structure'], linewidth=1.5)
-            self.ax_plan.add_patch(beam_plan)
-        
-        # Diaphragms/cross-beams
-        num_diaphragms = max(5, int(self.params.span_length / 20))
-        diaphragm_spacing = self.params.span_length / (num_diaphragms - 1)
-        diaphragm_width = 0.3
-        
-        for i in range(num_diaphragms):
-            x_pos = i * diaphragm_spacing
-            diaphragm = Rectangle((x_pos - diaphragm_width/2, 0), diaphragm_width, self.params.deck_width,
-                                facecolor=self.colors['plan_structure'], alpha=0.6,
-                                edgecolor=self.colors['structure'], linewidth=0.8)
-            self.ax_plan.add_patch(diaphragm)
-        
-        # Support locations in plan
-        num_spans = min(max(1, self.params.supports + 1), 30)
-        span_length = self.params.span_length / num_spans
-        support_width = 2.0
-        
-        # Intermediate supports
-        for i in range(1, num_spans):
-            x_pos = i * span_length
-            support_plan = Rectangle((x_pos - support_width/2, (self.params.deck_width - support_width)/2), 
-                                   support_width, support_width,
-                                   facecolor=self.colors['supports'], alpha=0.8,
-                                   edgecolor=self.colors['structure'], linewidth=self.line_width)
-            self.ax_plan.add_patch(support_plan)
-        
-        # End abutments
-        abutment_width = 3.0
-        for x_pos in [0, self.params.span_length]:
-            abutment_plan = Rectangle((x_pos - abutment_width/2, (self.params.deck_width - abutment_width)/2), 
-                                    abutment_width, abutment_width,
-                                    facecolor=self.colors['supports'], alpha=0.6,
-                                    edgecolor=self.colors['structure'], linewidth=self.line_width)
-            self.ax_plan.add_patch(abutment_plan)
-    
-    def draw_slab_bridge(self):
-        """Generate elevation and plan views for slab bridge"""
-        self.draw_slab_bridge_elevation()
-        self.draw_slab_bridge_plan()
+    def _dimension(self, ax, start: Tuple[float, float], end: Tuple[float, float]):
+        ax.annotate('', xy=start, xytext=end,
+                    arrowprops=dict(arrowstyle='<->', color=self.colors['dimensions'], lw=1.5))
     
-    def draw_slab_bridge_elevation(self):
-        """Generate elevation view for slab bridge"""
-        # Support multi-span capability
-        num_spans = min(max(1, self.params.supports + 1), 30)
-        span_length = self.params.span_length / num_spans
-        
-        # Main concrete slab (thick deck structure)
-        slab_thickness = max(0.8, self.params.span_length / 100)  # Slab thickness scales with span
-        deck_y = self.params.height - slab_thickness
-        
-        # Draw slab as continuous structure
-        slab = Rectangle((0, deck_y), self.params.span_length, slab_thickness,
-                        facecolor=self.colors['deck'], alpha=0.8,
-                        edgecolor=self.colors['structure'], linewidth=self.line_width)
-        self.ax_elevation.add_patch(slab)
-        
-        # Show reinforcement pattern (simplified representation)
-        rebar_spacing = 2.0  # Show rebar every 2m
-        for x in range(0, int(self.params.span_length), int(rebar_spacing)):
-            # Longitudinal reinforcement (bottom)
-            self.ax_elevation.plot([x, x + rebar_spacing], [deck_y + 0.1, deck_y + 0.1], 
-                                 color='darkred', linewidth=2, alpha=0.7)
-            # Transverse reinforcement
-            self.ax_elevation.plot([x + rebar_spacing/2, x + rebar_spacing/2], 
-                                 [deck_y + 0.1, deck_y + slab_thickness - 0.1], 
-                                 color='darkred', linewidth=1, alpha=0.5)
-        
-        # Supports/piers for multi-span
-        if num_spans > 1:
-            support_width = 2.5
-            for i in range(1, num_spans):
-                x_pos = i * span_length - support_width / 2
-                pier = Rectangle((x_pos, -self.params.foundation_depth), 
-                               support_width, deck_y + self.params.foundation_depth,
-                               facecolor=self.colors['supports'], alpha=0.8,
-                               edgecolor=self.colors['structure'], linewidth=self.line_width)
-                self.ax_elevation.add_patch(pier)
-        
-        # Abutments at ends (wider for slab bridges)
-        abutment_width = 4.0
-        for x_pos in [0, self.params.span_length]:
-            abutment = Rectangle((x_pos - abutment_width/2, -self.params.foundation_depth), 
-                               abutment_width, deck_y + self.params.foundation_depth,
-                               facecolor=self.colors['supports'], alpha=0.8,
-                               edgecolor=self.colors['structure'], linewidth=self.line_width)
-            self.ax_elevation.add_patch(abutment)
-        
-        # Expansion joints (for multi-span)
-        if num_spans > 1:
-            for i in range(1, num_spans):
-                x_pos = i * span_length
-                # Show expansion joint as a gap
-                joint = Rectangle((x_pos - 0.05, deck_y), 0.1, slab_thickness,
-                                facecolor='white', alpha=1.0,
-                                edgecolor=self.colors['structure'], linewidth=1)
-                self.ax_elevation.add_patch(joint)
+    def _dimension_text(self, ax, x: float, y: float, label: str, **kwargs):
+        ax.text(x, y, label, fontsize=self.dimension_fontsize, color=self.colors['dimensions'],
+                weight='bold', **kwargs)
     
-    def draw_slab_bridge_plan(self):
-        """Generate plan view for slab bridge"""
-        # Main slab outline
-        slab_plan = Rectangle((0, 0), self.params.span_length, self.params.deck_width,
-                            facecolor=self.colors['plan_deck'], alpha=0.8,
-                            edgecolor=self.colors['structure'], linewidth=self.line_width)
-        self.ax_plan.add_patch(slab_plan)
-        
-        # Reinforcement pattern in plan view
-        rebar_spacing_long = 3.0  # Longitudinal spacing
-        rebar_spacing_trans = 2.5  # Transverse spacing
-        
-        # Longitudinal reinforcement lines
-        for y in range(0, int(self.params.deck_width), int(rebar_spacing_trans)):
-            if y <= self.params.deck_width:
-                self.ax_plan.plot([0, self.params.span_length], [y, y], 
-                                color='darkred', linewidth=0.8, alpha=0.6, linestyle='--')
-        
-        # Transverse reinforcement lines  
-        for x in range(0, int(self.params.span_length), int(rebar_spacing_long)):
-            if x <= self.params.span_length:
-                self.ax_plan.plot([x, x], [0, self.params.deck_width], 
-                                color='darkred', linewidth=0.8, alpha=0.6, linestyle='--')
-        
-        # Construction joints (for large slabs)
-        if self.params.span_length > 30:
-            num_joints = int(self.params.span_length / 30)
-            joint_spacing = self.params.span_length / (num_joints + 1)
-            
-            for i in range(1, num_joints + 1):
-                x_pos = i * joint_spacing
-                self.ax_plan.plot([x_pos, x_pos], [0, self.params.deck_width], 
-                                color=self.colors['annotations'], linewidth=2, alpha=0.8, linestyle=':')
-        
-        # Support locations in plan
-        num_spans = min(max(1, self.params.supports + 1), 30)
-        span_length = self.params.span_length / num_spans
-        support_width = 2.5
-        
-        # Intermediate supports
-        for i in range(1, num_spans):
-            x_pos = i * span_length
-            support_plan = Rectangle((x_pos - support_width/2, (self.params.deck_width - support_width)/2), 
-                                   support_width, support_width,
-                                   facecolor=self.colors['supports'], alpha=0.8,
-                                   edgecolor=self.colors['structure'], linewidth=self.line_width)
-            self.ax_plan.add_patch(support_plan)
-        
-        # End abutments
-        abutment_width = 4.0
-        for x_pos in [0, self.params.span_length]:
-            abutment_plan = Rectangle((x_pos - abutment_width/2, (self.params.deck_width - abutment_width)/2), 
-                                    abutment_width, abutment_width,
-                                    facecolor=self.colors['supports'], alpha=0.8,
-                                    edgecolor=self.colors['structure'], linewidth=self.line_width)
-            self.ax_plan.add_patch(abutment_plan)
-        
-        # Edge markings to show slab thickness
-        edge_marking_spacing = 10.0
-        for x in range(0, int(self.params.span_length), int(edge_marking_spacing)):
-            if x <= self.params.span_length:
-                # Top edge markings
-                self.ax_plan.plot([x, x + 2], [self.params.deck_width, self.params.deck_width], 
-                                color=self.colors['structure'], linewidth=3, alpha=0.8)
-                # Bottom edge markings
-                self.ax_plan.plot([x, x + 2], [0, 0], 
-                                color=self.colors['structure'], linewidth=3, alpha=0.8)
+    def _place_span_chain(self, ax, placer: AnnotationPlacer, chainages: np.ndarray, rows: List[float],
+                          char_width: float, line_height: float) -> float:
+        """Dimension each span on the first row where no label collides; returns the row used"""
+        labels = [f'{b - a:.1f} m' for a, b in zip(chainages[:-1], chainages[1:])]
+        step = line_height * 1.2
+        
+        def row_boxes(y):
+            return [text_box((a + b) / 2, y + step * 0.2, len(label) * char_width, line_height)
+                    for a, b, label in zip(chainages[:-1], chainages[1:], labels)]
+        
+        y = next((y for y in rows if all(placer.is_free(box) for box in row_boxes(y))), rows[0])
+        for box in row_boxes(y):
+            placer.place([box])
+        placer.place([(chainages[0], y - step * 0.2, chainages[-1], y + step * 0.2)])
+        for a, b, label in zip(chainages[:-1], chainages[1:], labels):
+            self._dimension(ax, (a, y), (b, y))
+            self._dimension_text(ax, (a + b) / 2, y + step * 0.2, label, ha='center', va='bottom')
+        return y
     
     def _add_dimensions(self):
-        """Add dimension lines and annotations to both views"""
-        # Elevation view dimensions
-        dim_y = self.params.height + 10
-        self.ax_elevation.annotate('', xy=(0, dim_y), xytext=(self.params.span_length, dim_y),
-                                 arrowprops=dict(arrowstyle='<->', color=self.colors['dimensions'], lw=1.5))
-        self.ax_elevation.text(self.params.span_length/2, dim_y + 2, f'{self.params.span_length:.0f} m',
-                             ha='center', va='bottom', fontsize=self.dimension_fontsize, 
-                             color=self.colors['dimensions'], weight='bold')
-        
-        # Height dimension
-        dim_x = self.params.span_length + 15
-        self.ax_elevation.annotate('', xy=(dim_x, 0), xytext=(dim_x, self.params.height),
-                                 arrowprops=dict(arrowstyle='<->', color=self.colors['dimensions'], lw=1.5))
-        self.ax_elevation.text(dim_x + 2, self.params.height/2, f'{self.params.height:.0f} m',
-                             ha='left', va='center', fontsize=self.dimension_fontsize, 
-                             color=self.colors['dimensions'], weight='bold', rotation=90)
-        
-        # Plan view dimensions
-        dim_y_plan = self.params.deck_width + 3
-        self.ax_plan.annotate('', xy=(0, dim_y_plan), xytext=(self.params.span_length, dim_y_plan),
-                            arrowprops=dict(arrowstyle='<->', color=self.colors['dimensions'], lw=1.5))
-        self.ax_plan.text(self.params.span_length/2, dim_y_plan + 1, f'{self.params.span_length:.0f} m',
-                        ha='center', va='bottom', fontsize=self.dimension_fontsize, 
-                        color=self.colors['dimensions'], weight='bold')
-        
-        # Width dimension
-        dim_x_plan = self.params.span_length + 10
-        self.ax_plan.annotate('', xy=(dim_x_plan, 0), xytext=(dim_x_plan, self.params.deck_width),
-                            arrowprops=dict(arrowstyle='<->', color=self.colors['dimensions'], lw=1.5))
-        self.ax_plan.text(dim_x_plan + 1, self.params.deck_width/2, f'{self.params.deck_width:.1f} m',
-                        ha='left', va='center', fontsize=self.dimension_fontsize, 
-                        color=self.colors['dimensions'], weight='bold', rotation=90)
-        
-        # Add specification text box to elevation view
-        num_spans = min(max(1, self.params.supports + 1), 30)
+        """Add dimension lines and annotations to both views without overlapping the structure"""
+        span = self.params.span_length
+        chainages = self._support_chainages()
+        
+        # Elevation view: per-span chain, overall length, pier labels, height
+        ax = self.ax_elevation
+        placer, char_width, line_height = self._annotation_placer(ax)
+        step = line_height * 1.2
+        
+        rows = [self.params.height + step * (1 + k) for k in range(12)]
+        if len(chainages) > 2:
+            row_y = self._place_span_chain(ax, placer, chainages, rows, char_width, line_height)
+            rows = [y for y in rows if y > row_y] or [row_y + step]
+        self._place_span_chain(ax, placer, np.array([0.0, span]), rows, char_width, line_height)
+        
+        ground = -self.params.foundation_depth
+        for i, x in enumerate(chainages[1:-1], start=1):
+            label = f'P{i}'
+            width = len(label) * char_width
+            candidates = [text_box(x, ground - line_height * (0.3 + k * 1.1), width, line_height, va='top')
+                          for k in range(4)]
+            box = placer.place(candidates)
+            ax.text((box[0] + box[2]) / 2, box[3], label, ha='center', va='top',
+                    fontsize=self.dimension_fontsize, color=self.colors['annotations'])
+        
+        height_label = f'{self.params.height:.0f} m'
+        for k in range(12):
+            dim_x = span + step * (2 + k)
+            box = (dim_x - step * 0.2, 0, dim_x + step * 1.2, self.params.height)
+            if placer.is_free(box):
+                break
+        placer.place([box])
+        self._dimension(ax, (dim_x, 0), (dim_x, self.params.height))
+        self._dimension_text(ax, dim_x + step * 0.2, self.params.height / 2, height_label,
+                             ha='left', va='center', rotation=90)
+        
+        # Specification box in the first free corner of the elevation view
+        num_spans = len(chainages) - 1
+        lengths = np.diff(chainages)
+        if np.ptp(lengths) > 1e-9:
+            span_text = f"Span Lengths: {lengths.min():.1f} - {lengths.max():.1f} m"
+        else:
+            span_text = f"Span Length: {span/num_spans:.1f} m"
         specs_text = f"""Bridge Specifications:
 Type: {self.bridge_type.value.title()}
-Total Length: {self.params.span_length:.0f} m
+Total Length: {span:.0f} m
 Number of Spans: {num_spans}
-Span Length: {self.params.span_length/num_spans:.1f} m
+{span_text}
 Width: {self.params.deck_width:.1f} m
 Height: {self.params.height:.0f} m
 Material: {self.params.material.title()}
 Load: {self.params.load_capacity:.0f} kN/m"""
-        
-        self.ax_elevation.text(0.02, 0.98, specs_text, transform=self.ax_elevation.transAxes,
-                             fontsize=8, verticalalignment='top',
-                             bbox=dict(boxstyle='round', facecolor='wheat', alpha=0.8))
+        x_per_pt, y_per_pt = self._data_per_point(ax)
+        spec_width, spec_height = text_extent(specs_text, 8 * 0.62 * x_per_pt, 8 * 1.25 * y_per_pt)
+        pad_x, pad_y = 8 * x_per_pt, 8 * y_per_pt
+        spec_width, spec_height = spec_width + 2 * pad_x, spec_height + 2 * pad_y
+        (x0, x1), (y0, y1) = ax.get_xlim(), ax.get_ylim()
+        corners = [(x0 + pad_x, y1 - pad_y, 'left', 'top'), (x1 - pad_x, y1 - pad_y, 'right', 'top'),
+                   (x0 + pad_x, y0 + pad_y, 'left', 'bottom'), (x1 - pad_x, y0 + pad_y, 'right', 'bottom')]
+        box = placer.place([text_box(x, y, spec_width, spec_height, ha, va) for x, y, ha, va in corners])
+        ax.text(box[0] + pad_x, box[3] - pad_y, specs_text, fontsize=8, ha='left', va='top',
+                bbox=dict(boxstyle='round', facecolor='wheat', alpha=0.8))
+        
+        # Plan view: overall length above the deck and width on the right
+        ax = self.ax_plan
+        placer, char_width, line_height = self._annotation_placer(ax)
+        step = line_height * 1.2
+        rows = ([self.params.deck_width + step * (0.3 + k) for k in range(4)] +
+                [-step * (1.5 + k) for k in range(4)])
+        self._place_span_chain(ax, placer, np.array([0.0, span]), rows, char_width, line_height)
+        
+        width_label = f'{self.params.deck_width:.1f} m'
+        for k in range(12):
+            dim_x = span + step * (2 + k)
+            box = (dim_x - step * 0.2, 0, dim_x + step * 1.2, self.params.deck_width)
+            if placer.is_free(box):
+                break
+        placer.place([box])
+        self._dimension(ax, (dim_x, 0), (dim_x, self.params.deck_width))
+        self._dimension_text(ax, dim_x + step * 0.2, self.params.deck_width / 2, width_label,
+                             ha='left', va='center', rotation=90)
     
     def generate_drawing(self):
         """Main method to generate the bridge drawing"""
+        started = time.perf_counter()
         self.setup_drawing()
         
-        # Call appropriate drawing method based on bridge type
-        if self.bridge_type == BridgeType.BEAM:
-            self.draw_beam_bridge()
-        elif self.bridge_type == BridgeType.TRUSS:
-            self.draw_truss_bridge()
-        elif self.bridge_type == BridgeType.ARCH:
-            self.draw_arch_bridge()
-        elif self.bridge_type == BridgeType.SUSPENSION:
-            self.draw_suspension_bridge()
-        elif self.bridge_type == BridgeType.CABLE_STAYED:
-            self.draw_cable_stayed_bridge()
-        elif self.bridge_type == BridgeType.T_BEAM:
-            self.draw_t_beam_bridge()
-        elif self.bridge_type == BridgeType.SLAB:
-            self.draw_slab_bridge()
-        else:
-            raise ValueError(f"Unsupported bridge type: {self.bridge_type}")
+        # The bridge type's plugin module draws both views
+        plugin = self.plugin
+        plugin.draw_elevation(self)
+        plugin.draw_plan(self)
+        
+        if self.simplify_geometry:
+            simplify_axes_lines(self.ax_elevation)
+            simplify_axes_lines(self.ax_plan)
+        
+        # Skew before annotating so the placer avoids the members where they are drawn
+        if self.params.skew_angle:
+            self._apply_plan_skew()
+        
+        if self.include_dimensions:
+            self._add_dimensions()
         
-        plt.tight_layout()
+        self.figure.tight_layout()
+        STAGE_SECONDS.observe(time.perf_counter() - started, "generate")
+        ARTISTS.observe(sum(len(ax.patches) + len(ax.lines) + len(ax.texts) + len(ax.collections)
+                            for ax in self.figure.axes), self.bridge_type.value)
         return self.figure
     
-    def save_drawing(self, filename: str, format: OutputFormat = OutputFormat.PNG, dpi: int = 300):
-        """Save the drawing in specified format"""
+    def _apply_plan_skew(self):
+        """Skew the whole plan view with one composed transform instead of per-point math"""
+        skew = plan_skew_transform(self.params.skew_angle, self.params.deck_width).to_matplotlib()
+        transform = skew + self.ax_plan.transData
+        for artist in list(self.ax_plan.patches) + list(self.ax_plan.lines) + list(self.ax_plan.collections):
+            artist.set_transform(transform)
+    
+    def save_drawing(self, filename: str, format: OutputFormat = OutputFormat.PNG, dpi: int = 300,
+                     raster_options: Optional[RasterOptions] = None, parallel: bool = False,
+                     skip_unchanged: bool = False):
+        """Save the drawing in specified format
+        
+        With raster_options, PNG output is drawn once and encoded from the Agg
+        buffer through Pillow instead of savefig. WEBP always uses that path.
+        With parallel, each format is exported by its own worker process from
+        one geometry snapshot (see bridge_export).
+        With skip_unchanged, files whose content is unchanged are left alone
+        and the others are replaced atomically (see bridge_outputs); combine
+        it with deterministic mode so that SVG, PDF and DXF can match.
+        """
         if not self.figure:
             raise ValueError("No drawing generated. Call generate_drawing() first.")
         
         base_name = os.path.splitext(filename)[0]
         
+        if skip_unchanged:
+            self._save_changed(base_name, format, dpi, raster_options, parallel)
+            return
+        
+        if parallel:
+            from bridge_export import export_parallel
+            from bridge_handoff import SHARED_HANDOFF
+            saved = export_parallel(self, [format], dpi, base_name, raster_options=raster_options,
+                                    shared=SHARED_HANDOFF)
+            for output_format, path in saved.items():
+                print(f"Saved {output_format.value.upper()}: {path}")
+            return
+        
         if format == OutputFormat.PNG or format == OutputFormat.ALL:
-            self.figure.savefig(f"{base_name}.png", dpi=dpi, bbox_inches='tight', 
-                              facecolor='white', edgecolor='none')
+            if raster_options is not None:
+                with open(f"{base_name}.png", 'wb') as f:
+                    f.write(self.export_bytes(OutputFormat.PNG, dpi, raster_options))
+            else:
+                self._savefig(f"{base_name}.png", 'png', dpi)
             print(f"Saved PNG: {base_name}.png")
         
+        if format == OutputFormat.WEBP:
+            with open(f"{base_name}.webp", 'wb') as f:
+                f.write(self.export_bytes(OutputFormat.WEBP, dpi, raster_options))
+            print(f"Saved WEBP: {base_name}.webp")
+        
         if format == OutputFormat.SVG or format == OutputFormat.ALL:
-            self.figure.savefig(f"{base_name}.svg", format='svg', bbox_inches='tight',
-                              facecolor='white', edgecolor='none')
+            self._savefig(f"{base_name}.svg", 'svg', dpi)
             print(f"Saved SVG: {base_name}.svg")
         
         if format == OutputFormat.PDF or format == OutputFormat.ALL:
-            self.figure.savefig(f"{base_name}.pdf", format='pdf', bbox_inches='tight',
-                              facecolor='white', edgecolor='none')
+            self._savefig(f"{base_name}.pdf", 'pdf', dpi)
             print(f"Saved PDF: {base_name}.pdf")
         
         if format == OutputFormat.DXF or format == OutputFormat.ALL:
             self.save_as_dxf(f"{base_name}.dxf")
             print(f"Saved DXF: {base_name}.dxf")
     
-    def save_as_dxf(self, filename: str):
-        """Save bridge drawing as DXF file for AutoCAD compatibility"""
+    def _save_changed(self, base_name: str, format: OutputFormat, dpi: int,
+                      raster_options: Optional[RasterOptions], parallel: bool):
+        """Render every requested format to bytes and write only the files that changed"""
+        from bridge_export import expand_formats, export_parallel, export_snapshot
+        from bridge_handoff import SHARED_HANDOFF
+        
+        # expand_formats returns bridge_drawings enums, which differ from __main__'s when run as a script
+        formats = [OutputFormat(single.value) for single in expand_formats(format)]
+        # Both paths render the same stored snapshot, so toggling parallel rewrites nothing
+        if parallel:
+            outputs = export_parallel(self, formats, dpi, raster_options=raster_options, shared=SHARED_HANDOFF)
+        else:
+            outputs = export_snapshot(self, formats, dpi, raster_options)
+        
+        manifest = OutputManifest(os.path.dirname(base_name))
         try:
-            # Create new DXF document
-            doc = ezdxf.new('R2010')  # AutoCAD 2010 format for wide compatibility
-            msp = doc.modelspace()
-            
-            # Add layers for different elements
-            doc.layers.add('FOUNDATION', color=2)  # Yellow
-            doc.layers.add('STRUCTURE', color=1)   # Red  
-            doc.layers.add('DECK', color=3)        # Green
-            doc.layers.add('RAILINGS', color=4)    # Cyan
-            doc.layers.add('DIMENSIONS', color=5)  # Blue
-            doc.layers.add('TEXT', color=7)        # White/Black
-            
-            # Convert bridge elements to DXF entities
+            for output_format, data in outputs.items():
+                path = f"{base_name}.{output_format.value}"
+                status = "Saved" if write_if_changed(path, data, manifest) else "Unchanged"
+                print(f"{status} {output_format.value.upper()}: {path}")
+        finally:
+            manifest.save()
+    
+    def export_bytes(self, format: OutputFormat, dpi: int = 300,
+                     raster_options: Optional[RasterOptions] = None) -> bytes:
+        """Render a single output format to bytes without touching the filesystem"""
+        if format == OutputFormat.DXF:
+            return self.dxf_bytes()
+        if format == OutputFormat.ALL:
+            raise ValueError("export_bytes() needs a single output format")
+        if not self.figure:
+            raise ValueError("No drawing generated. Call generate_drawing() first.")
+        
+        if format == OutputFormat.WEBP:
+            raster_options = raster_options or RasterOptions(format='webp')
+            if raster_options.format != 'webp':
+                raise ValueError("WEBP output needs RasterOptions(format='webp')")
+            return self._encode_raster(dpi, raster_options)
+        if format == OutputFormat.PNG and raster_options is not None:
+            if raster_options.format != 'png':
+                raise ValueError("PNG output needs RasterOptions(format='png')")
+            return self._encode_raster(dpi, raster_options)
+        
+        buffer = io.BytesIO()
+        self._savefig(buffer, format.value, dpi)
+        return buffer.getvalue()
+    
+    def export_to(self, stream: BinaryIO, format: OutputFormat, dpi: int = 300,
+                  raster_options: Optional[RasterOptions] = None):
+        """Render a single output format into a writable binary stream
+        
+        Vector formats and DXF are written as they are produced, so the
+        stream may be a ZIP entry or socket that is never held in memory.
+        """
+        if format == OutputFormat.DXF:
+            self.write_dxf(stream)
+        elif format in (OutputFormat.SVG, OutputFormat.PDF) or (format == OutputFormat.PNG and raster_options is None):
+            if not self.figure:
+                raise ValueError("No drawing generated. Call generate_drawing() first.")
+            self._savefig(stream, format.value, dpi)
+        else:
+            stream.write(self.export_bytes(format, dpi, raster_options))
+    
+    def _encode_raster(self, dpi: int, raster_options: RasterOptions) -> bytes:
+        """Encode the culled figure through Pillow"""
+        started = time.perf_counter()
+        with cull_subpixel(self.figure, dpi, self.cull_threshold_px):
+            data = encode_figure(self.figure, dpi, raster_options, self.sheet_cache)
+        self._record_export(raster_options.format, started, len(data))
+        return data
+    
+    def _savefig(self, target, format: str, dpi: int):
+        """savefig with the drawing's standard options, pinning metadata in deterministic mode
+        
+        PNG output is culled of sub-pixel detail first; vector formats stay complete.
+        """
+        started = time.perf_counter()
+        start = _stream_position(target)
+        kwargs = dict(format=format, dpi=dpi, bbox_inches='tight', facecolor='white', edgecolor='none')
+        threshold = self.cull_threshold_px if format == 'png' else 0
+        # The SVG writer reads its hash salt from the global rcParams while it
+        # renders, so SVG exports in other threads must not overlap a pinned one
+        with cull_subpixel(self.figure, dpi, threshold), _SVG_LOCK if format == 'svg' else nullcontext():
+            if not self.deterministic:
+                self.figure.savefig(target, **kwargs)
+            else:
+                with matplotlib.rc_context({'svg.hashsalt': DETERMINISTIC_SVG_SALT}):
+                    self.figure.savefig(target, metadata=DETERMINISTIC_METADATA[format], **kwargs)
+        self._record_export(format, started, _written_size(target, start))
+    
+    def _record_export(self, format: str, started: float, size: Optional[int]):
+        """Count one finished export in the metrics registry"""
+        STAGE_SECONDS.observe(time.perf_counter() - started, f"export_{format}")
+        RENDERS.inc(self.bridge_type.value, format)
+        if size is not None:
+            OUTPUT_BYTES.inc(format, amount=size)
+    
+    def build_dxf_document(self, sheets: Optional[bool] = None):
+        """Create the ezdxf document for this bridge
+
+        Unless sheets (default: self.dxf_sheets) is False, paper-space sheet
+        layouts with viewports onto the modelspace are added as well.
+        """
+        # Create new DXF document
+        doc = ezdxf.new('R2010')  # AutoCAD 2010 format for wide compatibility
+        msp = doc.modelspace()
+        
+        # Add layers for different elements
+        doc.layers.add('FOUNDATION', color=2)  # Yellow
+        doc.layers.add('STRUCTURE', color=1)   # Red  
+        doc.layers.add('DECK', color=3)        # Green
+        doc.layers.add('RAILINGS', color=4)    # Cyan
+        doc.layers.add('DIMENSIONS', color=5)  # Blue
+        doc.layers.add('TEXT', color=7)        # White/Black
+        
+        # Convert bridge elements to DXF entities
+        if self.member_store is not None:
+            self.member_store.write_dxf_entities(msp)
+        else:
             self._add_bridge_elements_to_dxf(msp)
-            
-            # Save DXF file
-            doc.saveas(filename)
-            
+        DXF_ENTITIES.observe(len(msp), self.bridge_type.value)
+        
+        if sheets is None:
+            sheets = self.dxf_sheets
+        if sheets:
+            add_sheets(doc, standard_sheets(msp), f"General Arrangement - {self._dxf_title()}", self._dxf_specs())
+        return doc
+    
+    def write_dxf(self, stream: BinaryIO):
+        """Write the DXF drawing to a binary stream as it is serialised"""
+        started = time.perf_counter()
+        start = _stream_position(stream)
+        try:
+            with fixed_dxf_metadata() if self.deterministic else nullcontext():
+                doc = self.build_dxf_document()
+                text = io.TextIOWrapper(stream, encoding=doc.output_encoding, newline='')
+                try:
+                    if self.deterministic:
+                        write_stable_dxf(doc, text)
+                    else:
+                        doc.write(text)
+                finally:
+                    text.flush()
+                    text.detach()
         except Exception as e:
             raise RuntimeError(f"Failed to create DXF file: {str(e)}")
+        self._record_export('dxf', started, _written_size(stream, start))
+    
+    def dxf_bytes(self) -> bytes:
+        """Return the DXF drawing as bytes"""
+        buffer = io.BytesIO()
+        self.write_dxf(buffer)
+        return buffer.getvalue()
+    
+    def save_as_dxf(self, filename: str, skip_unchanged: bool = False) -> bool:
+        """Save bridge drawing as DXF file for AutoCAD compatibility
+        
+        With skip_unchanged an identical existing file is left untouched and
+        a changed one is replaced atomically. Returns whether the file was written.
+        """
+        if skip_unchanged:
+            return write_if_changed(filename, self.dxf_bytes())
+        started = time.perf_counter()
+        try:
+            with fixed_dxf_metadata() if self.deterministic else nullcontext():
+                doc = self.build_dxf_document()
+                
+                # Save DXF file
+                if self.deterministic:
+                    with open(filename, 'wt', encoding=doc.output_encoding, errors='dxfreplace') as f:
+                        write_stable_dxf(doc, f)
+                else:
+                    doc.saveas(filename)
+        except Exception as e:
+            raise RuntimeError(f"Failed to create DXF file: {str(e)}")
+        self._record_export('dxf', started, _written_size(filename, None))
+        return True
     
     def _add_bridge_elements_to_dxf(self, msp):
         """Add bridge structural elements to DXF modelspace"""
@@ -1163,200 +745,103 @@ Load: {self.params.load_capacity:.0f} kN/m"""
         ], dxfattribs={'layer': 'FOUNDATION'})
         
         # Bridge-specific elements
-        if self.bridge_type == BridgeType.BEAM:
-            self._add_beam_bridge_to_dxf(msp, span, height, width)
-        elif self.bridge_type == BridgeType.TRUSS:
-            self._add_truss_bridge_to_dxf(msp, span, height, width)
-        elif self.bridge_type == BridgeType.ARCH:
-            self._add_arch_bridge_to_dxf(msp, span, height, width)
-        elif self.bridge_type == BridgeType.SUSPENSION:
-            self._add_suspension_bridge_to_dxf(msp, span, height, width)
-        elif self.bridge_type == BridgeType.CABLE_STAYED:
-            self._add_cable_stayed_bridge_to_dxf(msp, span, height, width)
+        self.plugin.add_to_dxf(self, msp, span, height, width)
+        
+        if self.simplify_geometry:
+            simplify_dxf_lines(msp)
+        
+        # Annotations avoid the structure and each other
+        placer = self._dxf_annotation_placer(msp)
         
         # Add dimensions
-        self._add_dimensions_to_dxf(msp, span, height)
+        self._add_dimensions_to_dxf(msp, span, height, placer)
         
         # Add text specifications
-        self._add_text_to_dxf(msp, span)
-    
-    def _add_beam_bridge_to_dxf(self, msp, span, height, width):
-        """Add beam bridge elements to DXF"""
-        deck_thickness = 1.0
-        deck_y = height - deck_thickness
-        
-        # Deck
-        msp.add_lwpolyline([
-            (0, deck_y),
-            (span, deck_y),
-            (span, height),
-            (0, height),
-            (0, deck_y)
-        ], dxfattribs={'layer': 'DECK'})
-        
-        # Girders
-        girder_depth = self.params.girder_depth
-        num_girders = 4
-        for i in range(num_girders):
-            x = (i + 1) * span / (num_girders + 1)
-            msp.add_line((x, 0), (x, deck_y), dxfattribs={'layer': 'STRUCTURE'})
-            # Girder depth
-            msp.add_lwpolyline([
-                (x - 0.3, deck_y - girder_depth),
-                (x + 0.3, deck_y - girder_depth),
-                (x + 0.3, deck_y),
-                (x - 0.3, deck_y),
-                (x - 0.3, deck_y - girder_depth)
-            ], dxfattribs={'layer': 'STRUCTURE'})
-        
-        # Railings
-        rail_height = self.params.rail_height
-        msp.add_line((0, height), (0, height + rail_height), dxfattribs={'layer': 'RAILINGS'})
-        msp.add_line((span, height), (span, height + rail_height), dxfattribs={'layer': 'RAILINGS'})
-        msp.add_line((0, height + rail_height), (span, height + rail_height), dxfattribs={'layer': 'RAILINGS'})
+        self._add_text_to_dxf(msp, span, placer)
     
-    def _add_truss_bridge_to_dxf(self, msp, span, height, width):
-        """Add truss bridge elements to DXF"""
-        deck_y = height * 0.2
-        truss_top = height
-        
-        # Deck
-        msp.add_line((0, deck_y), (span, deck_y), dxfattribs={'layer': 'DECK'})
-        
-        # Top and bottom chords
-        msp.add_line((0, truss_top), (span, truss_top), dxfattribs={'layer': 'STRUCTURE'})
-        msp.add_line((0, deck_y), (span, deck_y), dxfattribs={'layer': 'STRUCTURE'})
-        
-        # Verticals and diagonals
-        num_panels = 8
-        panel_length = span / num_panels
-        
-        for i in range(num_panels + 1):
-            x = i * panel_length
-            # Verticals
-            msp.add_line((x, deck_y), (x, truss_top), dxfattribs={'layer': 'STRUCTURE'})
-            
-            # Diagonals
-            if i < num_panels:
-                x_next = (i + 1) * panel_length
-                msp.add_line((x, deck_y), (x_next, truss_top), dxfattribs={'layer': 'STRUCTURE'})
-                msp.add_line((x, truss_top), (x_next, deck_y), dxfattribs={'layer': 'STRUCTURE'})
+    def _dxf_annotation_placer(self, msp) -> AnnotationPlacer:
+        """Placer seeded with the extents of every entity already in modelspace"""
+        from ezdxf import bbox
+        
+        placer = AnnotationPlacer(cell_size=DXF_TEXT_HEIGHT * 4, padding=DXF_TEXT_HEIGHT * 0.3)
+        for extents in bbox.multi_flat(msp, fast=True):
+            if extents.has_data:
+                placer.add_obstacle((extents.extmin.x, extents.extmin.y, extents.extmax.x, extents.extmax.y))
+        return placer
     
-    def _add_arch_bridge_to_dxf(self, msp, span, height, width):
-        """Add arch bridge elements to DXF"""
-        deck_y = height * 0.8
-        arch_rise = height * 0.6
-        
-        # Deck
-        msp.add_line((0, deck_y), (span, deck_y), dxfattribs={'layer': 'DECK'})
-        
-        # Arch (approximated with line segments)
-        num_segments = 20
-        arch_points = []
-        for i in range(num_segments + 1):
-            x = i * span / num_segments
-            # Parabolic arch
-            y = arch_rise * (1 - (2 * x / span - 1) ** 2)
-            arch_points.append((x, y))
-        
-        msp.add_lwpolyline(arch_points, dxfattribs={'layer': 'STRUCTURE'})
-    
-    def _add_suspension_bridge_to_dxf(self, msp, span, height, width):
-        """Add suspension bridge elements to DXF"""
-        tower_width = 2.0
-        tower_height = height
-        deck_y = height * 0.3
-        
-        # Towers
-        tower1_x = span * 0.25
-        tower2_x = span * 0.75
-        
-        msp.add_line((tower1_x, 0), (tower1_x, tower_height), dxfattribs={'layer': 'STRUCTURE'})
-        msp.add_line((tower2_x, 0), (tower2_x, tower_height), dxfattribs={'layer': 'STRUCTURE'})
-        
-        # Deck
-        msp.add_line((0, deck_y), (span, deck_y), dxfattribs={'layer': 'DECK'})
-        
-        # Main cables (parabolic curve)
-        num_points = 30
-        cable_points = []
-        for i in range(num_points + 1):
-            x = i * span / num_points
-            # Parabolic cable shape
-            if tower1_x <= x <= tower2_x:
-                y = deck_y + 0.1 * ((x - span/2) / (span/4)) ** 2 * (tower_height - deck_y)
-            else:
-                y = tower_height
-            cable_points.append((x, y))
-        
-        msp.add_lwpolyline(cable_points, dxfattribs={'layer': 'STRUCTURE'})
+    def _add_dimensions_to_dxf(self, msp, span, height, placer: AnnotationPlacer):
+        """Add dimension lines and their values to DXF"""
+        from ezdxf.enums import TextEntityAlignment
         
-        # Hangers
-        for i in range(1, num_points):
-            x = i * span / num_points
-            if tower1_x < x < tower2_x:
-                cable_y = deck_y + 0.1 * ((x - span/2) / (span/4)) ** 2 * (tower_height - deck_y)
-                msp.add_line((x, deck_y), (x, cable_y), dxfattribs={'layer': 'STRUCTURE'})
-    
-    def _add_cable_stayed_bridge_to_dxf(self, msp, span, height, width):
-        """Add cable-stayed bridge elements to DXF"""
-        tower_x = span / 2
-        tower_height = height
-        deck_y = height * 0.2
-        
-        # Tower
-        msp.add_line((tower_x, 0), (tower_x, tower_height), dxfattribs={'layer': 'STRUCTURE'})
-        
-        # Deck
-        msp.add_line((0, deck_y), (span, deck_y), dxfattribs={'layer': 'DECK'})
-        
-        # Cables
-        num_cables = 8
-        for i in range(1, num_cables + 1):
-            # Left side cables
-            x_left = i * tower_x / (num_cables + 1)
-            cable_top_y = tower_height * (1 - i / (num_cables + 2))
-            msp.add_line((x_left, deck_y), (tower_x, cable_top_y), dxfattribs={'layer': 'STRUCTURE'})
-            
-            # Right side cables
-            x_right = tower_x + i * tower_x / (num_cables + 1)
-            msp.add_line((x_right, deck_y), (tower_x, cable_top_y), dxfattribs={'layer': 'STRUCTURE'})
-    
-    def _add_dimensions_to_dxf(self, msp, span, height):
-        """Add dimension lines to DXF"""
-        # Span dimension
-        dim_y = -5
+        text_height = DXF_TEXT_HEIGHT
+        char_width = text_height * DXF_CHAR_WIDTH
+        
+        # Span dimension on the first free row below the structure
+        label = f"{span:.0f} m"
+        for k in range(20):
+            dim_y = -self.params.foundation_depth - 2 - k * text_height * 1.5
+            box = (0, dim_y - 1, span, dim_y + 1 + text_height * 1.3)
+            if placer.is_free(box):
+                break
+        placer.place([box])
         msp.add_line((0, dim_y), (span, dim_y), dxfattribs={'layer': 'DIMENSIONS'})
         msp.add_line((0, dim_y - 1), (0, dim_y + 1), dxfattribs={'layer': 'DIMENSIONS'})
         msp.add_line((span, dim_y - 1), (span, dim_y + 1), dxfattribs={'layer': 'DIMENSIONS'})
-        
-        # Height dimension
-        dim_x = span + 5
+        text = msp.add_text(label, dxfattribs={'layer': 'DIMENSIONS', 'height': text_height})
+        text.set_placement((span / 2, dim_y + text_height * 0.3), align=TextEntityAlignment.BOTTOM_CENTER)
+        
+        # Height dimension on the first free column right of the structure
+        label = f"{height:.0f} m"
+        for k in range(20):
+            dim_x = span + 5 + k * text_height * 1.5
+            box = (dim_x - 1, 0, dim_x + 1.5 + len(label) * char_width, height)
+            if placer.is_free(box):
+                break
+        placer.place([box])
         msp.add_line((dim_x, 0), (dim_x, height), dxfattribs={'layer': 'DIMENSIONS'})
         msp.add_line((dim_x - 1, 0), (dim_x + 1, 0), dxfattribs={'layer': 'DIMENSIONS'})
         msp.add_line((dim_x - 1, height), (dim_x + 1, height), dxfattribs={'layer': 'DIMENSIONS'})
+        text = msp.add_text(label, dxfattribs={'layer': 'DIMENSIONS', 'height': text_height})
+        text.set_placement((dim_x + 1.5, height / 2), align=TextEntityAlignment.MIDDLE_LEFT)
     
-    def _add_text_to_dxf(self, msp, span):
-        """Add text annotations to DXF"""
-        from ezdxf.enums import TextEntityAlignment
-        
-        # Title
-        title_text = f"{self.bridge_type.value.title().replace('_', ' ')} Bridge"
-        title = msp.add_text(title_text, dxfattribs={'layer': 'TEXT', 'height': 3})
-        title.set_placement((span/2, -15), align=TextEntityAlignment.MIDDLE_CENTER)
-        
-        # Specifications
-        specs = [
+    def _dxf_title(self) -> str:
+        return f"{self.bridge_type.value.title().replace('_', ' ')} Bridge"
+    
+    def _dxf_specs(self) -> List[str]:
+        """Specification lines shown in modelspace and in the sheet title blocks"""
+        return [
             f"Span: {self.params.span_length:.0f}m",
             f"Width: {self.params.deck_width:.0f}m", 
             f"Height: {self.params.height:.0f}m",
             f"Material: {self.params.material.title()}",
             f"Load: {self.params.load_capacity:.0f} kN/m"
         ]
+    
+    def _add_text_to_dxf(self, msp, span, placer: AnnotationPlacer):
+        """Add text annotations to DXF"""
+        from ezdxf.enums import TextEntityAlignment
         
+        # Title, centred under the bridge on the first free line
+        title_text = self._dxf_title()
+        title_height = DXF_TEXT_HEIGHT * 2
+        title_width = len(title_text) * title_height * DXF_CHAR_WIDTH
+        top = -self.params.foundation_depth - 10
+        box = placer.place([text_box(span / 2, top - k * title_height, title_width, title_height * 1.2, va='top')
+                            for k in range(30)])
+        title = msp.add_text(title_text, dxfattribs={'layer': 'TEXT', 'height': title_height})
+        title.set_placement(((box[0] + box[2]) / 2, (box[1] + box[3]) / 2), align=TextEntityAlignment.MIDDLE_CENTER)
+        
+        # Specifications, kept together as one block below the title or beside it
+        specs = self._dxf_specs()
+        line_height = DXF_TEXT_HEIGHT * 2
+        block_width, block_height = text_extent("\n".join(specs), DXF_TEXT_HEIGHT * DXF_CHAR_WIDTH, line_height)
+        candidates = [text_box(x, box[1] - DXF_TEXT_HEIGHT - k * line_height, block_width, block_height, ha='left', va='top')
+                      for k in range(30) for x in (5, box[2] + 5)]
+        block = placer.place(candidates)
         for i, spec in enumerate(specs):
-            spec_text = msp.add_text(spec, dxfattribs={'layer': 'TEXT', 'height': 1.5})
-            spec_text.set_placement((5, -25 - i*3), align=TextEntityAlignment.LEFT)
+            spec_text = msp.add_text(spec, dxfattribs={'layer': 'TEXT', 'height': DXF_TEXT_HEIGHT})
+            spec_text.set_placement((block[0], block[3] - (i + 0.5) * line_height),
+                                    align=TextEntityAlignment.MIDDLE_LEFT)
 
 
 def create_example_bridges():
@@ -1412,7 +897,7 @@ def create_example_bridges():
         span_length=150.0,
         deck_width=18.0,
         height=60.0,
-        supports=0,
+        supports=1,
         load_capacity=100.0,
         material="steel"
     )
@@ -1424,7 +909,7 @@ def create_example_bridges():
 def main():
     """Main function for command-line interface"""
     parser = argparse.ArgumentParser(description='Generate bridge general arrangement drawings')
-    parser.add_argument('bridge_type', choices=[bt.value for bt in BridgeType],
+    parser.add_argument('bridge_type', nargs='?', choices=bridge_type_names(),
                        help='Type of bridge to generate')
     parser.add_argument('--span', type=float, default=100.0,
                        help='Main span length in meters (default: 100.0)')
@@ -1434,32 +919,64 @@ def main():
                        help='Overall height in meters (default: 20.0)')
     parser.add_argument('--supports', type=int, default=0,
                        help='Number of intermediate supports (default: 0)')
+    parser.add_argument('--spans', type=float, nargs='+', metavar='LENGTH',
+                       help='Individual span lengths in meters, overrides --span and --supports')
+    parser.add_argument('--pier-heights', type=float, nargs='+', metavar='LEVEL',
+                       help='Pier top levels in meters, one per intermediate support')
     parser.add_argument('--load', type=float, default=50.0,
                        help='Design load in kN/m (default: 50.0)')
     parser.add_argument('--material', default='steel',
                        help='Primary material (default: steel)')
+    parser.add_argument('--skew', type=float, default=0.0,
+                       help='Plan skew angle in degrees (default: 0)')
     parser.add_argument('--output', default='bridge_drawing',
                        help='Output filename (without extension)')
     parser.add_argument('--format', choices=[of.value for of in OutputFormat], 
                        default='png', help='Output format (default: png)')
     parser.add_argument('--examples', action='store_true',
                        help='Generate example bridges of all types')
+    parser.add_argument('--deterministic', action='store_true',
+                       help='Byte-identical output for identical inputs (fixed metadata, IDs and DXF header)')
+    parser.add_argument('--parallel', action='store_true',
+                       help='Export each format in its own worker process')
+    parser.add_argument('--skip-unchanged', action='store_true',
+                       help='Only rewrite files whose content changed (implies --deterministic)')
+    parser.add_argument('--cull-px', type=float, default=DEFAULT_THRESHOLD_PX,
+                       help=f'Drop or merge raster detail smaller than this many pixels, 0 keeps all (default: {DEFAULT_THRESHOLD_PX})')
+    parser.add_argument('--no-dxf-sheets', action='store_true',
+                       help='Write only the DXF modelspace, without the paper-space sheet layouts')
+    parser.add_argument('--store', action='store_true',
+                       help='Also save the generated geometry as a re-exportable .npz member store')
+    parser.add_argument('--force', action='store_true',
+                       help='Render even if feasibility screening reports errors')
     
     args = parser.parse_args()
+    if args.skip_unchanged:
+        args.deterministic = True
+    
+    from bridge_feasibility import check_feasibility, partition_feasible
     
     if args.examples:
         print("Generating example bridges...")
-        examples = create_example_bridges()
+        examples, rejected = partition_feasible(create_example_bridges())
+        for report in rejected:
+            print(f"Skipping infeasible example:\n{report.summary()}")
         
         for bridge_type, params, filename in examples:
             generator = BridgeDrawingGenerator(bridge_type, params)
+            generator.deterministic = args.deterministic
+            generator.cull_threshold_px = args.cull_px
+            generator.dxf_sheets = not args.no_dxf_sheets
             generator.generate_drawing()
-            generator.save_drawing(filename, OutputFormat.ALL)
+            generator.save_drawing(filename, OutputFormat.ALL, skip_unchanged=args.skip_unchanged)
             print(f"Generated {bridge_type.value} bridge example")
         
         print("All example bridges generated successfully!")
         return
     
+    if not args.bridge_type:
+        parser.error("bridge_type is required unless --examples is given")
+    
     # Create bridge parameters from command line arguments
     try:
         params = BridgeParameters(
@@ -1468,18 +985,38 @@ def main():
             height=args.height,
             supports=args.supports,
             load_capacity=args.load,
-            material=args.material
+            material=args.material,
+            skew_angle=args.skew,
+            span_lengths=args.spans,
+            pier_heights=args.pier_heights
         )
         
-        bridge_type = BridgeType(args.bridge_type)
+        bridge_type = resolve_bridge_type(args.bridge_type)
         output_format = OutputFormat(args.format)
         
+        report = check_feasibility(bridge_type, params)
+        if report.issues:
+            print(report.summary())
+        if not report.feasible and not args.force:
+            print("Bridge geometry is infeasible, use --force to render anyway.")
+            return 1
+        
         print(f"Generating {bridge_type.value} bridge drawing...")
         print(f"Parameters: {params}")
         
         generator = BridgeDrawingGenerator(bridge_type, params)
+        generator.deterministic = args.deterministic
+        generator.cull_threshold_px = args.cull_px
+        generator.dxf_sheets = not args.no_dxf_sheets
         generator.generate_drawing()
-        generator.save_drawing(args.output, output_format)
+        generator.save_drawing(args.output, output_format, parallel=args.parallel,
+                               skip_unchanged=args.skip_unchanged)
+        
+        if args.store:
+            from bridge_store import MemberStore
+            store_path = f"{os.path.splitext(args.output)[0]}.npz"
+            MemberStore.from_generator(generator).save(store_path)
+            print(f"Saved member store: {store_path}")
         
         print(f"Bridge drawing saved successfully!")
         
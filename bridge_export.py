@@ -0,0 +1,182 @@
+"""
+Parallel Per-Format Export
+
+Snapshots a generated drawing once as a member store (.npz) and exports each
+requested format in its own worker process. Every worker memory-maps the
+same snapshot, rebuilds the figure from arrays and encodes a single format,
+so exporting all formats costs roughly the slowest one instead of the sum.
+With shared=True workers hand their output back through shared memory
+(bridge_handoff) rather than pickling it through the pool, so the parent
+reads each file's bytes where the worker wrote them.
+
+write_bundle streams several formats into one ZIP archive instead, one entry
+at a time, for "download all" style delivery.
+"""
+
+from concurrent.futures import ProcessPoolExecutor
+from typing import BinaryIO, Dict, Iterable, List, Optional, Tuple, Union
+import os
+import shutil
+import tempfile
+import time
+import zipfile
+
+from bridge_drawings import OutputFormat
+from bridge_handoff import Handoff, discard, hand_off, receive
+from bridge_metrics import REGISTRY
+from bridge_raster import RasterOptions
+from bridge_store import MemberStore
+
+
+EXPORT_FORMATS = [OutputFormat.PNG, OutputFormat.SVG, OutputFormat.PDF, OutputFormat.DXF]
+
+# Already-compressed formats are stored, everything else is deflated
+STORED_FORMATS = {OutputFormat.PNG, OutputFormat.WEBP}
+DETERMINISTIC_ZIP_TIME = (1980, 1, 1, 0, 0, 0)
+
+
+def render_snapshot(store_path: str, format: str, dpi: int, raster_options: Optional[RasterOptions] = None,
+                    deterministic: bool = False, dxf_sheets: bool = True) -> bytes:
+    """Encode one format of a stored snapshot, exactly as the export workers do"""
+    import matplotlib.pyplot as plt
+
+    generator = MemberStore.load(store_path).to_generator()
+    generator.deterministic = deterministic
+    generator.dxf_sheets = dxf_sheets
+    try:
+        return generator.export_bytes(OutputFormat(format), dpi=dpi, raster_options=raster_options)
+    finally:
+        plt.close(generator.figure)
+
+
+def _export_worker(store_path: str, format: str, dpi: int, output: Optional[str],
+                   raster_options: Optional[RasterOptions] = None,
+                   deterministic: bool = False, dxf_sheets: bool = True,
+                   shared: bool = False) -> Tuple[Union[bytes, Handoff], Dict]:
+    """Render one format from a stored snapshot; writes output if given, else returns bytes
+
+    With shared the bytes are left in shared memory and a Handoff is returned
+    in their place. The worker's metrics are returned alongside for the
+    parent to merge.
+    """
+    import matplotlib
+    matplotlib.use('Agg')
+
+    REGISTRY.drain()  # a forked worker starts with a copy of the parent's values
+    data = render_snapshot(store_path, format, dpi, raster_options, deterministic, dxf_sheets)
+    if output is not None:
+        with open(output, 'wb') as f:
+            f.write(data)
+        data = b""
+    elif shared:
+        data = hand_off(data)
+    return data, REGISTRY.drain()
+
+
+def _save_snapshot(generator, workdir: str) -> str:
+    """Store the generator's geometry in workdir; returns the snapshot path"""
+    store_path = os.path.join(workdir, "snapshot.npz")
+    store = generator.member_store or MemberStore.from_generator(generator)
+    store.save(store_path)
+    return store_path
+
+
+def _format_options(raster_options: Optional[RasterOptions], fmt: OutputFormat) -> Optional[RasterOptions]:
+    return raster_options if raster_options and raster_options.format == fmt.value else None
+
+
+def expand_formats(format: OutputFormat) -> List[OutputFormat]:
+    """The single formats behind format; compares by value so enums from __main__ work too"""
+    format = OutputFormat(format.value)
+    return list(EXPORT_FORMATS) if format == OutputFormat.ALL else [format]
+
+
+def export_parallel(generator, formats: Iterable[OutputFormat], dpi: int = 300,
+                    base_name: Optional[str] = None, max_workers: Optional[int] = None,
+                    raster_options: Optional[RasterOptions] = None,
+                    shared: bool = False) -> Dict[OutputFormat, Union[bytes, memoryview, str]]:
+    """Export several formats concurrently from one geometry snapshot
+
+    With base_name each worker writes <base_name>.<ext> itself and the
+    returned dict maps formats to filenames; otherwise it maps formats to
+    their data: bytes pickled through the pool, or with shared (pass
+    SHARED_HANDOFF) a read-only memoryview of the worker's output in shared
+    memory.
+    """
+    formats = [f for fmt in formats for f in expand_formats(fmt)]
+    if generator.member_store is None and generator.figure is None:
+        generator.generate_drawing()
+
+    workdir = tempfile.mkdtemp(prefix="bridge_export_")
+    try:
+        store_path = _save_snapshot(generator, workdir)
+        outputs = {fmt: f"{base_name}.{fmt.value}" if base_name else None for fmt in formats}
+        futures = {}
+        try:
+            with ProcessPoolExecutor(max_workers=max_workers or len(formats)) as executor:
+                for fmt in formats:
+                    futures[fmt] = executor.submit(_export_worker, store_path, fmt.value, dpi, outputs[fmt],
+                                                   _format_options(raster_options, fmt), generator.deterministic,
+                                                   generator.dxf_sheets, shared)
+                results = {}
+                for fmt, future in futures.items():
+                    result, metrics = future.result()
+                    results[fmt] = receive(result)
+                    REGISTRY.merge(metrics)
+        except BaseException:
+            # The pool has finished: free whatever the other workers left in shared memory
+            for future in futures.values():
+                if future.done() and not future.cancelled() and future.exception() is None:
+                    discard(future.result()[0])
+            raise
+    finally:
+        shutil.rmtree(workdir, ignore_errors=True)
+
+    if base_name:
+        return outputs
+    return results
+
+
+def export_snapshot(generator, formats: Iterable[OutputFormat], dpi: int = 300,
+                    raster_options: Optional[RasterOptions] = None) -> Dict[OutputFormat, bytes]:
+    """Export several formats in this process from the same snapshot export_parallel renders
+
+    The figure is rebuilt from the stored geometry as in the workers, so the
+    bytes are identical to export_parallel's and skip-unchanged writes do
+    not depend on whether the export ran in parallel.
+    """
+    formats = [f for fmt in formats for f in expand_formats(fmt)]
+    if generator.member_store is None and generator.figure is None:
+        generator.generate_drawing()
+
+    workdir = tempfile.mkdtemp(prefix="bridge_export_")
+    try:
+        store_path = _save_snapshot(generator, workdir)
+        return {fmt: render_snapshot(store_path, fmt.value, dpi, _format_options(raster_options, fmt),
+                                     generator.deterministic, generator.dxf_sheets)
+                for fmt in formats}
+    finally:
+        shutil.rmtree(workdir, ignore_errors=True)
+
+
+def write_bundle(generator, fileobj: BinaryIO, base_name: str,
+                 formats: Iterable[OutputFormat] = EXPORT_FORMATS, dpi: int = 300,
+                 raster_options: Optional[RasterOptions] = None):
+    """Write a ZIP archive of several formats to fileobj, rendering each straight into its entry
+
+    Only one format is being produced at any time and vector formats never
+    exist as a whole in memory. fileobj need not be seekable.
+    """
+    formats = [f for fmt in formats for f in expand_formats(fmt)]
+    if generator.member_store is None and generator.figure is None:
+        generator.generate_drawing()
+    date_time = DETERMINISTIC_ZIP_TIME if generator.deterministic else time.localtime()[:6]
+
+    with zipfile.ZipFile(fileobj, 'w') as bundle:
+        for fmt in formats:
+            info = zipfile.ZipInfo(f"{base_name}.{fmt.value}", date_time=date_time)
+            info.compress_type = zipfile.ZIP_STORED if fmt in STORED_FORMATS else zipfile.ZIP_DEFLATED
+            info.external_attr = 0o644 << 16
+            options = _format_options(raster_options, fmt)
+            with bundle.open(info, 'w', force_zip64=True) as entry:
+                generator.export_to(entry, OutputFormat(fmt.value), dpi, options)
@@ -0,0 +1,316 @@
+#!/usr/bin/env python3
+"""
+Geometric Feasibility Screening for Bridge Drawings
+
+Cheap checks that catch parameter combinations which would produce nonsense
+drawings (missing towers, arches rising higher than their span, piers that
+overlap each other, decks below ground level) before anything is rendered.
+
+The rules mirror the geometry used by the draw_* methods in bridge_drawings.py
+and are evaluated as NumPy masks over whole columns of parameters, so a batch
+of thousands of cases is screened in a single pass per bridge type.
+"""
+
+from dataclasses import dataclass, field
+from typing import Callable, Dict, Iterable, List, Sequence, Tuple
+import argparse
+import itertools
+
+import numpy as np
+
+from bridge_drawings import BridgeType, BridgeParameters, resolve_bridge_type
+from bridge_types import bridge_type_names
+
+
+@dataclass
+class FeasibilityIssue:
+    """A single problem found while screening a bridge"""
+    code: str
+    message: str
+    severity: str = "error"  # "error" blocks rendering, "warning" is informational
+
+
+@dataclass
+class FeasibilityReport:
+    """Screening result for one bridge"""
+    bridge_type: BridgeType
+    params: BridgeParameters
+    issues: List[FeasibilityIssue] = field(default_factory=list)
+
+    @property
+    def errors(self) -> List[FeasibilityIssue]:
+        return [issue for issue in self.issues if issue.severity == "error"]
+
+    @property
+    def warnings(self) -> List[FeasibilityIssue]:
+        return [issue for issue in self.issues if issue.severity == "warning"]
+
+    @property
+    def feasible(self) -> bool:
+        return not self.errors
+
+    def summary(self) -> str:
+        """One line per issue, suitable for console output"""
+        if not self.issues:
+            return f"{self.bridge_type.value}: OK"
+        lines = [f"{self.bridge_type.value}: {len(self.errors)} error(s), {len(self.warnings)} warning(s)"]
+        for issue in self.issues:
+            lines.append(f"  [{issue.severity.upper()}] {issue.code}: {issue.message}")
+        return "\n".join(lines)
+
+
+@dataclass
+class _Rule:
+    """Vectorised screening rule: `failed` maps parameter columns to a boolean mask"""
+    code: str
+    severity: str
+    failed: Callable[[Dict[str, np.ndarray]], np.ndarray]
+    message: Callable[[Dict[str, np.ndarray], int], str]
+
+
+def _columns(params_list: Sequence[BridgeParameters]) -> Dict[str, np.ndarray]:
+    """Build parameter columns plus the derived quantities the drawings use"""
+    cols = {
+        'span': np.array([p.span_length for p in params_list], dtype=float),
+        'width': np.array([p.deck_width for p in params_list], dtype=float),
+        'height': np.array([p.height for p in params_list], dtype=float),
+        'supports': np.array([p.supports for p in params_list], dtype=int),
+        'girder': np.array([p.girder_depth for p in params_list], dtype=float),
+        'foundation': np.array([p.foundation_depth for p in params_list], dtype=float),
+        'skew': np.array([p.skew_angle for p in params_list], dtype=float),
+    }
+    cols['num_spans'] = np.maximum(cols['supports'] + 1, 1)
+    cols['span_each'] = cols['span'] / cols['num_spans']
+    cols['end_span'] = cols['span_each'].copy()
+    cols['explicit_towers'] = np.zeros(len(params_list), dtype=bool)
+    # Explicit pier heights are screened by their lowest and highest top, NaN if any is not finite
+    cols['pier_low'] = np.zeros(len(params_list))
+    cols['pier_high'] = np.zeros(len(params_list))
+    # Unequal spans are screened by their shortest span and shortest end span
+    for row, p in enumerate(params_list):
+        if p.span_lengths is not None:
+            lengths = p.span_table().lengths
+            cols['span_each'][row] = lengths.min()
+            cols['end_span'][row] = min(lengths[0], lengths[-1])
+            cols['explicit_towers'][row] = len(lengths) == 3
+        if p.pier_heights:
+            tops = np.asarray(p.pier_heights, dtype=float)
+            finite = np.isfinite(tops).all()
+            cols['pier_low'][row] = tops.min() if finite else np.nan
+            cols['pier_high'][row] = tops.max() if finite else np.nan
+    # Suspension towers sit at the piers of an explicit three-span table, else at 20% of the span
+    cols['side_span'] = np.where(cols['explicit_towers'], cols['end_span'], cols['span'] * 0.2)
+    return cols
+
+
+# Rules shared by every bridge type
+_COMMON_RULES = [
+    _Rule("negative-supports", "error",
+          lambda c: c['supports'] < 0,
+          lambda c, i: f"supports={c['supports'][i]} must not be negative"),
+    _Rule("foundation-depth", "error",
+          lambda c: c['foundation'] <= 0,
+          lambda c, i: f"foundation_depth={c['foundation'][i]:g} m must be positive"),
+    _Rule("pier-height", "error",
+          lambda c: ~(c['pier_low'] >= 0) | ~(c['pier_high'] <= c['height']),
+          lambda c, i: "pier heights must be finite" if np.isnan(c['pier_low'][i]) else
+                       f"pier tops from {c['pier_low'][i]:g} to {c['pier_high'][i]:g} m must lie "
+                       f"between ground and the {c['height'][i]:g} m height"),
+    _Rule("high-skew", "warning",
+          lambda c: np.abs(c['skew']) > 45,
+          lambda c, i: f"skew of {c['skew'][i]:g} degrees distorts supports beyond typical practice"),
+]
+
+
+def _pier_rules(pier_width: float, abutment_width: float) -> List[_Rule]:
+    """Overlap rules for types with piers between end abutments"""
+    return [
+        _Rule("pier-overlap", "error",
+              lambda c: (c['num_spans'] > 2) & (c['span_each'] <= pier_width),
+              lambda c, i: f"span of {c['span_each'][i]:.2f} m is narrower than the "
+                           f"{pier_width:g} m piers, adjacent piers overlap"),
+        _Rule("abutment-overlap", "error",
+              lambda c: (c['num_spans'] > 1) & (c['end_span'] <= (pier_width + abutment_width) / 2),
+              lambda c, i: f"end pier at {c['end_span'][i]:.2f} m overlaps the "
+                           f"{abutment_width:g} m abutment"),
+    ]
+
+
+def _girder_rules(pier_width: float) -> List[_Rule]:
+    """Rules for girder-supported decks (beam and T-beam)"""
+    return [
+        _Rule("deck-below-ground", "error",
+              lambda c: c['height'] - c['girder'] <= 0,
+              lambda c, i: f"girder_depth={c['girder'][i]:g} m reaches the ground "
+                           f"(height={c['height'][i]:g} m)"),
+        _Rule("pier-narrower-than-girder", "warning",
+              lambda c: (c['num_spans'] > 1) & (pier_width < c['girder']),
+              lambda c, i: f"{pier_width:g} m piers are narrower than the "
+                           f"{c['girder'][i]:g} m girder depth"),
+    ]
+
+
+_TYPE_RULES: Dict[BridgeType, List[_Rule]] = {
+    BridgeType.BEAM: _girder_rules(2.0) + _pier_rules(2.0, 3.0),
+    BridgeType.TRUSS: [
+        _Rule("truss-depth", "error",
+              lambda c: c['height'] * 0.7 - 1 <= 0,
+              lambda c, i: f"height={c['height'][i]:g} m leaves no room for a truss above the deck"),
+        _Rule("support-overlap", "error",
+              lambda c: (c['num_spans'] > 1) & (c['span_each'] <= 2.5),
+              lambda c, i: f"span of {c['span_each'][i]:.2f} m is narrower than the 2.5 m supports"),
+        _Rule("support-wider-than-deck", "warning",
+              lambda c: c['width'] < 2.5,
+              lambda c, i: f"2.5 m supports are wider than the {c['width'][i]:g} m deck in plan"),
+    ],
+    BridgeType.ARCH: _pier_rules(4.0 * 2 / 3, 4.0) + [
+        _Rule("arch-rise-exceeds-span", "error",
+              lambda c: c['height'] * 0.7 > c['span_each'],
+              lambda c, i: f"arch rise of {c['height'][i] * 0.7:.2f} m exceeds the "
+                           f"{c['span_each'][i]:.2f} m span"),
+        _Rule("arch-thickness", "error",
+              lambda c: c['span_each'] / 2 <= 2.0,
+              lambda c, i: f"span of {c['span_each'][i]:.2f} m is too short for a 2 m thick arch ring"),
+        _Rule("arch-rise-thickness", "error",
+              lambda c: c['height'] * 0.7 <= 2.0,
+              lambda c, i: f"arch rise of {c['height'][i] * 0.7:.2f} m is not more than the 2 m ring"),
+        _Rule("abutment-wider-than-deck", "warning",
+              lambda c: c['width'] < 4.0,
+              lambda c, i: f"4 m abutments are wider than the {c['width'][i]:g} m deck in plan"),
+    ],
+    BridgeType.SUSPENSION: [
+        _Rule("anchorage-tower-overlap", "error",
+              lambda c: c['side_span'] - 1.5 <= 3.0,
+              lambda c, i: f"towers at {c['side_span'][i]:.2f} m overlap the 6 m anchorages"),
+        _Rule("tower-below-deck", "error",
+              lambda c: c['height'] <= c['height'] * 0.4 + 0.8,
+              lambda c, i: f"height={c['height'][i]:g} m puts the tower top below the deck"),
+        _Rule("supports-ignored", "warning",
+              lambda c: (c['supports'] > 0) & ~c['explicit_towers'],
+              lambda c, i: "suspension bridges always draw two towers, supports are ignored "
+                           "unless three span_lengths place them"),
+    ],
+    BridgeType.CABLE_STAYED: _pier_rules(4.0, 5.0) + [
+        _Rule("no-towers", "error",
+              lambda c: c['supports'] <= 0,
+              lambda c, i: "supports=0 draws no towers, at least one support is required"),
+        _Rule("stay-anchorage", "error",
+              lambda c: c['height'] * 0.8 <= c['height'] * 0.3 + 0.8,
+              lambda c, i: f"height={c['height'][i]:g} m puts the stay anchorages below the deck"),
+    ],
+    BridgeType.T_BEAM: _girder_rules(2.0) + _pier_rules(2.0, 3.0) + [
+        _Rule("t-beam-web", "error",
+              lambda c: c['girder'] <= 0.6,
+              lambda c, i: f"girder_depth={c['girder'][i]:g} m is not deeper than the 0.6 m deck slab"),
+        _Rule("t-beam-flange-below-ground", "error",
+              lambda c: c['height'] - 2 * c['girder'] + 0.6 - 0.3 <= 0,
+              lambda c, i: "T-beam flanges extend below ground level"),
+    ],
+    BridgeType.SLAB: _pier_rules(2.5, 4.0) + [
+        _Rule("slab-below-ground", "error",
+              lambda c: c['height'] - np.maximum(0.8, c['span'] / 100) <= 0,
+              lambda c, i: f"slab of {max(0.8, c['span'][i] / 100):.2f} m fills the "
+                           f"{c['height'][i]:g} m height"),
+        _Rule("rebar-spacing", "warning",
+              lambda c: c['span'] < 2.0,
+              lambda c, i: "span is shorter than the 2 m reinforcement spacing"),
+    ],
+}
+
+_TYPE_RULES_BY_NAME = {bridge_type.value: rules for bridge_type, rules in _TYPE_RULES.items()}
+
+
+def screen_batch(cases: Iterable[Tuple[BridgeType, BridgeParameters]]) -> List[FeasibilityReport]:
+    """Screen many bridges at once, returning one report per case in input order"""
+    cases = list(cases)
+    reports = [FeasibilityReport(bridge_type, params) for bridge_type, params in cases]
+
+    # Group by type so each rule is evaluated once over a whole column
+    groups: Dict[BridgeType, List[int]] = {}
+    for index, (bridge_type, _) in enumerate(cases):
+        groups.setdefault(bridge_type, []).append(index)
+
+    for bridge_type, indices in groups.items():
+        cols = _columns([cases[i][1] for i in indices])
+        # Look up by value so enums from a script run as __main__ and plugin types still match
+        for rule in _COMMON_RULES + _TYPE_RULES_BY_NAME.get(bridge_type.value, []):
+            for row in np.flatnonzero(rule.failed(cols)):
+                reports[indices[row]].issues.append(
+                    FeasibilityIssue(rule.code, rule.message(cols, row), rule.severity))
+
+    return reports
+
+
+def check_feasibility(bridge_type: BridgeType, params: BridgeParameters) -> FeasibilityReport:
+    """Screen a single bridge"""
+    return screen_batch([(bridge_type, params)])[0]
+
+
+def partition_feasible(cases: Iterable[Tuple]) -> Tuple[List[Tuple], List[FeasibilityReport]]:
+    """Split (bridge_type, params, ...) tuples into feasible cases and rejected reports"""
+    cases = list(cases)
+    reports = screen_batch((case[0], case[1]) for case in cases)
+    feasible = [case for case, report in zip(cases, reports) if report.feasible]
+    rejected = [report for report in reports if not report.feasible]
+    return feasible, rejected
+
+
+def _sweep_cases(steps: int) -> List[Tuple[BridgeType, BridgeParameters]]:
+    """Parameter grid over the Streamlit slider ranges for every bridge type"""
+    spans = np.linspace(20.0, 500.0, steps)
+    widths = np.linspace(6.0, 30.0, max(2, steps // 2))
+    heights = np.linspace(10.0, 100.0, steps)
+    girders = np.linspace(1.0, 5.0, max(2, steps // 2))
+    cases = []
+    for bridge_type in map(resolve_bridge_type, bridge_type_names()):
+        for span, width, height, supports, girder in itertools.product(
+                spans, widths, heights, range(0, 11), girders):
+            params = BridgeParameters(span_length=float(span), deck_width=float(width),
+                                      height=float(height), supports=supports,
+                                      load_capacity=50.0, material="steel",
+                                      girder_depth=float(girder))
+            cases.append((bridge_type, params))
+    return cases
+
+
+def main():
+    """Command-line feasibility screening"""
+    parser = argparse.ArgumentParser(description='Screen bridge parameters for degenerate geometry')
+    parser.add_argument('bridge_type', nargs='?', choices=bridge_type_names(),
+                       help='Type of bridge to screen')
+    parser.add_argument('--span', type=float, default=100.0, help='Main span length in meters')
+    parser.add_argument('--width', type=float, default=12.0, help='Deck width in meters')
+    parser.add_argument('--height', type=float, default=20.0, help='Overall height in meters')
+    parser.add_argument('--supports', type=int, default=0, help='Number of intermediate supports')
+    parser.add_argument('--girder-depth', type=float, default=2.0, help='Girder depth in meters')
+    parser.add_argument('--sweep', type=int, metavar='STEPS',
+                       help='Screen a STEPS-point grid over the app slider ranges for all types')
+
+    args = parser.parse_args()
+
+    if args.sweep:
+        import time
+        cases = _sweep_cases(args.sweep)
+        start = time.perf_counter()
+        reports = screen_batch(cases)
+        elapsed = time.perf_counter() - start
+        print(f"Screened {len(cases)} cases in {elapsed:.3f}s")
+        for name in bridge_type_names():
+            typed = [r for r in reports if r.bridge_type.value == name]
+            rejected = sum(1 for r in typed if not r.feasible)
+            print(f"  {name:<13} {rejected:>6} / {len(typed)} infeasible")
+        return 0
+
+    if not args.bridge_type:
+        parser.error("bridge_type is required unless --sweep is given")
+
+    params = BridgeParameters(span_length=args.span, deck_width=args.width, height=args.height,
+                              supports=args.supports, load_capacity=50.0, material="steel",
+                              girder_depth=args.girder_depth)
+    report = check_feasibility(resolve_bridge_type(args.bridge_type), params)
+    print(report.summary())
+    return 0 if report.feasible else 1
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
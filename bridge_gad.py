@@ -0,0 +1,362 @@
+#!/usr/bin/env python3
+"""
+Excel-Driven General Arrangement Drawing Pipeline
+
+Converts legacy LISP-style Excel parameter sheets (SCALE1, DATUM, LEFT, RTL,
+NSPAN, LBRIDGE, CCBR, PIERTW, ...) into DXF general arrangement drawings.
+
+Support chainages for all NSPAN spans are computed as arrays, every deck,
+pier, pier cap and footing outline is built in one vectorised pass through a
+single composed transform, and the entities are then written to modelspace.
+Folders of sheets are converted in parallel worker processes.
+
+Usage:
+    python bridge_gad.py SAMPLE_INPUT_FILES/input.xlsx -o input.dxf
+    python bridge_gad.py SAMPLE_INPUT_FILES --output-dir gad_dxf --workers 4
+    python bridge_gad.py SAMPLE_INPUT_FILES --output-dir gad_dxf --skip-unchanged
+"""
+
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from functools import partial
+from typing import Any, Dict, List, Optional
+import argparse
+import glob
+import hashlib
+import io
+import os
+import time
+
+import ezdxf
+import numpy as np
+
+from bridge_outputs import OutputManifest, fixed_dxf_metadata, write_if_changed, write_stable_dxf
+from bridge_transforms import AffineTransform, lisp_transform, plan_skew_transform, vpos
+
+
+REQUIRED_PARAMETERS = ['SCALE1', 'DATUM', 'LEFT', 'RIGHT', 'RTL', 'NSPAN']
+
+
+# Enhanced DXF functions
+
+def setup_dxf_layers(doc):
+    """Setup professional DXF layers"""
+    layers = [
+        ("GRID", 8, "Grid lines and axes"),
+        ("STRUCTURE", 1, "Main structural elements"),
+        ("DIMENSIONS", 6, "Dimension lines and text"),
+        ("ANNOTATIONS", 3, "Text and labels"),
+        ("CENTERLINES", 4, "Center lines"),
+        ("HATCHING", 9, "Section hatching"),
+        ("DETAILS", 2, "Detail elements"),
+        ("FOUNDATION", 5, "Foundation elements")
+    ]
+
+    for name, color, description in layers:
+        layer = doc.layers.new(name=name)
+        layer.dxf.color = color
+        layer.description = description
+
+
+# Enhanced Excel processing
+
+def read_excel_parameters(file_path) -> Dict[str, Any]:
+    """Read the Variable/Value table from Sheet1, raising if it is unusable"""
+    import pandas as pd
+
+    # Read Excel file with proper encoding
+    df = pd.read_excel(file_path, sheet_name=None, header=None)
+
+    if 'Sheet1' not in df:
+        raise ValueError("Sheet1 not found in Excel file")
+
+    # Process parameters
+    df_params = df['Sheet1']
+
+    # Handle different Excel formats
+    if len(df_params.columns) >= 3:
+        df_params = df_params.iloc[:, :3]
+        df_params.columns = ['Value', 'Variable', 'Description']
+    else:
+        df_params.columns = ['Variable', 'Value']
+
+    # Convert to dictionary
+    return dict(zip(df_params['Variable'], df_params['Value']))
+
+
+def process_excel_parameters(file_path):
+    """Enhanced Excel parameter processing"""
+    try:
+        parameters = read_excel_parameters(file_path)
+
+        # Validate essential parameters
+        missing_params = [p for p in REQUIRED_PARAMETERS if p not in parameters]
+
+        if missing_params:
+            print(f"Warning: Missing parameters: {missing_params}")
+
+        return parameters
+
+    except Exception as e:
+        print(f"Error processing Excel file: {e}")
+        return create_default_parameters()
+
+
+def create_default_parameters():
+    """Create default parameters if Excel processing fails"""
+    return {
+        'SCALE1': 100,
+        'SCALE2': 50,
+        'SKEW': 0,
+        'DATUM': 100,
+        'LEFT': 0,
+        'RIGHT': 100,
+        'RTL': 105,
+        'SOFL': 103,
+        'NSPAN': 3,
+        'LBRIDGE': 30,
+        'CCBR': 7.5,
+        'PIERTW': 0.8
+    }
+
+
+def read_ground_profile(file_path) -> Optional[np.ndarray]:
+    """Chainage/RL ground profile from Sheet2 as an (N, 2) array, if present"""
+    import pandas as pd
+
+    sheets = pd.read_excel(file_path, sheet_name=None)
+    profile = sheets.get('Sheet2')
+    if profile is None or not {'Chainage', 'RL'} <= set(profile.columns):
+        return None
+    points = profile[['Chainage', 'RL']].apply(pd.to_numeric, errors='coerce').dropna()
+    return points.to_numpy(dtype=float) if len(points) >= 2 else None
+
+
+# Layout computation
+
+@dataclass
+class GADLayout:
+    """Support chainages and levels for a multi-span bridge"""
+    span_lengths: np.ndarray   # (NSPAN,)
+    chainages: np.ndarray      # (NSPAN + 1,) abutment, piers..., abutment
+    params: Dict[str, float]
+
+    @property
+    def pier_chainages(self) -> np.ndarray:
+        return self.chainages[1:-1]
+
+    @property
+    def scale(self) -> float:
+        """Model units per metre: paper millimetres at 1:SCALE1"""
+        return 1000.0 / self.params['SCALE1']
+
+
+def _number(parameters: Dict[str, Any], name: str, default: Optional[float] = None) -> float:
+    value = parameters.get(name, default)
+    if value is None:
+        raise ValueError(f"Missing parameter: {name}")
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        raise ValueError(f"Parameter {name} is not numeric: {value!r}")
+
+
+def compute_layout(parameters: Dict[str, Any]) -> GADLayout:
+    """Compute all span lengths and support chainages as arrays"""
+    missing = [p for p in REQUIRED_PARAMETERS if p not in parameters]
+    if missing:
+        raise ValueError(f"Missing parameters: {missing}")
+
+    defaults = create_default_parameters()
+    params = {name: _number(parameters, name, defaults.get(name))
+              for name in set(REQUIRED_PARAMETERS) | set(defaults)}
+    params['ABTL'] = _number(parameters, 'ABTL', params['LEFT'])
+    for name, default in (('CAPT', params['SOFL']), ('CAPB', params['SOFL'] - 1.0),
+                          ('CAPW', params['PIERTW'] * 1.5), ('FUTRL', params['DATUM']),
+                          ('FUTD', 1.0), ('FUTW', params['PIERTW'] * 3),
+                          ('ABTW', params['PIERTW'] * 2), ('KERBW', 0.0)):
+        params[name] = _number(parameters, name, default)
+
+    if not params['NSPAN'].is_integer():
+        raise ValueError(f"NSPAN must be a whole number, got {params['NSPAN']:g}")
+    nspan = int(params['NSPAN'])
+    if nspan < 1:
+        raise ValueError(f"NSPAN must be at least 1, got {nspan}")
+
+    # Per-span lengths if SPAN1..SPANn are all given, otherwise equal spans of LBRIDGE
+    span_keys = [f"SPAN{i}" for i in range(1, nspan + 1)]
+    if all(key in parameters for key in span_keys):
+        span_lengths = np.array([_number(parameters, key) for key in span_keys])
+    else:
+        total = _number(parameters, 'LBRIDGE', params['LBRIDGE'])
+        span_lengths = np.full(nspan, total / nspan)
+    if np.any(span_lengths <= 0):
+        raise ValueError("Span lengths must be positive")
+
+    chainages = params['ABTL'] + np.concatenate(([0.0], np.cumsum(span_lengths)))
+    return GADLayout(span_lengths, chainages, params)
+
+
+def _rectangles(x0, x1, y0, y1) -> np.ndarray:
+    """(N, 4, 2) corner array for axis-aligned rectangles given as broadcastable arrays"""
+    x0, x1, y0, y1 = np.broadcast_arrays(*(np.atleast_1d(np.asarray(v, dtype=float))
+                                           for v in (x0, x1, y0, y1)))
+    return np.stack([np.stack([x0, y0], -1), np.stack([x1, y0], -1),
+                     np.stack([x1, y1], -1), np.stack([x0, y1], -1)], axis=1)
+
+
+def _add_polylines(msp, outlines: np.ndarray, layer: str):
+    """Write each (4, 2) outline as a closed LWPOLYLINE"""
+    attribs = {'layer': layer}
+    for outline in outlines.tolist():
+        msp.add_lwpolyline(outline, close=True, dxfattribs=attribs)
+
+
+def build_gad_document(parameters: Dict[str, Any], ground: Optional[np.ndarray] = None):
+    """Create the elevation and plan GAD as an ezdxf document"""
+    layout = compute_layout(parameters)
+    p = layout.params
+    ch = layout.chainages
+    piers = layout.pier_chainages
+
+    doc = ezdxf.new('R2010')
+    setup_dxf_layers(doc)
+    msp = doc.modelspace()
+
+    # Elevation: one transform from chainage/RL to paper units for everything
+    elevation = lisp_transform(p['LEFT'], p['DATUM'], layout.scale)
+
+    decks = _rectangles(ch[:-1], ch[1:], p['SOFL'], p['RTL'])
+    pier_shafts = _rectangles(piers - p['PIERTW'] / 2, piers + p['PIERTW'] / 2, p['FUTRL'], p['CAPB'])
+    pier_caps = _rectangles(piers - p['CAPW'] / 2, piers + p['CAPW'] / 2, p['CAPB'], p['CAPT'])
+    footings = _rectangles(ch - p['FUTW'] / 2, ch + p['FUTW'] / 2, p['FUTRL'] - p['FUTD'], p['FUTRL'])
+    abutments = _rectangles(ch[[0, -1]] - p['ABTW'] / 2, ch[[0, -1]] + p['ABTW'] / 2,
+                            p['FUTRL'], p['SOFL'])
+
+    _add_polylines(msp, elevation.apply(decks), 'STRUCTURE')
+    _add_polylines(msp, elevation.apply(pier_shafts), 'STRUCTURE')
+    _add_polylines(msp, elevation.apply(pier_caps), 'DETAILS')
+    _add_polylines(msp, elevation.apply(footings), 'FOUNDATION')
+    _add_polylines(msp, elevation.apply(abutments), 'FOUNDATION')
+
+    if ground is not None:
+        msp.add_lwpolyline(elevation.apply(ground).tolist(), dxfattribs={'layer': 'GRID'})
+
+    # Plan below the elevation, supports skewed about the deck centreline
+    deck_width = p['CCBR'] + 2 * p['KERBW']
+    plan_offset = vpos(p['FUTRL'] - p['FUTD'], p['DATUM'], layout.scale) - 2 * deck_width * layout.scale
+    plan = (plan_skew_transform(p['SKEW'], deck_width)
+            .then(AffineTransform.translation(-p['LEFT'], -deck_width))
+            .then(AffineTransform.scaling(layout.scale))
+            .then(AffineTransform.translation(0.0, float(plan_offset))))
+
+    plan_deck = _rectangles(ch[0], ch[-1], 0.0, deck_width)
+    plan_piers = _rectangles(piers - p['PIERTW'] / 2, piers + p['PIERTW'] / 2, 0.0, deck_width)
+    _add_polylines(msp, plan.apply(plan_deck), 'STRUCTURE')
+    _add_polylines(msp, plan.apply(plan_piers), 'STRUCTURE')
+
+    centreline = plan.apply([[ch[0], deck_width / 2], [ch[-1], deck_width / 2]])
+    msp.add_line(*centreline.tolist(), dxfattribs={'layer': 'CENTERLINES'})
+
+    return doc
+
+
+def convert_excel_to_dxf(excel_path: str, dxf_path: str, skip_unchanged: bool = False,
+                         manifest: Optional[OutputManifest] = None) -> Dict[str, Any]:
+    """Convert one parameter sheet; returns a result record instead of raising
+
+    With skip_unchanged the DXF is written with fixed header metadata and
+    only replaced (atomically) when its content differs from the existing file.
+    Without a manifest the one in the output folder is updated here; with
+    one, it is only read, and the caller records the returned digest and
+    saves it.
+    """
+    started = time.perf_counter()
+    try:
+        parameters = read_excel_parameters(excel_path)
+        changed, digest = True, None
+        if skip_unchanged:
+            stream = io.StringIO()
+            with fixed_dxf_metadata():
+                doc = build_gad_document(parameters, read_ground_profile(excel_path))
+                write_stable_dxf(doc, stream)
+            data = stream.getvalue().encode(doc.output_encoding)
+            own_manifest = manifest is None
+            if own_manifest:
+                manifest = OutputManifest(os.path.dirname(dxf_path))
+            changed = write_if_changed(dxf_path, data, manifest)
+            digest = hashlib.sha256(data).hexdigest()
+            if own_manifest:
+                manifest.save()
+        else:
+            doc = build_gad_document(parameters, read_ground_profile(excel_path))
+            doc.saveas(dxf_path)
+        return {'input': excel_path, 'output': dxf_path, 'ok': True, 'error': None, 'changed': changed,
+                'digest': digest, 'seconds': time.perf_counter() - started}
+    except Exception as e:
+        return {'input': excel_path, 'output': None, 'ok': False, 'error': str(e), 'changed': False,
+                'digest': None, 'seconds': time.perf_counter() - started}
+
+
+def convert_folder(input_dir: str, output_dir: str, workers: Optional[int] = None,
+                   skip_unchanged: bool = False) -> List[Dict[str, Any]]:
+    """Convert every .xlsx sheet in a folder using a pool of worker processes"""
+    os.makedirs(output_dir, exist_ok=True)
+    sources = sorted(path for path in glob.glob(os.path.join(input_dir, '*.xlsx'))
+                     if not os.path.basename(path).startswith('~$'))
+    targets = [os.path.join(output_dir, os.path.splitext(os.path.basename(path))[0] + '.dxf')
+               for path in sources]
+
+    # Workers only read the manifest; the parent records their digests and saves it once
+    manifest = OutputManifest(output_dir) if skip_unchanged else None
+    convert = partial(convert_excel_to_dxf, skip_unchanged=skip_unchanged, manifest=manifest)
+    if workers == 1 or len(sources) <= 1:
+        results = [convert(src, dst) for src, dst in zip(sources, targets)]
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            results = list(executor.map(convert, sources, targets))
+    if manifest is not None:
+        for result in results:
+            if result['ok']:
+                manifest.record(result['output'], result['digest'])
+        manifest.save()
+    return results
+
+
+def main():
+    """Command-line interface for the Excel to DXF pipeline"""
+    parser = argparse.ArgumentParser(description='Convert LISP-style Excel parameter sheets to GAD DXF files')
+    parser.add_argument('input', help='Excel file or folder of Excel files')
+    parser.add_argument('-o', '--output', help='Output DXF file (single input)')
+    parser.add_argument('--output-dir', default='gad_dxf', help='Output folder (folder input)')
+    parser.add_argument('--workers', type=int, help='Worker processes (default: CPU count)')
+    parser.add_argument('--skip-unchanged', action='store_true',
+                        help='Only rewrite DXF files whose content changed')
+
+    args = parser.parse_args()
+
+    if os.path.isdir(args.input):
+        started = time.perf_counter()
+        results = convert_folder(args.input, args.output_dir, args.workers, args.skip_unchanged)
+        for result in results:
+            if result['ok'] and not result['changed']:
+                print(f"Unchanged {result['input']} -> {result['output']}")
+            elif result['ok']:
+                print(f"Converted {result['input']} -> {result['output']}")
+            else:
+                print(f"Failed    {result['input']}: {result['error']}")
+        converted = sum(1 for r in results if r['ok'])
+        print(f"{converted}/{len(results)} sheets converted in {time.perf_counter() - started:.2f}s")
+        return 0 if converted == len(results) else 1
+
+    output = args.output or os.path.splitext(os.path.basename(args.input))[0] + '.dxf'
+    result = convert_excel_to_dxf(args.input, output, args.skip_unchanged)
+    if not result['ok']:
+        print(f"Error converting {args.input}: {result['error']}")
+        return 1
+    print(f"{'Saved' if result['changed'] else 'Unchanged'} DXF: {output}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
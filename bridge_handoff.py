@@ -0,0 +1,102 @@
+"""
+Shared-Memory Hand-Off of Worker Results
+
+Worker processes that render drawings used to return their output through
+the pool's result pipe: the bytes were pickled in the worker, copied
+through the pipe and unpickled into a fresh copy in the parent. For a
+6000x4800 RGBA buffer (110 MB) or a large DXF that copying dominates.
+
+Instead, a worker writes its output once into a file in shared memory
+(/dev/shm, falling back to the temporary directory) and returns a small
+Handoff, which pickles in a few bytes. The parent maps the file read-only
+and reads the worker's pages in place:
+
+    # worker
+    return hand_off(data)            # bytes-like or numpy array
+
+    # parent
+    data = receive(future.result())  # memoryview, or an array view
+
+receive() unlinks the file as soon as it is mapped, so the memory goes
+back to the system when the last view of it is dropped, and nothing is
+left behind if the parent dies. A Handoff that is never received must be
+discard()ed. Plain results pass through receive() unchanged, so callers
+may fall back to pickling, as they do where shared memory is unavailable
+(SHARED_HANDOFF is False on Windows, which cannot unlink a mapped file).
+"""
+
+from dataclasses import dataclass
+from typing import Optional, Tuple, Union
+import mmap
+import os
+import secrets
+import tempfile
+
+import numpy as np
+
+SHM_DIR = "/dev/shm"
+SHARED_HANDOFF = os.name == "posix"
+HANDOFF_PREFIX = "bridge_handoff_"
+
+
+def handoff_dir() -> str:
+    """Where hand-off files live: tmpfs if the system has one"""
+    return SHM_DIR if os.path.isdir(SHM_DIR) and os.access(SHM_DIR, os.W_OK) else tempfile.gettempdir()
+
+
+@dataclass(frozen=True)
+class Handoff:
+    """Picklable handle to a worker result left in shared memory"""
+    path: str
+    nbytes: int
+    shape: Optional[Tuple[int, ...]] = None  # set for numpy arrays
+    dtype: Optional[str] = None
+
+    def open(self) -> Union[memoryview, np.ndarray]:
+        """Map the result read-only and unlink its file; the mapping lives as long as the returned view"""
+        try:
+            with open(self.path, 'rb') as f:
+                # mmap rejects empty files
+                mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) if self.nbytes else b""
+        finally:
+            self.discard()
+        view = memoryview(mapped)
+        if self.shape is None:
+            return view
+        return np.frombuffer(view, dtype=self.dtype).reshape(self.shape)
+
+    def discard(self):
+        """Free a result without reading it"""
+        try:
+            os.unlink(self.path)
+        except FileNotFoundError:
+            pass
+
+
+def hand_off(data: Union[bytes, bytearray, memoryview, np.ndarray]) -> Handoff:
+    """Write a result to shared memory (in the worker) and return its handle"""
+    shape = dtype = None
+    if isinstance(data, np.ndarray):
+        shape, dtype = data.shape, data.dtype.str
+        data = np.ascontiguousarray(data)
+    view = memoryview(data).cast('B')
+    path = os.path.join(handoff_dir(), f"{HANDOFF_PREFIX}{os.getpid()}_{secrets.token_hex(8)}")
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o600)
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(view)
+    except BaseException:
+        os.unlink(path)
+        raise
+    return Handoff(path, view.nbytes, shape, dtype)
+
+
+def receive(result):
+    """The data behind a worker result: mapped in place for a Handoff, else the result itself"""
+    return result.open() if isinstance(result, Handoff) else result
+
+
+def discard(result):
+    """Free a worker result that will not be received"""
+    if isinstance(result, Handoff):
+        result.discard()
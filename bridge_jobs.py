@@ -0,0 +1,199 @@
+"""
+Background Render Jobs
+
+Runs a bridge render on a background executor so interactive front ends (the
+Streamlit app) stay responsive. Each stage publishes its result as soon as it
+finishes, progress is reported per stage, and a job can be cancelled between
+stages.
+
+The preview is by default the compact geometry payload of bridge_payload.py,
+drawn in the browser by bridge_viewer.html, so the server does not rasterise
+it; client_preview=False keeps the PNG preview.
+
+Download formats are not part of the job: a finished job keeps its generator
+and encodes a format (or a ZIP bundle of all of them) only when asked, so
+formats nobody downloads are never rendered.
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional
+import io
+import os
+import secrets
+import tempfile
+import threading
+import time
+
+from bridge_drawings import BridgeDrawingGenerator, BridgeParameters, BridgeType, OutputFormat
+from bridge_export import EXPORT_FORMATS, write_bundle
+from bridge_metrics import REGISTRY
+from bridge_payload import encode_payload, generator_payload
+from bridge_raster import RasterOptions
+
+
+# Stage name -> human readable label, in execution order
+RENDER_STAGES = [
+    ("drawing", "Building drawing"),
+    ("preview", "Preparing preview"),
+]
+
+PREVIEW_DPI = 100
+
+# Drawings use few colours, a 256-colour palette PNG is visually identical
+DOWNLOAD_PNG_OPTIONS = RasterOptions(colors=256)
+
+RENDER_WORKERS = 2
+
+_executor = ThreadPoolExecutor(max_workers=RENDER_WORKERS, thread_name_prefix="bridge-render")
+
+JOBS = REGISTRY.counter("bridge_jobs_total", "Background render jobs by final status", ("status",))
+JOBS_RUNNING = REGISTRY.gauge("bridge_jobs_running", "Background render jobs currently running")
+REGISTRY.gauge("bridge_job_pool_utilisation", "Fraction of background render threads busy",
+               function=lambda: JOBS_RUNNING.value() / RENDER_WORKERS)
+
+
+class JobCancelled(Exception):
+    """Raised inside a job when cancellation was requested"""
+
+
+def _anonymous_file() -> io.FileIO:
+    """Temporary file that leaves nothing behind: unlinked at once on POSIX, deleted on close on Windows"""
+    path = os.path.join(tempfile.gettempdir(), f"bridge_bundle_{os.getpid()}_{secrets.token_hex(8)}.zip")
+    flags = os.O_RDWR | os.O_CREAT | os.O_EXCL | getattr(os, "O_BINARY", 0) | getattr(os, "O_TEMPORARY", 0)
+    fd = os.open(path, flags, 0o600)
+    if os.name == "posix":
+        os.unlink(path)
+    return io.FileIO(fd, 'r+b')
+
+
+class RenderJob:
+    """A render running in the background with per-stage results"""
+
+    def __init__(self, bridge_type: BridgeType, params: BridgeParameters, dpi: int = 300,
+                 client_preview: bool = True):
+        self.bridge_type = bridge_type
+        self.params = params
+        self.dpi = dpi
+        self.preview_format = "geometry" if client_preview else "png"  # geometry is payload JSON
+        self.status = "queued"  # queued, running, done, cancelled, failed
+        self.stage: Optional[str] = None
+        self.error: Optional[str] = None
+        self.results: Dict[str, bytes] = {}
+        self.timings: Dict[str, float] = {}
+        self._completed: List[str] = []
+        self._cancel = threading.Event()
+        self._lock = threading.Lock()
+        self._export_lock = threading.Lock()  # one export at a time per figure
+        self.generator: Optional[BridgeDrawingGenerator] = None
+        self.future = None
+
+    @property
+    def progress(self) -> float:
+        """Fraction of stages completed"""
+        return len(self._completed) / len(RENDER_STAGES)
+
+    @property
+    def stage_label(self) -> str:
+        return dict(RENDER_STAGES).get(self.stage, self.status.title())
+
+    @property
+    def finished(self) -> bool:
+        return self.status in ("done", "cancelled", "failed")
+
+    def result(self, stage: str) -> Optional[bytes]:
+        """Bytes produced by a stage, or None if it has not finished yet"""
+        with self._lock:
+            return self.results.get(stage)
+
+    def cancel(self):
+        """Request cancellation; takes effect before the next stage starts"""
+        self._cancel.set()
+        if self.future is not None and self.future.cancel():
+            self.status = "cancelled"
+
+    def _check_cancelled(self):
+        if self._cancel.is_set():
+            raise JobCancelled()
+
+    def _publish(self, stage: str, data: Optional[bytes], started: float):
+        with self._lock:
+            if data is not None:
+                self.results[stage] = data
+            self.timings[stage] = time.perf_counter() - started
+            self._completed.append(stage)
+
+    def _run_stage(self, generator: BridgeDrawingGenerator, stage: str) -> Optional[bytes]:
+        """Execute one stage and return its output bytes, if any"""
+        if stage == "drawing":
+            generator.generate_drawing()
+            return None
+        elif stage == "preview":
+            if self.preview_format == "geometry":
+                return encode_payload(generator_payload(generator))
+            return generator.export_bytes(OutputFormat.PNG, dpi=PREVIEW_DPI,
+                                          raster_options=RasterOptions(compress_level=1))
+        raise ValueError(f"Unknown render stage: {stage}")
+
+    def _finished_generator(self) -> BridgeDrawingGenerator:
+        if self.status != "done" or self.generator is None:
+            raise RuntimeError("Render job has not finished successfully")
+        return self.generator
+
+    def export(self, format: OutputFormat) -> bytes:
+        """Encode one download format of a finished job on demand"""
+        generator = self._finished_generator()
+        options = DOWNLOAD_PNG_OPTIONS if format == OutputFormat.PNG else None
+        with self._export_lock:
+            return generator.export_bytes(format, dpi=self.dpi, raster_options=options)
+
+    def bundle(self, base_name: str, formats: List[OutputFormat] = EXPORT_FORMATS) -> io.FileIO:
+        """ZIP of all download formats, streamed entry by entry into a temporary file
+
+        Returns the file rewound as a raw FileIO, which st.download_button
+        accepts from a deferred callable and reads once on click. The file
+        goes away when it is closed or garbage collected.
+        """
+        generator = self._finished_generator()
+        bundle_file = _anonymous_file()
+        try:
+            writer = io.BufferedWriter(bundle_file)
+            with self._export_lock:
+                write_bundle(generator, writer, base_name, formats, self.dpi, DOWNLOAD_PNG_OPTIONS)
+            writer.flush()
+            writer.detach()
+        except BaseException:
+            bundle_file.close()
+            raise
+        bundle_file.seek(0)
+        return bundle_file
+
+    def run(self):
+        """Execute all stages; called on the executor thread"""
+        generator = BridgeDrawingGenerator(self.bridge_type, self.params)
+        self.status = "running"
+        JOBS_RUNNING.inc()
+        try:
+            for stage, _ in RENDER_STAGES:
+                self._check_cancelled()
+                self.stage = stage
+                started = time.perf_counter()
+                self._publish(stage, self._run_stage(generator, stage), started)
+            self.generator = generator
+            self.status = "done"
+        except JobCancelled:
+            self.status = "cancelled"
+        except Exception as e:
+            self.error = str(e)
+            self.status = "failed"
+        finally:
+            self.stage = None
+            JOBS_RUNNING.dec()
+            JOBS.inc(self.status)
+
+
+def submit_render(bridge_type: BridgeType, params: BridgeParameters, dpi: int = 300,
+                  client_preview: bool = True) -> RenderJob:
+    """Start a render job on the shared background executor"""
+    job = RenderJob(bridge_type, params, dpi, client_preview)
+    job.future = _executor.submit(job.run)
+    return job
@@ -0,0 +1,186 @@
+"""
+Paper-Space Sheets for DXF Output
+
+Builds plotted sheets as paper-space layouts over the single modelspace
+copy of a bridge, instead of duplicating geometry per sheet:
+
+- an ISO A-size border with a title block (title, bridge data, sheet name,
+  scale and sheet number) drawn in paper space on the SHEET layer
+- viewports onto windows of modelspace at standard scales (1:N), picked
+  as the largest scale at which the window fits its viewport
+- layers frozen per viewport, e.g. the modelspace title and specification
+  text wherever the title block already carries it
+
+Modelspace is in metres and paper space in millimetres.
+"""
+
+from dataclasses import dataclass, field
+from typing import List, Optional, Sequence, Tuple
+
+PAPER_SIZES = {'A0': (1189, 841), 'A1': (841, 594), 'A2': (594, 420), 'A3': (420, 297), 'A4': (297, 210)}
+STANDARD_SCALES = (1, 2, 5, 10, 20, 25, 50, 100, 200, 250, 500, 1000, 1250, 2000, 2500, 5000, 10000)
+MM_PER_MODEL_UNIT = 1000.0
+
+SHEET_LAYER = 'SHEET'
+BORDER_MARGIN = 10.0      # paper edge to border
+TITLE_BLOCK_HEIGHT = 35.0
+AREA_PADDING = 5.0        # border and title block to the viewports
+VIEWPORT_GAP = 10.0
+LABEL_HEIGHT = 7.0        # band under each viewport for its name and scale
+
+Window = Tuple[float, float, float, float]  # modelspace xmin, ymin, xmax, ymax
+
+
+@dataclass
+class ViewportSpec:
+    """A window of modelspace shown on a sheet"""
+    label: str
+    window: Window
+    frozen_layers: Tuple[str, ...] = ()
+    scale: Optional[int] = None  # 1:scale, None picks the largest standard scale that fits
+
+
+@dataclass
+class SheetSpec:
+    """One paper-space layout; its viewports are placed side by side"""
+    name: str
+    title: str
+    viewports: List[ViewportSpec] = field(default_factory=list)
+    paper: str = 'A3'
+
+
+def fit_scale(window_size: Tuple[float, float], area: Tuple[float, float]) -> int:
+    """Smallest standard N such that a window (model units) fits area (mm) at 1:N"""
+    width, height = window_size
+    needed = max(width * MM_PER_MODEL_UNIT / area[0], height * MM_PER_MODEL_UNIT / area[1])
+    for scale in STANDARD_SCALES:
+        if scale >= needed:
+            return scale
+    step = STANDARD_SCALES[-1]
+    return int(-(-needed // step) * step)
+
+
+def layer_extents(msp, exclude: Sequence[str] = ()) -> Optional[Window]:
+    """Bounding box of the modelspace entities not on an excluded layer"""
+    from ezdxf import bbox
+
+    excluded = {name.upper() for name in exclude}
+    entities = [e for e in msp if e.dxf.layer.upper() not in excluded]
+    extents = bbox.extents(entities, fast=True)
+    if not extents.has_data:
+        return None
+    return extents.extmin.x, extents.extmin.y, extents.extmax.x, extents.extmax.y
+
+
+def _pad(window: Window, fraction: float) -> Window:
+    xmin, ymin, xmax, ymax = window
+    pad = max(xmax - xmin, ymax - ymin) * fraction
+    return xmin - pad, ymin - pad, xmax + pad, ymax + pad
+
+
+def standard_sheets(msp, detail_length: float = 20.0) -> List[SheetSpec]:
+    """General arrangement, structure-only elevation and end support details of one modelspace"""
+    everything = layer_extents(msp)
+    structure = layer_extents(msp, exclude=('TEXT', 'DIMENSIONS'))
+    if everything is None or structure is None:
+        return []
+    xmin, ymin, xmax, ymax = structure
+    detail = min(xmax - xmin, max(detail_length, (xmax - xmin) * 0.15))
+    return [
+        SheetSpec('GA', 'General Arrangement', [
+            ViewportSpec('ELEVATION', _pad(everything, 0.02), frozen_layers=('TEXT',))]),
+        SheetSpec('ELEVATION', 'Structural Elevation', [
+            ViewportSpec('STRUCTURE', _pad(structure, 0.02), frozen_layers=('TEXT', 'DIMENSIONS'))]),
+        SheetSpec('DETAILS', 'Support Details', [
+            ViewportSpec('LEFT END', _pad((xmin, ymin, xmin + detail, ymax), 0.05), frozen_layers=('TEXT',)),
+            ViewportSpec('RIGHT END', _pad((xmax - detail, ymin, xmax, ymax), 0.05), frozen_layers=('TEXT',))]),
+    ]
+
+
+def _text(layout, text: str, position: Tuple[float, float], height: float, align):
+    entity = layout.add_text(text, dxfattribs={'layer': SHEET_LAYER, 'height': height})
+    entity.set_placement(position, align=align)
+    return entity
+
+
+def _rectangle(layout, xmin: float, ymin: float, xmax: float, ymax: float):
+    layout.add_lwpolyline([(xmin, ymin), (xmax, ymin), (xmax, ymax), (xmin, ymax)], close=True,
+                          dxfattribs={'layer': SHEET_LAYER})
+
+
+def _title_block(layout, paper: Tuple[float, float], title: str, details: Sequence[str],
+                 sheet: SheetSpec, scale_text: str, number: int, count: int):
+    from ezdxf.enums import TextEntityAlignment
+
+    left, bottom = BORDER_MARGIN, BORDER_MARGIN
+    right, top = paper[0] - BORDER_MARGIN, bottom + TITLE_BLOCK_HEIGHT
+    sheet_column = right - 180.0
+    number_column = right - 70.0
+    _rectangle(layout, left, bottom, right, top)
+    layout.add_line((sheet_column, bottom), (sheet_column, top), dxfattribs={'layer': SHEET_LAYER})
+    layout.add_line((number_column, bottom), (number_column, top), dxfattribs={'layer': SHEET_LAYER})
+    layout.add_line((number_column, bottom + TITLE_BLOCK_HEIGHT / 2), (right, bottom + TITLE_BLOCK_HEIGHT / 2),
+                    dxfattribs={'layer': SHEET_LAYER})
+
+    _text(layout, title, (left + 5, top - 5), 5.0, TextEntityAlignment.TOP_LEFT)
+    # Details wrap onto two lines of roughly equal length
+    half = (len(details) + 1) // 2
+    for i, line in enumerate(("   ".join(details[:half]), "   ".join(details[half:]))):
+        if line:
+            _text(layout, line, (left + 5, top - 15 - i * 6), 2.5, TextEntityAlignment.TOP_LEFT)
+
+    _text(layout, sheet.title.upper(), ((sheet_column + number_column) / 2, bottom + TITLE_BLOCK_HEIGHT / 2),
+          3.5, TextEntityAlignment.MIDDLE_CENTER)
+    _text(layout, f"SCALE {scale_text}", ((number_column + right) / 2, bottom + TITLE_BLOCK_HEIGHT * 0.75),
+          3.0, TextEntityAlignment.MIDDLE_CENTER)
+    _text(layout, f"SHEET {number} OF {count}", ((number_column + right) / 2, bottom + TITLE_BLOCK_HEIGHT * 0.25),
+          3.0, TextEntityAlignment.MIDDLE_CENTER)
+
+
+def add_sheet(doc, sheet: SheetSpec, title: str, details: Sequence[str], number: int = 1, count: int = 1):
+    """Create the paper-space layout of one sheet; returns the layout"""
+    from ezdxf.enums import TextEntityAlignment
+
+    if SHEET_LAYER not in doc.layers:
+        doc.layers.add(SHEET_LAYER, color=7)
+    paper = PAPER_SIZES[sheet.paper]
+    layout = doc.layouts.new(sheet.name)
+    layout.page_setup(size=paper, margins=(0, 0, 0, 0), units='mm')
+    _rectangle(layout, BORDER_MARGIN, BORDER_MARGIN, paper[0] - BORDER_MARGIN, paper[1] - BORDER_MARGIN)
+
+    # Viewport cells share the area between the title block and the border
+    left = BORDER_MARGIN + AREA_PADDING
+    bottom = BORDER_MARGIN + TITLE_BLOCK_HEIGHT + AREA_PADDING
+    right = paper[0] - BORDER_MARGIN - AREA_PADDING
+    top = paper[1] - BORDER_MARGIN - AREA_PADDING
+    count_viewports = max(1, len(sheet.viewports))
+    cell_width = (right - left - (count_viewports - 1) * VIEWPORT_GAP) / count_viewports
+    cell_height = top - bottom - LABEL_HEIGHT
+
+    scales = []
+    for i, spec in enumerate(sheet.viewports):
+        xmin, ymin, xmax, ymax = spec.window
+        scale = spec.scale or fit_scale((xmax - xmin, ymax - ymin), (cell_width, cell_height))
+        scales.append(scale)
+        cell_left = left + i * (cell_width + VIEWPORT_GAP)
+        center = (cell_left + cell_width / 2, bottom + LABEL_HEIGHT + cell_height / 2)
+        viewport = layout.add_viewport(center=center, size=(cell_width, cell_height),
+                                       view_center_point=((xmin + xmax) / 2, (ymin + ymax) / 2),
+                                       view_height=cell_height * scale / MM_PER_MODEL_UNIT)
+        viewport.dxf.layer = SHEET_LAYER
+        if spec.frozen_layers:
+            viewport.frozen_layers = list(spec.frozen_layers)
+        _text(layout, f"{spec.label}  1:{scale}", (cell_left, bottom + LABEL_HEIGHT / 2), 3.0,
+              TextEntityAlignment.MIDDLE_LEFT)
+
+    scale_text = f"1:{scales[0]}" if len(set(scales)) == 1 else "AS SHOWN"
+    _title_block(layout, paper, title, details, sheet, scale_text, number, count)
+    return layout
+
+
+def add_sheets(doc, sheets: Sequence[SheetSpec], title: str, details: Sequence[str]):
+    """Add every sheet as a paper-space layout, replacing the empty default layout"""
+    layouts = [add_sheet(doc, sheet, title, details, i + 1, len(sheets)) for i, sheet in enumerate(sheets)]
+    if layouts and 'Layout1' in doc.layouts and not len(doc.layouts.get('Layout1')):
+        doc.layouts.delete('Layout1')
+    return layouts
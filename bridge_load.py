@@ -0,0 +1,449 @@
+#!/usr/bin/env python3
+"""
+Offline Load Testing for the Bridge App and Render Entry Points
+
+Virtual users replay a realistic request mix: all seven bridge types, with
+parameters drawn from the Streamlit sliders and a share pinned to the slider
+extremes, a preview render per request and PNG/SVG/PDF/DXF/ZIP downloads on
+top. Three targets are supported:
+
+- library  BridgeDrawingGenerator directly, one worker process per user
+- service  a running bridge_service.py over local HTTP, one thread per user
+- app      streamlit_app.py through Streamlit's AppTest harness, one session
+           per user, all sharing the app's render executor as in a deployment
+
+Each step of --users runs for --duration seconds and reports throughput,
+p50/p95/p99 latency per operation, error and rejection rates and the memory
+growth of the process under test. Nothing leaves localhost.
+
+Usage:
+    python bridge_load.py library --users 1 2 4 --duration 30
+    python bridge_load.py service --url http://127.0.0.1:8600 --users 4 8 --service-pid 1234
+    python bridge_load.py app --users 1 4 8 --duration 60 --json load.json
+"""
+
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import asdict, dataclass, field
+from functools import partial
+from typing import Any, Dict, List, Optional, Tuple
+import argparse
+import io
+import json
+import math
+import os
+import random
+import threading
+import time
+import urllib.error
+import urllib.request
+
+import numpy as np
+
+
+# Slider ranges of streamlit_app.py: (min, max, step)
+SLIDERS = {
+    'span_length': (20.0, 500.0, 5.0),
+    'deck_width': (6.0, 30.0, 1.0),
+    'height': (10.0, 100.0, 2.0),
+    'load_capacity': (25.0, 150.0, 5.0),
+    'foundation_depth': (2.0, 15.0, 1.0),
+    'girder_depth': (1.0, 5.0, 0.5),
+    'skew_angle': (0.0, 45.0, 2.5),
+}
+SUPPORT_SLIDERS = {'beam': (0, 10), 't_beam': (0, 10), 'cable_stayed': (1, 10)}
+MATERIALS = ["steel", "concrete", "timber", "stone"]
+
+# App labels for the parameters a virtual user sets
+APP_LABELS = {
+    'span_length': "Span Length (m)",
+    'deck_width': "Deck Width (m)",
+    'height': "Height (m)",
+    'load_capacity': "Design Load (kN/m)",
+    'foundation_depth': "Foundation Depth (m)",
+    'girder_depth': "Girder Depth (m)",
+    'skew_angle': "Skew Angle (°)",
+}
+APP_BRIDGE_NAMES = {
+    'beam': "Beam Bridge", 'truss': "Truss Bridge", 'arch': "Arch Bridge",
+    'suspension': "Suspension Bridge", 'cable_stayed': "Cable-Stayed Bridge",
+    't_beam': "T-Beam Bridge", 'slab': "Slab Bridge",
+}
+APP_SUPPORT_LABELS = ("Intermediate Supports", "Towers")
+
+# Chance that a request also downloads each of these after its preview
+DOWNLOAD_MIX = {'dxf': 0.4, 'png': 0.15, 'pdf': 0.1, 'svg': 0.1, 'zip': 0.1}
+EXTREME_SHARE = 0.2
+DOWNLOAD_DPI = 300
+SERVICE_PREVIEW_DPI = 100
+
+
+@dataclass
+class Scenario:
+    """One virtual user request: a bridge, its parameters and the downloads that follow"""
+    bridge_type: str
+    params: Dict[str, Any]
+    downloads: List[str]
+
+
+@dataclass
+class Sample:
+    """Outcome of one timed operation"""
+    operation: str
+    seconds: float
+    status: str = "ok"  # ok, error, rejected
+    error: Optional[str] = None
+
+
+@dataclass
+class StepReport:
+    """Aggregated results of one concurrency step"""
+    target: str
+    users: int
+    seconds: float
+    operations: Dict[str, Dict[str, float]] = field(default_factory=dict)
+    requests: int = 0
+    rejected: int = 0
+    errors: Dict[str, int] = field(default_factory=dict)
+    rss_start_mb: float = math.nan
+    rss_end_mb: float = math.nan
+
+    @property
+    def error_count(self) -> int:
+        return sum(self.errors.values())
+
+    def summary(self) -> str:
+        lines = [f"== {self.target}, {self.users} user(s), {self.seconds:.1f}s ==",
+                 f"{'operation':<14} {'count':>6} {'ops/s':>7} {'p50 ms':>9} {'p95 ms':>9} {'p99 ms':>9} {'errors':>7}"]
+        for name, stats in self.operations.items():
+            lines.append(f"{name:<14} {stats['count']:>6.0f} {stats['throughput']:>7.2f} {stats['p50'] * 1e3:>9.0f} "
+                         f"{stats['p95'] * 1e3:>9.0f} {stats['p99'] * 1e3:>9.0f} {stats['errors']:>7.0f}")
+        rejected_rate = self.rejected / self.requests if self.requests else 0.0
+        error_rate = self.error_count / self.requests if self.requests else 0.0
+        lines.append(f"requests {self.requests}, rejected as infeasible {self.rejected} ({rejected_rate:.1%}), "
+                     f"errors {self.error_count} ({error_rate:.1%})")
+        for message, count in sorted(self.errors.items(), key=lambda item: -item[1])[:5]:
+            lines.append(f"  {count} x {message}")
+        lines.append(f"memory {self.rss_end_mb:.1f} MB ({self.rss_end_mb - self.rss_start_mb:+.1f} MB)")
+        return "\n".join(lines)
+
+
+def _slider_value(rng: random.Random, low: float, high: float, step: float) -> float:
+    if rng.random() < EXTREME_SHARE:
+        return rng.choice((low, high))
+    return low + step * rng.randint(0, int(round((high - low) / step)))
+
+
+def make_scenario(rng: random.Random) -> Scenario:
+    """Random request over the app's slider ranges, with a share of slider extremes"""
+    bridge_type = rng.choice(list(APP_BRIDGE_NAMES))
+    params: Dict[str, Any] = {name: _slider_value(rng, *limits) for name, limits in SLIDERS.items()}
+    low, high = SUPPORT_SLIDERS.get(bridge_type, (0, 0))
+    params['supports'] = int(_slider_value(rng, low, high, 1))
+    params['material'] = rng.choice(MATERIALS)
+    downloads = [name for name, share in DOWNLOAD_MIX.items() if rng.random() < share]
+    return Scenario(bridge_type, params, downloads)
+
+
+def process_rss_mb(pid: Optional[int] = None, children: bool = False) -> float:
+    """Resident memory of a process (and optionally its descendants) in MB, NaN where unsupported"""
+    pid = pid or os.getpid()
+    total = 0.0
+    try:
+        with open(f"/proc/{pid}/status") as f:
+            for line in f:
+                if line.startswith("VmRSS:"):
+                    total = int(line.split()[1]) / 1024
+                    break
+    except OSError:
+        return math.nan
+    if children:
+        for task in os.listdir(f"/proc/{pid}/task"):
+            try:
+                with open(f"/proc/{pid}/task/{task}/children") as f:
+                    total += sum(process_rss_mb(int(child), True) for child in f.read().split())
+            except OSError:
+                pass
+    return total
+
+
+def _timed(samples: List[Sample], operation: str, func) -> Any:
+    """Run func, appending its duration and outcome; returns its result or None on error"""
+    started = time.perf_counter()
+    try:
+        result = func()
+    except Exception as e:
+        samples.append(Sample(operation, time.perf_counter() - started, "error", f"{type(e).__name__}: {e}"))
+        return None
+    samples.append(Sample(operation, time.perf_counter() - started))
+    return result
+
+
+def library_user(seed: int, deadline: float, think: float) -> Tuple[List[Sample], float, float]:
+    """Virtual user calling the library in its own process; returns samples and RSS before/after"""
+    import matplotlib
+    matplotlib.use('Agg')
+    import matplotlib.pyplot as plt
+    from bridge_drawings import BridgeDrawingGenerator, BridgeParameters, BridgeType, OutputFormat
+    from bridge_export import write_bundle
+    from bridge_feasibility import check_feasibility
+    from bridge_jobs import DOWNLOAD_PNG_OPTIONS
+    from bridge_payload import encode_payload, generator_payload
+
+    rng = random.Random(seed)
+    samples: List[Sample] = []
+    rss_start = process_rss_mb()  # after the imports, so only growth under load counts
+    while time.time() < deadline:
+        scenario = make_scenario(rng)
+        params = BridgeParameters(**scenario.params)
+        bridge_type = BridgeType(scenario.bridge_type)
+        if not check_feasibility(bridge_type, params).feasible:
+            samples.append(Sample("render", 0.0, "rejected"))
+            continue
+        generator = BridgeDrawingGenerator(bridge_type, params)
+
+        def render():
+            generator.generate_drawing()
+            return encode_payload(generator_payload(generator))  # the app's client-side preview
+        try:
+            if _timed(samples, "render", render) is not None:
+                for name in scenario.downloads:
+                    if name == 'zip':
+                        _timed(samples, "download_zip", lambda: write_bundle(
+                            generator, io.BytesIO(), "bridge", dpi=DOWNLOAD_DPI, raster_options=DOWNLOAD_PNG_OPTIONS))
+                    else:
+                        options = DOWNLOAD_PNG_OPTIONS if name == 'png' else None
+                        _timed(samples, f"download_{name}", lambda: generator.export_bytes(
+                            OutputFormat(name), DOWNLOAD_DPI, options))
+        finally:
+            if generator.figure is not None:
+                plt.close(generator.figure)
+        time.sleep(think)
+    return samples, rss_start, process_rss_mb()
+
+
+def _post_render(url: str, scenario: Scenario, format: str, dpi: int, timeout: float) -> bytes:
+    body = json.dumps({"bridge_type": scenario.bridge_type, "format": format, "dpi": dpi,
+                       "params": scenario.params}).encode("utf-8")
+    request = urllib.request.Request(f"{url}/render", data=body, headers={"Content-Type": "application/json"})
+    with urllib.request.urlopen(request, timeout=timeout) as response:
+        return response.read()
+
+
+class _Rejected(Exception):
+    pass
+
+
+def service_user(url: str, seed: int, deadline: float, think: float, timeout: float) -> List[Sample]:
+    """Virtual user posting to a running render service; ZIP downloads are not offered there"""
+    rng = random.Random(seed)
+    samples: List[Sample] = []
+    while time.time() < deadline:
+        scenario = make_scenario(rng)
+
+        def render():
+            try:
+                return _post_render(url, scenario, "png", SERVICE_PREVIEW_DPI, timeout)
+            except urllib.error.HTTPError as e:
+                if e.code == 422:
+                    raise _Rejected()
+                raise RuntimeError(f"HTTP {e.code}")
+        started = time.perf_counter()
+        try:
+            render()
+        except _Rejected:
+            samples.append(Sample("render", time.perf_counter() - started, "rejected"))
+            continue
+        except Exception as e:
+            samples.append(Sample("render", time.perf_counter() - started, "error", f"{type(e).__name__}: {e}"))
+            continue
+        samples.append(Sample("render", time.perf_counter() - started))
+        for name in scenario.downloads:
+            if name != 'zip':
+                _timed(samples, f"download_{name}",
+                       lambda: _post_render(url, scenario, name, DOWNLOAD_DPI, timeout))
+        time.sleep(think)
+    return samples
+
+
+# AppTest swaps a process-wide mock runtime in and out around every script
+# run, so runs of different sessions are serialised. Render jobs and
+# downloads, where the time goes, still overlap freely.
+_app_run_lock = threading.Lock()
+
+
+def _app_run(at):
+    """Rerun an AppTest session's script, failing on an uncaught exception in the app"""
+    with _app_run_lock:
+        at.run()
+    if at.exception:
+        raise RuntimeError(at.exception[0].message)
+    return at
+
+
+def _deferred_download(data_callable) -> bytes:
+    """Call a download button's deferred callable and convert its result as Streamlit does on click"""
+    from streamlit.runtime.download_data_util import convert_data_to_bytes_and_infer_mime
+
+    data, _ = convert_data_to_bytes_and_infer_mime(data_callable(), TypeError("Unsupported download data type"))
+    return data
+
+
+def app_user(seed: int, deadline: float, think: float, timeout: float) -> List[Sample]:
+    """Virtual user driving streamlit_app.py through AppTest in this process"""
+    from streamlit.testing.v1 import AppTest
+    from bridge_drawings import OutputFormat
+
+    app_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), "streamlit_app.py")
+    rng = random.Random(seed)
+    samples: List[Sample] = []
+    at = _timed(samples, "page_load", lambda: _app_run(AppTest.from_file(app_path, default_timeout=timeout)))
+    if at is None:
+        return samples
+    while time.time() < deadline:
+        scenario = make_scenario(rng)
+
+        def configure():
+            selects = {s.label: s for s in at.sidebar.selectbox}
+            selects["Select Bridge Type:"].set_value(APP_BRIDGE_NAMES[scenario.bridge_type])
+            _app_run(at)  # the support slider depends on the bridge type
+            sliders = {s.label: s for s in at.sidebar.slider}
+            for name, label in APP_LABELS.items():
+                sliders[label].set_value(scenario.params[name])
+            for label in APP_SUPPORT_LABELS:
+                if label in sliders:
+                    sliders[label].set_value(scenario.params['supports'])
+            selects = {s.label: s for s in at.sidebar.selectbox}
+            selects["Primary Material:"].set_value(scenario.params['material'])
+            return _app_run(at)
+        if _timed(samples, "configure", configure) is None:
+            break  # the session is broken, further requests would fail the same way
+
+        def render():
+            next(b for b in at.button if b.label.endswith("Generate Bridge Drawing")).click()
+            _app_run(at)
+            if at.error:
+                raise _Rejected()
+            job = at.session_state["render_job"]
+            job.future.result(timeout=timeout)
+            _app_run(at)  # the rerun that shows the preview and download buttons
+            if job.status != "done":
+                raise RuntimeError(job.error or job.status)
+            return job
+        started = time.perf_counter()
+        try:
+            job = render()
+        except _Rejected:
+            samples.append(Sample("render", time.perf_counter() - started, "rejected"))
+            continue
+        except Exception as e:
+            samples.append(Sample("render", time.perf_counter() - started, "error", f"{type(e).__name__}: {e}"))
+            continue
+        samples.append(Sample("render", time.perf_counter() - started))
+
+        # What the deferred download buttons do when clicked, including Streamlit's conversion
+        for name in scenario.downloads:
+            if name == 'zip':
+                _timed(samples, "download_zip", lambda: _deferred_download(partial(job.bundle, "bridge")))
+            else:
+                _timed(samples, f"download_{name}",
+                       lambda: _deferred_download(partial(job.export, OutputFormat(name))))
+        time.sleep(think)
+    return samples
+
+
+def summarise(target: str, users: int, seconds: float, samples: List[Sample],
+              rss_start: float, rss_end: float) -> StepReport:
+    """Throughput, latency percentiles and error counts per operation"""
+    report = StepReport(target, users, seconds, rss_start_mb=rss_start, rss_end_mb=rss_end)
+    report.requests = sum(1 for s in samples if s.operation == "render")
+    report.rejected = sum(1 for s in samples if s.status == "rejected")
+    for sample in samples:
+        if sample.status == "error":
+            report.errors[sample.error] = report.errors.get(sample.error, 0) + 1
+
+    first = ["page_load", "configure", "render"]
+    names = sorted({s.operation for s in samples}, key=lambda n: (first.index(n) if n in first else len(first), n))
+    for name in names + ["all"]:
+        durations = np.array([s.seconds for s in samples if s.status == "ok" and name in ("all", s.operation)])
+        errors = sum(1 for s in samples if s.status == "error" and name in ("all", s.operation))
+        if len(durations) == 0 and not errors:
+            continue
+        p50, p95, p99 = np.percentile(durations, [50, 95, 99]) if len(durations) else (math.nan,) * 3
+        report.operations[name] = {'count': len(durations), 'throughput': len(durations) / seconds,
+                                   'p50': float(p50), 'p95': float(p95), 'p99': float(p99), 'errors': errors}
+    return report
+
+
+def run_step(args, users: int) -> StepReport:
+    """Run one concurrency step against the chosen target"""
+    deadline = time.time() + args.duration
+    seeds = [args.seed * 1000 + users * 100 + user for user in range(users)]
+    started = time.perf_counter()
+
+    if args.target == 'library':
+        with ProcessPoolExecutor(max_workers=users) as executor:
+            results = list(executor.map(library_user, seeds, [deadline] * users, [args.think] * users))
+        samples = [s for user_samples, _, _ in results for s in user_samples]
+        rss_start = sum(start for _, start, _ in results)
+        rss_end = sum(end for _, _, end in results)
+    else:
+        if args.target == 'service':
+            pid, children = args.service_pid, True
+            def user(seed):
+                return service_user(args.url.rstrip("/"), seed, deadline, args.think, args.timeout)
+        else:
+            pid, children = None, False
+            def user(seed):
+                return app_user(seed, deadline, args.think, args.timeout)
+        rss_start = process_rss_mb(pid, children) if args.target == 'app' or pid else math.nan
+        with ThreadPoolExecutor(max_workers=users, thread_name_prefix="bridge-load") as executor:
+            results = list(executor.map(user, seeds))
+        samples = [s for user_samples in results for s in user_samples]
+        rss_end = process_rss_mb(pid, children) if args.target == 'app' or pid else math.nan
+
+    return summarise(args.target, users, time.perf_counter() - started, samples, rss_start, rss_end)
+
+
+def main():
+    """Command-line entry point for the load harness"""
+    parser = argparse.ArgumentParser(description='Replay a realistic request mix with concurrent virtual users')
+    parser.add_argument('target', choices=['library', 'service', 'app'], help='What to load')
+    parser.add_argument('--users', type=int, nargs='+', default=[1, 2, 4],
+                        help='Concurrent virtual users, one step per value (default: 1 2 4)')
+    parser.add_argument('--duration', type=float, default=30.0, help='Seconds per step (default: 30)')
+    parser.add_argument('--think', type=float, default=0.0,
+                        help='Pause in seconds between a user\'s requests (default: 0)')
+    parser.add_argument('--seed', type=int, default=0, help='Random seed for the request mix (default: 0)')
+    parser.add_argument('--timeout', type=float, default=300.0, help='Per-operation timeout in seconds (default: 300)')
+    parser.add_argument('--url', default='http://127.0.0.1:8600', help='Render service URL (service target)')
+    parser.add_argument('--service-pid', type=int,
+                        help='PID of the render service, to report its memory including workers (service target)')
+    parser.add_argument('--json', metavar='PATH', help='Also write all step reports as JSON')
+    args = parser.parse_args()
+
+    if args.target == 'app':
+        import logging
+        from streamlit.testing.v1 import AppTest
+        # Sessions outside `streamlit run` warn about their missing context on every script run;
+        # disabling survives the log level Streamlit re-applies from its config
+        logging.getLogger("streamlit.runtime.scriptrunner_utils.script_run_context").disabled = True
+        # One page load up front, so module imports do not count as memory growth
+        app_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), "streamlit_app.py")
+        _app_run(AppTest.from_file(app_path, default_timeout=args.timeout))
+
+    reports = []
+    for users in args.users:
+        report = run_step(args, users)
+        print(report.summary())
+        print()
+        reports.append(report)
+
+    if args.json:
+        with open(args.json, 'w', encoding='utf-8') as f:
+            json.dump([dict(asdict(report), error_count=report.error_count) for report in reports], f, indent=1)
+        print(f"Saved: {args.json}")
+    return 1 if any(report.error_count for report in reports) else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,340 @@
+"""
+Runtime Metrics for Bridge Drawings
+
+A small in-process metrics registry (counters, gauges and histograms with
+labels) and its Prometheus text exposition. The library records render
+counts, stage latencies, artist and DXF entity counts, output bytes and
+cache hits; the HTTP service and the Streamlit app expose the registry on
+/metrics for a local Prometheus or OpenMetrics collector to scrape.
+
+Recording is a dictionary update under a lock, around a microsecond, so it
+stays on the hot path. Worker processes drain() their registry after
+each job and the parent merge()s the result, so process pools report too.
+"""
+
+from bisect import bisect_left
+from contextlib import contextmanager
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+import math
+import threading
+import time
+
+
+DEFAULT_METRICS_PORT = 9464
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+COUNT_BUCKETS = (10, 50, 100, 250, 500, 1000, 2500, 5000, 10000, 25000, 50000)
+
+LabelValues = Tuple[str, ...]
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_value(value: float) -> str:
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    return repr(float(value)) if value != int(value) else str(int(value))
+
+
+def _label_text(names: Sequence[str], values: Sequence[str]) -> str:
+    if not names:
+        return ""
+    return "{" + ",".join(f'{name}="{_escape(str(value))}"' for name, value in zip(names, values)) + "}"
+
+
+class _Metric:
+    """Named metric with a fixed set of label names"""
+    kind = ""
+
+    def __init__(self, name: str, help: str, labelnames: Sequence[str] = ()):
+        self.name = name
+        self.help = help
+        self.labelnames = tuple(labelnames)
+        self._lock = threading.Lock()
+
+    def _key(self, labels: Sequence) -> LabelValues:
+        if len(labels) != len(self.labelnames):
+            raise ValueError(f"{self.name} expects labels {self.labelnames}, got {tuple(labels)}")
+        return tuple(str(value) for value in labels)
+
+    def samples(self) -> List[Tuple[str, str, float]]:
+        """(name suffix, label text, value) for every series"""
+        raise NotImplementedError
+
+    def exposition(self) -> List[str]:
+        lines = [f"# HELP {self.name} {_escape(self.help)}", f"# TYPE {self.name} {self.kind}"]
+        for suffix, labels, value in self.samples():
+            lines.append(f"{self.name}{suffix}{labels} {_format_value(value)}")
+        return lines
+
+
+class Counter(_Metric):
+    """Monotonically increasing total per label set"""
+    kind = "counter"
+
+    def __init__(self, name: str, help: str, labelnames: Sequence[str] = ()):
+        super().__init__(name, help, labelnames)
+        self._values: Dict[LabelValues, float] = {}
+
+    def inc(self, *labels, amount: float = 1.0):
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+
+    def value(self, *labels) -> float:
+        with self._lock:
+            return self._values.get(self._key(labels), 0.0)
+
+    def samples(self):
+        with self._lock:
+            values = sorted(self._values.items())
+        if not values and not self.labelnames:
+            values = [((), 0.0)]  # an unlabelled counter exists from the start
+        return [("", _label_text(self.labelnames, key), value) for key, value in values]
+
+    def drain(self) -> Dict[LabelValues, float]:
+        with self._lock:
+            values, self._values = self._values, {}
+        return values
+
+    def merge(self, values: Dict[LabelValues, float]):
+        with self._lock:
+            for key, value in values.items():
+                self._values[key] = self._values.get(key, 0.0) + value
+
+
+class Gauge(_Metric):
+    """Current value per label set, optionally read from a callback at scrape time"""
+    kind = "gauge"
+
+    def __init__(self, name: str, help: str, labelnames: Sequence[str] = (),
+                 function: Optional[Callable[[], float]] = None):
+        super().__init__(name, help, labelnames)
+        self._values: Dict[LabelValues, float] = {}
+        self.function = function
+
+    def set(self, value: float, *labels):
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = float(value)
+
+    def inc(self, *labels, amount: float = 1.0):
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+
+    def dec(self, *labels, amount: float = 1.0):
+        self.inc(*labels, amount=-amount)
+
+    def value(self, *labels) -> float:
+        if self.function is not None:
+            return float(self.function())
+        with self._lock:
+            return self._values.get(self._key(labels), 0.0)
+
+    def samples(self):
+        if self.function is not None:
+            return [("", "", float(self.function()))]
+        with self._lock:
+            values = sorted(self._values.items())
+        return [("", _label_text(self.labelnames, key), value) for key, value in values]
+
+
+class Histogram(_Metric):
+    """Observation counts per bucket, plus their sum and count, per label set"""
+    kind = "histogram"
+
+    def __init__(self, name: str, help: str, labelnames: Sequence[str] = (),
+                 buckets: Sequence[float] = LATENCY_BUCKETS):
+        super().__init__(name, help, labelnames)
+        self.buckets = tuple(sorted(buckets))
+        # Per label set: [count in each bucket..., count above the last bucket, sum]
+        self._values: Dict[LabelValues, List[float]] = {}
+
+    def observe(self, value: float, *labels):
+        key = self._key(labels)
+        index = bisect_left(self.buckets, value)
+        with self._lock:
+            series = self._values.get(key)
+            if series is None:
+                series = self._values[key] = [0] * (len(self.buckets) + 1) + [0.0]
+            series[index] += 1
+            series[-1] += value
+
+    @contextmanager
+    def time(self, *labels):
+        """Observe the duration of a with-block"""
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(time.perf_counter() - started, *labels)
+
+    def count(self, *labels) -> int:
+        with self._lock:
+            series = self._values.get(self._key(labels))
+        return int(sum(series[:-1])) if series else 0
+
+    def samples(self):
+        with self._lock:
+            values = sorted((key, list(series)) for key, series in self._values.items())
+        samples = []
+        for key, series in values:
+            cumulative = 0
+            for bound, count in zip(self.buckets + (math.inf,), series[:-1]):
+                cumulative += count
+                labels = _label_text(self.labelnames + ("le",), key + (_format_value(bound),))
+                samples.append(("_bucket", labels, cumulative))
+            samples.append(("_sum", _label_text(self.labelnames, key), series[-1]))
+            samples.append(("_count", _label_text(self.labelnames, key), cumulative))
+        return samples
+
+    def drain(self) -> Dict[LabelValues, List[float]]:
+        with self._lock:
+            values, self._values = self._values, {}
+        return values
+
+    def merge(self, values: Dict[LabelValues, List[float]]):
+        with self._lock:
+            for key, other in values.items():
+                series = self._values.get(key)
+                if series is None:
+                    self._values[key] = list(other)
+                else:
+                    for i, value in enumerate(other):
+                        series[i] += value
+
+
+class MetricsRegistry:
+    """Named collection of metrics with Prometheus text exposition"""
+
+    def __init__(self):
+        self._metrics: Dict[str, _Metric] = {}
+        self._lock = threading.Lock()
+
+    def _register(self, metric: _Metric) -> _Metric:
+        with self._lock:
+            existing = self._metrics.get(metric.name)
+            if existing is not None and type(existing) is type(metric) and not isinstance(metric, Gauge):
+                return existing  # re-imports and repeated service instances share one series
+            self._metrics[metric.name] = metric
+        return metric
+
+    def counter(self, name: str, help: str, labelnames: Sequence[str] = ()) -> Counter:
+        return self._register(Counter(name, help, labelnames))
+
+    def gauge(self, name: str, help: str, labelnames: Sequence[str] = (),
+              function: Optional[Callable[[], float]] = None) -> Gauge:
+        """A gauge; registering the same name again replaces it, so a callback can be rebound"""
+        return self._register(Gauge(name, help, labelnames, function))
+
+    def histogram(self, name: str, help: str, labelnames: Sequence[str] = (),
+                  buckets: Sequence[float] = LATENCY_BUCKETS) -> Histogram:
+        return self._register(Histogram(name, help, labelnames, buckets))
+
+    def get(self, name: str) -> Optional[_Metric]:
+        return self._metrics.get(name)
+
+    def exposition(self) -> str:
+        """All metrics in Prometheus text format"""
+        with self._lock:
+            metrics = sorted(self._metrics.values(), key=lambda metric: metric.name)
+        lines = []
+        for metric in metrics:
+            lines.extend(metric.exposition())
+        return "\n".join(lines) + "\n"
+
+    def drain(self) -> Dict[str, Dict]:
+        """Take and reset the counter and histogram values, e.g. at the end of a worker job
+
+        Gauges describe the current process and are not handed over.
+        """
+        with self._lock:
+            metrics = list(self._metrics.values())
+        drained = {}
+        for metric in metrics:
+            if isinstance(metric, (Counter, Histogram)):
+                values = metric.drain()
+                if values:
+                    drained[metric.name] = values
+        return drained
+
+    def merge(self, drained: Dict[str, Dict]):
+        """Add values drained from another process's registry"""
+        for name, values in drained.items():
+            metric = self._metrics.get(name)
+            if isinstance(metric, (Counter, Histogram)):
+                metric.merge(values)
+
+
+REGISTRY = MetricsRegistry()
+
+RENDERS = REGISTRY.counter(
+    "bridge_renders_total", "Drawings exported, by bridge type and output format", ("bridge_type", "format"))
+STAGE_SECONDS = REGISTRY.histogram(
+    "bridge_stage_seconds", "Time spent per rendering stage (generate, export_<format>)", ("stage",))
+ARTISTS = REGISTRY.histogram(
+    "bridge_drawing_artists", "Matplotlib artists per generated drawing", ("bridge_type",), COUNT_BUCKETS)
+DXF_ENTITIES = REGISTRY.histogram(
+    "bridge_dxf_entities", "Model space entities per DXF document", ("bridge_type",), COUNT_BUCKETS)
+OUTPUT_BYTES = REGISTRY.counter(
+    "bridge_output_bytes_total", "Bytes of exported drawings, by output format", ("format",))
+CACHE_REQUESTS = REGISTRY.counter(
+    "bridge_cache_requests_total", "Cache lookups by cache and result (hit or miss)", ("cache", "result"))
+
+
+def record_cache(cache: str, hit: bool):
+    """Count one cache lookup"""
+    CACHE_REQUESTS.inc(cache, "hit" if hit else "miss")
+
+
+class _MetricsHandler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        if self.path.split("?")[0] != "/metrics":
+            self.send_error(404)
+            return
+        body = self.server.registry.exposition().encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", CONTENT_TYPE)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+_servers: Dict[Tuple[str, int], Optional[ThreadingHTTPServer]] = {}  # None where the address was taken
+_servers_lock = threading.Lock()
+
+
+def start_metrics_server(port: int = DEFAULT_METRICS_PORT, host: str = "127.0.0.1",
+                         registry: MetricsRegistry = REGISTRY) -> Optional[ThreadingHTTPServer]:
+    """Serve registry on http://host:port/metrics from a daemon thread
+
+    Calling it again for the same address returns the running server, so it
+    can sit at the top of a script that is re-run. Port 0 disables it; an
+    address that is already taken is reported once and None is returned,
+    then and on every later call for it.
+    """
+    if not port:
+        return None
+    with _servers_lock:
+        if (host, port) in _servers:
+            return _servers[(host, port)]
+        try:
+            server = ThreadingHTTPServer((host, port), _MetricsHandler)
+        except OSError as e:
+            print(f"Metrics endpoint not started on {host}:{port}: {e}")
+            _servers[(host, port)] = None
+            return None
+        server.daemon_threads = True
+        server.registry = registry
+        threading.Thread(target=server.serve_forever, name="bridge-metrics", daemon=True).start()
+        _servers[(host, port)] = server
+    return server
+
@@ -0,0 +1,185 @@
+"""
+Skip-Unchanged Atomic Output Writes
+
+Every output directory keeps a small manifest (.bridge_outputs.json) with the
+SHA-256, size and modification time of each file written through it. New
+content is hashed and compared with the stored hash of the existing file;
+when they match nothing is written, so the file keeps its mtime and sync
+tools and git see no change. Otherwise the content goes to a temporary file
+in the same directory, is flushed to disk and renamed over the target, so a
+reader never sees a half-written drawing.
+
+A manifest entry is trusted only while the file's size and mtime still match
+it; a file that was edited or replaced by something else is re-hashed.
+"""
+
+from contextlib import contextmanager
+from typing import Dict, List, Optional
+import hashlib
+import json
+import os
+import secrets
+import threading
+
+import ezdxf
+
+from bridge_metrics import record_cache
+
+
+MANIFEST_NAME = ".bridge_outputs.json"
+_fixed_dxf_lock = threading.Lock()
+
+_CLASSES_START = "  0\nSECTION\n  2\nCLASSES\n"
+_CLASS_RECORD = "  0\nCLASS\n"
+_SECTION_END = "  0\nENDSEC\n"
+
+
+@contextmanager
+def fixed_dxf_metadata():
+    """Write DXF files with ezdxf's fixed dates, GUIDs and marker string"""
+    with _fixed_dxf_lock:
+        previous = ezdxf.options.write_fixed_meta_data_for_testing
+        ezdxf.options.write_fixed_meta_data_for_testing = True
+        try:
+            yield
+        finally:
+            ezdxf.options.write_fixed_meta_data_for_testing = previous
+
+
+def sort_dxf_classes(text: str) -> str:
+    """DXF text with the CLASS records of its CLASSES section sorted by class name"""
+    start = text.find(_CLASSES_START)
+    if start < 0:
+        return text
+    body = start + len(_CLASSES_START)
+    end = text.index(_SECTION_END, body)
+    records = text[body:end].split(_CLASS_RECORD)[1:]
+    records.sort(key=lambda record: record.split("\n", 2)[1])  # group code 1 holds the name
+    return text[:body] + "".join(_CLASS_RECORD + record for record in records) + text[end:]
+
+
+class _SortedClassesWriter:
+    """Text stream for doc.write() that holds back the file up to the end of
+    its CLASSES section, writes that sorted and passes the rest through"""
+
+    def __init__(self, stream):
+        self.stream = stream
+        self._head: Optional[List[str]] = []  # None once the head is written
+
+    def write(self, text: str):
+        if self._head is None:
+            return self.stream.write(text)
+        self._head.append(text)
+        if text == _SECTION_END:
+            head = "".join(self._head)
+            # The CLASSES section, if any, directly follows the HEADER section
+            if _CLASSES_START in head or head.count(_SECTION_END) > 1:
+                self.flush()
+
+    def flush(self):
+        if self._head is not None:
+            head, self._head = "".join(self._head), None
+            self.stream.write(sort_dxf_classes(head))
+
+
+def write_stable_dxf(doc, stream):
+    """doc.write() to a text stream with the CLASSES section in a fixed order
+
+    ezdxf adds the classes of the entity types in use by iterating a set, so
+    their order changes with the string hash seed. Sorting the written
+    records keeps the output byte-stable without relying on ezdxf internals.
+    """
+    writer = _SortedClassesWriter(stream)
+    doc.write(writer)
+    writer.flush()
+
+
+def file_sha256(path: str) -> str:
+    """SHA-256 of a file on disk"""
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def atomic_write(path: str, data: bytes):
+    """Write data to a temporary file next to path and rename it into place"""
+    temp_path = f"{path}.{os.getpid()}.{secrets.token_hex(4)}.tmp"
+    # os.open applies the umask, unlike mkstemp's fixed 0600
+    fd = os.open(temp_path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o666)
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(temp_path, path)
+    except BaseException:
+        try:
+            os.unlink(temp_path)
+        except FileNotFoundError:
+            pass
+        raise
+
+
+class OutputManifest:
+    """Stored hashes of the files written to one output directory"""
+
+    def __init__(self, directory: str = "."):
+        self.directory = directory or "."
+        self.path = os.path.join(self.directory, MANIFEST_NAME)
+        self.entries: Dict[str, Dict] = {}
+        self.dirty = False
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                self.entries = json.load(f)
+        except (FileNotFoundError, ValueError):
+            self.entries = {}
+
+    def stored_hash(self, path: str) -> Optional[str]:
+        """Hash of the file currently at path, or None if there is no file"""
+        try:
+            stat = os.stat(path)
+        except FileNotFoundError:
+            return None
+        entry = self.entries.get(os.path.basename(path))
+        if entry and entry.get('size') == stat.st_size and entry.get('mtime_ns') == stat.st_mtime_ns:
+            return entry['sha256']
+        digest = file_sha256(path)
+        self.record(path, digest)
+        return digest
+
+    def record(self, path: str, digest: str):
+        """Remember the hash of the file now at path"""
+        stat = os.stat(path)
+        self.entries[os.path.basename(path)] = {'sha256': digest, 'size': stat.st_size,
+                                                'mtime_ns': stat.st_mtime_ns}
+        self.dirty = True
+
+    def save(self):
+        """Write the manifest back if anything was recorded"""
+        if not self.dirty:
+            return
+        data = json.dumps(self.entries, indent=1, sort_keys=True).encode('utf-8')
+        atomic_write(self.path, data)
+        self.dirty = False
+
+
+def write_if_changed(path: str, data: bytes, manifest: Optional[OutputManifest] = None) -> bool:
+    """Atomically write data to path unless the file already holds it; True if written
+
+    Without a manifest the one for path's directory is loaded and saved around
+    this single write; batch callers pass their own and save it once.
+    """
+    own_manifest = manifest is None
+    if own_manifest:
+        manifest = OutputManifest(os.path.dirname(path))
+    digest = hashlib.sha256(data).hexdigest()
+    changed = manifest.stored_hash(path) != digest
+    record_cache("outputs", not changed)
+    if changed:
+        atomic_write(path, data)
+        manifest.record(path, digest)
+    if own_manifest:
+        manifest.save()
+    return changed
@@ -0,0 +1,189 @@
+#!/usr/bin/env python3
+"""
+Compact Geometry Payload for Client-Side Rendering
+
+Packs the elevation and plan views of a generated drawing into a small JSON
+document that a browser can draw itself, instead of shipping a rasterised
+PNG:
+
+- views:       per view, the axes frame (position, limits, titles) and its
+               paths as typed arrays: vertex offsets (Uint32), interleaved
+               x/y vertices (Float32), style codes (Uint16), closed flags (Uint8)
+- styles:      stroke and fill colour, line width, dash pattern and z-order per style code
+- annotations: text, dimension arrows and label boxes per view
+
+Typed arrays are base64 encoded little-endian buffers that decode straight
+into JavaScript typed arrays. Paths are pre-sorted into draw order, so the
+renderer walks them once and batches runs that share a style.
+
+bridge_viewer.html is the matching canvas renderer: it fits the figure to its
+frame and pans (drag) and zooms (wheel) each view locally, double-click
+resets. viewer_html() embeds a payload into it for the Streamlit app or as a
+standalone page.
+
+Usage:
+    python bridge_payload.py beam_bridge.npz --output beam_bridge
+"""
+
+from typing import Dict, List
+import argparse
+import base64
+import json
+import os
+
+import numpy as np
+
+from bridge_store import VIEW_CODES, MemberStore
+
+
+PAYLOAD_VERSION = 1
+PAYLOAD_VIEWS = ('elevation', 'plan')
+VIEWER_TEMPLATE = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'bridge_viewer.html')
+PAYLOAD_MARKER = '/*PAYLOAD*/null'
+
+# matplotlib's dash patterns in units of the line width
+DASHES = {'-': [], '--': [3.7, 1.6], ':': [1.0, 1.65], '-.': [6.4, 1.6, 1.0, 1.6]}
+
+
+def _typed(values: np.ndarray, dtype: str) -> Dict:
+    """A little-endian typed array as {'type', 'data'} with base64 data"""
+    array = np.ascontiguousarray(values, dtype=np.dtype(dtype).newbyteorder('<'))
+    return {'type': np.dtype(dtype).name, 'data': base64.b64encode(array.tobytes()).decode('ascii')}
+
+
+def _rgba(color) -> List[float]:
+    return [round(float(c), 3) for c in color]
+
+
+def _style_table(styles: np.ndarray) -> List[Dict]:
+    table = []
+    for style in styles:
+        table.append({
+            'stroke': _rgba(style['edge']),
+            'fill': _rgba(style['face']) if style['fill'] and style['face'][3] > 0 else None,
+            'width': round(float(style['linewidth']), 3),
+            'dash': DASHES.get(str(style['linestyle']), []),
+            'z': float(style['zorder']),
+        })
+    return table
+
+
+def _view_paths(store: MemberStore, view: int) -> Dict:
+    """Segments and polylines of one view as draw-ordered typed arrays"""
+    segments = store.segments[store.segments['view'] == view]
+    polylines = store.polylines[store.polylines['view'] == view]
+    vertices = np.asarray(store.vertices, dtype=float).reshape(-1, 2)
+
+    # Segments become two-vertex paths ahead of the polylines in one vertex pool
+    segment_points = np.stack([segments['x0'], segments['y0'], segments['x1'], segments['y1']], axis=1).reshape(-1, 2)
+    pool = np.concatenate([segment_points, vertices])
+    starts = np.concatenate([np.arange(len(segments), dtype=np.int64) * 2,
+                             polylines['start'].astype(np.int64) + len(segment_points)])
+    counts = np.concatenate([np.full(len(segments), 2, dtype=np.int64), polylines['count'].astype(np.int64)])
+    styles = np.concatenate([segments['style'], polylines['style']]).astype(np.int64)
+    orders = np.concatenate([segments['order'], polylines['order']])
+    closed = np.concatenate([np.zeros(len(segments), dtype=bool), polylines['closed']])
+
+    # matplotlib draws by z-order, then in insertion order
+    zorder = store.styles['zorder'][styles] if len(store.styles) else np.zeros(len(styles))
+    order = np.lexsort((orders, zorder))
+    starts, counts, styles, closed = starts[order], counts[order], styles[order], closed[order]
+
+    offsets = np.concatenate(([0], np.cumsum(counts)))
+    gather = np.repeat(starts - offsets[:-1], counts) + np.arange(offsets[-1])
+    return {
+        'offsets': _typed(offsets, 'uint32'),
+        'vertices': _typed(pool[gather].reshape(-1), 'float32'),
+        'styles': _typed(styles, 'uint16'),
+        'closed': _typed(closed, 'uint8'),
+    }
+
+
+def _annotations(store: MemberStore, view: int) -> List[Dict]:
+    records = []
+    for a in sorted((a for a in store.annotations if a.view == view), key=lambda a: a.order):
+        record = {'x': a.x, 'y': a.y, 'text': a.text, 'size': a.size, 'rotation': a.rotation,
+                  'color': _rgba(a.color), 'halign': a.halign, 'valign': a.valign, 'weight': a.weight}
+        if a.box is not None:
+            record['box'] = _rgba(a.box)
+        if a.arrow is not None:
+            record.update(arrow=list(a.arrow), arrowstyle=a.arrowstyle, linewidth=a.linewidth)
+        records.append(record)
+    return records
+
+
+def build_payload(store: MemberStore) -> Dict:
+    """Payload dictionary for the elevation and plan views of a member store"""
+    views = {}
+    for name in PAYLOAD_VIEWS:
+        frame = store.metadata['views'][name]
+        aspect = frame['aspect']
+        views[name] = {
+            'frame': {
+                'position': [float(v) for v in frame['position']],
+                'aspect': float(aspect) if not isinstance(aspect, str) else None,
+                'grid': frame['grid'],
+                'xlim': [float(v) for v in frame['xlim']],
+                'ylim': [float(v) for v in frame['ylim']],
+                'title': frame['title'], 'title_size': frame['title_size'],
+                'xlabel': frame['xlabel'], 'ylabel': frame['ylabel'], 'label_size': frame['label_size'],
+            },
+            'paths': _view_paths(store, VIEW_CODES[name]),
+            'annotations': _annotations(store, VIEW_CODES[name]),
+        }
+    return {
+        'version': PAYLOAD_VERSION,
+        'bridge_type': store.metadata['bridge_type'],
+        'figsize': [float(v) for v in store.metadata['figsize']],
+        'suptitle': store.metadata['suptitle'],
+        'suptitle_size': store.metadata['suptitle_size'],
+        'styles': _style_table(store.styles),
+        'views': views,
+    }
+
+
+def generator_payload(generator) -> Dict:
+    """Payload for a generator, drawing it first if needed; the DXF model space is not captured"""
+    store = generator.member_store or MemberStore.from_generator(generator, include_model=False)
+    return build_payload(store)
+
+
+def encode_payload(payload: Dict) -> bytes:
+    """Compact UTF-8 JSON of a payload"""
+    return json.dumps(payload, separators=(',', ':'), ensure_ascii=False).encode('utf-8')
+
+
+def viewer_html(payload) -> str:
+    """bridge_viewer.html with a payload (dict or encoded bytes) embedded"""
+    if isinstance(payload, dict):
+        payload = encode_payload(payload)
+    with open(VIEWER_TEMPLATE, encoding='utf-8') as f:
+        template = f.read()
+    # '</' would end the enclosing <script> element early
+    return template.replace(PAYLOAD_MARKER, payload.decode('utf-8').replace('</', '<\\/'), 1)
+
+
+def main():
+    """Command-line entry point for writing payloads of stored drawings"""
+    parser = argparse.ArgumentParser(description='Write the client-side geometry payload of a stored bridge drawing')
+    parser.add_argument('store', help='Member store written with bridge_drawings.py --store')
+    parser.add_argument('--output', help='Output filename without extension (default: store name)')
+    parser.add_argument('--no-html', action='store_true', help='Only write the .json payload, not the viewer page')
+
+    args = parser.parse_args()
+
+    store = MemberStore.load(args.store)
+    output = args.output or (args.store[:-4] if args.store.endswith('.npz') else args.store)
+    data = encode_payload(build_payload(store))
+    with open(f"{output}.json", 'wb') as f:
+        f.write(data)
+    print(f"Payload saved as {output}.json ({len(data) / 1024:.1f} KB)")
+    if not args.no_html:
+        with open(f"{output}.html", 'w', encoding='utf-8') as f:
+            f.write(viewer_html(data))
+        print(f"Viewer saved as {output}.html")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
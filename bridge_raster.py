@@ -0,0 +1,104 @@
+"""
+Raster Encoding from the Agg Buffer
+
+Draws a matplotlib figure once on an Agg canvas, wraps the canvas RGBA buffer
+in a Pillow image without copying it, and encodes PNG or WebP with selectable
+compression level, palette quantisation and lossless options.
+
+Bridge drawings use only a handful of flat colours on a white sheet, so an
+RGB or palette PNG is a fraction of the size of matplotlib's default RGBA PNG.
+
+Given a bridge_sheet.SheetCache, the grid, labels and titles come from a
+cached sheet and only the bridge itself is drawn.
+"""
+
+from dataclasses import dataclass
+from typing import Optional, Tuple
+import io
+
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from PIL import Image
+
+from bridge_sheet import SheetCache, render_composited
+
+
+@dataclass
+class RasterOptions:
+    """Encoder settings for draw-once raster export"""
+    format: str = "png"                 # "png" or "webp"
+    compress_level: int = 6             # PNG zlib level 0-9 (WebP: method 0-6)
+    colors: Optional[int] = None        # Quantise to a palette of this many colours
+    lossless: bool = True               # WebP only
+    quality: int = 90                   # Lossy WebP quality
+    crop: bool = True                   # Trim to the tight bounding box like bbox_inches='tight'
+    pad_inches: float = 0.1
+
+    def __post_init__(self):
+        if self.format not in ("png", "webp"):
+            raise ValueError(f"Unsupported raster format: {self.format}")
+        if not 0 <= self.compress_level <= 9:
+            raise ValueError("compress_level must be between 0 and 9")
+        if self.colors is not None and not 2 <= self.colors <= 256:
+            raise ValueError("colors must be between 2 and 256")
+
+
+def render_rgba(figure, dpi: float,
+                sheet_cache: Optional[SheetCache] = None) -> Tuple[Image.Image, FigureCanvasAgg]:
+    """Draw the figure once at dpi and return a zero-copy Pillow view of the RGBA buffer
+
+    The figure keeps the new dpi so layout queries match the rendered pixels;
+    callers restore it when they are done with the buffer.
+    """
+    if sheet_cache is not None:
+        canvas = render_composited(figure, dpi, sheet_cache)
+    else:
+        canvas = FigureCanvasAgg(figure)
+        figure.dpi = dpi
+        canvas.draw()
+    buffer = canvas.buffer_rgba()
+    height, width = buffer.shape[:2]
+    # frombuffer shares memory with the Agg renderer as long as the canvas lives
+    image = Image.frombuffer("RGBA", (width, height), buffer, "raw", "RGBA", 0, 1)
+    return image, canvas
+
+
+def _tight_box(figure, canvas: FigureCanvasAgg, dpi: float, pad_inches: float,
+               size: Tuple[int, int]) -> Tuple[int, int, int, int]:
+    """Pixel box (left, upper, right, lower) of the figure's tight bounding box"""
+    bbox = figure.get_tightbbox(canvas.get_renderer()).padded(pad_inches)
+    width, height = size
+    left = max(0, int(bbox.x0 * dpi))
+    right = min(width, int(round(bbox.x1 * dpi)))
+    upper = max(0, height - int(round(bbox.y1 * dpi)))
+    lower = min(height, height - int(bbox.y0 * dpi))
+    return left, upper, right, lower
+
+
+def encode_image(image: Image.Image, options: RasterOptions) -> bytes:
+    """Encode opaque pixels as PNG or WebP"""
+    # The sheet is opaque white, so the alpha channel carries no information
+    image = image.convert("RGB")
+    if options.colors is not None:
+        image = image.quantize(options.colors, method=Image.Quantize.FASTOCTREE)
+
+    output = io.BytesIO()
+    if options.format == "png":
+        image.save(output, format="PNG", compress_level=options.compress_level)
+    else:
+        image.save(output, format="WEBP", lossless=options.lossless, quality=options.quality,
+                   method=min(options.compress_level, 6))
+    return output.getvalue()
+
+
+def encode_figure(figure, dpi: float = 300, options: Optional[RasterOptions] = None,
+                  sheet_cache: Optional[SheetCache] = None) -> bytes:
+    """Render the figure once and encode it with the given options"""
+    options = options or RasterOptions()
+    original_dpi = figure.dpi
+    try:
+        image, canvas = render_rgba(figure, dpi, sheet_cache)
+        if options.crop:
+            image = image.crop(_tight_box(figure, canvas, dpi, options.pad_inches, image.size))
+        return encode_image(image, options)
+    finally:
+        figure.dpi = original_dpi
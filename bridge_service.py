@@ -0,0 +1,406 @@
+#!/usr/bin/env python3
+"""
+Local HTTP Render Service for Bridge Drawings
+
+A small self-hosted HTTP service that exposes BridgeDrawingGenerator to other
+tools on the same machine. Rendering runs in a bounded process pool, identical
+requests that are already in flight share one render, and the service answers
+503 once its queue is full instead of piling up work. Geometry beyond
+MAX_SPAN_LENGTH, MAX_SPANS or MAX_DECK_WIDTH is refused with 400, since a
+render that outlives its timeout would still hold a worker.
+
+Endpoints:
+- POST /render   JSON body -> PNG/SVG/PDF/DXF/WEBP bytes
+- GET  /health   JSON status
+- GET  /metrics  Prometheus text format: service counters plus the library
+                 metrics recorded in the render workers (see bridge_metrics)
+
+Request body:
+    {"bridge_type": "beam", "format": "png", "dpi": 150,
+     "params": {"span_length": 40, "deck_width": 12, "height": 8,
+                "supports": 1, "load_capacity": 50, "material": "concrete"}}
+
+Usage:
+    python bridge_service.py --port 8600 --workers 4
+"""
+
+from concurrent.futures import Future, ProcessPoolExecutor, TimeoutError
+from dataclasses import fields
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, Tuple, Union
+import argparse
+import hashlib
+import json
+import math
+import os
+import threading
+import time
+
+from bridge_drawings import BridgeDrawingGenerator, BridgeParameters, BridgeType, OutputFormat, resolve_bridge_type
+from bridge_handoff import SHARED_HANDOFF, Handoff, hand_off, receive
+from bridge_metrics import CONTENT_TYPE, REGISTRY, record_cache
+from bridge_types import bridge_type_names
+
+
+MIME_TYPES = {
+    OutputFormat.PNG: "image/png",
+    OutputFormat.SVG: "image/svg+xml",
+    OutputFormat.PDF: "application/pdf",
+    OutputFormat.DXF: "application/dxf",
+    OutputFormat.WEBP: "image/webp",
+}
+
+MAX_BODY_BYTES = 64 * 1024
+MAX_DPI = 600
+
+# Render time grows with these, and a timed-out render keeps its worker busy.
+# The app's sliders stop at 500 m, 30 m and 11 spans; explicit span_lengths get
+# twice the length and room for many short spans
+MAX_SPAN_LENGTH = 1000.0
+MAX_DECK_WIDTH = 30.0
+MAX_SPANS = 50
+
+REQUESTS = REGISTRY.counter("bridge_service_requests_total", "Render requests received")
+RENDERS = REGISTRY.counter("bridge_service_renders_total", "Renders submitted to the worker pool")
+REJECTED = REGISTRY.counter("bridge_service_rejected_total", "Requests answered 503 because the queue was full")
+ERRORS = REGISTRY.counter("bridge_service_errors_total", "Renders that failed in a worker")
+BYTES_SENT = REGISTRY.counter("bridge_service_bytes_sent_total", "Response bytes of successful renders")
+RENDER_SECONDS = REGISTRY.histogram("bridge_service_render_seconds",
+                                    "Time from submitting a render to its result, including queueing")
+
+
+def render_request(bridge_type: str, params: Dict[str, Any], format: str, dpi: int,
+                   shared: bool = False) -> Tuple[Union[bytes, Handoff], Dict]:
+    """Render one drawing in a worker process
+
+    Returns the encoded bytes, or with shared their Handoff in shared
+    memory, and the metrics the worker recorded for it, for the service to
+    merge into its own registry.
+    """
+    import matplotlib
+    matplotlib.use('Agg')
+    import matplotlib.pyplot as plt
+
+    REGISTRY.drain()  # a forked worker starts with a copy of the service's values
+    generator = BridgeDrawingGenerator(resolve_bridge_type(bridge_type), BridgeParameters(**params))
+    output_format = OutputFormat(format)
+    if output_format != OutputFormat.DXF:
+        generator.generate_drawing()
+    try:
+        data = generator.export_bytes(output_format, dpi=dpi)
+    finally:
+        if generator.figure is not None:
+            plt.close(generator.figure)
+    return hand_off(data) if shared else data, REGISTRY.drain()
+
+
+class RequestError(Exception):
+    """Client error carrying the HTTP status to answer with"""
+
+    def __init__(self, status: int, message: str):
+        super().__init__(message)
+        self.status = status
+
+
+def _finite(value) -> bool:
+    """A JSON number (not a boolean) that is neither NaN nor infinite"""
+    if isinstance(value, bool) or not isinstance(value, (int, float)):
+        return False
+    try:
+        return math.isfinite(value)
+    except OverflowError:  # integers too large for a float
+        return False
+
+
+def check_param_types(raw_params: Dict[str, Any]):
+    """Reject parameter values of the wrong JSON type before they reach the geometry code"""
+    for f in fields(BridgeParameters):
+        if f.name not in raw_params:
+            continue
+        value = raw_params[f.name]
+        if f.type is int:
+            valid = _finite(value) and isinstance(value, int)
+            expected = "an integer"
+        elif f.type is float:
+            valid = _finite(value)
+            expected = "a finite number"
+        elif f.type is str:
+            valid = isinstance(value, str)
+            expected = "a string"
+        else:  # optional lists of numbers
+            valid = value is None or (isinstance(value, list) and all(_finite(item) for item in value))
+            expected = "a list of finite numbers or null"
+        if not valid:
+            raise RequestError(400, f"{f.name} must be {expected}")
+
+
+def check_geometry_limits(params: BridgeParameters):
+    """Reject geometry too large to render within the service timeout"""
+    if params.span_length > MAX_SPAN_LENGTH:
+        raise RequestError(400, f"Total span length must be at most {MAX_SPAN_LENGTH:g} m")
+    if params.supports + 1 > MAX_SPANS:
+        raise RequestError(400, f"At most {MAX_SPANS} spans ({MAX_SPANS - 1} supports) are allowed")
+    if params.deck_width > MAX_DECK_WIDTH:
+        raise RequestError(400, f"Deck width must be at most {MAX_DECK_WIDTH:g} m")
+
+
+def parse_render_request(body: bytes) -> Tuple[BridgeType, BridgeParameters, OutputFormat, int]:
+    """Validate a /render request body"""
+    try:
+        payload = json.loads(body or b"{}")
+    except ValueError as e:
+        raise RequestError(400, f"Invalid JSON: {e}")
+    if not isinstance(payload, dict):
+        raise RequestError(400, "Request body must be a JSON object")
+
+    try:
+        bridge_type = resolve_bridge_type(payload.get("bridge_type", ""))
+    except ValueError:
+        raise RequestError(400, f"Unknown bridge_type, expected one of {bridge_type_names()}")
+
+    try:
+        output_format = OutputFormat(payload.get("format", "png"))
+    except ValueError:
+        output_format = OutputFormat.ALL
+    if output_format not in MIME_TYPES:
+        raise RequestError(400, f"Unsupported format, expected one of {[f.value for f in MIME_TYPES]}")
+
+    dpi = payload.get("dpi", 150)
+    if not isinstance(dpi, int) or not 10 <= dpi <= MAX_DPI:
+        raise RequestError(400, f"dpi must be an integer between 10 and {MAX_DPI}")
+
+    raw_params = payload.get("params")
+    if not isinstance(raw_params, dict):
+        raise RequestError(400, "params must be a JSON object")
+    known = {f.name for f in fields(BridgeParameters)}
+    unknown = set(raw_params) - known
+    if unknown:
+        raise RequestError(400, f"Unknown parameters: {sorted(unknown)}")
+    check_param_types(raw_params)
+    try:
+        params = BridgeParameters(**raw_params)
+    except (TypeError, ValueError) as e:
+        raise RequestError(400, f"Invalid parameters: {e}")
+    check_geometry_limits(params)
+
+    return bridge_type, params, output_format, dpi
+
+
+class RenderService:
+    """Process pool with request coalescing and a bounded queue"""
+
+    def __init__(self, workers: int = 2, max_pending: int = 16, timeout: float = 120.0):
+        self.workers = workers
+        self.max_pending = max_pending
+        self.timeout = timeout
+        self.executor = ProcessPoolExecutor(max_workers=workers)
+        self.started = time.time()
+
+        self._lock = threading.Lock()
+        self._inflight: Dict[str, Future] = {}
+        REGISTRY.gauge("bridge_service_pending", "Distinct renders queued or running", function=self.pending)
+        REGISTRY.gauge("bridge_service_worker_utilisation", "Fraction of render workers busy",
+                       function=lambda: min(self.pending(), self.workers) / self.workers)
+
+    def pending(self) -> int:
+        with self._lock:
+            return len(self._inflight)
+
+    @staticmethod
+    def request_key(bridge_type: BridgeType, params: BridgeParameters,
+                    output_format: OutputFormat, dpi: int) -> str:
+        """Content hash identifying identical render requests"""
+        canonical = json.dumps({
+            "bridge_type": bridge_type.value,
+            "format": output_format.value,
+            "dpi": dpi,
+            "params": params.__dict__,
+        }, sort_keys=True)
+        return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+    def submit(self, bridge_type: BridgeType, params: BridgeParameters,
+               output_format: OutputFormat, dpi: int) -> Future:
+        """Return the future for this request, joining an identical in-flight one if present"""
+        key = self.request_key(bridge_type, params, output_format, dpi)
+        REQUESTS.inc()
+        with self._lock:
+            future = self._inflight.get(key)
+            # Joining an identical in-flight render counts as a hit of the in-flight cache
+            record_cache("inflight", future is not None)
+            if future is not None:
+                return future
+            if len(self._inflight) >= self.max_pending:
+                REJECTED.inc()
+                raise RequestError(503, "Render queue is full, retry later")
+
+            submitted = time.perf_counter()
+            future = self.executor.submit(render_request, bridge_type.value, dict(params.__dict__),
+                                          output_format.value, dpi, SHARED_HANDOFF)
+            # Identical requests share this future, which holds the rendered data
+            received = Future()
+            self._inflight[key] = received
+            RENDERS.inc()
+
+        def _finished(done: Future):
+            with self._lock:
+                self._inflight.pop(key, None)
+            RENDER_SECONDS.observe(time.perf_counter() - submitted)
+            if done.cancelled():
+                received.cancel()
+                return
+            if done.exception() is not None:
+                ERRORS.inc()
+                received.set_exception(done.exception())
+                return
+            result, metrics = done.result()
+            REGISTRY.merge(metrics)
+            # Open the hand-off here, once: opening unlinks its file, and every
+            # waiter reads the same view. Unread, the mapping goes with the future.
+            try:
+                received.set_result(receive(result))
+            except Exception as e:
+                ERRORS.inc()
+                received.set_exception(e)
+
+        future.add_done_callback(_finished)
+        return received
+
+    def render(self, bridge_type: BridgeType, params: BridgeParameters,
+               output_format: OutputFormat, dpi: int) -> Union[bytes, memoryview]:
+        """Submit and wait for a render"""
+        future = self.submit(bridge_type, params, output_format, dpi)
+        try:
+            data = future.result(timeout=self.timeout)
+        except TimeoutError:
+            raise RequestError(504, "Render timed out")
+        except RequestError:
+            raise
+        except Exception as e:
+            raise RequestError(500, f"Render failed: {e}")
+        BYTES_SENT.inc(amount=len(data))
+        return data
+
+    def health(self) -> Dict[str, Any]:
+        return {
+            "status": "ok",
+            "workers": self.workers,
+            "pending": self.pending(),
+            "max_pending": self.max_pending,
+            "uptime_seconds": round(time.time() - self.started, 1),
+        }
+
+    def metrics_text(self) -> str:
+        """All registered metrics in Prometheus text exposition format"""
+        return REGISTRY.exposition()
+
+    def shutdown(self):
+        self.executor.shutdown(wait=False, cancel_futures=True)
+
+
+class RenderRequestHandler(BaseHTTPRequestHandler):
+    """HTTP front end for RenderService"""
+    server_version = "BridgeRenderService/1.0"
+
+    @property
+    def service(self) -> RenderService:
+        return self.server.service
+
+    def _send(self, status: int, body: Union[bytes, memoryview], content_type: str, headers: Dict[str, str] = None):
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _send_json(self, status: int, payload: Dict[str, Any], headers: Dict[str, str] = None):
+        self._send(status, json.dumps(payload).encode("utf-8"), "application/json", headers)
+
+    def do_GET(self):
+        if self.path == "/health":
+            self._send_json(200, self.service.health())
+        elif self.path == "/metrics":
+            self._send(200, self.service.metrics_text().encode("utf-8"), CONTENT_TYPE)
+        else:
+            self._send_json(404, {"error": "Not found"})
+
+    def do_POST(self):
+        if self.path != "/render":
+            self._send_json(404, {"error": "Not found"})
+            return
+        try:
+            try:
+                length = int(self.headers.get("Content-Length", 0))
+            except ValueError:
+                raise RequestError(400, "Invalid Content-Length")
+            if length < 0:
+                raise RequestError(400, "Invalid Content-Length")
+            if length > MAX_BODY_BYTES:
+                raise RequestError(413, "Request body too large")
+            bridge_type, params, output_format, dpi = parse_render_request(self.rfile.read(length))
+
+            from bridge_feasibility import check_feasibility
+            report = check_feasibility(bridge_type, params)
+            if not report.feasible:
+                self._send_json(422, {"error": "Infeasible bridge geometry",
+                                      "issues": [issue.__dict__ for issue in report.issues]})
+                return
+
+            data = self.service.render(bridge_type, params, output_format, dpi)
+            filename = f"{bridge_type.value}_bridge.{output_format.value}"
+            self._send(200, data, MIME_TYPES[output_format],
+                       {"Content-Disposition": f'attachment; filename="{filename}"'})
+        except RequestError as e:
+            headers = {"Retry-After": "1"} if e.status == 503 else None
+            self._send_json(e.status, {"error": str(e)}, headers)
+        except Exception as e:
+            # Logged even without --verbose
+            super().log_message("Error handling /render: %r", e)
+            self._send_json(500, {"error": f"Internal error: {e}"})
+
+    def log_message(self, format, *args):
+        if self.server.verbose:
+            super().log_message(format, *args)
+
+
+def create_server(host: str, port: int, service: RenderService, verbose: bool = False) -> ThreadingHTTPServer:
+    """Bind the HTTP server to a RenderService"""
+    server = ThreadingHTTPServer((host, port), RenderRequestHandler)
+    server.daemon_threads = True
+    server.service = service
+    server.verbose = verbose
+    return server
+
+
+def main():
+    """Command-line entry point for the render service"""
+    parser = argparse.ArgumentParser(description='Serve bridge drawings over local HTTP')
+    parser.add_argument('--host', default='127.0.0.1', help='Bind address (default: 127.0.0.1)')
+    parser.add_argument('--port', type=int, default=8600, help='Port (default: 8600)')
+    parser.add_argument('--workers', type=int, default=max(1, (os.cpu_count() or 2) - 1),
+                       help='Render worker processes (default: CPU count - 1)')
+    parser.add_argument('--max-pending', type=int, default=16,
+                       help='Distinct renders queued or running before answering 503 (default: 16)')
+    parser.add_argument('--timeout', type=float, default=120.0,
+                       help='Seconds to wait for a render before answering 504 (default: 120)')
+    parser.add_argument('--verbose', action='store_true', help='Log every request')
+
+    args = parser.parse_args()
+
+    service = RenderService(args.workers, args.max_pending, args.timeout)
+    server = create_server(args.host, args.port, service, args.verbose)
+    print(f"Bridge render service listening on http://{args.host}:{args.port} "
+          f"with {args.workers} worker(s)")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        print("\nShutting down...")
+    finally:
+        server.server_close()
+        service.shutdown()
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,215 @@
+"""
+Cached Static Sheet Layers for Raster Output
+
+Every drawing repeats the same sheet: the grid, tick marks and labels, axis
+labels, view titles, the suptitle and the frames of both views. Raster
+exports render that sheet once per layout and dpi on a transparent
+canvas, cache it, and composite it with the bridge layers:
+
+- the white sheet and every member below the grid are drawn first
+- the cached sheet is blended on top of them, so the grid lies over fills
+  exactly as in a full draw
+- members above the grid (lines, dimensions, annotations) are drawn last
+
+The sheet is mostly transparent, so only its covered pixels are kept: a
+flat index and their RGBA values, a few percent of a full-size buffer at
+any dpi, blended into the Agg buffer with numpy.
+
+The key covers the figure size, dpi, axes positions, view limits, tick
+labels, grid style and every static text, so any change to them renders a
+new sheet; members never affect it. Renders that only change the bridge
+(supports, materials, dimensions on or off, culling) at the same span and
+sheet size pay for the members alone.
+
+Vector output and savefig() are unaffected; the cache is used by the
+Pillow encoders in bridge_raster.py.
+"""
+
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import List, Optional, Tuple
+import threading
+
+import numpy as np
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+
+from bridge_metrics import record_cache
+
+DEFAULT_CACHE_BYTES = 256 * 1024 * 1024
+
+
+@dataclass
+class SheetLayer:
+    """The covered pixels of a rendered sheet"""
+    shape: Tuple[int, int]      # buffer rows and columns
+    index: np.ndarray           # (N,) flat pixel indices, int32
+    pixels: np.ndarray          # (N, 4) straight RGBA, uint8
+    premultiplied: np.ndarray   # (N, 3) colour times alpha plus rounding, uint16
+
+    @classmethod
+    def from_buffer(cls, rgba: np.ndarray) -> 'SheetLayer':
+        flat = rgba.reshape(-1, 4)
+        index = np.flatnonzero(flat[:, 3]).astype(np.int32)
+        pixels = flat[index].copy()
+        premultiplied = pixels[:, :3].astype(np.uint16) * pixels[:, 3:].astype(np.uint16) + 127
+        return cls(rgba.shape[:2], index, pixels, premultiplied)
+
+    @property
+    def nbytes(self) -> int:
+        return self.index.nbytes + self.pixels.nbytes + self.premultiplied.nbytes
+
+    def composite(self, rgba: np.ndarray, opaque: bool = True):
+        """Blend the sheet over an RGBA buffer in place (straight alpha "over")
+
+        opaque says the buffer is fully opaque, as it is over a solid sheet
+        colour; the blend then stays in integers.
+        """
+        if rgba.shape[:2] != self.shape:
+            raise ValueError(f"Sheet of {self.shape} does not fit a {rgba.shape[:2]} buffer")
+        flat = rgba.reshape(-1, 4)
+        if opaque:
+            below = flat[self.index, :3].astype(np.uint16)
+            below *= 255 - self.pixels[:, 3:].astype(np.uint16)
+            below += self.premultiplied
+            flat[self.index, :3] = below // 255
+            return
+        below = flat[self.index].astype(np.float32) / 255
+        above = self.pixels.astype(np.float32) / 255
+        alpha = above[:, 3:]
+        out_alpha = alpha + below[:, 3:] * (1 - alpha)
+        color = (above[:, :3] * alpha + below[:, :3] * below[:, 3:] * (1 - alpha)) / np.maximum(out_alpha, 1e-6)
+        flat[self.index] = np.rint(np.concatenate([color, out_alpha], axis=1) * 255).astype(np.uint8)
+
+
+class SheetCache:
+    """Least recently used sheet rasters, bounded by their total size in bytes"""
+
+    def __init__(self, max_bytes: int = DEFAULT_CACHE_BYTES):
+        self.max_bytes = max_bytes
+        self.nbytes = 0
+        self._entries: "OrderedDict[tuple, SheetLayer]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def get(self, key: tuple) -> Optional[SheetLayer]:
+        with self._lock:
+            sheet = self._entries.get(key)
+            if sheet is not None:
+                self._entries.move_to_end(key)
+        record_cache("sheet", sheet is not None)
+        return sheet
+
+    def put(self, key: tuple, sheet: SheetLayer):
+        if sheet.nbytes > self.max_bytes:
+            return
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self.nbytes -= previous.nbytes
+            self._entries[key] = sheet
+            self.nbytes += sheet.nbytes
+            while self.nbytes > self.max_bytes:
+                _, evicted = self._entries.popitem(last=False)
+                self.nbytes -= evicted.nbytes
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self.nbytes = 0
+
+
+SHEET_CACHE = SheetCache()
+
+
+def members(ax) -> List:
+    """The bridge layers of an axes, in Axes.draw order before the zorder sort"""
+    drawn = set(ax.collections) | set(ax.patches) | set(ax.lines) | set(ax.texts) | set(ax.images) \
+        | set(ax.artists) | set(ax.tables)
+    if ax.get_legend() is not None:
+        drawn.add(ax.get_legend())
+    return [artist for artist in ax.get_children() if artist in drawn]
+
+
+def _text_key(text, placed: bool = True) -> tuple:
+    """Content and style of a text; axis labels and titles are placed by the draw itself"""
+    return (text.get_text(), text.get_fontsize(), str(text.get_fontweight()), str(text.get_color()),
+            tuple(np.round(text.get_position(), 6)) if placed else None, text.get_visible())
+
+
+def _axis_key(axis) -> tuple:
+    locations = axis.get_majorticklocs()
+    gridlines = axis.get_gridlines()
+    grid = gridlines[0] if len(gridlines) else None
+    return (tuple(np.round(locations, 9)), tuple(axis.get_major_formatter().format_ticks(locations)),
+            _text_key(axis.label, placed=False),
+            None if grid is None else (grid.get_visible(), grid.get_alpha(), str(grid.get_color()),
+                                       grid.get_linewidth(), str(grid.get_linestyle())))
+
+
+def sheet_key(figure, dpi: float) -> tuple:
+    """Everything that shapes the static sheet of a figure at dpi"""
+    axes = []
+    for ax in figure.axes:
+        ax.apply_aspect()
+        axes.append((tuple(np.round(ax.get_position().bounds, 9)), ax.get_xlim(), ax.get_ylim(),
+                     ax.axison, ax.get_frame_on(), str(ax.get_facecolor()),
+                     _axis_key(ax.xaxis), _axis_key(ax.yaxis), _text_key(ax.title, placed=False)))
+    suptitle = figure.get_suptitle()
+    return (tuple(figure.get_size_inches()), dpi, str(figure.get_facecolor()), suptitle,
+            _text_key(figure._suptitle) if suptitle else None,
+            tuple(_text_key(text) for text in figure.texts), tuple(axes))
+
+
+def render_sheet(figure, canvas: FigureCanvasAgg) -> SheetLayer:
+    """The static sheet, drawn on a transparent background"""
+    hidden = [artist for ax in figure.axes for artist in members(ax) + [ax.patch] if artist.get_visible()]
+    hidden += [figure.patch] if figure.patch.get_visible() else []
+    try:
+        for artist in hidden:
+            artist.set_visible(False)
+        canvas.draw()
+        return SheetLayer.from_buffer(np.asarray(canvas.buffer_rgba()))
+    finally:
+        for artist in hidden:
+            artist.set_visible(True)
+
+
+def _split(ax) -> Tuple[List, List]:
+    """Visible members drawn before and after the axes' grid and ticks"""
+    layers = sorted((artist for artist in members(ax) if artist.get_visible()), key=lambda artist: artist.zorder)
+    grid_zorder = min(ax.xaxis.zorder, ax.yaxis.zorder)
+    # Ties go first, as members precede the axis artists in get_children()
+    return ([artist for artist in layers if artist.zorder <= grid_zorder],
+            [artist for artist in layers if artist.zorder > grid_zorder])
+
+
+def render_composited(figure, dpi: float, cache: SheetCache = SHEET_CACHE) -> FigureCanvasAgg:
+    """Draw the figure at dpi as cached sheet plus members; returns the canvas holding the pixels"""
+    # The figure's own Agg canvas keeps its renderer between renders of the same size
+    canvas = figure.canvas if isinstance(figure.canvas, FigureCanvasAgg) else FigureCanvasAgg(figure)
+    figure.dpi = dpi
+    key = sheet_key(figure, dpi)
+    sheet = cache.get(key)
+    if sheet is None:
+        sheet = render_sheet(figure, canvas)
+        cache.put(key, sheet)
+
+    renderer = canvas.get_renderer()
+    renderer.clear()
+    figure.patch.draw(renderer)
+    axes = sorted(figure.axes, key=lambda ax: ax.zorder)
+    layers = [_split(ax) for ax in axes]
+    for ax, (below, _) in zip(axes, layers):
+        if ax.axison and ax.get_frame_on():
+            ax.patch.draw(renderer)
+        for artist in below:
+            artist.draw(renderer)
+    opaque = figure.patch.get_visible() and figure.patch.get_facecolor()[3] == 1
+    sheet.composite(np.asarray(renderer.buffer_rgba()), opaque)
+    for _, above in layers:
+        for artist in above:
+            artist.draw(renderer)
+    figure.stale = False
+    return canvas
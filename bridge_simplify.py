@@ -0,0 +1,188 @@
+"""
+Geometry Simplification Before Export
+
+Straight segments are snapped to a tolerance grid and indexed by their
+quantised endpoints, so exact and near duplicates collapse in one hashed
+pass. Remaining segments are grouped by the line they lie on (quantised
+direction and offset) and overlapping or touching runs along each line are
+merged into a single segment. Both passes are near-linear in the number of
+segments.
+
+Applied to matplotlib axes (two-point solid Line2D artists) and to DXF
+modelspace LINE entities before any writer runs.
+"""
+
+from collections import defaultdict
+from dataclasses import dataclass
+from typing import Dict, Hashable, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+
+DEFAULT_TOLERANCE = 1e-6
+DIRECTION_DECIMALS = 9
+
+
+@dataclass
+class SimplifyStats:
+    """Segment counts before and after simplification"""
+    segments_in: int = 0
+    duplicates_removed: int = 0
+    merged_away: int = 0
+
+    @property
+    def segments_out(self) -> int:
+        return self.segments_in - self.duplicates_removed - self.merged_away
+
+    def __str__(self):
+        return (f"{self.segments_in} -> {self.segments_out} segments "
+                f"({self.duplicates_removed} duplicates, {self.merged_away} merged)")
+
+
+def canonical_segments(segments) -> np.ndarray:
+    """(N, 2, 2) copy with each segment's endpoints in lexicographic order"""
+    segments = np.array(segments, dtype=float).reshape(-1, 2, 2)
+    p0, p1 = segments[:, 0], segments[:, 1]
+    swap = (p0[:, 0] > p1[:, 0]) | ((p0[:, 0] == p1[:, 0]) & (p0[:, 1] > p1[:, 1]))
+    segments[swap] = segments[swap][:, ::-1]
+    return segments
+
+
+def simplify_segments(segments, merge_keys: Sequence[Hashable],
+                      dedupe_keys: Optional[Sequence[Hashable]] = None,
+                      tolerance: float = DEFAULT_TOLERANCE) -> Tuple[np.ndarray, List[int], SimplifyStats]:
+    """Remove duplicate segments and merge collinear touching ones
+
+    merge_keys separate segments that must not be merged (e.g. by style);
+    dedupe_keys do the same for duplicate removal and default to merge_keys.
+    Returns the simplified (M, 2, 2) segments, the index of the source
+    segment whose attributes each result should carry, and stats.
+    """
+    segments = canonical_segments(segments)
+    count = len(segments)
+    stats = SimplifyStats(segments_in=count)
+    if dedupe_keys is None:
+        dedupe_keys = merge_keys
+
+    # Pass 1: quantised endpoint index, first occurrence wins
+    quantised = np.round(segments / tolerance).astype(np.int64).reshape(count, 4)
+    seen = set()
+    kept = []
+    for i in range(count):
+        key = (dedupe_keys[i], quantised[i].tobytes())
+        if key not in seen:
+            seen.add(key)
+            kept.append(i)
+    stats.duplicates_removed = count - len(kept)
+    if not kept:
+        return segments[:0], [], stats
+
+    # Pass 2: group by supporting line and merge overlapping runs
+    kept_arr = np.array(kept)
+    p0 = segments[kept_arr, 0]
+    p1 = segments[kept_arr, 1]
+    delta = p1 - p0
+    length = np.hypot(delta[:, 0], delta[:, 1])
+    point = length <= tolerance
+    direction = np.where(point[:, None], [1.0, 0.0], delta / np.where(point, 1.0, length)[:, None])
+    normal_offset = direction[:, 0] * p0[:, 1] - direction[:, 1] * p0[:, 0]
+    t0 = (p0 * direction).sum(axis=1)
+    t1 = (p1 * direction).sum(axis=1)
+    direction_q = np.round(direction, DIRECTION_DECIMALS)
+    offset_q = np.round(normal_offset / tolerance).astype(np.int64)
+
+    lines: Dict[Tuple, List[int]] = defaultdict(list)
+    for j, i in enumerate(kept):
+        if point[j]:
+            lines[("point", j)].append(j)
+        else:
+            lines[(merge_keys[i], direction_q[j, 0], direction_q[j, 1], offset_q[j])].append(j)
+
+    runs: List[Tuple[int, np.ndarray, np.ndarray]] = []  # (first member, start, end)
+    for members in lines.values():
+        members.sort(key=lambda j: t0[j])
+        first = members[0]
+        start, end, reach = p0[first], p1[first], t1[first]
+        for j in members[1:]:
+            if t0[j] <= reach + tolerance:
+                if t1[j] > reach:
+                    end, reach = p1[j], t1[j]
+                first = min(first, j)
+            else:
+                runs.append((first, start, end))
+                first, start, end, reach = j, p0[j], p1[j], t1[j]
+        runs.append((first, start, end))
+
+    runs.sort(key=lambda run: run[0])
+    stats.merged_away = len(kept) - len(runs)
+    result = np.array([[start, end] for _, start, end in runs])
+    sources = [kept[first] for first, _, _ in runs]
+    return result, sources, stats
+
+
+def _line_style_key(line):
+    from matplotlib.colors import to_rgba
+    return (to_rgba(line.get_color(), line.get_alpha()), line.get_linewidth(),
+            line.get_zorder(), line.get_solid_capstyle(), line.get_visible())
+
+
+def _replacements(segments: np.ndarray, simplified: np.ndarray, sources: List[int]) -> Dict[int, np.ndarray]:
+    """Source index -> simplified segment, for the sources whose segment was extended by a merge"""
+    canonical = canonical_segments(segments)
+    return {source: segment for segment, source in zip(simplified, sources)
+            if not np.array_equal(segment, canonical[source])}
+
+
+def simplify_axes_lines(ax, tolerance: float = DEFAULT_TOLERANCE) -> SimplifyStats:
+    """Simplify the two-point solid lines of an axes in place
+
+    Duplicates and lines merged into another are removed; a merged run is
+    drawn by its first line, so every line keeps its place in the draw order.
+    """
+    candidates = [line for line in ax.lines
+                  if len(line.get_xdata()) == 2 and line.get_linestyle() == '-'
+                  and line.get_marker() in (None, 'None', '', ' ')
+                  and line.get_transform() == ax.transData]
+    if not candidates:
+        return SimplifyStats()
+    segments = np.array([line.get_xydata() for line in candidates], dtype=float)
+    keys = [_line_style_key(line) for line in candidates]
+    simplified, sources, stats = simplify_segments(segments, keys, tolerance=tolerance)
+    if stats.segments_out == stats.segments_in:
+        return stats
+
+    kept = set(sources)
+    for index, (start, end) in _replacements(segments, simplified, sources).items():
+        candidates[index].set_data([start[0], end[0]], [start[1], end[1]])
+    for index, line in enumerate(candidates):
+        if index not in kept:
+            line.remove()
+    return stats
+
+
+def simplify_dxf_lines(msp, tolerance: float = DEFAULT_TOLERANCE, across_layers: bool = True) -> SimplifyStats:
+    """Deduplicate and merge LINE entities in a DXF layout
+
+    With across_layers a LINE duplicated on another layer is dropped and the
+    first one written is kept; merging only joins lines with the same layer,
+    colour and linetype. Like simplify_axes_lines it edits in place, so the
+    remaining entities keep their order and handles.
+    """
+    entities = list(msp.query('LINE'))
+    if not entities:
+        return SimplifyStats()
+    segments = np.array([[(e.dxf.start.x, e.dxf.start.y), (e.dxf.end.x, e.dxf.end.y)] for e in entities])
+    merge_keys = [(e.dxf.layer, e.dxf.color, e.dxf.linetype) for e in entities]
+    dedupe_keys = [None] * len(entities) if across_layers else merge_keys
+    simplified, sources, stats = simplify_segments(segments, merge_keys, dedupe_keys, tolerance)
+    if stats.segments_out == stats.segments_in:
+        return stats
+
+    kept = set(sources)
+    for index, (start, end) in _replacements(segments, simplified, sources).items():
+        entities[index].dxf.start = tuple(start)
+        entities[index].dxf.end = tuple(end)
+    for index, entity in enumerate(entities):
+        if index not in kept:
+            msp.delete_entity(entity)
+    return stats
@@ -0,0 +1,101 @@
+"""
+Per-Span Geometry Table
+
+Bridges are laid out from an array of span lengths instead of one total
+length split into equal spans. SpanTable derives support chainages, span
+start/end/mid points and pier heights as arrays, and subdivides every span
+into panels in a single vectorised step, so the draw_* methods handle
+hundreds of unequal spans in linear time without a cap on the span count.
+"""
+
+from dataclasses import dataclass
+from typing import Optional, Sequence, Tuple
+
+import numpy as np
+
+
+@dataclass
+class SpanTable:
+    """Span lengths and pier heights of a multi-span bridge"""
+    lengths: np.ndarray                        # (N,) span lengths
+    pier_heights: Optional[np.ndarray] = None  # (N - 1,) pier top levels, None means deck level
+
+    def __post_init__(self):
+        self.lengths = np.asarray(self.lengths, dtype=float).reshape(-1)
+        if len(self.lengths) == 0:
+            raise ValueError("At least one span is required")
+        if np.any(self.lengths <= 0):
+            raise ValueError("Span lengths must be positive")
+        if self.pier_heights is not None:
+            self.pier_heights = np.asarray(self.pier_heights, dtype=float).reshape(-1)
+            if len(self.pier_heights) != len(self.lengths) - 1:
+                raise ValueError(f"{len(self.lengths)} spans need {len(self.lengths) - 1} pier heights, "
+                                 f"got {len(self.pier_heights)}")
+            if np.any(self.pier_heights <= 0):
+                raise ValueError("Pier heights must be positive")
+
+    @classmethod
+    def equal(cls, total: float, count: int) -> 'SpanTable':
+        """count equal spans over total"""
+        count = max(1, int(count))
+        return cls(np.full(count, total / count))
+
+    @classmethod
+    def from_lengths(cls, lengths: Sequence[float], pier_heights: Optional[Sequence[float]] = None) -> 'SpanTable':
+        return cls(np.asarray(lengths, dtype=float),
+                   None if pier_heights is None else np.asarray(pier_heights, dtype=float))
+
+    @property
+    def count(self) -> int:
+        return len(self.lengths)
+
+    @property
+    def total(self) -> float:
+        return float(self.lengths.sum())
+
+    @property
+    def chainages(self) -> np.ndarray:
+        """(N + 1,) abutment, piers..., abutment"""
+        return np.concatenate(([0.0], np.cumsum(self.lengths)))
+
+    @property
+    def starts(self) -> np.ndarray:
+        return self.chainages[:-1]
+
+    @property
+    def ends(self) -> np.ndarray:
+        return self.chainages[1:]
+
+    @property
+    def midpoints(self) -> np.ndarray:
+        return self.starts + self.lengths / 2
+
+    @property
+    def pier_chainages(self) -> np.ndarray:
+        """(N - 1,) intermediate support chainages"""
+        return self.chainages[1:-1]
+
+    def pier_tops(self, default: float) -> np.ndarray:
+        """Pier top levels, using default where no pier heights were given"""
+        if self.pier_heights is None:
+            return np.full(self.count - 1, float(default))
+        return self.pier_heights
+
+    def panel_counts(self, panel_length: float, minimum: int) -> np.ndarray:
+        """Panels per span: one every panel_length, at least minimum"""
+        return np.maximum(minimum, (self.lengths / panel_length).astype(int))
+
+    def subdivide(self, counts, interior: bool = False) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Split span i into counts[i] equal panels
+
+        Returns the panel points of all spans as flat arrays (x, span index,
+        point index within its span). Points include both span ends, or only
+        the interior points with interior=True.
+        """
+        counts = np.broadcast_to(np.asarray(counts, dtype=int), (self.count,))
+        points = counts - 1 if interior else counts + 1
+        span = np.repeat(np.arange(self.count), points)
+        offsets = np.concatenate(([0], np.cumsum(points)[:-1]))
+        k = np.arange(len(span)) - offsets[span] + (1 if interior else 0)
+        x = self.starts[span] + k * (self.lengths / counts)[span]
+        return x, span, k
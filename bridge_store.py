@@ -0,0 +1,485 @@
+#!/usr/bin/env python3
+"""
+Compact Member Store for Generated Bridge Drawings
+
+Captures a generated drawing as flat NumPy arrays instead of matplotlib
+artists and ezdxf entities:
+
+- segments:    structured array of two-point members (view, draw order, style, layer, endpoints)
+- polylines:   structured index into one shared (N, 2) vertex array
+- styles:      face/edge colour, line width, line style and z-order per style code
+- annotations: __slots__ records in memory, a structured array on disk
+
+Views are the elevation and plan axes of the matplotlib figure plus the DXF
+modelspace. The store saves as an uncompressed .npz whose members can be
+memory-mapped straight from their zip offsets, so re-exporting a stored
+bridge to another format skips geometry generation entirely.
+
+Usage:
+    python bridge_store.py beam_bridge.npz --format svg --output beam_bridge
+"""
+
+from typing import Dict, List, Optional, Tuple
+import argparse
+import json
+import struct
+import zipfile
+
+import numpy as np
+
+
+VIEWS = ('elevation', 'plan', 'model')
+VIEW_CODES = {name: code for code, name in enumerate(VIEWS)}
+MODEL_VIEW = VIEW_CODES['model']
+
+# In the model view the style field holds the DXF colour (256 = BYLAYER)
+STYLE_DTYPE = np.dtype([('face', 'f4', 4), ('edge', 'f4', 4), ('linewidth', 'f4'),
+                        ('linestyle', 'U8'), ('zorder', 'f4'), ('fill', '?')])
+SEGMENT_DTYPE = np.dtype([('view', 'u1'), ('order', 'u4'), ('style', 'u2'), ('layer', 'u2'),
+                          ('x0', 'f8'), ('y0', 'f8'), ('x1', 'f8'), ('y1', 'f8')])
+POLYLINE_DTYPE = np.dtype([('view', 'u1'), ('order', 'u4'), ('style', 'u2'), ('layer', 'u2'),
+                           ('start', 'u4'), ('count', 'u4'), ('closed', '?')])
+
+NO_LAYER = 0xFFFF
+
+
+class Annotation:
+    """Text, optionally with a dimension arrow, in one of the stored views"""
+
+    __slots__ = ('view', 'order', 'layer', 'x', 'y', 'text', 'size', 'rotation', 'color',
+                 'halign', 'valign', 'weight', 'box', 'arrow', 'arrowstyle', 'linewidth', 'align')
+
+    def __init__(self, view: int, order: int, x: float, y: float, text: str, size: float,
+                 rotation: float = 0.0, color=(0.0, 0.0, 0.0, 1.0), halign: str = 'left',
+                 valign: str = 'baseline', weight: str = 'normal', box=None, arrow=None,
+                 arrowstyle: str = '', linewidth: float = 1.0, layer: int = NO_LAYER, align: str = ''):
+        self.view = view
+        self.order = order
+        self.layer = layer
+        self.x = x
+        self.y = y
+        self.text = text
+        self.size = size
+        self.rotation = rotation
+        self.color = tuple(color)
+        self.halign = halign
+        self.valign = valign
+        self.weight = weight
+        self.box = None if box is None else tuple(box)        # background RGBA
+        self.arrow = None if arrow is None else tuple(arrow)  # (x_text, y_text, x_head, y_head)
+        self.arrowstyle = arrowstyle
+        self.linewidth = linewidth
+        self.align = align  # DXF TextEntityAlignment name in the model view
+
+
+def _annotation_dtype(max_text: int) -> np.dtype:
+    """Record layout for annotations; text is stored as UTF-8 bytes"""
+    return np.dtype([('view', 'u1'), ('order', 'u4'), ('layer', 'u2'), ('x', 'f8'), ('y', 'f8'),
+                     ('size', 'f4'), ('rotation', 'f4'), ('color', 'f4', 4), ('halign', 'U8'),
+                     ('valign', 'U16'), ('weight', 'U12'), ('has_box', '?'), ('box', 'f4', 4),
+                     ('has_arrow', '?'), ('arrow', 'f8', 4), ('arrowstyle', 'U8'),
+                     ('linewidth', 'f4'), ('align', 'U16'), ('text', f'S{max(1, max_text)}')])
+
+
+def load_npz_mmap(path: str) -> Dict[str, np.ndarray]:
+    """Open every member of an uncompressed .npz as a read-only memory map
+
+    np.load() cannot memory-map .npz members, but np.savez stores them
+    uncompressed, so each .npy payload sits at a fixed offset in the file.
+    """
+    arrays = {}
+    with zipfile.ZipFile(path) as archive, open(path, 'rb') as f:
+        for info in archive.infolist():
+            name = info.filename[:-4] if info.filename.endswith('.npy') else info.filename
+            if info.compress_type != zipfile.ZIP_STORED:
+                with archive.open(info) as member:
+                    arrays[name] = np.lib.format.read_array(member, allow_pickle=False)
+                continue
+            f.seek(info.header_offset)
+            local_header = f.read(30)
+            name_length, extra_length = struct.unpack('<HH', local_header[26:30])
+            f.seek(info.header_offset + 30 + name_length + extra_length)
+            version = np.lib.format.read_magic(f)
+            if version == (1, 0):
+                shape, fortran_order, dtype = np.lib.format.read_array_header_1_0(f)
+            else:
+                shape, fortran_order, dtype = np.lib.format.read_array_header_2_0(f)
+            if dtype.hasobject:
+                raise ValueError(f"{info.filename} holds Python objects and cannot be memory-mapped")
+            if not shape or int(np.prod(shape)) == 0:
+                arrays[name] = np.fromfile(f, dtype=dtype, count=int(np.prod(shape))).reshape(shape)
+            else:
+                arrays[name] = np.memmap(path, dtype=dtype, mode='r', offset=f.tell(), shape=shape,
+                                         order='F' if fortran_order else 'C')
+    return arrays
+
+
+class MemberStore:
+    """Array-backed snapshot of a generated bridge drawing"""
+
+    def __init__(self, segments: np.ndarray, polylines: np.ndarray, vertices: np.ndarray,
+                 styles: np.ndarray, annotations: List[Annotation], metadata: Dict):
+        self.segments = segments
+        self.polylines = polylines
+        self.vertices = vertices
+        self.styles = styles
+        self.annotations = annotations
+        self.metadata = metadata
+
+    @property
+    def layers(self) -> List[str]:
+        return [layer['name'] for layer in self.metadata.get('layers', [])]
+
+    def __repr__(self):
+        return (f"MemberStore({self.metadata.get('bridge_type')}: {len(self.segments)} segments, "
+                f"{len(self.polylines)} polylines, {len(self.vertices)} vertices, "
+                f"{len(self.annotations)} annotations)")
+
+    # Capture
+
+    @classmethod
+    def from_generator(cls, generator, include_model: bool = True) -> "MemberStore":
+        """Capture the figure and, unless include_model is False, the DXF modelspace of a generator"""
+        if generator.figure is None:
+            generator.generate_drawing()
+        builder = _StoreBuilder()
+        for view, ax in (('elevation', generator.ax_elevation), ('plan', generator.ax_plan)):
+            builder.capture_axes(VIEW_CODES[view], ax)
+        doc = None
+        if include_model:
+            doc = generator.build_dxf_document(sheets=False)
+            builder.capture_modelspace(doc)
+
+        figure = generator.figure
+        suptitle = next((text for text in figure.texts if text.get_text() == figure.get_suptitle()), None)
+        metadata = {
+            'bridge_type': generator.bridge_type.value,
+            'params': dict(generator.params.__dict__),
+            'figsize': list(figure.get_size_inches()),
+            'suptitle': suptitle.get_text() if suptitle is not None else '',
+            'suptitle_size': suptitle.get_fontsize() if suptitle is not None else 16,
+            'views': {view: _axes_metadata(ax) for view, ax in
+                      (('elevation', generator.ax_elevation), ('plan', generator.ax_plan))},
+            'layers': builder.layer_table(doc) if doc is not None else [],
+        }
+        return builder.build(metadata)
+
+    # Serialisation
+
+    def save(self, path: str):
+        """Write an uncompressed, memory-mappable .npz"""
+        annotations = np.zeros(len(self.annotations),
+                               dtype=_annotation_dtype(max((len(a.text.encode('utf-8')) for a in self.annotations), default=1)))
+        for i, a in enumerate(self.annotations):
+            annotations[i] = (a.view, a.order, a.layer, a.x, a.y, a.size, a.rotation, a.color,
+                              a.halign, a.valign, a.weight, a.box is not None, a.box or (0, 0, 0, 0),
+                              a.arrow is not None, a.arrow or (0, 0, 0, 0), a.arrowstyle,
+                              a.linewidth, a.align, a.text.encode('utf-8'))
+        np.savez(path, segments=self.segments, polylines=self.polylines, vertices=self.vertices,
+                 styles=self.styles, annotations=annotations, metadata=np.array(json.dumps(self.metadata)))
+
+    @classmethod
+    def load(cls, path: str, mmap: bool = True) -> "MemberStore":
+        """Load a store saved by save(), memory-mapping the geometry arrays by default"""
+        if mmap:
+            arrays = load_npz_mmap(path)
+        else:
+            with np.load(path, allow_pickle=False) as data:
+                arrays = {name: data[name] for name in data.files}
+        annotations = [
+            Annotation(int(r['view']), int(r['order']), float(r['x']), float(r['y']), r['text'].decode('utf-8'),
+                       float(r['size']), float(r['rotation']), tuple(float(c) for c in r['color']),
+                       str(r['halign']), str(r['valign']), str(r['weight']),
+                       tuple(float(c) for c in r['box']) if r['has_box'] else None,
+                       tuple(float(c) for c in r['arrow']) if r['has_arrow'] else None,
+                       str(r['arrowstyle']), float(r['linewidth']), int(r['layer']), str(r['align']))
+            for r in arrays['annotations']
+        ]
+        return cls(arrays['segments'], arrays['polylines'], arrays['vertices'], arrays['styles'],
+                   annotations, json.loads(str(arrays['metadata'][()])))
+
+    # Re-export
+
+    def to_figure(self):
+        """Rebuild the matplotlib figure; returns (figure, ax_elevation, ax_plan)"""
+        from matplotlib.backends.backend_agg import FigureCanvasAgg
+        from matplotlib.figure import Figure
+
+        figure = Figure(figsize=self.metadata['figsize'])
+        FigureCanvasAgg(figure)
+        axes = []
+        for view in ('elevation', 'plan'):
+            info = self.metadata['views'][view]
+            ax = figure.add_axes(info['position'])
+            ax.set_aspect(info['aspect'])
+            if info['grid']:
+                ax.grid(True, alpha=0.3)
+            ax.set_xlim(*info['xlim'])
+            ax.set_ylim(*info['ylim'])
+            ax.set_xlabel(info['xlabel'], fontsize=info['label_size'])
+            ax.set_ylabel(info['ylabel'], fontsize=info['label_size'])
+            ax.set_title(info['title'], fontsize=info['title_size'], fontweight='bold')
+            self._draw_view(ax, VIEW_CODES[view])
+            axes.append(ax)
+        if self.metadata['suptitle']:
+            figure.suptitle(self.metadata['suptitle'], fontsize=self.metadata['suptitle_size'], fontweight='bold')
+        return figure, axes[0], axes[1]
+
+    def _draw_view(self, ax, view: int):
+        from matplotlib.collections import LineCollection, PolyCollection
+
+        items = []  # (order, kind, style, vertices)
+        for s in self.segments[self.segments['view'] == view]:
+            items.append((int(s['order']), 'line', int(s['style']),
+                          np.array([[s['x0'], s['y0']], [s['x1'], s['y1']]])))
+        for p in self.polylines[self.polylines['view'] == view]:
+            points = np.asarray(self.vertices[p['start']:p['start'] + p['count']])
+            style = self.styles[p['style']]
+            kind = 'poly' if p['closed'] and style['fill'] else 'line'
+            items.append((int(p['order']), kind, int(p['style']), points))
+        items.sort(key=lambda item: item[0])
+
+        # One collection per run of consecutive items sharing kind and style keeps the draw order
+        run: List[np.ndarray] = []
+        for index, (order, kind, style_code, points) in enumerate(items):
+            run.append(points)
+            last = index == len(items) - 1
+            if last or items[index + 1][1:3] != (kind, style_code):
+                style = self.styles[style_code]
+                if kind == 'poly':
+                    collection = PolyCollection(run, facecolors=[style['face']], edgecolors=[style['edge']],
+                                                linewidths=float(style['linewidth']),
+                                                linestyles=str(style['linestyle']))
+                else:
+                    collection = LineCollection(run, colors=[style['edge']],
+                                                linewidths=float(style['linewidth']),
+                                                linestyles=str(style['linestyle']), capstyle='projecting')
+                collection.set_zorder(float(style['zorder']))
+                ax.add_collection(collection, autolim=False)
+                run = []
+
+        for a in sorted((a for a in self.annotations if a.view == view), key=lambda a: a.order):
+            if a.arrow is not None:
+                ax.annotate(a.text, xy=a.arrow[2:], xytext=a.arrow[:2],
+                            arrowprops=dict(arrowstyle=a.arrowstyle, color=a.color, lw=a.linewidth))
+                continue
+            bbox = dict(boxstyle='round', facecolor=a.box[:3], alpha=a.box[3]) if a.box else None
+            ax.text(a.x, a.y, a.text, fontsize=a.size, rotation=a.rotation, color=a.color,
+                    ha=a.halign, va=a.valign, weight=a.weight, bbox=bbox)
+
+    def write_dxf_entities(self, msp):
+        """Recreate the stored modelspace entities in msp"""
+        from ezdxf.enums import TextEntityAlignment
+
+        doc = msp.doc
+        for layer in self.metadata.get('layers', []):
+            if layer['name'] not in doc.layers:
+                doc.layers.add(layer['name'], color=layer['color'])
+        layers = self.layers
+
+        def attribs(record):
+            result = {'color': int(record['style'])}
+            if record['layer'] != NO_LAYER:
+                result['layer'] = layers[record['layer']]
+            return result
+
+        items = [(int(s['order']), 'segment', s) for s in self.segments[self.segments['view'] == MODEL_VIEW]]
+        items += [(int(p['order']), 'polyline', p) for p in self.polylines[self.polylines['view'] == MODEL_VIEW]]
+        items += [(a.order, 'text', a) for a in self.annotations if a.view == MODEL_VIEW]
+        items.sort(key=lambda item: item[0])
+        for _, kind, record in items:
+            if kind == 'segment':
+                msp.add_line((float(record['x0']), float(record['y0'])), (float(record['x1']), float(record['y1'])),
+                             dxfattribs=attribs(record))
+            elif kind == 'polyline':
+                points = np.asarray(self.vertices[record['start']:record['start'] + record['count']])
+                msp.add_lwpolyline(points.tolist(), close=bool(record['closed']), dxfattribs=attribs(record))
+            else:
+                dxfattribs = {'height': record.size, 'rotation': record.rotation}
+                if record.layer != NO_LAYER:
+                    dxfattribs['layer'] = layers[record.layer]
+                text = msp.add_text(record.text, dxfattribs=dxfattribs)
+                text.set_placement((record.x, record.y), align=TextEntityAlignment[record.align])
+
+    def to_generator(self):
+        """A BridgeDrawingGenerator whose exports come from this store"""
+        from bridge_drawings import BridgeDrawingGenerator
+        return BridgeDrawingGenerator.from_store(self)
+
+
+def _axes_metadata(ax) -> Dict:
+    return {
+        'position': list(ax.get_position(original=True).bounds),
+        'aspect': ax.get_aspect(),
+        'grid': any(line.get_visible() for line in ax.get_xgridlines()),
+        'xlim': list(ax.get_xlim()),
+        'ylim': list(ax.get_ylim()),
+        'title': ax.get_title(),
+        'title_size': ax.title.get_fontsize(),
+        'xlabel': ax.get_xlabel(),
+        'ylabel': ax.get_ylabel(),
+        'label_size': ax.xaxis.label.get_fontsize(),
+    }
+
+
+def _linestyle(value) -> str:
+    if isinstance(value, str):
+        return {'solid': '-', 'dashed': '--', 'dotted': ':', 'dashdot': '-.'}.get(value, value)
+    return '--' if value and value[0] and value[0][1] else '-'
+
+
+class _StoreBuilder:
+    """Accumulates captured geometry before it is packed into arrays"""
+
+    def __init__(self):
+        self.segments: List[Tuple] = []
+        self.polylines: List[Tuple] = []
+        self.vertices: List[np.ndarray] = []
+        self.vertex_count = 0
+        self.styles: Dict[Tuple, int] = {}
+        self.annotations: List[Annotation] = []
+        self.layer_codes: Dict[str, int] = {}
+        self.order = 0
+
+    def _next_order(self) -> int:
+        self.order += 1
+        return self.order
+
+    def _style(self, face, edge, linewidth, linestyle, zorder, fill) -> int:
+        key = (tuple(np.round(face, 4)), tuple(np.round(edge, 4)), round(float(linewidth), 4),
+               _linestyle(linestyle), float(zorder), bool(fill))
+        return self.styles.setdefault(key, len(self.styles))
+
+    def _layer(self, name: str) -> int:
+        return self.layer_codes.setdefault(name, len(self.layer_codes))
+
+    def _add_points(self, view: int, order: int, style: int, layer: int, points: np.ndarray, closed: bool):
+        if len(points) == 2 and not closed:
+            (x0, y0), (x1, y1) = points
+            self.segments.append((view, order, style, layer, x0, y0, x1, y1))
+            return
+        self.polylines.append((view, order, style, layer, self.vertex_count, len(points), closed))
+        self.vertices.append(np.asarray(points, dtype=float))
+        self.vertex_count += len(points)
+
+    def capture_axes(self, view: int, ax):
+        from matplotlib.collections import Collection
+        from matplotlib.colors import to_rgba
+        from matplotlib.lines import Line2D
+        from matplotlib.patches import Patch
+        from matplotlib.text import Text
+
+        drawn = {id(artist) for artist in (*ax.lines, *ax.patches, *ax.collections, *ax.texts)}
+        for artist in ax.get_children():
+            if id(artist) not in drawn or not artist.get_visible():
+                continue
+            if isinstance(artist, Line2D):
+                to_data = artist.get_transform() - ax.transData
+                points = to_data.transform(artist.get_xydata())
+                style = self._style((0, 0, 0, 0), to_rgba(artist.get_color(), artist.get_alpha()),
+                                    artist.get_linewidth(), artist.get_linestyle(), artist.get_zorder(), False)
+                self._add_points(view, self._next_order(), style, NO_LAYER, points, False)
+            elif isinstance(artist, Patch):
+                to_data = artist.get_transform() - ax.transData
+                style = self._style(artist.get_facecolor(), artist.get_edgecolor(), artist.get_linewidth(),
+                                    artist.get_linestyle(), artist.get_zorder(), artist.get_fill())
+                order = self._next_order()
+                for polygon in artist.get_path().to_polygons(to_data, closed_only=False):
+                    closed = len(polygon) > 2 and np.allclose(polygon[0], polygon[-1])
+                    self._add_points(view, order, style, NO_LAYER, polygon, closed)
+            elif isinstance(artist, Collection):
+                to_data = artist.get_transform() - ax.transData
+                faces, edges = artist.get_facecolor(), artist.get_edgecolor()
+                widths, styles = artist.get_linewidth(), artist.get_linestyle()
+                order = self._next_order()
+                for i, path in enumerate(artist.get_paths()):
+                    face = faces[i % len(faces)] if len(faces) else (0, 0, 0, 0)
+                    edge = edges[i % len(edges)] if len(edges) else (0, 0, 0, 0)
+                    style = self._style(face, edge, widths[i % len(widths)], styles[i % len(styles)],
+                                        artist.get_zorder(), len(faces) > 0)
+                    for polygon in path.to_polygons(to_data, closed_only=False):
+                        closed = len(polygon) > 2 and np.allclose(polygon[0], polygon[-1])
+                        self._add_points(view, order, style, NO_LAYER, polygon, closed)
+            elif isinstance(artist, Text):
+                self.annotations.append(self._capture_text(view, ax, artist))
+
+    def _capture_text(self, view: int, ax, text) -> Annotation:
+        from matplotlib.colors import to_rgba
+        from matplotlib.text import Annotation as TextAnnotation
+
+        to_data = text.get_transform() - ax.transData
+        x, y = to_data.transform(text.get_position())
+        box = text.get_bbox_patch()
+        record = Annotation(view, self._next_order(), float(x), float(y), text.get_text(), text.get_fontsize(),
+                            text.get_rotation(), to_rgba(text.get_color()), text.get_horizontalalignment(),
+                            text.get_verticalalignment(), str(text.get_fontweight()),
+                            box=box.get_facecolor() if box is not None else None)
+        if isinstance(text, TextAnnotation) and text.arrowprops:
+            props = text.arrowprops
+            record.arrow = (*text.xyann, *text.xy)
+            record.arrowstyle = props.get('arrowstyle', '->')
+            record.color = to_rgba(props.get('color', 'black'))
+            record.linewidth = props.get('lw', props.get('linewidth', 1.0))
+        return record
+
+    def capture_modelspace(self, doc):
+        for entity in doc.modelspace():
+            kind = entity.dxftype()
+            layer = self._layer(entity.dxf.layer)
+            color = entity.dxf.color
+            if kind == 'LINE':
+                start, end = entity.dxf.start, entity.dxf.end
+                self._add_points(MODEL_VIEW, self._next_order(), color, layer,
+                                 np.array([[start.x, start.y], [end.x, end.y]]), False)
+            elif kind == 'LWPOLYLINE':
+                points = np.array(list(entity.get_points('xy')), dtype=float)
+                self.polylines.append((MODEL_VIEW, self._next_order(), color, layer,
+                                       self.vertex_count, len(points), bool(entity.closed)))
+                self.vertices.append(points)
+                self.vertex_count += len(points)
+            elif kind == 'TEXT':
+                align, p1, _ = entity.get_placement()
+                self.annotations.append(Annotation(MODEL_VIEW, self._next_order(), p1.x, p1.y, entity.dxf.text,
+                                                   entity.dxf.height, entity.dxf.rotation, layer=layer,
+                                                   align=align.name))
+
+    def layer_table(self, doc) -> List[Dict]:
+        table = []
+        for name in sorted(self.layer_codes, key=self.layer_codes.get):
+            color = doc.layers.get(name).color if name in doc.layers else 7
+            table.append({'name': name, 'color': color})
+        return table
+
+    def build(self, metadata: Dict) -> MemberStore:
+        styles = np.zeros(len(self.styles), dtype=STYLE_DTYPE)
+        for (face, edge, linewidth, linestyle, zorder, fill), code in self.styles.items():
+            styles[code] = (face, edge, linewidth, linestyle, zorder, fill)
+        vertices = np.concatenate(self.vertices) if self.vertices else np.zeros((0, 2))
+        return MemberStore(np.array(self.segments, dtype=SEGMENT_DTYPE),
+                           np.array(self.polylines, dtype=POLYLINE_DTYPE),
+                           vertices, styles, self.annotations, metadata)
+
+
+def main():
+    """Command-line entry point for re-exporting stored drawings"""
+    from bridge_drawings import OutputFormat
+
+    parser = argparse.ArgumentParser(description='Re-export a stored bridge drawing (.npz)')
+    parser.add_argument('store', help='Member store written with bridge_drawings.py --store')
+    parser.add_argument('--format', choices=[of.value for of in OutputFormat], default='png',
+                       help='Output format (default: png)')
+    parser.add_argument('--output', help='Output filename without extension (default: store name)')
+    parser.add_argument('--dpi', type=int, default=300, help='Raster resolution (default: 300)')
+
+    args = parser.parse_args()
+
+    store = MemberStore.load(args.store)
+    print(store)
+    generator = store.to_generator()
+    output = args.output or (args.store[:-4] if args.store.endswith('.npz') else args.store)
+    generator.save_drawing(output, OutputFormat(args.format), dpi=args.dpi)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,182 @@
+#!/usr/bin/env python3
+"""
+Tiled Multi-Resolution Raster Export
+
+Renders the elevation and plan views of a bridge as a pyramid of fixed-size
+PNG tiles at several zoom levels, plus an index.json describing the pyramid.
+A viewer only needs to fetch the tiles that are visible at the current zoom.
+
+Each view is drawn once into a single tile-sized figure; every tile is then
+produced by moving the axes limits over the drawing and re-rendering that one
+small canvas, so peak memory stays constant however long the bridge is.
+Artists that do not intersect a tile are hidden while it is rendered.
+
+Tile layout: <output>/<view>/<level>/<col>_<row>.png, row 0 at the top.
+"""
+
+from typing import Any, Dict, List, Optional, Tuple
+import argparse
+import json
+import math
+import os
+
+import matplotlib
+matplotlib.use('Agg')
+import matplotlib.pyplot as plt
+import numpy as np
+
+from bridge_drawings import (BridgeDrawingGenerator, BridgeParameters, BridgeType,
+                             artist_data_bounds, resolve_bridge_type)
+from bridge_types import bridge_type_names
+
+
+VIEWS = ('elevation', 'plan')
+
+
+def _level_count(extent_width: float, tile_size: int, max_pixels_per_metre: float) -> int:
+    """Levels needed until the finest level reaches max_pixels_per_metre"""
+    base = tile_size / extent_width
+    return max(1, int(math.ceil(math.log2(max(max_pixels_per_metre / base, 1.0)))) + 1)
+
+
+def _view_axes(generator: BridgeDrawingGenerator, view: str, tile_size: int, dpi: int):
+    """Create a single borderless tile-sized axes and draw one view into it"""
+    figure = plt.figure(figsize=(tile_size / dpi, tile_size / dpi), dpi=dpi)
+    ax = figure.add_axes((0, 0, 1, 1))
+    ax.set_axis_off()
+    ax.set_autoscale_on(False)
+    figure.patch.set_facecolor('white')
+
+    if view == 'elevation':
+        generator.ax_elevation = ax
+    else:
+        generator.ax_plan = ax
+    generator.draw_view(view)
+    if view == 'plan' and generator.params.skew_angle:
+        generator._apply_plan_skew()
+    return figure, ax
+
+
+def _artist_bounds(ax) -> Tuple[List[Any], np.ndarray]:
+    """Artists of the axes with their data bounds (NaN for always-visible artists)"""
+    artists = list(ax.patches) + list(ax.lines) + list(ax.collections)
+    bounds = np.full((len(artists), 4), np.nan)
+    for i, artist in enumerate(artists):
+        box = artist_data_bounds(artist)
+        if box is not None:
+            bounds[i] = box
+    return artists, bounds
+
+
+def export_view_tiles(generator: BridgeDrawingGenerator, view: str, output_dir: str,
+                      tile_size: int = 256, levels: Optional[int] = None,
+                      max_pixels_per_metre: float = 16.0, dpi: int = 100) -> Dict[str, Any]:
+    """Write the tile pyramid of one view and return its index entry"""
+    (xmin, xmax), (ymin, ymax) = generator.view_limits()[view]
+    width, height = xmax - xmin, ymax - ymin
+    if levels is None:
+        levels = _level_count(width, tile_size, max_pixels_per_metre)
+
+    figure, ax = _view_axes(generator, view, tile_size, dpi)
+    artists, bounds = _artist_bounds(ax)
+    always_visible = np.isnan(bounds).any(axis=1)
+
+    # Level 0 fits the whole view width into one tile
+    base_pixels_per_metre = tile_size / width
+    index_levels = []
+    try:
+        for level in range(levels):
+            pixels_per_metre = base_pixels_per_metre * 2 ** level
+            tile_metres = tile_size / pixels_per_metre
+            cols = int(math.ceil(width / tile_metres))
+            rows = int(math.ceil(height / tile_metres))
+            level_dir = os.path.join(output_dir, view, str(level))
+            os.makedirs(level_dir, exist_ok=True)
+
+            for col in range(cols):
+                x0 = xmin + col * tile_metres
+                x1 = x0 + tile_metres
+                in_column = always_visible | ((bounds[:, 2] >= x0) & (bounds[:, 0] <= x1))
+                for row in range(rows):
+                    y1 = ymax - row * tile_metres
+                    y0 = y1 - tile_metres
+                    visible = in_column & (always_visible |
+                                           ((bounds[:, 3] >= y0) & (bounds[:, 1] <= y1)))
+                    for artist, show in zip(artists, visible):
+                        artist.set_visible(bool(show))
+                    ax.set_xlim(x0, x1)
+                    ax.set_ylim(y0, y1)
+                    figure.savefig(os.path.join(level_dir, f"{col}_{row}.png"), dpi=dpi,
+                                   facecolor='white')
+
+            index_levels.append({
+                'level': level,
+                'pixels_per_metre': pixels_per_metre,
+                'tile_metres': tile_metres,
+                'cols': cols,
+                'rows': rows,
+            })
+    finally:
+        plt.close(figure)
+
+    return {
+        'extent': [xmin, xmax, ymin, ymax],
+        'path': f"{view}/{{level}}/{{col}}_{{row}}.png",
+        'levels': index_levels,
+    }
+
+
+def export_tile_pyramid(bridge_type: BridgeType, params: BridgeParameters, output_dir: str,
+                        tile_size: int = 256, levels: Optional[int] = None,
+                        max_pixels_per_metre: float = 16.0,
+                        views: tuple = VIEWS) -> Dict[str, Any]:
+    """Render tile pyramids for the requested views and write index.json"""
+    generator = BridgeDrawingGenerator(bridge_type, params)
+    index = {
+        'bridge_type': bridge_type.value,
+        'tile_size': tile_size,
+        'origin': 'top-left',
+        'views': {},
+    }
+    for view in views:
+        index['views'][view] = export_view_tiles(generator, view, output_dir, tile_size,
+                                                 levels, max_pixels_per_metre)
+
+    with open(os.path.join(output_dir, 'index.json'), 'w') as f:
+        json.dump(index, f, indent=2)
+    return index
+
+
+def main():
+    """Command-line interface for tiled export"""
+    parser = argparse.ArgumentParser(description='Export bridge views as a multi-resolution tile pyramid')
+    parser.add_argument('bridge_type', choices=bridge_type_names(),
+                       help='Type of bridge to generate')
+    parser.add_argument('--span', type=float, default=100.0, help='Main span length in meters')
+    parser.add_argument('--width', type=float, default=12.0, help='Deck width in meters')
+    parser.add_argument('--height', type=float, default=20.0, help='Overall height in meters')
+    parser.add_argument('--supports', type=int, default=0, help='Number of intermediate supports')
+    parser.add_argument('--material', default='steel', help='Primary material')
+    parser.add_argument('--skew', type=float, default=0.0, help='Plan skew angle in degrees (default: 0)')
+    parser.add_argument('--output', default='bridge_tiles', help='Output directory')
+    parser.add_argument('--tile-size', type=int, default=256, help='Tile edge in pixels (default: 256)')
+    parser.add_argument('--levels', type=int, help='Number of zoom levels (default: automatic)')
+    parser.add_argument('--max-ppm', type=float, default=16.0,
+                       help='Pixels per metre at the finest automatic level (default: 16)')
+
+    args = parser.parse_args()
+
+    params = BridgeParameters(span_length=args.span, deck_width=args.width, height=args.height,
+                              supports=args.supports, load_capacity=50.0, material=args.material,
+                              skew_angle=args.skew)
+    index = export_tile_pyramid(resolve_bridge_type(args.bridge_type), params, args.output,
+                                args.tile_size, args.levels, args.max_ppm)
+    for view, entry in index['views'].items():
+        tiles = sum(level['cols'] * level['rows'] for level in entry['levels'])
+        print(f"{view}: {len(entry['levels'])} levels, {tiles} tiles")
+    print(f"Tile index written to {os.path.join(args.output, 'index.json')}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,120 @@
+"""
+Coordinate Transforms for Bridge Drawings
+
+Affine transforms (scale, datum offset, skew) stored as 3x3 matrices that are
+composed once per drawing and applied to whole NumPy coordinate arrays in a
+single operation. The LISP-style helpers hpos/vpos/h2pos/v2pos and
+calculate_skew_coordinates are built on the same layer and accept scalars or
+arrays alike.
+"""
+
+from typing import Tuple
+import math
+
+import numpy as np
+
+
+class AffineTransform:
+    """2-D affine transform acting on (x, y) coordinate arrays"""
+
+    __slots__ = ("matrix",)
+
+    def __init__(self, matrix=None):
+        self.matrix = np.eye(3) if matrix is None else np.asarray(matrix, dtype=float)
+
+    @classmethod
+    def identity(cls) -> "AffineTransform":
+        return cls()
+
+    @classmethod
+    def translation(cls, dx: float, dy: float) -> "AffineTransform":
+        return cls([[1.0, 0.0, dx], [0.0, 1.0, dy], [0.0, 0.0, 1.0]])
+
+    @classmethod
+    def scaling(cls, sx: float, sy: float = None) -> "AffineTransform":
+        sy = sx if sy is None else sy
+        return cls([[sx, 0.0, 0.0], [0.0, sy, 0.0], [0.0, 0.0, 1.0]])
+
+    @classmethod
+    def rotation(cls, degrees: float, origin: Tuple[float, float] = (0.0, 0.0)) -> "AffineTransform":
+        """Counter-clockwise rotation about origin"""
+        rad = math.radians(degrees)
+        c, s = math.cos(rad), math.sin(rad)
+        rotate = cls([[c, -s, 0.0], [s, c, 0.0], [0.0, 0.0, 1.0]])
+        ox, oy = origin
+        return cls.translation(-ox, -oy).then(rotate).then(cls.translation(ox, oy))
+
+    @classmethod
+    def shear_x(cls, degrees: float, origin_y: float = 0.0) -> "AffineTransform":
+        """Shift x by (y - origin_y) * tan(angle), keeping horizontal lines horizontal"""
+        t = math.tan(math.radians(degrees))
+        return cls([[1.0, t, -t * origin_y], [0.0, 1.0, 0.0], [0.0, 0.0, 1.0]])
+
+    def then(self, other: "AffineTransform") -> "AffineTransform":
+        """Compose so that self is applied first, then other"""
+        return AffineTransform(other.matrix @ self.matrix)
+
+    def inverted(self) -> "AffineTransform":
+        return AffineTransform(np.linalg.inv(self.matrix))
+
+    def apply(self, points) -> np.ndarray:
+        """Transform an (..., 2) array of points"""
+        points = np.asarray(points, dtype=float)
+        return points @ self.matrix[:2, :2].T + self.matrix[:2, 2]
+
+    def apply_xy(self, x, y) -> Tuple[np.ndarray, np.ndarray]:
+        """Transform separate x and y arrays (or scalars)"""
+        m = self.matrix
+        x = np.asarray(x, dtype=float)
+        y = np.asarray(y, dtype=float)
+        return m[0, 0] * x + m[0, 1] * y + m[0, 2], m[1, 0] * x + m[1, 1] * y + m[1, 2]
+
+    def to_matplotlib(self):
+        """Equivalent matplotlib Affine2D, to be combined with an axes transData"""
+        from matplotlib.transforms import Affine2D
+        return Affine2D(self.matrix.copy())
+
+    def __repr__(self):
+        return f"AffineTransform({self.matrix[:2].tolist()})"
+
+
+def lisp_transform(left: float, datum: float, scale: float) -> AffineTransform:
+    """Chainage/level to drawing coordinates, as LISP hpos/vpos do"""
+    return AffineTransform.translation(-left, -datum).then(AffineTransform.scaling(scale))
+
+
+def skew_transform(skew_angle: float, origin: Tuple[float, float] = (0.0, 0.0)) -> AffineTransform:
+    """Rotation used by calculate_skew_coordinates"""
+    return AffineTransform.rotation(skew_angle, origin)
+
+
+def plan_skew_transform(skew_angle: float, deck_width: float) -> AffineTransform:
+    """Skewed plan: supports and cross members lean by the skew angle about the centreline"""
+    return AffineTransform.shear_x(skew_angle, origin_y=deck_width / 2)
+
+
+# LISP-style helpers; all accept scalars or NumPy arrays
+
+def hpos(ch, left, scale):
+    """Horizontal position calculation - LISP hpos() function"""
+    return (np.asarray(ch, dtype=float) - left) * scale
+
+
+def vpos(rl, datum, scale):
+    """Vertical position calculation - LISP vpos() function"""
+    return (np.asarray(rl, dtype=float) - datum) * scale
+
+
+def h2pos(ch, left, scale2):
+    """Secondary horizontal position - LISP h2pos() function"""
+    return hpos(ch, left, scale2)
+
+
+def v2pos(rl, datum, scale2):
+    """Secondary vertical position - LISP v2pos() function"""
+    return vpos(rl, datum, scale2)
+
+
+def calculate_skew_coordinates(x, y, skew_angle):
+    """Calculate coordinates for skewed bridges"""
+    return skew_transform(skew_angle).apply_xy(x, y)
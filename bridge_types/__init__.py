@@ -0,0 +1,114 @@
+"""
+Bridge Type Plugins
+
+Every bridge type is a module providing its own geometry and drawing code:
+
+- draw_elevation(generator): the elevation view into generator.ax_elevation
+- draw_plan(generator): the plan view into generator.ax_plan
+- add_to_dxf(generator, msp, span, height, width): its DXF modelspace entities
+
+plus whatever geometry helpers it needs, and optionally CONSTRUCTION_STAGES
+and construction_stage(generator, artist) for bridge_animation.py. BridgeDrawingGenerator looks its
+type up here and imports the module on first use, so a process only loads
+the types it actually draws.
+
+New types plug in without touching the core: call register_bridge_type()
+with a module or its import path, or declare an entry point in the
+"bridge_drawings.bridge_types" group of an installed package
+(name = "package.module").
+"""
+
+from importlib import import_module
+from types import ModuleType
+from typing import Dict, List, Union
+import threading
+
+ENTRY_POINT_GROUP = "bridge_drawings.bridge_types"
+PLUGIN_FUNCTIONS = ("draw_elevation", "draw_plan", "add_to_dxf")
+
+# Built-in types, in BridgeType order
+BUILTIN_TYPES = {
+    "beam": "bridge_types.beam",
+    "truss": "bridge_types.truss",
+    "arch": "bridge_types.arch",
+    "suspension": "bridge_types.suspension",
+    "cable_stayed": "bridge_types.cable_stayed",
+    "t_beam": "bridge_types.t_beam",
+    "slab": "bridge_types.slab",
+}
+
+_registry: Dict[str, Union[str, ModuleType]] = dict(BUILTIN_TYPES)
+_loaded: Dict[str, ModuleType] = {}
+_lock = threading.Lock()
+_entry_points_scanned = False
+
+
+class PluginBridgeType:
+    """Stands in for a BridgeType member for types registered outside the enum"""
+
+    def __init__(self, value: str):
+        self.value = value
+        self.name = value.upper()
+
+    def __eq__(self, other):
+        return getattr(other, "value", None) == self.value
+
+    def __hash__(self):
+        return hash(self.value)
+
+    def __repr__(self):
+        return f"<PluginBridgeType.{self.name}: {self.value!r}>"
+
+
+def register_bridge_type(name: str, module: Union[str, ModuleType]):
+    """Register (or replace) the plugin module of a bridge type; a path is imported on first use"""
+    with _lock:
+        _registry[name] = module
+        _loaded.pop(name, None)
+
+
+def _scan_entry_points():
+    global _entry_points_scanned
+    if _entry_points_scanned:
+        return
+    from importlib.metadata import entry_points
+
+    with _lock:
+        for entry_point in entry_points(group=ENTRY_POINT_GROUP):
+            _registry.setdefault(entry_point.name, entry_point.value)
+        _entry_points_scanned = True
+
+
+def bridge_type_names() -> List[str]:
+    """Names of all registered bridge types, built-in ones first"""
+    _scan_entry_points()
+    return list(_registry)
+
+
+def loaded_types() -> List[str]:
+    """Names of the types whose modules have been imported so far"""
+    return list(_loaded)
+
+
+def get_plugin(name: str) -> ModuleType:
+    """The module of a bridge type, imported on first use"""
+    plugin = _loaded.get(name)
+    if plugin is not None:
+        return plugin
+    if name not in _registry:
+        _scan_entry_points()
+    with _lock:
+        module = _registry.get(name)
+        if module is None:
+            raise ValueError(f"Unsupported bridge type: {name}")
+        plugin = import_module(module) if isinstance(module, str) else module
+        missing = [function for function in PLUGIN_FUNCTIONS if not callable(getattr(plugin, function, None))]
+        if missing:
+            raise TypeError(f"Bridge type plugin {plugin.__name__} lacks {', '.join(missing)}")
+        _loaded[name] = plugin
+    return plugin
+
+
+def box_points(xmin: float, ymin: float, xmax: float, ymax: float) -> List[tuple]:
+    """Closed rectangle outline for msp.add_lwpolyline"""
+    return [(xmin, ymin), (xmax, ymin), (xmax, ymax), (xmin, ymax), (xmin, ymin)]
@@ -0,0 +1,163 @@
+"""
+Arch Bridge
+
+Parabolic arch ribs with spandrel columns carrying the deck, arch
+springs on the supports.
+"""
+
+import numpy as np
+from matplotlib.patches import Rectangle
+from bridge_types import box_points
+
+
+def draw_elevation(generator):
+    """Generate elevation view for arch bridge"""
+    # Support multi-span arches
+    spans = generator.params.span_table()
+    
+    # Arch parameters, shared by all spans
+    arch_center_y = 0
+    arch_rise = generator.params.height * 0.7
+    arch_thickness = 2.0
+    theta = np.linspace(0, np.pi, 100)
+    
+    for span_start, span_length in zip(spans.starts, spans.lengths):
+        # Create arch using parametric equations
+        arch_x = span_length/2 * np.cos(theta) + span_start + span_length/2
+        arch_y = arch_rise * np.sin(theta) + arch_center_y
+        
+        # Arch structure (hollow)
+        inner_y = (arch_rise - arch_thickness) * np.sin(theta) + arch_center_y
+        
+        # Draw arch
+        generator.ax_elevation.fill_between(arch_x, arch_y, inner_y, 
+                                     where=inner_y <= arch_y, alpha=0.8,
+                                     facecolor=generator.colors['structure'], 
+                                     edgecolor=generator.colors['structure'],
+                                     linewidth=generator.line_width)
+        
+    # Spandrel walls/supports between arch and deck, for all spans at once
+    spandrel_x, spandrel_span, _ = spans.subdivide(spans.panel_counts(20, 3) + 1, interior=True)
+    # Corresponding arch height at each spandrel
+    spandrel_y = arch_rise * np.sin(np.pi * (spandrel_x - spans.starts[spandrel_span]) /
+                                    spans.lengths[spandrel_span])
+    for x_pos, arch_height_at_x in zip(spandrel_x, spandrel_y):
+        spandrel = Rectangle((x_pos - 0.3, arch_height_at_x), 0.6, 
+                           (arch_rise + 2) - arch_height_at_x,
+                           facecolor=generator.colors['supports'], alpha=0.6,
+                           edgecolor=generator.colors['structure'], linewidth=1)
+        generator.ax_elevation.add_patch(spandrel)
+    
+    # Continuous deck/roadway above arches
+    deck_y = arch_rise + 2
+    deck = Rectangle((0, deck_y), generator.params.span_length, 0.8,
+                    facecolor=generator.colors['deck'], alpha=0.7,
+                    edgecolor=generator.colors['structure'], linewidth=generator.line_width)
+    generator.ax_elevation.add_patch(deck)
+    
+    # Abutments and piers
+    abutment_width = 4.0
+    abutment_height = arch_rise + 5
+    
+    # End abutments
+    for x_pos in [0, generator.params.span_length]:
+        abutment = Rectangle((x_pos - abutment_width/2, -generator.params.foundation_depth), 
+                           abutment_width, abutment_height + generator.params.foundation_depth,
+                           facecolor=generator.colors['supports'], alpha=0.8,
+                           edgecolor=generator.colors['structure'], linewidth=generator.line_width)
+        generator.ax_elevation.add_patch(abutment)
+    
+    # Intermediate piers for multi-span
+    for x_pos, pier_top in zip(spans.pier_chainages, spans.pier_tops(abutment_height)):
+        pier = Rectangle((x_pos - abutment_width/3, -generator.params.foundation_depth), 
+                       abutment_width * 2/3, pier_top + generator.params.foundation_depth,
+                       facecolor=generator.colors['supports'], alpha=0.8,
+                       edgecolor=generator.colors['structure'], linewidth=generator.line_width)
+        generator.ax_elevation.add_patch(pier)
+
+
+def draw_plan(generator):
+    """Generate plan view for arch bridge"""
+    # Deck outline
+    deck_plan = Rectangle((0, 0), generator.params.span_length, generator.params.deck_width,
+                        facecolor=generator.colors['plan_deck'], alpha=0.7,
+                        edgecolor=generator.colors['structure'], linewidth=generator.line_width)
+    generator.ax_plan.add_patch(deck_plan)
+    
+    # Arch ribs (multiple parallel arches)
+    num_ribs = 3  # Three parallel arch ribs
+    rib_width = 1.0
+    rib_spacing = generator.params.deck_width / (num_ribs + 1)
+    
+    for i in range(num_ribs):
+        y_pos = (i + 1) * rib_spacing - rib_width/2
+        rib_plan = Rectangle((0, y_pos), generator.params.span_length, rib_width,
+                           facecolor=generator.colors['plan_structure'], alpha=0.9,
+                           edgecolor=generator.colors['structure'], linewidth=1.5)
+        generator.ax_plan.add_patch(rib_plan)
+    
+    # Spandrel structure (cross-walls)
+    spans = generator.params.span_table()
+    spandrel_x, _, _ = spans.subdivide(spans.panel_counts(20, 3) + 1, interior=True)
+    for x_pos in spandrel_x:
+        spandrel_plan = Rectangle((x_pos - 0.3, 0), 0.6, generator.params.deck_width,
+                                facecolor=generator.colors['plan_structure'], alpha=0.4,
+                                edgecolor=generator.colors['structure'], linewidth=0.5)
+        generator.ax_plan.add_patch(spandrel_plan)
+    
+    # Supports in plan view
+    support_width = 4.0
+    
+    # End abutments
+    for x_pos in [0, generator.params.span_length]:
+        abutment_plan = Rectangle((x_pos - support_width/2, (generator.params.deck_width - support_width)/2), 
+                                support_width, support_width,
+                                facecolor=generator.colors['supports'], alpha=0.8,
+                                edgecolor=generator.colors['structure'], linewidth=generator.line_width)
+        generator.ax_plan.add_patch(abutment_plan)
+    
+    # Intermediate piers
+    for x_pos in spans.pier_chainages:
+        pier_plan = Rectangle((x_pos - support_width/3, (generator.params.deck_width - support_width*2/3)/2), 
+                            support_width * 2/3, support_width * 2/3,
+                            facecolor=generator.colors['supports'], alpha=0.8,
+                            edgecolor=generator.colors['structure'], linewidth=generator.line_width)
+        generator.ax_plan.add_patch(pier_plan)
+
+
+def add_to_dxf(generator, msp, span, height, width):
+    """Add arch bridge elements to DXF, one arch per span of the span table as in the elevation"""
+    spans = generator.params.span_table()
+    foundation_depth = generator.params.foundation_depth
+    arch_rise = height * 0.7
+    arch_thickness = 2.0
+    deck_y = arch_rise + 2
+    
+    # Arch ribs, outer and inner edge of each span
+    theta = np.linspace(0, np.pi, 25)
+    for span_start, span_length in zip(spans.starts, spans.lengths):
+        arch_x = span_length/2 * np.cos(theta) + span_start + span_length/2
+        for rise in (arch_rise, arch_rise - arch_thickness):
+            msp.add_lwpolyline(np.column_stack((arch_x, rise * np.sin(theta))).tolist(),
+                               dxfattribs={'layer': 'STRUCTURE'})
+    
+    # Spandrel columns between arch and deck
+    spandrel_x, spandrel_span, _ = spans.subdivide(spans.panel_counts(20, 3) + 1, interior=True)
+    spandrel_y = arch_rise * np.sin(np.pi * (spandrel_x - spans.starts[spandrel_span]) /
+                                    spans.lengths[spandrel_span])
+    for x, arch_y in zip(spandrel_x, spandrel_y):
+        msp.add_lwpolyline(box_points(x - 0.3, arch_y, x + 0.3, deck_y), dxfattribs={'layer': 'STRUCTURE'})
+    
+    # Deck
+    msp.add_lwpolyline(box_points(0, deck_y, span, deck_y + 0.8), dxfattribs={'layer': 'DECK'})
+    
+    # Abutments and intermediate piers
+    abutment_width = 4.0
+    abutment_height = arch_rise + 5
+    for x in (0, span):
+        msp.add_lwpolyline(box_points(x - abutment_width/2, -foundation_depth, x + abutment_width/2, abutment_height),
+                           dxfattribs={'layer': 'STRUCTURE'})
+    for x, pier_top in zip(spans.pier_chainages, spans.pier_tops(abutment_height)):
+        msp.add_lwpolyline(box_points(x - abutment_width/3, -foundation_depth, x + abutment_width/3, pier_top),
+                           dxfattribs={'layer': 'STRUCTURE'})
+
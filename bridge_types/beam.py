@@ -0,0 +1,154 @@
+"""
+Beam Bridge
+
+Deck on twin girders over piers at the span table's supports, with
+abutments, railings and cross-beams in plan.
+"""
+
+from matplotlib.patches import Rectangle
+from bridge_types import box_points
+
+
+def draw_elevation(generator):
+    """Generate elevation view for beam bridge"""
+    # Main deck
+    deck_y = generator.params.height - generator.params.girder_depth
+    deck = Rectangle((0, deck_y), generator.params.span_length, 
+                    generator.params.girder_depth, 
+                    facecolor=generator.colors['deck'], alpha=0.7,
+                    edgecolor=generator.colors['structure'], linewidth=generator.line_width)
+    generator.ax_elevation.add_patch(deck)
+    
+    # Girders (simplified as rectangles under deck)
+    girder_height = generator.params.girder_depth * 0.8
+    girder_y = deck_y - girder_height
+    
+    # Main girders
+    for i in range(2):  # Two main girders
+        girder = Rectangle((0, girder_y), generator.params.span_length, 
+                         girder_height * 0.3,
+                         facecolor=generator.colors['structure'], alpha=0.8)
+        generator.ax_elevation.add_patch(girder)
+    
+    # Supports/piers
+    spans = generator.params.span_table()
+    support_width = 2.0
+    pier_x = spans.pier_chainages - support_width / 2
+    pier_tops = spans.pier_tops(deck_y)
+    for x_pos, pier_top in zip(pier_x, pier_tops):
+        # Pier
+        pier = Rectangle((x_pos, -generator.params.foundation_depth), 
+                       support_width, pier_top + generator.params.foundation_depth,
+                       facecolor=generator.colors['supports'], alpha=0.8,
+                       edgecolor=generator.colors['structure'], linewidth=generator.line_width)
+        generator.ax_elevation.add_patch(pier)
+            
+        # Foundation
+        foundation_width = support_width * 2
+        foundation = Rectangle((x_pos - support_width/2, -generator.params.foundation_depth), 
+                             foundation_width, generator.params.foundation_depth * 0.6,
+                             facecolor=generator.colors['foundations'], alpha=0.8)
+        generator.ax_elevation.add_patch(foundation)
+    
+    # Abutments at ends
+    abutment_width = 3.0
+    for x_pos in [0, generator.params.span_length]:
+        abutment = Rectangle((x_pos - abutment_width/2, -generator.params.foundation_depth), 
+                           abutment_width, generator.params.height - generator.params.girder_depth + generator.params.foundation_depth,
+                           facecolor=generator.colors['supports'], alpha=0.6,
+                           edgecolor=generator.colors['structure'], linewidth=generator.line_width)
+        generator.ax_elevation.add_patch(abutment)
+    
+    # Railings
+    rail_y = generator.params.height
+    generator.ax_elevation.plot([0, generator.params.span_length], [rail_y, rail_y], 
+                         color=generator.colors['structure'], linewidth=1.5)
+
+
+def draw_plan(generator):
+    """Generate plan view for beam bridge"""
+    # Deck outline
+    deck_plan = Rectangle((0, 0), generator.params.span_length, generator.params.deck_width,
+                        facecolor=generator.colors['plan_deck'], alpha=0.7,
+                        edgecolor=generator.colors['structure'], linewidth=generator.line_width)
+    generator.ax_plan.add_patch(deck_plan)
+    
+    # Main girders (longitudinal)
+    girder_width = 0.6
+    girder_positions = [generator.params.deck_width * 0.2, generator.params.deck_width * 0.8]
+    
+    for y_pos in girder_positions:
+        girder_plan = Rectangle((0, y_pos - girder_width/2), generator.params.span_length, girder_width,
+                              facecolor=generator.colors['plan_structure'], alpha=0.9,
+                              edgecolor=generator.colors['structure'], linewidth=1)
+        generator.ax_plan.add_patch(girder_plan)
+    
+    # Cross-beams/diaphragms
+    num_cross_beams = max(5, int(generator.params.span_length / 15))
+    cross_beam_spacing = generator.params.span_length / (num_cross_beams - 1)
+    cross_beam_width = 0.3
+    
+    for i in range(num_cross_beams):
+        x_pos = i * cross_beam_spacing
+        cross_beam = Rectangle((x_pos - cross_beam_width/2, 0), cross_beam_width, generator.params.deck_width,
+                             facecolor=generator.colors['plan_structure'], alpha=0.6,
+                             edgecolor=generator.colors['structure'], linewidth=0.5)
+        generator.ax_plan.add_patch(cross_beam)
+    
+    # Supports/piers in plan
+    support_width = 2.0
+    support_depth = 1.5
+    y_pos = (generator.params.deck_width - support_depth) / 2
+    for x_pos in generator.params.span_table().pier_chainages - support_width / 2:
+        pier_plan = Rectangle((x_pos, y_pos), support_width, support_depth,
+                            facecolor=generator.colors['supports'], alpha=0.8,
+                            edgecolor=generator.colors['structure'], linewidth=generator.line_width)
+        generator.ax_plan.add_patch(pier_plan)
+    
+    # Centerline
+    generator.ax_plan.plot([0, generator.params.span_length], [generator.params.deck_width/2, generator.params.deck_width/2], 
+                     '--', color=generator.colors['annotations'], linewidth=1, alpha=0.7)
+    
+    # Edge lines  
+    generator.ax_plan.plot([0, generator.params.span_length], [0, 0], 
+                     color=generator.colors['structure'], linewidth=2)
+    generator.ax_plan.plot([0, generator.params.span_length], [generator.params.deck_width, generator.params.deck_width], 
+                     color=generator.colors['structure'], linewidth=2)
+
+
+def add_to_dxf(generator, msp, span, height, width):
+    """Add beam bridge elements to DXF, laid out from the span table as in the elevation"""
+    spans = generator.params.span_table()
+    foundation_depth = generator.params.foundation_depth
+    deck_y = height - generator.params.girder_depth
+    
+    # Deck
+    msp.add_lwpolyline(box_points(0, deck_y, span, height), dxfattribs={'layer': 'DECK'})
+    
+    # Main girders under the deck
+    girder_height = generator.params.girder_depth * 0.8
+    girder_y = deck_y - girder_height
+    msp.add_lwpolyline(box_points(0, girder_y, span, girder_y + girder_height * 0.3),
+                       dxfattribs={'layer': 'STRUCTURE'})
+    
+    # Piers with their foundations
+    support_width = 2.0
+    for x, pier_top in zip(spans.pier_chainages, spans.pier_tops(deck_y)):
+        msp.add_lwpolyline(box_points(x - support_width/2, -foundation_depth, x + support_width/2, pier_top),
+                           dxfattribs={'layer': 'STRUCTURE'})
+        msp.add_lwpolyline(box_points(x - support_width, -foundation_depth,
+                                      x + support_width, -foundation_depth * 0.4),
+                           dxfattribs={'layer': 'FOUNDATION'})
+    
+    # Abutments at ends
+    abutment_width = 3.0
+    for x in (0, span):
+        msp.add_lwpolyline(box_points(x - abutment_width/2, -foundation_depth, x + abutment_width/2, deck_y),
+                           dxfattribs={'layer': 'STRUCTURE'})
+    
+    # Railings
+    rail_height = generator.params.rail_height
+    msp.add_line((0, height), (0, height + rail_height), dxfattribs={'layer': 'RAILINGS'})
+    msp.add_line((span, height), (span, height + rail_height), dxfattribs={'layer': 'RAILINGS'})
+    msp.add_line((0, height + rail_height), (span, height + rail_height), dxfattribs={'layer': 'RAILINGS'})
+
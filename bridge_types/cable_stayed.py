@@ -0,0 +1,154 @@
+"""
+Cable-Stayed Bridge
+
+A tower at every intermediate support, each fanning stay cables over
+the spans on either side of it.
+"""
+
+import numpy as np
+from matplotlib.patches import Rectangle
+
+from bridge_spans import SpanTable
+from bridge_types import box_points
+
+
+def draw_elevation(generator):
+    """Generate elevation view for cable-stayed bridge"""
+    # Support multi-tower design for longer spans, a tower at each support point
+    spans = generator.params.span_table()
+    tower_positions = spans.pier_chainages
+    
+    tower_height = generator.params.height
+    tower_width = 4.0
+    
+    # Draw towers
+    for tower_x in tower_positions:
+        tower = Rectangle((tower_x - tower_width/2, -generator.params.foundation_depth), 
+                        tower_width, tower_height + generator.params.foundation_depth,
+                        facecolor=generator.colors['supports'], alpha=0.8,
+                        edgecolor=generator.colors['structure'], linewidth=generator.line_width)
+        generator.ax_elevation.add_patch(tower)
+    
+    # Deck
+    deck_y = generator.params.height * 0.3
+    deck = Rectangle((0, deck_y), generator.params.span_length, 0.8,
+                    facecolor=generator.colors['deck'], alpha=0.7,
+                    edgecolor=generator.colors['structure'], linewidth=generator.line_width)
+    generator.ax_elevation.add_patch(deck)
+    
+    # Stay cables for each tower, fanning over the spans on either side
+    cable_attachment_height = tower_height * 0.8
+    for tower_x, deck_x in stay_cable_anchors(spans):
+        generator.ax_elevation.plot([tower_x, deck_x], [cable_attachment_height, deck_y + 0.8], 
+                             color='red', linewidth=2, alpha=0.8)
+    
+    # Abutments at ends
+    abutment_width = 5.0
+    for x_pos in [0, generator.params.span_length]:
+        abutment = Rectangle((x_pos - abutment_width/2, -generator.params.foundation_depth), 
+                           abutment_width, deck_y + generator.params.foundation_depth,
+                           facecolor=generator.colors['supports'], alpha=0.8,
+                           edgecolor=generator.colors['structure'], linewidth=generator.line_width)
+        generator.ax_elevation.add_patch(abutment)
+
+
+def stay_cable_anchors(spans: SpanTable) -> np.ndarray:
+    """(M, 2) tower chainage and deck anchor chainage of every stay cable
+    
+    Each tower fans max(4, length / 15) cables evenly over the span on
+    either side of it.
+    """
+    towers = np.arange(spans.count - 1)
+    rows = []
+    for side, (span_index, direction) in enumerate(((towers, -1.0), (towers + 1, 1.0))):
+        lengths = spans.lengths[span_index]
+        counts = np.maximum(4, (lengths / 15).astype(int))
+        tower = np.repeat(towers, counts)
+        i = np.arange(counts.sum()) - np.repeat(np.cumsum(counts) - counts, counts) + 1
+        step = np.repeat(lengths / (counts + 1), counts)
+        tower_x = spans.pier_chainages[tower]
+        rows.append(np.column_stack((tower_x, tower_x + direction * i * step, tower, i, np.full(len(i), side))))
+    rows = np.concatenate(rows)
+    # Tower by tower, alternating left and right cables outwards from the tower
+    order = np.lexsort((rows[:, 4], rows[:, 3], rows[:, 2]))
+    return rows[order, :2]
+
+
+def draw_plan(generator):
+    """Generate plan view for cable-stayed bridge"""
+    # Deck outline
+    deck_plan = Rectangle((0, 0), generator.params.span_length, generator.params.deck_width,
+                        facecolor=generator.colors['plan_deck'], alpha=0.7,
+                        edgecolor=generator.colors['structure'], linewidth=generator.line_width)
+    generator.ax_plan.add_patch(deck_plan)
+    
+    # Tower positions in plan
+    spans = generator.params.span_table()
+    tower_width = 4.0
+    tower_depth = 3.0
+    
+    for tower_x in spans.pier_chainages:
+        tower_plan = Rectangle((tower_x - tower_width/2, (generator.params.deck_width - tower_depth)/2), 
+                             tower_width, tower_depth,
+                             facecolor=generator.colors['supports'], alpha=0.8,
+                             edgecolor=generator.colors['structure'], linewidth=generator.line_width)
+        generator.ax_plan.add_patch(tower_plan)
+    
+    # Cable arrangement (stays in plan view)
+    cable_positions = [generator.params.deck_width * 0.15, generator.params.deck_width * 0.85]
+    
+    # Draw cable lines radiating from tower center
+    anchors = stay_cable_anchors(spans)
+    bounds = np.searchsorted(anchors[:, 0], spans.pier_chainages, side='right')
+    for tower_x, tower_anchors in zip(spans.pier_chainages, np.split(anchors[:, 1], bounds[:-1])):
+        for y_cable in cable_positions:
+            for deck_x in tower_anchors:
+                generator.ax_plan.plot([tower_x, deck_x], [generator.params.deck_width/2, y_cable], 
+                                color='red', linewidth=1, alpha=0.6)
+    
+    # Main girders
+    girder_positions = [generator.params.deck_width * 0.2, generator.params.deck_width * 0.8]
+    girder_width = 0.8
+    
+    for y_pos in girder_positions:
+        girder_plan = Rectangle((0, y_pos - girder_width/2), generator.params.span_length, girder_width,
+                              facecolor=generator.colors['plan_structure'], alpha=0.6,
+                              edgecolor=generator.colors['structure'], linewidth=1)
+        generator.ax_plan.add_patch(girder_plan)
+    
+    # Abutments in plan
+    abutment_width = 5.0
+    for x_pos in [0, generator.params.span_length]:
+        abutment_plan = Rectangle((x_pos - abutment_width/2, (generator.params.deck_width - abutment_width)/2), 
+                                abutment_width, abutment_width,
+                                facecolor=generator.colors['supports'], alpha=0.8,
+                                edgecolor=generator.colors['structure'], linewidth=generator.line_width)
+        generator.ax_plan.add_patch(abutment_plan)
+
+
+def add_to_dxf(generator, msp, span, height, width):
+    """Add cable-stayed bridge elements to DXF, a tower at every support as in the elevation"""
+    spans = generator.params.span_table()
+    foundation_depth = generator.params.foundation_depth
+    tower_width = 4.0
+    deck_y = height * 0.3
+    
+    # Towers
+    for x in spans.pier_chainages:
+        msp.add_lwpolyline(box_points(x - tower_width/2, -foundation_depth, x + tower_width/2, height),
+                           dxfattribs={'layer': 'STRUCTURE'})
+    
+    # Deck
+    msp.add_lwpolyline(box_points(0, deck_y, span, deck_y + 0.8), dxfattribs={'layer': 'DECK'})
+    
+    # Stay cables fanning from each tower over the spans on either side
+    cable_attachment_height = height * 0.8
+    for tower_x, deck_x in stay_cable_anchors(spans).tolist():
+        msp.add_line((tower_x, cable_attachment_height), (deck_x, deck_y + 0.8), dxfattribs={'layer': 'STRUCTURE'})
+    
+    # Abutments at ends
+    abutment_width = 5.0
+    for x in (0, span):
+        msp.add_lwpolyline(box_points(x - abutment_width/2, -foundation_depth, x + abutment_width/2, deck_y),
+                           dxfattribs={'layer': 'STRUCTURE'})
+
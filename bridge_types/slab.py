@@ -0,0 +1,153 @@
+"""
+Slab Bridge
+
+Solid reinforced concrete slab with expansion joints over the piers.
+"""
+
+from matplotlib.patches import Rectangle
+
+from bridge_types import box_points
+
+
+def draw_elevation(generator):
+    """Generate elevation view for slab bridge"""
+    # Support multi-span capability
+    spans = generator.params.span_table()
+    
+    # Main concrete slab (thick deck structure)
+    slab_thickness = max(0.8, generator.params.span_length / 100)  # Slab thickness scales with span
+    deck_y = generator.params.height - slab_thickness
+    
+    # Draw slab as continuous structure
+    slab = Rectangle((0, deck_y), generator.params.span_length, slab_thickness,
+                    facecolor=generator.colors['deck'], alpha=0.8,
+                    edgecolor=generator.colors['structure'], linewidth=generator.line_width)
+    generator.ax_elevation.add_patch(slab)
+    
+    # Show reinforcement pattern (simplified representation)
+    rebar_spacing = 2.0  # Show rebar every 2m
+    for x in range(0, int(generator.params.span_length), int(rebar_spacing)):
+        # Longitudinal reinforcement (bottom)
+        generator.ax_elevation.plot([x, x + rebar_spacing], [deck_y + 0.1, deck_y + 0.1], 
+                             color='darkred', linewidth=2, alpha=0.7)
+        # Transverse reinforcement
+        generator.ax_elevation.plot([x + rebar_spacing/2, x + rebar_spacing/2], 
+                             [deck_y + 0.1, deck_y + slab_thickness - 0.1], 
+                             color='darkred', linewidth=1, alpha=0.5)
+    
+    # Supports/piers for multi-span
+    support_width = 2.5
+    pier_x = spans.pier_chainages - support_width / 2
+    for x_pos, pier_top in zip(pier_x, spans.pier_tops(deck_y)):
+        pier = Rectangle((x_pos, -generator.params.foundation_depth), 
+                       support_width, pier_top + generator.params.foundation_depth,
+                       facecolor=generator.colors['supports'], alpha=0.8,
+                       edgecolor=generator.colors['structure'], linewidth=generator.line_width)
+        generator.ax_elevation.add_patch(pier)
+    
+    # Abutments at ends (wider for slab bridges)
+    abutment_width = 4.0
+    for x_pos in [0, generator.params.span_length]:
+        abutment = Rectangle((x_pos - abutment_width/2, -generator.params.foundation_depth), 
+                           abutment_width, deck_y + generator.params.foundation_depth,
+                           facecolor=generator.colors['supports'], alpha=0.8,
+                           edgecolor=generator.colors['structure'], linewidth=generator.line_width)
+        generator.ax_elevation.add_patch(abutment)
+    
+    # Expansion joints (for multi-span)
+    for x_pos in spans.pier_chainages:
+        # Show expansion joint as a gap
+        joint = Rectangle((x_pos - 0.05, deck_y), 0.1, slab_thickness,
+                        facecolor='white', alpha=1.0,
+                        edgecolor=generator.colors['structure'], linewidth=1)
+        generator.ax_elevation.add_patch(joint)
+
+
+def draw_plan(generator):
+    """Generate plan view for slab bridge"""
+    # Main slab outline
+    slab_plan = Rectangle((0, 0), generator.params.span_length, generator.params.deck_width,
+                        facecolor=generator.colors['plan_deck'], alpha=0.8,
+                        edgecolor=generator.colors['structure'], linewidth=generator.line_width)
+    generator.ax_plan.add_patch(slab_plan)
+    
+    # Reinforcement pattern in plan view
+    rebar_spacing_long = 3.0  # Longitudinal spacing
+    rebar_spacing_trans = 2.5  # Transverse spacing
+    
+    # Longitudinal reinforcement lines
+    for y in range(0, int(generator.params.deck_width), int(rebar_spacing_trans)):
+        if y <= generator.params.deck_width:
+            generator.ax_plan.plot([0, generator.params.span_length], [y, y], 
+                            color='darkred', linewidth=0.8, alpha=0.6, linestyle='--')
+    
+    # Transverse reinforcement lines  
+    for x in range(0, int(generator.params.span_length), int(rebar_spacing_long)):
+        if x <= generator.params.span_length:
+            generator.ax_plan.plot([x, x], [0, generator.params.deck_width], 
+                            color='darkred', linewidth=0.8, alpha=0.6, linestyle='--')
+    
+    # Construction joints (for large slabs)
+    if generator.params.span_length > 30:
+        num_joints = int(generator.params.span_length / 30)
+        joint_spacing = generator.params.span_length / (num_joints + 1)
+        
+        for i in range(1, num_joints + 1):
+            x_pos = i * joint_spacing
+            generator.ax_plan.plot([x_pos, x_pos], [0, generator.params.deck_width], 
+                            color=generator.colors['annotations'], linewidth=2, alpha=0.8, linestyle=':')
+    
+    # Support locations in plan
+    support_width = 2.5
+    
+    # Intermediate supports
+    for x_pos in generator.params.span_table().pier_chainages:
+        support_plan = Rectangle((x_pos - support_width/2, (generator.params.deck_width - support_width)/2), 
+                               support_width, support_width,
+                               facecolor=generator.colors['supports'], alpha=0.8,
+                               edgecolor=generator.colors['structure'], linewidth=generator.line_width)
+        generator.ax_plan.add_patch(support_plan)
+    
+    # End abutments
+    abutment_width = 4.0
+    for x_pos in [0, generator.params.span_length]:
+        abutment_plan = Rectangle((x_pos - abutment_width/2, (generator.params.deck_width - abutment_width)/2), 
+                                abutment_width, abutment_width,
+                                facecolor=generator.colors['supports'], alpha=0.8,
+                                edgecolor=generator.colors['structure'], linewidth=generator.line_width)
+        generator.ax_plan.add_patch(abutment_plan)
+    
+    # Edge markings to show slab thickness
+    edge_marking_spacing = 10.0
+    for x in range(0, int(generator.params.span_length), int(edge_marking_spacing)):
+        if x <= generator.params.span_length:
+            # Top edge markings
+            generator.ax_plan.plot([x, x + 2], [generator.params.deck_width, generator.params.deck_width], 
+                            color=generator.colors['structure'], linewidth=3, alpha=0.8)
+            # Bottom edge markings
+            generator.ax_plan.plot([x, x + 2], [0, 0], 
+                            color=generator.colors['structure'], linewidth=3, alpha=0.8)
+
+
+def add_to_dxf(generator, msp, span, height, width):
+    """Add slab bridge elements to DXF"""
+    spans = generator.params.span_table()
+    slab_thickness = max(0.8, span / 100)
+    deck_y = height - slab_thickness
+    
+    # Slab
+    msp.add_lwpolyline(box_points(0, deck_y, span, height), dxfattribs={'layer': 'DECK'})
+    
+    # Piers, with an expansion joint through the slab over each
+    support_width = 2.5
+    for x, pier_top in zip(spans.pier_chainages, spans.pier_tops(deck_y)):
+        msp.add_lwpolyline(box_points(x - support_width/2, -generator.params.foundation_depth,
+                                      x + support_width/2, pier_top),
+                           dxfattribs={'layer': 'STRUCTURE'})
+        msp.add_line((x, deck_y), (x, height), dxfattribs={'layer': 'STRUCTURE'})
+    
+    # Railings
+    rail_y = height + generator.params.rail_height
+    msp.add_line((0, height), (0, rail_y), dxfattribs={'layer': 'RAILINGS'})
+    msp.add_line((span, height), (span, rail_y), dxfattribs={'layer': 'RAILINGS'})
+    msp.add_line((0, rail_y), (span, rail_y), dxfattribs={'layer': 'RAILINGS'})
@@ -0,0 +1,201 @@
+"""
+Suspension Bridge
+
+Two towers with parabolic main cables, hangers and anchorages. Towers
+sit at the piers of an explicit side/main/side span table.
+"""
+
+from typing import List
+
+import numpy as np
+from matplotlib.collections import LineCollection
+from matplotlib.colors import to_rgb
+from matplotlib.lines import Line2D
+from matplotlib.patches import Rectangle
+from bridge_types import box_points
+
+# Erection order for bridge_animation: the deck is hung from the cables
+CONSTRUCTION_STAGES = ('foundations', 'substructure', 'cables', 'superstructure', 'finishing')
+
+
+def draw_elevation(generator):
+    """Generate elevation view for suspension bridge"""
+    # Towers
+    tower_height = generator.params.height
+    tower_width = 3.0
+    tower_positions = tower_chainages(generator.params)
+    main_span_centre = (tower_positions[0] + tower_positions[1]) / 2
+    
+    for x_pos in tower_positions:
+        # Tower shaft
+        tower = Rectangle((x_pos - tower_width/2, -generator.params.foundation_depth), 
+                        tower_width, tower_height + generator.params.foundation_depth,
+                        facecolor=generator.colors['supports'], alpha=0.8,
+                        edgecolor=generator.colors['structure'], linewidth=generator.line_width)
+        generator.ax_elevation.add_patch(tower)
+        
+        # Tower top cross-beam
+        crossbeam = Rectangle((x_pos - tower_width, tower_height - 2), 
+                            tower_width * 2, 1,
+                            facecolor=generator.colors['structure'], alpha=0.9)
+        generator.ax_elevation.add_patch(crossbeam)
+    
+    # Main cables (catenary curve approximation)
+    cable_sag = generator.params.height * 0.3
+    deck_y = generator.params.height * 0.4
+    
+    # Main span cable
+    x_cable = np.linspace(tower_positions[0], tower_positions[1], 100)
+    y_cable = deck_y + cable_sag * (1 - 4 * (x_cable - main_span_centre)**2 / 
+                                   (tower_positions[1] - tower_positions[0])**2)
+    generator.ax_elevation.plot(x_cable, y_cable, color='black', linewidth=3, label='Main Cable')
+    
+    # Side span cables
+    x_left = np.linspace(0, tower_positions[0], 50)
+    y_left = tower_height - (tower_height - deck_y) * (x_left / tower_positions[0])**2
+    generator.ax_elevation.plot(x_left, y_left, color='black', linewidth=3)
+    
+    x_right = np.linspace(tower_positions[1], generator.params.span_length, 50)
+    y_right = tower_height - (tower_height - deck_y) * ((x_right - generator.params.span_length) / 
+                                                        (tower_positions[1] - generator.params.span_length))**2
+    generator.ax_elevation.plot(x_right, y_right, color='black', linewidth=3)
+    
+    # Deck
+    deck = Rectangle((0, deck_y), generator.params.span_length, 0.8,
+                    facecolor=generator.colors['deck'], alpha=0.7,
+                    edgecolor=generator.colors['structure'], linewidth=generator.line_width)
+    generator.ax_elevation.add_patch(deck)
+    
+    # Hangers (vertical cables)
+    num_hangers = 20
+    hanger_spacing = generator.params.span_length / num_hangers
+    
+    for i in range(1, num_hangers):
+        x_hanger = i * hanger_spacing
+        if tower_positions[0] <= x_hanger <= tower_positions[1]:
+            # Main span hanger
+            y_cable_at_x = deck_y + cable_sag * (1 - 4 * (x_hanger - main_span_centre)**2 / 
+                                                (tower_positions[1] - tower_positions[0])**2)
+            generator.ax_elevation.plot([x_hanger, x_hanger], [deck_y + 0.8, y_cable_at_x], 
+                                 color='gray', linewidth=1, alpha=0.8)
+    
+    # Anchorages
+    anchorage_width = 6.0
+    for x_pos in [0, generator.params.span_length]:
+        anchorage = Rectangle((x_pos - anchorage_width/2, -generator.params.foundation_depth), 
+                            anchorage_width, deck_y + generator.params.foundation_depth,
+                            facecolor=generator.colors['foundations'], alpha=0.8,
+                            edgecolor=generator.colors['structure'], linewidth=generator.line_width)
+        generator.ax_elevation.add_patch(anchorage)
+
+
+def tower_chainages(params) -> List[float]:
+    """Towers at the piers of an explicit side/main/side span table, else at 20% and 80%"""
+    if params.span_lengths is not None and len(params.span_lengths) == 3:
+        return params.span_table().pier_chainages.tolist()
+    return [params.span_length * 0.2, params.span_length * 0.8]
+
+
+def construction_stage(generator, artist):
+    """Main cables and hangers are cables; the tower cross-beams go up with the towers"""
+    if isinstance(artist, (Line2D, LineCollection)):
+        return 'cables'
+    if isinstance(artist, Rectangle) and tuple(artist.get_facecolor()[:3]) == to_rgb(generator.colors['structure']):
+        return 'cables' if artist.axes is generator.ax_plan else 'substructure'
+    return None
+
+
+def draw_plan(generator):
+    """Generate plan view for suspension bridge"""
+    # Deck outline
+    deck_plan = Rectangle((0, 0), generator.params.span_length, generator.params.deck_width,
+                        facecolor=generator.colors['plan_deck'], alpha=0.7,
+                        edgecolor=generator.colors['structure'], linewidth=generator.line_width)
+    generator.ax_plan.add_patch(deck_plan)
+    
+    # Main cables (two parallel cables)
+    cable_positions = [generator.params.deck_width * 0.1, generator.params.deck_width * 0.9]
+    cable_width = 0.5
+    
+    for y_pos in cable_positions:
+        cable_plan = Rectangle((0, y_pos - cable_width/2), generator.params.span_length, cable_width,
+                             facecolor='black', alpha=0.9,
+                             edgecolor='black', linewidth=1)
+        generator.ax_plan.add_patch(cable_plan)
+    
+    # Towers in plan
+    tower_positions = tower_chainages(generator.params)
+    tower_width = 3.0
+    tower_depth = 2.0
+    
+    for x_pos in tower_positions:
+        tower_plan = Rectangle((x_pos - tower_width/2, (generator.params.deck_width - tower_depth)/2), 
+                             tower_width, tower_depth,
+                             facecolor=generator.colors['supports'], alpha=0.8,
+                             edgecolor=generator.colors['structure'], linewidth=generator.line_width)
+        generator.ax_plan.add_patch(tower_plan)
+    
+    # Deck stiffening trusses/girders
+    truss_positions = [generator.params.deck_width * 0.25, generator.params.deck_width * 0.75]
+    truss_width = 0.8
+    
+    for y_pos in truss_positions:
+        truss_plan = Rectangle((0, y_pos - truss_width/2), generator.params.span_length, truss_width,
+                             facecolor=generator.colors['plan_structure'], alpha=0.6,
+                             edgecolor=generator.colors['structure'], linewidth=1)
+        generator.ax_plan.add_patch(truss_plan)
+    
+    # Anchorages in plan
+    anchorage_width = 6.0
+    for x_pos in [0, generator.params.span_length]:
+        anchorage_plan = Rectangle((x_pos - anchorage_width/2, (generator.params.deck_width - anchorage_width)/2), 
+                                 anchorage_width, anchorage_width,
+                                 facecolor=generator.colors['foundations'], alpha=0.8,
+                                 edgecolor=generator.colors['structure'], linewidth=generator.line_width)
+        generator.ax_plan.add_patch(anchorage_plan)
+
+
+def add_to_dxf(generator, msp, span, height, width):
+    """Add suspension bridge elements to DXF, towers and cables placed as in the elevation"""
+    foundation_depth = generator.params.foundation_depth
+    tower_width = 3.0
+    tower_positions = tower_chainages(generator.params)
+    main_span = tower_positions[1] - tower_positions[0]
+    main_span_centre = (tower_positions[0] + tower_positions[1]) / 2
+    cable_sag = height * 0.3
+    deck_y = height * 0.4
+    
+    # Towers with their top cross-beams
+    for x in tower_positions:
+        msp.add_lwpolyline(box_points(x - tower_width/2, -foundation_depth, x + tower_width/2, height),
+                           dxfattribs={'layer': 'STRUCTURE'})
+        msp.add_lwpolyline(box_points(x - tower_width, height - 2, x + tower_width, height - 1),
+                           dxfattribs={'layer': 'STRUCTURE'})
+    
+    def main_cable_y(x):
+        return deck_y + cable_sag * (1 - 4 * (x - main_span_centre)**2 / main_span**2)
+    
+    # Main span and side span cables
+    x_main = np.linspace(tower_positions[0], tower_positions[1], 40)
+    x_left = np.linspace(0, tower_positions[0], 20)
+    x_right = np.linspace(tower_positions[1], span, 20)
+    y_left = height - (height - deck_y) * (x_left / tower_positions[0])**2
+    y_right = height - (height - deck_y) * ((x_right - span) / (tower_positions[1] - span))**2
+    for x, y in ((x_main, main_cable_y(x_main)), (x_left, y_left), (x_right, y_right)):
+        msp.add_lwpolyline(np.column_stack((x, y)).tolist(), dxfattribs={'layer': 'STRUCTURE'})
+    
+    # Deck
+    msp.add_lwpolyline(box_points(0, deck_y, span, deck_y + 0.8), dxfattribs={'layer': 'DECK'})
+    
+    # Hangers in the main span
+    x_hangers = np.arange(1, 20) * span / 20
+    x_hangers = x_hangers[(x_hangers >= tower_positions[0]) & (x_hangers <= tower_positions[1])]
+    for x, cable_y in zip(x_hangers.tolist(), main_cable_y(x_hangers).tolist()):
+        msp.add_line((x, deck_y + 0.8), (x, cable_y), dxfattribs={'layer': 'STRUCTURE'})
+    
+    # Anchorages
+    anchorage_width = 6.0
+    for x in (0, span):
+        msp.add_lwpolyline(box_points(x - anchorage_width/2, -foundation_depth, x + anchorage_width/2, deck_y),
+                           dxfattribs={'layer': 'FOUNDATION'})
+
@@ -0,0 +1,158 @@
+"""
+T-Beam Bridge
+
+Reinforced concrete deck slab cast with T-shaped girders, piers at
+intermediate supports.
+"""
+
+import numpy as np
+from matplotlib.patches import Rectangle
+
+from bridge_types import box_points
+
+
+def draw_elevation(generator):
+    """Generate elevation view for T-beam bridge"""
+    # Support multi-span capability
+    spans = generator.params.span_table()
+    
+    # Main deck slab
+    deck_y = generator.params.height - generator.params.girder_depth
+    deck_thickness = 0.6  # Deck slab thickness
+    deck = Rectangle((0, deck_y), generator.params.span_length, deck_thickness,
+                    facecolor=generator.colors['deck'], alpha=0.7,
+                    edgecolor=generator.colors['structure'], linewidth=generator.line_width)
+    generator.ax_elevation.add_patch(deck)
+    
+    # T-beam girders (showing the T-shape in elevation)
+    girder_height = generator.params.girder_depth - deck_thickness
+    girder_y = deck_y - girder_height
+    
+    # Number of T-beams based on deck width
+    num_beams = max(3, int(generator.params.deck_width / 3))  # T-beam every ~3m
+    beam_spacing = generator.params.span_length / 20  # Show beams every 20m for visibility
+    
+    for i in range(0, int(generator.params.span_length / beam_spacing) + 1):
+        x_pos = i * beam_spacing
+        if x_pos <= generator.params.span_length:
+            # Web of T-beam (vertical part)
+            web_width = 0.4
+            web = Rectangle((x_pos - web_width/2, girder_y), web_width, girder_height,
+                          facecolor=generator.colors['structure'], alpha=0.8,
+                          edgecolor=generator.colors['structure'], linewidth=1)
+            generator.ax_elevation.add_patch(web)
+            
+            # Flange of T-beam (bottom horizontal part)
+            flange_width = 1.2
+            flange_height = 0.3
+            flange = Rectangle((x_pos - flange_width/2, girder_y - flange_height), 
+                             flange_width, flange_height,
+                             facecolor=generator.colors['structure'], alpha=0.8,
+                             edgecolor=generator.colors['structure'], linewidth=1)
+            generator.ax_elevation.add_patch(flange)
+    
+    # Supports/piers for multi-span
+    support_width = 2.0
+    pier_x = spans.pier_chainages - support_width / 2
+    for x_pos, pier_top in zip(pier_x, spans.pier_tops(deck_y)):
+        pier = Rectangle((x_pos, -generator.params.foundation_depth), 
+                       support_width, pier_top + generator.params.foundation_depth,
+                       facecolor=generator.colors['supports'], alpha=0.8,
+                       edgecolor=generator.colors['structure'], linewidth=generator.line_width)
+        generator.ax_elevation.add_patch(pier)
+    
+    # Abutments at ends
+    abutment_width = 3.0
+    for x_pos in [0, generator.params.span_length]:
+        abutment = Rectangle((x_pos - abutment_width/2, -generator.params.foundation_depth), 
+                           abutment_width, generator.params.height - generator.params.girder_depth + generator.params.foundation_depth,
+                           facecolor=generator.colors['supports'], alpha=0.6,
+                           edgecolor=generator.colors['structure'], linewidth=generator.line_width)
+        generator.ax_elevation.add_patch(abutment)
+
+
+def draw_plan(generator):
+    """Generate plan view for T-beam bridge"""
+    # Deck slab outline
+    deck_plan = Rectangle((0, 0), generator.params.span_length, generator.params.deck_width,
+                        facecolor=generator.colors['plan_deck'], alpha=0.7,
+                        edgecolor=generator.colors['structure'], linewidth=generator.line_width)
+    generator.ax_plan.add_patch(deck_plan)
+    
+    # T-beam girders (longitudinal beams)
+    num_beams = max(3, int(generator.params.deck_width / 3))  # T-beam every ~3m
+    beam_spacing = generator.params.deck_width / (num_beams + 1)
+    beam_width = 0.4  # Web width of T-beam
+    
+    for i in range(num_beams):
+        y_pos = (i + 1) * beam_spacing - beam_width/2
+        beam_plan = Rectangle((0, y_pos), generator.params.span_length, beam_width,
+                            facecolor=generator.colors['plan_structure'], alpha=0.9,
+                            edgecolor=generator.colors['structure'], linewidth=1.5)
+        generator.ax_plan.add_patch(beam_plan)
+    
+    # Diaphragms/cross-beams
+    num_diaphragms = max(5, int(generator.params.span_length / 20))
+    diaphragm_spacing = generator.params.span_length / (num_diaphragms - 1)
+    diaphragm_width = 0.3
+    
+    for i in range(num_diaphragms):
+        x_pos = i * diaphragm_spacing
+        diaphragm = Rectangle((x_pos - diaphragm_width/2, 0), diaphragm_width, generator.params.deck_width,
+                            facecolor=generator.colors['plan_structure'], alpha=0.6,
+                            edgecolor=generator.colors['structure'], linewidth=0.8)
+        generator.ax_plan.add_patch(diaphragm)
+    
+    # Support locations in plan
+    support_width = 2.0
+    
+    # Intermediate supports
+    for x_pos in generator.params.span_table().pier_chainages:
+        support_plan = Rectangle((x_pos - support_width/2, (generator.params.deck_width - support_width)/2), 
+                               support_width, support_width,
+                               facecolor=generator.colors['supports'], alpha=0.8,
+                               edgecolor=generator.colors['structure'], linewidth=generator.line_width)
+        generator.ax_plan.add_patch(support_plan)
+    
+    # End abutments
+    abutment_width = 3.0
+    for x_pos in [0, generator.params.span_length]:
+        abutment_plan = Rectangle((x_pos - abutment_width/2, (generator.params.deck_width - abutment_width)/2), 
+                                abutment_width, abutment_width,
+                                facecolor=generator.colors['supports'], alpha=0.6,
+                                edgecolor=generator.colors['structure'], linewidth=generator.line_width)
+        generator.ax_plan.add_patch(abutment_plan)
+
+
+def add_to_dxf(generator, msp, span, height, width):
+    """Add T-beam bridge elements to DXF"""
+    spans = generator.params.span_table()
+    deck_thickness = 0.6
+    deck_y = height - generator.params.girder_depth
+    
+    # Deck slab
+    msp.add_lwpolyline(box_points(0, deck_y, span, deck_y + deck_thickness), dxfattribs={'layer': 'DECK'})
+    
+    # T-beam webs with their bottom flanges, every twentieth of the length as in the elevation
+    web_width = 0.4
+    flange_width = 1.2
+    flange_height = 0.3
+    girder_y = deck_y - (generator.params.girder_depth - deck_thickness)
+    for x in np.linspace(0, span, 21):
+        msp.add_lwpolyline(box_points(x - web_width/2, girder_y, x + web_width/2, deck_y),
+                           dxfattribs={'layer': 'STRUCTURE'})
+        msp.add_lwpolyline(box_points(x - flange_width/2, girder_y - flange_height, x + flange_width/2, girder_y),
+                           dxfattribs={'layer': 'STRUCTURE'})
+    
+    # Piers
+    support_width = 2.0
+    for x, pier_top in zip(spans.pier_chainages, spans.pier_tops(deck_y)):
+        msp.add_lwpolyline(box_points(x - support_width/2, -generator.params.foundation_depth,
+                                      x + support_width/2, pier_top),
+                           dxfattribs={'layer': 'STRUCTURE'})
+    
+    # Railings
+    rail_y = deck_y + deck_thickness + generator.params.rail_height
+    msp.add_line((0, deck_y + deck_thickness), (0, rail_y), dxfattribs={'layer': 'RAILINGS'})
+    msp.add_line((span, deck_y + deck_thickness), (span, rail_y), dxfattribs={'layer': 'RAILINGS'})
+    msp.add_line((0, rail_y), (span, rail_y), dxfattribs={'layer': 'RAILINGS'})
@@ -0,0 +1,130 @@
+"""
+Truss Bridge
+
+Top and bottom chords with verticals and diagonals per panel, the deck
+at the bottom chord and piers at intermediate supports.
+"""
+
+import numpy as np
+from matplotlib.patches import Rectangle
+from bridge_types import box_points
+
+
+def draw_elevation(generator):
+    """Generate elevation view for truss bridge"""
+    spans = generator.params.span_table()
+    deck_y = generator.params.height * 0.3
+    truss_height = generator.params.height - deck_y - 1
+    top_y = deck_y + truss_height
+    
+    # Panel points of every span at once, a panel every ~10m
+    num_panels = spans.panel_counts(10, 4)
+    panel_x, panel_span, panel_index = spans.subdivide(num_panels)
+    
+    for span_start, span_end, length in zip(spans.starts, spans.ends, spans.lengths):
+        # Deck level for this span
+        deck = Rectangle((span_start, deck_y), length, 0.5,
+                        facecolor=generator.colors['deck'], alpha=0.7,
+                        edgecolor=generator.colors['structure'], linewidth=generator.line_width)
+        generator.ax_elevation.add_patch(deck)
+        
+        # Top chord
+        generator.ax_elevation.plot([span_start, span_end], [top_y, top_y], 
+                             color=generator.colors['structure'], linewidth=generator.line_width * 1.5)
+        
+        # Bottom chord (deck level)
+        generator.ax_elevation.plot([span_start, span_end], [deck_y, deck_y], 
+                             color=generator.colors['structure'], linewidth=generator.line_width * 1.5)
+    
+    # Vertical members
+    for x in panel_x:
+        generator.ax_elevation.plot([x, x], [deck_y, top_y], 
+                             color=generator.colors['structure'], linewidth=generator.line_width)
+    
+    # Diagonal members, alternating up-right and down-right within each span
+    starts = panel_index < num_panels[panel_span]
+    for x, x_next, up in zip(panel_x[:-1][starts[:-1]], panel_x[1:][starts[:-1]],
+                             panel_index[:-1][starts[:-1]] % 2 == 0):
+        generator.ax_elevation.plot([x, x_next], [deck_y, top_y] if up else [top_y, deck_y], 
+                             color=generator.colors['structure'], linewidth=generator.line_width * 0.8)
+    
+    # Supports at intermediate points and ends
+    support_width = 2.5
+    support_tops = np.concatenate(([deck_y], spans.pier_tops(deck_y), [deck_y]))
+    for x_pos, support_top in zip(spans.chainages, support_tops):
+        support = Rectangle((x_pos - support_width/2, -generator.params.foundation_depth), 
+                          support_width, support_top + generator.params.foundation_depth,
+                          facecolor=generator.colors['supports'], alpha=0.8,
+                          edgecolor=generator.colors['structure'], linewidth=generator.line_width)
+        generator.ax_elevation.add_patch(support)
+
+
+def draw_plan(generator):
+    """Generate plan view for truss bridge"""
+    # Deck outline
+    deck_plan = Rectangle((0, 0), generator.params.span_length, generator.params.deck_width,
+                        facecolor=generator.colors['plan_deck'], alpha=0.7,
+                        edgecolor=generator.colors['structure'], linewidth=generator.line_width)
+    generator.ax_plan.add_patch(deck_plan)
+    
+    # Main trusses (two parallel trusses)
+    truss_width = 1.0
+    truss_positions = [generator.params.deck_width * 0.15, generator.params.deck_width * 0.85]
+    
+    for y_pos in truss_positions:
+        truss_plan = Rectangle((0, y_pos - truss_width/2), generator.params.span_length, truss_width,
+                             facecolor=generator.colors['plan_structure'], alpha=0.9,
+                             edgecolor=generator.colors['structure'], linewidth=1.5)
+        generator.ax_plan.add_patch(truss_plan)
+    
+    # Cross-bracing/floor beams
+    num_cross_frames = max(8, int(generator.params.span_length / 10))
+    cross_frame_spacing = generator.params.span_length / (num_cross_frames - 1)
+    
+    for i in range(num_cross_frames):
+        x_pos = i * cross_frame_spacing
+        generator.ax_plan.plot([x_pos, x_pos], [truss_positions[0], truss_positions[1]], 
+                         color=generator.colors['structure'], linewidth=1.5, alpha=0.8)
+    
+    # Support positions in plan
+    support_width = 2.5
+    
+    for x_pos in generator.params.span_table().chainages:
+        support_plan = Rectangle((x_pos - support_width/2, (generator.params.deck_width - support_width)/2), 
+                               support_width, support_width,
+                               facecolor=generator.colors['supports'], alpha=0.8,
+                               edgecolor=generator.colors['structure'], linewidth=generator.line_width)
+        generator.ax_plan.add_patch(support_plan)
+
+
+def add_to_dxf(generator, msp, span, height, width):
+    """Add truss bridge elements to DXF, panels of every span of the span table as in the elevation"""
+    spans = generator.params.span_table()
+    deck_y = height * 0.3
+    top_y = height - 1
+    
+    # Deck and chords of each span
+    for span_start, span_end in zip(spans.starts, spans.ends):
+        msp.add_lwpolyline(box_points(span_start, deck_y, span_end, deck_y + 0.5), dxfattribs={'layer': 'DECK'})
+        msp.add_line((span_start, top_y), (span_end, top_y), dxfattribs={'layer': 'STRUCTURE'})
+        msp.add_line((span_start, deck_y), (span_end, deck_y), dxfattribs={'layer': 'STRUCTURE'})
+    
+    # Verticals, and diagonals alternating up-right and down-right within each span
+    num_panels = spans.panel_counts(10, 4)
+    panel_x, panel_span, panel_index = spans.subdivide(num_panels)
+    for x in panel_x.tolist():
+        msp.add_line((x, deck_y), (x, top_y), dxfattribs={'layer': 'STRUCTURE'})
+    starts = panel_index[:-1] < num_panels[panel_span[:-1]]
+    for x, x_next, up in zip(panel_x[:-1][starts].tolist(), panel_x[1:][starts].tolist(),
+                             (panel_index[:-1][starts] % 2 == 0).tolist()):
+        y0, y1 = (deck_y, top_y) if up else (top_y, deck_y)
+        msp.add_line((x, y0), (x_next, y1), dxfattribs={'layer': 'STRUCTURE'})
+    
+    # Supports at the ends and intermediate points
+    support_width = 2.5
+    support_tops = np.concatenate(([deck_y], spans.pier_tops(deck_y), [deck_y]))
+    for x, support_top in zip(spans.chainages.tolist(), support_tops.tolist()):
+        msp.add_lwpolyline(box_points(x - support_width/2, -generator.params.foundation_depth,
+                                      x + support_width/2, support_top),
+                           dxfattribs={'layer': 'STRUCTURE'})
+
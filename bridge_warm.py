@@ -0,0 +1,286 @@
+#!/usr/bin/env python3
+"""
+Warm Worker Pool for Bridge Drawings
+
+The server imports numpy, matplotlib (Agg), ezdxf and bridge_drawings once,
+renders a small bridge in every output format to load fonts and backends,
+freezes the garbage collector and then forks workers that share all of that
+copy-on-write. Workers accept jobs directly on one listening Unix socket, so
+a job only pays for its own rendering.
+
+The submit client uses nothing but the standard library, so it starts in a
+few milliseconds instead of paying the import cost of a full CLI run.
+
+Protocol: one JSON request line per connection, answered by one JSON line.
+    {"bridge_type": "slab", "params": {...}, "format": "png", "dpi": 300,
+     "output": "/abs/path/slab_bridge", "force": false}
+    -> {"ok": true, "files": ["/abs/path/slab_bridge.png"], "seconds": 0.21}
+A connection that has not sent its request line within REQUEST_TIMEOUT
+seconds is answered {"ok": false, "error": "timeout"} and closed.
+
+Usage:
+    python bridge_warm.py serve --workers 2
+    python bridge_warm.py submit slab --span 30 --format png --output slab
+"""
+
+from typing import Any, Dict, List
+import argparse
+import json
+import os
+import signal
+import socket
+import sys
+import time
+
+
+DEFAULT_SOCKET = "/tmp/bridge_warm.sock"
+MAX_REQUEST_BYTES = 64 * 1024
+# A client must send its whole request line within this many seconds
+REQUEST_TIMEOUT = 10.0
+# Workers that crash are restarted after a delay that doubles up to the maximum
+RESTART_DELAY = 0.1
+MAX_RESTART_DELAY = 10.0
+
+
+def warm_up():
+    """Import the heavy modules and render every format once in this process"""
+    import gc
+    import matplotlib
+    matplotlib.use('Agg')
+    import matplotlib.pyplot as plt
+    import ezdxf  # noqa: F401
+
+    from bridge_drawings import BridgeDrawingGenerator, BridgeParameters, BridgeType, OutputFormat
+    from bridge_types import bridge_type_names, get_plugin
+
+    # Workers serve every type, so all plugin modules are imported before forking
+    for name in bridge_type_names():
+        get_plugin(name)
+    generator = BridgeDrawingGenerator(BridgeType.SLAB, BridgeParameters(
+        span_length=20, deck_width=8, height=6, supports=0, load_capacity=30, material='concrete'))
+    generator.generate_drawing()
+    for output_format in (OutputFormat.PNG, OutputFormat.SVG, OutputFormat.PDF, OutputFormat.DXF):
+        generator.export_bytes(output_format, dpi=50)
+    plt.close(generator.figure)
+    gc.collect()
+    gc.freeze()  # keep the shared heap out of later collections so it stays shared
+
+
+def handle_job(request: Dict[str, Any]) -> Dict[str, Any]:
+    """Render one job in a warm worker"""
+    import matplotlib.pyplot as plt
+    from bridge_drawings import BridgeDrawingGenerator, BridgeParameters, OutputFormat, resolve_bridge_type
+    from bridge_export import expand_formats
+    from bridge_feasibility import check_feasibility
+
+    started = time.perf_counter()
+    bridge_type = resolve_bridge_type(request["bridge_type"])
+    params = BridgeParameters(**request["params"])
+    output_format = OutputFormat(request.get("format", "png"))
+    dpi = int(request.get("dpi", 300))
+    base_name = os.path.splitext(request["output"])[0]
+
+    report = check_feasibility(bridge_type, params)
+    if not report.feasible and not request.get("force"):
+        return {"ok": False, "error": "Bridge geometry is infeasible", "summary": report.summary()}
+
+    generator = BridgeDrawingGenerator(bridge_type, params)
+    files: List[str] = []
+    try:
+        if output_format != OutputFormat.DXF:
+            generator.generate_drawing()
+        for single in expand_formats(output_format):
+            path = f"{base_name}.{single.value}"
+            with open(path, 'wb') as f:
+                f.write(generator.export_bytes(single, dpi=dpi))
+            files.append(path)
+    finally:
+        if generator.figure is not None:
+            plt.close(generator.figure)
+    return {"ok": True, "files": files, "seconds": round(time.perf_counter() - started, 3)}
+
+
+def _read_line(conn: socket.socket, timeout: float = REQUEST_TIMEOUT) -> bytes:
+    """Read one request line; raises TimeoutError if it is not complete within timeout"""
+    deadline = time.monotonic() + timeout
+    data = b""
+    while not data.endswith(b"\n"):
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            raise TimeoutError()
+        conn.settimeout(remaining)
+        chunk = conn.recv(4096)
+        if not chunk:
+            break
+        data += chunk
+        if len(data) > MAX_REQUEST_BYTES:
+            raise ValueError("Request too large")
+    return data
+
+
+def worker_loop(listener: socket.socket, max_jobs: int):
+    """Accept and serve jobs until max_jobs have been handled"""
+    signal.signal(signal.SIGTERM, signal.SIG_DFL)
+    signal.signal(signal.SIGINT, signal.SIG_DFL)
+    for _ in range(max_jobs):
+        conn, _ = listener.accept()
+        conn.settimeout(REQUEST_TIMEOUT)
+        with conn:
+            try:
+                response = handle_job(json.loads(_read_line(conn)))
+            except TimeoutError:
+                # An idle client would otherwise hold this worker in recv() forever
+                response = {"ok": False, "error": "timeout"}
+            except Exception as e:
+                response = {"ok": False, "error": f"{type(e).__name__}: {e}"}
+            try:
+                conn.settimeout(REQUEST_TIMEOUT)  # nor can one that never reads the answer
+                conn.sendall(json.dumps(response).encode("utf-8") + b"\n")
+            except OSError:
+                pass
+
+
+def serve(socket_path: str, workers: int, max_jobs: int) -> int:
+    """Warm up, fork the workers and keep their number constant until stopped"""
+    started = time.perf_counter()
+    warm_up()
+    print(f"Warmed up in {time.perf_counter() - started:.2f}s")
+
+    if os.path.exists(socket_path):
+        os.unlink(socket_path)
+    listener = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    listener.bind(socket_path)
+    listener.listen(64)
+
+    children: Dict[int, float] = {}  # pid -> start time
+
+    def spawn():
+        pid = os.fork()
+        if pid == 0:
+            code = 0
+            try:
+                worker_loop(listener, max_jobs)
+            except BaseException:
+                code = 1
+            os._exit(code)
+        children[pid] = time.monotonic()
+
+    def stop(signum, frame):
+        raise KeyboardInterrupt
+
+    signal.signal(signal.SIGTERM, stop)
+    print(f"Serving on {socket_path} with {workers} warm worker(s)")
+    sys.stdout.flush()  # children must not inherit unflushed output
+
+    try:
+        for _ in range(workers):
+            spawn()
+        delay = 0.0
+        while True:
+            try:
+                pid, status = os.wait()
+            except ChildProcessError:
+                break
+            lifetime = time.monotonic() - children.pop(pid, time.monotonic())
+            code = os.waitstatus_to_exitcode(status)
+            # Workers that reached max_jobs, or crashed after running a while, are replaced at once
+            if code == 0 or lifetime >= MAX_RESTART_DELAY:
+                delay = 0.0
+            else:
+                delay = min(max(delay * 2, RESTART_DELAY), MAX_RESTART_DELAY)
+                print(f"Worker {pid} exited with status {code}, restarting in {delay:.1f}s")
+                sys.stdout.flush()
+                time.sleep(delay)
+            spawn()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        for pid in children:
+            try:
+                os.kill(pid, signal.SIGTERM)
+            except ProcessLookupError:
+                pass
+        for pid in children:
+            try:
+                os.waitpid(pid, 0)
+            except ChildProcessError:
+                pass
+        listener.close()
+        if os.path.exists(socket_path):
+            os.unlink(socket_path)
+        print("Warm worker pool stopped")
+    return 0
+
+
+def submit(socket_path: str, request: Dict[str, Any], timeout: float = 300.0) -> Dict[str, Any]:
+    """Send one job to a running warm pool and wait for its answer"""
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as conn:
+        conn.settimeout(timeout)
+        conn.connect(socket_path)
+        conn.sendall(json.dumps(request).encode("utf-8") + b"\n")
+        return json.loads(_read_line(conn, timeout) or b'{"ok": false, "error": "Connection closed by worker"}')
+
+
+def main():
+    """Command-line entry point for the warm worker pool"""
+    parser = argparse.ArgumentParser(description='Warm worker pool for bridge drawings')
+    parser.add_argument('--socket', default=DEFAULT_SOCKET, help=f'Unix socket path (default: {DEFAULT_SOCKET})')
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    serve_parser = commands.add_parser('serve', help='Warm up and serve jobs')
+    serve_parser.add_argument('--workers', type=int, default=max(1, (os.cpu_count() or 2) - 1),
+                              help='Forked worker processes (default: CPU count - 1)')
+    serve_parser.add_argument('--max-jobs', type=int, default=500,
+                              help='Jobs per worker before it is replaced (default: 500)')
+
+    submit_parser = commands.add_parser('submit', help='Render a bridge on a running pool')
+    # The bridge_types registry lists built-in and plugin types without importing bridge_drawings
+    from bridge_types import bridge_type_names
+    submit_parser.add_argument('bridge_type', choices=bridge_type_names())
+    submit_parser.add_argument('--span', type=float, default=100.0, help='Main span length in meters')
+    submit_parser.add_argument('--width', type=float, default=12.0, help='Deck width in meters')
+    submit_parser.add_argument('--height', type=float, default=20.0, help='Overall height in meters')
+    submit_parser.add_argument('--supports', type=int, default=0, help='Number of intermediate supports')
+    submit_parser.add_argument('--load', type=float, default=50.0, help='Design load in kN/m')
+    submit_parser.add_argument('--material', default='steel', help='Primary material')
+    submit_parser.add_argument('--skew', type=float, default=0.0, help='Plan skew angle in degrees')
+    submit_parser.add_argument('--output', default='bridge_drawing', help='Output filename (without extension)')
+    submit_parser.add_argument('--format', choices=['svg', 'png', 'pdf', 'dxf', 'webp', 'all'], default='png',
+                               help='Output format')
+    submit_parser.add_argument('--dpi', type=int, default=300, help='Raster resolution (default: 300)')
+    submit_parser.add_argument('--force', action='store_true',
+                               help='Render even if feasibility screening reports errors')
+
+    args = parser.parse_args()
+
+    if args.command == 'serve':
+        return serve(args.socket, args.workers, args.max_jobs)
+
+    request = {
+        "bridge_type": args.bridge_type,
+        "params": {"span_length": args.span, "deck_width": args.width, "height": args.height,
+                   "supports": args.supports, "load_capacity": args.load, "material": args.material,
+                   "skew_angle": args.skew},
+        "format": args.format,
+        "dpi": args.dpi,
+        "output": os.path.abspath(args.output),
+        "force": args.force,
+    }
+    try:
+        response = submit(args.socket, request)
+    except (FileNotFoundError, ConnectionRefusedError):
+        print(f"No warm pool listening on {args.socket}; start one with: python bridge_warm.py serve")
+        return 1
+    if not response.get("ok"):
+        print(f"Error: {response.get('error')}")
+        if response.get("summary"):
+            print(response["summary"])
+        return 1
+    for path in response["files"]:
+        print(f"Saved: {path}")
+    print(f"Rendered in {response['seconds']:.3f}s")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
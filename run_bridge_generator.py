@@ -125,6 +125,7 @@ def create_custom_bridge():
         print(f"Specifications: {params}")
         
         generator = BridgeDrawingGenerator(bridge_type, params)
+        generator.pyplot_figure = True  # shown with plt.show() below
         fig = generator.generate_drawing()
         
         # Save the drawing
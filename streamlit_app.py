@@ -1,35 +1,18 @@
 import streamlit as st
 
-# Enhanced coordinate functions
-
-def hpos(ch, left, scale):
-    """Horizontal position calculation - LISP hpos() function"""
-    return (ch - left) * scale
-
-def vpos(rl, datum, scale):
-    """Vertical position calculation - LISP vpos() function"""
-    return (rl - datum) * scale
-
-def h2pos(ch, left, scale2):
-    """Secondary horizontal position - LISP h2pos() function"""
-    return (ch - left) * scale2
-
-def v2pos(rl, datum, scale2):
-    """Secondary vertical position - LISP v2pos() function"""
-    return (rl - datum) * scale2
-
-def calculate_skew_coordinates(x, y, skew_angle):
-    """Calculate coordinates for skewed bridges"""
-    import math
-    skew_rad = math.radians(skew_angle)
-    x_skew = x * math.cos(skew_rad) - y * math.sin(skew_rad)
-    y_skew = x * math.sin(skew_rad) + y * math.cos(skew_rad)
-    return x_skew, y_skew
+# Enhanced coordinate functions (vectorised, accept scalars or NumPy arrays)
+from bridge_transforms import hpos, vpos, h2pos, v2pos, calculate_skew_coordinates
 
 import matplotlib.pyplot as plt
 import io
 import base64
+import os
+from functools import partial
 from bridge_drawings import BridgeDrawingGenerator, BridgeType, BridgeParameters, OutputFormat
+from bridge_feasibility import check_feasibility
+from bridge_jobs import submit_render
+from bridge_metrics import DEFAULT_METRICS_PORT, start_metrics_server
+from bridge_payload import viewer_html
 
 # Page configuration
 st.set_page_config(
@@ -39,6 +22,9 @@ st.set_page_config(
     initial_sidebar_state="expanded"
 )
 
+# Prometheus metrics of this app process on http://127.0.0.1:<port>/metrics; started once, 0 disables
+start_metrics_server(int(os.environ.get("BRIDGE_METRICS_PORT", DEFAULT_METRICS_PORT)))
+
 st.title("🌉 Bridge General Arrangement Drawing Generator")
 st.markdown("---")
 
@@ -98,6 +84,13 @@ if bridge_type in [BridgeType.BEAM, BridgeType.T_BEAM]:
         max_value=10,
         value=1
     )
+elif bridge_type == BridgeType.CABLE_STAYED:
+    supports = st.sidebar.slider(
+        "Towers",
+        min_value=1,
+        max_value=10,
+        value=1
+    )
 else:
     supports = 0
 
@@ -140,6 +133,21 @@ with st.sidebar.expander("Advanced Parameters"):
         value=2.0,
         step=0.5
     )
+    
+    skew_angle = st.slider(
+        "Skew Angle (°)",
+        min_value=0.0,
+        max_value=45.0,
+        value=0.0,
+        step=2.5
+    )
+    
+    span_lengths_text = st.text_input(
+        "Span Lengths (m)",
+        value="",
+        placeholder="e.g. 30, 35, 30",
+        help="Comma-separated individual spans; overrides the span length and supports above"
+    )
 
 # Main content area
 col1, col2 = st.columns([3, 1])
@@ -161,6 +169,7 @@ with col2:
     if st.button("🎨 Generate Bridge Drawing", type="primary"):
         try:
             # Create bridge parameters
+            span_lengths = [float(value) for value in span_lengths_text.split(",") if value.strip()] or None
             params = BridgeParameters(
                 span_length=span_length,
                 deck_width=deck_width,
@@ -170,82 +179,80 @@ with col2:
                 material=material,
                 approach_length=approach_length,
                 foundation_depth=foundation_depth,
-                girder_depth=girder_depth
+                girder_depth=girder_depth,
+                skew_angle=skew_angle,
+                span_lengths=span_lengths
             )
             
-            # Generate the bridge drawing
-            with st.spinner(f"Generating {selected_bridge}..."):
-                generator = BridgeDrawingGenerator(bridge_type, params)
-                fig = generator.generate_drawing()
-                
-                # Display the drawing
-                st.pyplot(fig)
-                
-                # Save options
-                st.subheader("Download Options")
-                
-                # Create download buttons for different formats
-                filename = f"{bridge_type.value}_bridge_{span_length}m"
-                
-                # PNG download
-                img_buffer = io.BytesIO()
-                fig.savefig(img_buffer, format='png', dpi=300, bbox_inches='tight')
-                img_buffer.seek(0)
-                
-                st.download_button(
-                    label="📥 Download PNG",
-                    data=img_buffer.getvalue(),
-                    file_name=f"{filename}.png",
-                    mime="image/png"
-                )
-                
-                # SVG download
-                svg_buffer = io.StringIO()
-                fig.savefig(svg_buffer, format='svg', bbox_inches='tight')
-                svg_content = svg_buffer.getvalue()
-                
-                st.download_button(
-                    label="📥 Download SVG",
-                    data=svg_content,
-                    file_name=f"{filename}.svg",
-                    mime="image/svg+xml"
-                )
-                
-                # DXF download (AutoCAD format)
-                try:
-                    import tempfile
-                    import os
-                    
-                    # Create temporary file for DXF export
-                    with tempfile.NamedTemporaryFile(suffix='.dxf', delete=False) as tmp_file:
-                        tmp_filename = tmp_file.name
-                    
-                    # Generate DXF file
-                    generator.save_as_dxf(tmp_filename)
-                    
-                    # Read DXF content
-                    with open(tmp_filename, 'rb') as dxf_file:
-                        dxf_content = dxf_file.read()
-                    
-                    # Clean up temp file
-                    os.unlink(tmp_filename)
-                    
-                    st.download_button(
-                        label="📥 Download DXF (AutoCAD)",
-                        data=dxf_content,
-                        file_name=f"{filename}.dxf",
-                        mime="application/dxf"
-                    )
-                        
-                except Exception as e:
-                    st.error(f"DXF export failed: {str(e)}")
-                    st.info("DXF export requires the ezdxf library. The PNG and SVG downloads are still available.")
-                
-                plt.close(fig)  # Clean up
+            # Screen the geometry before paying for a render
+            report = check_feasibility(bridge_type, params)
+            for issue in report.warnings:
+                st.warning(issue.message)
+            for issue in report.errors:
+                st.error(issue.message)
+            if not report.feasible:
+                st.stop()
+            
+            # Render in the background so the app stays responsive
+            previous_job = st.session_state.get("render_job")
+            if previous_job is not None and not previous_job.finished:
+                previous_job.cancel()
+            st.session_state["render_job"] = submit_render(bridge_type, params)
+            st.session_state["render_filename"] = f"{bridge_type.value}_bridge_{params.span_length}m"
                 
         except Exception as e:
             st.error(f"Error generating bridge: {str(e)}")
 
+def show_render_job(polling: bool):
+    """Progress, preview and on-demand downloads for the current render job"""
+    job = st.session_state.get("render_job")
+    if job is None:
+        return
+    
+    if not job.finished:
+        st.progress(job.progress, text=f"{job.stage_label}...")
+        if st.button("✖ Cancel Render", key="cancel_render"):
+            job.cancel()
+    elif job.status == "failed":
+        st.error(f"Error generating bridge: {job.error}")
+    elif job.status == "cancelled":
+        st.info("Render cancelled.")
+    
+    # The preview is ready long before the 300 dpi exports. It is drawn in the
+    # browser from the geometry payload, so pan and zoom need no round-trips
+    preview = job.result("preview")
+    if preview is not None and job.preview_format == "geometry":
+        st.iframe(viewer_html(preview), height=800)  # the drawing sheet is 20 x 16 in
+        st.caption("Drag to pan, scroll to zoom, double-click a view to reset it.")
+    elif preview is not None:
+        st.image(preview)
+    
+    # Downloads are rendered only when clicked, nothing is encoded up front
+    filename = st.session_state["render_filename"]
+    downloads = [
+        (OutputFormat.PNG, "📥 Download PNG", "image/png"),
+        (OutputFormat.SVG, "📥 Download SVG", "image/svg+xml"),
+        (OutputFormat.DXF, "📥 Download DXF (AutoCAD)", "application/dxf"),
+    ]
+    if job.status == "done":
+        st.subheader("Download Options")
+        st.download_button(label="📦 Download All (PNG, SVG, PDF, DXF as ZIP)",
+                           data=partial(job.bundle, filename), file_name=f"{filename}.zip",
+                           mime="application/zip", key="download_all", on_click="ignore", type="primary")
+        for output_format, label, mime in downloads:
+            st.download_button(label=label, data=partial(job.export, output_format),
+                               file_name=f"{filename}.{output_format.value}", mime=mime,
+                               key=f"download_{output_format.value}", on_click="ignore")
+    
+    # Stop polling once the job is over by rerunning the whole page
+    if polling and job.finished:
+        st.rerun()
+
+
+current_job = st.session_state.get("render_job")
+job_active = current_job is not None and not current_job.finished
+st.fragment(run_every=0.5 if job_active else None)(show_render_job)(job_active)
+
 # Information section
 st.markdown("---")
 st.subheader("📚 Bridge Type Information")
@@ -317,109 +324,3 @@ st.markdown(
     Generated drawings follow standard engineering conventions and include proper dimensioning.
     """
 )
-
-# Enhanced DXF functions
-
-def setup_dxf_layers(doc):
-    """Setup professional DXF layers"""
-    layers = [
-        ("GRID", 8, "Grid lines and axes"),
-        ("STRUCTURE", 1, "Main structural elements"),
-        ("DIMENSIONS", 6, "Dimension lines and text"),
-        ("ANNOTATIONS", 3, "Text and labels"),
-        ("CENTERLINES", 4, "Center lines"),
-        ("HATCHING", 9, "Section hatching"),
-        ("DETAILS", 2, "Detail elements"),
-        ("FOUNDATION", 5, "Foundation elements")
-    ]
-    
-    for name, color, description in layers:
-        layer = doc.layers.new(name=name)
-        layer.dxf.color = color
-        layer.description = description
-
-def add_bridge_deck(msp, left, right, rtl, ccbr, scale, layer="STRUCTURE"):
-    """Add bridge deck to DXF"""
-    deck_width = ccbr
-    deck_left = left - deck_width/2
-    deck_right = right + deck_width/2
-    
-    # Main deck rectangle
-    deck_points = [
-        (hpos(deck_left, left, scale), vpos(rtl, 100, scale)),
-        (hpos(deck_right, left, scale), vpos(rtl, 100, scale)),
-        (hpos(deck_right, left, scale), vpos(rtl-0.2, 100, scale)),
-        (hpos(deck_left, left, scale), vpos(rtl-0.2, 100, scale))
-    ]
-    
-    msp.add_lwpolyline(deck_points, close=True, dxfattribs={'layer': layer})
-
-def add_pier(msp, ch, datum, rtl, pier_width, scale, layer="STRUCTURE"):
-    """Add pier to DXF"""
-    pier_left = ch - pier_width/2
-    pier_right = ch + pier_width/2
-    
-    pier_points = [
-        (hpos(pier_left, 0, scale), vpos(datum, datum, scale)),
-        (hpos(pier_right, 0, scale), vpos(datum, datum, scale)),
-        (hpos(pier_right, 0, scale), vpos(rtl, datum, scale)),
-        (hpos(pier_left, 0, scale), vpos(rtl, datum, scale))
-    ]
-    
-    msp.add_lwpolyline(pier_points, close=True, dxfattribs={'layer': layer})
-
-
-# Enhanced Excel processing
-
-def process_excel_parameters(file_path):
-    """Enhanced Excel parameter processing"""
-    import pandas as pd
-    
-    try:
-        # Read Excel file with proper encoding
-        df = pd.read_excel(file_path, sheet_name=None, header=None)
-        
-        if 'Sheet1' not in df:
-            raise ValueError("Sheet1 not found in Excel file")
-        
-        # Process parameters
-        df_params = df['Sheet1']
-        
-        # Handle different Excel formats
-        if len(df_params.columns) >= 3:
-            df_params.columns = ['Value', 'Variable', 'Description']
-        else:
-            df_params.columns = ['Variable', 'Value']
-        
-        # Convert to dictionary
-        parameters = dict(zip(df_params['Variable'], df_params['Value']))
-        
-        # Validate essential parameters
-        required_params = ['SCALE1', 'DATUM', 'LEFT', 'RIGHT', 'RTL', 'NSPAN']
-        missing_params = [p for p in required_params if p not in parameters]
-        
-        if missing_params:
-            print(f"Warning: Missing parameters: {missing_params}")
-            
-        return parameters
-        
-    except Exception as e:
-        print(f"Error processing Excel file: {e}")
-        return create_default_parameters()
-
-def create_default_parameters():
-    """Create default parameters if Excel processing fails"""
-    return {
-        'SCALE1': 100,
-        'SCALE2': 50, 
-        'SKEW': 0,
-        'DATUM': 100,
-        'LEFT': 0,
-        'RIGHT': 100,
-        'RTL': 105,
-        'SOFL': 103,
-        'NSPAN': 3,
-        'LBRIDGE': 30,
-        'CCBR': 7.5,
-        'PIERTW': 0.8
-    }